@@ -12,12 +12,11 @@ Usage (from repo root):
     uv run streamlit run examples/medical-tools/app.py
 """
 
-import asyncio
 import json
 import os
 import streamlit as st
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.pool import SessionPool
 
 st.set_page_config(page_title="Medical Tools MCP Client", layout="wide")
 st.title("Medical Research Assistant")
@@ -28,24 +27,32 @@ st.markdown(
 
 # --- MCP Helper ---
 
-async def call_mcp_tool(tool_name: str, arguments: dict) -> str:
-    """Connect to the MCP server, call a tool, and return the result."""
-    server_script = os.path.join(os.path.dirname(__file__), "server.py")
-    params = StdioServerParameters(
-        command="uv",
-        args=["run", "python", server_script],
-        env={**os.environ},
-    )
-    async with stdio_client(params) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            result = await session.call_tool(tool_name, arguments)
-            return result.content[0].text
+SERVER_CONFIG = MCPServerConfig(
+    name="medical-tools",
+    command="uv",
+    args=["run", "python", os.path.join(os.path.dirname(__file__), "server.py")],
+    env={**os.environ},
+)
+
+
+@st.cache_resource
+def get_session_pool() -> SessionPool:
+    """One warm MCP session shared across Streamlit reruns.
+
+    The server subprocess is spawned and initialized once; every button
+    click after that reuses the open session instead of paying for a new
+    interpreter, `uv` resolution and handshake.
+    """
+    return SessionPool(size=1, max_idle=600)
 
 
 def run_tool(tool_name: str, arguments: dict) -> str:
-    """Synchronous wrapper for calling an MCP tool."""
-    return asyncio.run(call_mcp_tool(tool_name, arguments))
+    """Call an MCP tool on the pooled server session.
+
+    Returns the text of every content part, joined by newlines. These tools
+    return a single part (a string, or a dict as one JSON object).
+    """
+    return get_session_pool().call_tool_sync(SERVER_CONFIG, tool_name, arguments)
 
 
 # --- Disclaimer ---
@@ -20,7 +20,6 @@ Required env vars:
 
 import os
 import json
-import requests
 from pathlib import Path
 from typing import Any
 from bs4 import BeautifulSoup
@@ -28,10 +27,13 @@ from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from mcp_toolkit.server import http_get, http_lifespan
+
 # Resolve .env from repo root (2 levels up from examples/medical-tools/)
 load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
 
-mcp = FastMCP("medical-tools")
+# http_lifespan closes the shared, pooled HTTP client when the server stops
+mcp = FastMCP("medical-tools", lifespan=http_lifespan)
 
 _openai = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
@@ -114,7 +116,7 @@ def diagnose_symptoms(symptoms: list[str]) -> str:
 
 
 @mcp.tool()
-def search_pubmed(query: str, max_results: int = 3) -> str:
+async def search_pubmed(query: str, max_results: int = 3) -> str:
     """Search PubMed for medical research articles.
 
     Uses the free NCBI eUtils API — no API key required.
@@ -128,26 +130,22 @@ def search_pubmed(query: str, max_results: int = 3) -> str:
     headers = {"User-Agent": "MCP-Medical-Tools/1.0 (learning project)"}
 
     # Step 1: Search for article IDs
-    search_resp = requests.get(
+    search_resp = await http_get(
         "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
         params={"db": "pubmed", "term": query, "retmax": max_results, "retmode": "json"},
         headers=headers,
-        timeout=10,
     )
-    search_resp.raise_for_status()
     id_list = search_resp.json().get("esearchresult", {}).get("idlist", [])
 
     if not id_list:
         return json.dumps([])
 
     # Step 2: Fetch article metadata
-    fetch_resp = requests.get(
+    fetch_resp = await http_get(
         "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi",
         params={"db": "pubmed", "id": ",".join(id_list), "retmode": "xml"},
         headers=headers,
-        timeout=10,
     )
-    fetch_resp.raise_for_status()
 
     soup = BeautifulSoup(fetch_resp.text, "xml")
     articles = []
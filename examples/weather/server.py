@@ -13,38 +13,41 @@ Resources:
   - weather://favorites: A list of example cities to try
 """
 
-import urllib.request
-import json
+import asyncio
+import urllib.parse
+
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("weather")
+from mcp_toolkit.server import http_get, http_lifespan
+
+# http_lifespan closes the shared, pooled HTTP client when the server stops
+mcp = FastMCP("weather", lifespan=http_lifespan)
 
 # --- Helper ---
 
-def _fetch_weather(city: str, format: str = "3") -> str:
+async def _fetch_weather(city: str, format: str = "3") -> str:
     """Fetch weather data from wttr.in."""
+    # Keep the format in the raw URL: wttr.in expects its literal '%' and '+'
     url = f"https://wttr.in/{urllib.parse.quote(city)}?format={format}"
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return response.read().decode("utf-8").strip()
+        response = await http_get(url)
+        return response.text.strip()
     except Exception as e:
         return f"Error: {e}"
 
 
-import urllib.parse
-
 # --- Tools ---
 
 @mcp.tool()
-def check_weather(city: str) -> str:
+async def check_weather(city: str) -> str:
     """Get the current weather for a city. Returns temperature, condition, and wind."""
     # format="%l:+%c+%t+%w" gives: City: ☁️ +15°C ↗10km/h
-    result = _fetch_weather(city, format="%l:+%c+%t+%w")
+    result = await _fetch_weather(city, format="%l:+%c+%t+%w")
     return result
 
 
 @mcp.tool()
-def get_forecast(city: str, days: int = 3) -> str:
+async def get_forecast(city: str, days: int = 3) -> str:
     """Get a multi-day weather forecast for a city.
 
     Args:
@@ -56,8 +59,8 @@ def get_forecast(city: str, days: int = 3) -> str:
     # Instead, get day-by-day summary
     url = f"https://wttr.in/{urllib.parse.quote(city)}?format=j1"
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        response = await http_get(url)
+        data = response.json()
 
         forecast_days = data.get("weather", [])[:days]
         lines = [f"Forecast for {city} ({days} day{'s' if days > 1 else ''}):\n"]
@@ -77,15 +80,18 @@ def get_forecast(city: str, days: int = 3) -> str:
 
 
 @mcp.tool()
-def compare_weather(city1: str, city2: str) -> str:
+async def compare_weather(city1: str, city2: str) -> str:
     """Compare current weather between two cities side by side.
 
     Args:
         city1: First city name
         city2: Second city name
     """
-    w1 = _fetch_weather(city1, format="%c+%t+%w")
-    w2 = _fetch_weather(city2, format="%c+%t+%w")
+    # Both lookups share the pooled client and run at the same time
+    w1, w2 = await asyncio.gather(
+        _fetch_weather(city1, format="%c+%t+%w"),
+        _fetch_weather(city2, format="%c+%t+%w"),
+    )
     return f"{city1}: {w1}\n{city2}: {w2}"
 
 
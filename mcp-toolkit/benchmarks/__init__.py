@@ -0,0 +1,8 @@
+"""
+MCP Toolkit benchmarks.
+
+Throughput and latency of the tool-calling loop, measured against local stub
+servers and a deterministic fake LLM. Run from the ``mcp-toolkit`` directory:
+
+    python -m benchmarks.run
+"""
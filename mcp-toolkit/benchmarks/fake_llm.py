@@ -0,0 +1,206 @@
+"""
+Deterministic in-process stand-in for ``AsyncOpenAI``.
+
+Implements just enough of ``chat.completions.create`` (plain and
+``stream=True``) for the toolkit's tool-calling loops. Every conversation
+follows the same script: ``tool_rounds`` rounds of ``calls_per_round``
+parallel tool calls, then a short final answer. Tools are picked
+round-robin from the ``tools`` offered in the request, with arguments
+generated from their JSON Schema, so any stub server works unchanged.
+
+Example:
+    >>> llm = FakeOpenAI(tool_rounds=2, calls_per_round=3)
+    >>> client = OpenAIMCPClient(server_script="math_server.py", openai_client=llm)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+
+@dataclass
+class _Function:
+    name: str
+    arguments: str
+
+
+@dataclass
+class _ToolCall:
+    id: str
+    function: _Function
+    type: str = "function"
+
+
+@dataclass
+class _Message:
+    content: str | None
+    tool_calls: list[_ToolCall] | None = None
+    role: str = "assistant"
+
+    def model_dump(self) -> dict[str, Any]:
+        """The message in the shape the OpenAI SDK's ``model_dump()`` returns."""
+        message: dict[str, Any] = {"role": self.role, "content": self.content}
+        if self.tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": tc.type,
+                    "function": {"name": tc.function.name, "arguments": tc.function.arguments},
+                }
+                for tc in self.tool_calls
+            ]
+        return message
+
+
+@dataclass
+class FakeUsage:
+    """Counters for everything the fake model was asked to do.
+
+    Attributes:
+        requests: ``create`` calls served.
+        tool_calls: Tool calls requested from the client.
+        tool_results: Tool result messages received back.
+    """
+    requests: int = 0
+    tool_calls: int = 0
+    tool_results: int = 0
+
+
+class FakeOpenAI:
+    """A scripted, network-free replacement for ``AsyncOpenAI``.
+
+    Attributes:
+        usage: Running :class:`FakeUsage` counters.
+    """
+
+    def __init__(
+        self,
+        *,
+        tool_rounds: int = 1,
+        calls_per_round: int = 2,
+        latency: float = 0.0,
+        answer: str = "All tool calls completed.",
+        chunk_size: int = 8,
+    ):
+        """Initialize the fake model.
+
+        Args:
+            tool_rounds: Tool-calling rounds before the final answer.
+            calls_per_round: Parallel tool calls requested per round.
+            latency: Seconds to wait before every response, to model
+                time-to-first-token.
+            answer: Final answer text.
+            chunk_size: Characters per text chunk when streaming.
+        """
+        self.tool_rounds = tool_rounds
+        self.calls_per_round = calls_per_round
+        self.latency = latency
+        self.answer = answer
+        self.chunk_size = chunk_size
+        self.usage = FakeUsage()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(
+        self,
+        *,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        stream: bool = False,
+        **_: Any,
+    ) -> Any:
+        self.usage.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        rounds, results = _progress(messages)
+        self.usage.tool_results += results
+        if tools and rounds < self.tool_rounds:
+            calls = self._tool_calls(tools, rounds)
+            self.usage.tool_calls += len(calls)
+            message = _Message(content=None, tool_calls=calls)
+        else:
+            message = _Message(content=self.answer)
+
+        if stream:
+            return _FakeStream(_chunks(message, self.chunk_size))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    def _tool_calls(self, tools: list[dict[str, Any]], round_index: int) -> list[_ToolCall]:
+        calls = []
+        for i in range(self.calls_per_round):
+            n = round_index * self.calls_per_round + i
+            spec = tools[n % len(tools)]["function"]
+            arguments = _arguments_for(spec.get("parameters") or {}, n)
+            function = _Function(spec["name"], json.dumps(arguments))
+            calls.append(_ToolCall(f"call_{round_index}_{i}", function))
+        return calls
+
+
+def _progress(messages: list[dict[str, Any]]) -> tuple[int, int]:
+    """Tool rounds so far and tool results in the latest round, since the last user turn."""
+    rounds = results = 0
+    for message in reversed(messages):
+        role = message.get("role")
+        if role == "user":
+            break
+        if role == "assistant" and message.get("tool_calls"):
+            rounds += 1
+        elif role == "tool" and rounds == 0:
+            results += 1
+    return rounds, results
+
+
+def _arguments_for(schema: dict[str, Any], n: int) -> dict[str, Any]:
+    """Plausible arguments for every property in a tool's input schema."""
+    samples = {
+        "number": float(n + 1),
+        "integer": n + 1,
+        "string": f"benchmark input {n}",
+        "boolean": n % 2 == 0,
+        "array": [],
+        "object": {},
+    }
+    return {
+        name: samples.get(prop.get("type"), f"value {n}")
+        for name, prop in (schema.get("properties") or {}).items()
+    }
+
+
+def _chunks(message: _Message, size: int) -> list[Any]:
+    """Split a message into Chat Completions stream chunks."""
+    def chunk(content=None, tool_calls=None):
+        delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    if message.tool_calls:
+        chunks = []
+        for index, tc in enumerate(message.tool_calls):
+            # Name first, arguments in a later chunk, as the real API sends them
+            name = SimpleNamespace(name=tc.function.name, arguments="")
+            arguments = SimpleNamespace(name=None, arguments=tc.function.arguments)
+            chunks.append(chunk(tool_calls=[SimpleNamespace(index=index, id=tc.id, function=name)]))
+            chunks.append(chunk(tool_calls=[SimpleNamespace(index=index, id=None, function=arguments)]))
+        return chunks
+    text = message.content or ""
+    return [chunk(content=text[i:i + size]) for i in range(0, len(text), size)]
+
+
+class _FakeStream:
+    """Async context manager and iterator over pre-built chunks."""
+
+    def __init__(self, chunks: list[Any]):
+        self._chunks = chunks
+
+    async def __aenter__(self) -> _FakeStream:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
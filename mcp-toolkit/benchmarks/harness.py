@@ -0,0 +1,330 @@
+"""
+Benchmark scenarios for the toolkit's tool-calling hot path.
+
+Each scenario drives a real client (``OpenAIMCPClient``,
+``MultiServerClient`` or ``BaseAgent``) against local stub servers and the
+deterministic :class:`~benchmarks.fake_llm.FakeOpenAI`, so the numbers
+measure toolkit and transport overhead only — no network, no API keys.
+
+Example:
+    >>> options = BenchmarkOptions(requests=50, concurrency=4)
+    >>> result = await bench_multi_client("stdio", options)
+    >>> print(result.p50_ms, result.tool_calls_per_sec)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import math
+import socket
+import sys
+import time
+import tracemalloc
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncGenerator, Awaitable, Callable
+
+from mcp_toolkit.agents import BaseAgent
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.clients.openai import OpenAIMCPClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig
+from mcp_toolkit.connection import ServerConnection, start_connections
+
+from benchmarks.fake_llm import FakeOpenAI
+
+SERVERS_DIR = Path(__file__).parent / "servers"
+STUB_SERVERS = {
+    "math": SERVERS_DIR / "math_server.py",
+    "text": SERVERS_DIR / "text_server.py",
+}
+
+TRANSPORTS = ("stdio", "sse", "streamable_http")
+
+# FastMCP's name for each transport and the path it serves it on
+_SERVER_TRANSPORTS = {"sse": ("sse", "/sse"), "streamable_http": ("streamable-http", "/mcp")}
+
+
+@dataclass
+class BenchmarkOptions:
+    """Knobs shared by every scenario.
+
+    Attributes:
+        requests: Chat requests per scenario (``startup`` connects
+            ``requests // 10`` times).
+        concurrency: Requests in flight at once.
+        tool_rounds: Tool-calling rounds the fake model makes per request.
+        calls_per_round: Parallel tool calls per round.
+        llm_latency_ms: Delay before each fake model response.
+        tool_latency_ms: Delay inside each stub tool call.
+        sessions: Sessions opened for the memory measurement.
+    """
+    requests: int = 100
+    concurrency: int = 8
+    tool_rounds: int = 1
+    calls_per_round: int = 2
+    llm_latency_ms: float = 0.0
+    tool_latency_ms: float = 0.0
+    sessions: int = 10
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one scenario on one transport.
+
+    Latencies are end-to-end per request (for ``startup``, per connection).
+
+    Attributes:
+        scenario: Scenario name.
+        transport: ``"stdio"``, ``"sse"`` or ``"streamable_http"``.
+        count: Requests measured.
+        p50_ms: Median latency.
+        p99_ms: 99th percentile latency.
+        mean_ms: Mean latency.
+        tool_calls_per_sec: Tool calls completed per second of wall time.
+        startup_ms: Time to connect, initialize and list tools.
+        memory_per_session_kb: Client-side memory held by each open session.
+    """
+    scenario: str
+    transport: str
+    count: int = 0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    mean_ms: float = 0.0
+    tool_calls_per_sec: float = 0.0
+    startup_ms: float = 0.0
+    memory_per_session_kb: float = 0.0
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 for an empty list)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# -- Stub servers -----------------------------------------------------------
+
+
+@asynccontextmanager
+async def stub_servers(
+    transport: str, names: list[str], options: BenchmarkOptions
+) -> AsyncGenerator[dict[str, MCPServerConfig], None]:
+    """Yield configs for the named stub servers on ``transport``.
+
+    For stdio the client spawns each server itself. For HTTP transports the
+    servers are started here, once, and stopped on exit, so server boot time
+    is not counted against the client.
+    """
+    extra = ["--latency", str(options.tool_latency_ms)] if options.tool_latency_ms else []
+    if transport == "stdio":
+        yield {
+            name: MCPServerConfig(
+                name=name, command=sys.executable, args=[str(STUB_SERVERS[name]), *extra]
+            )
+            for name in names
+        }
+        return
+
+    server_transport, path = _SERVER_TRANSPORTS[transport]
+    configs = {}
+    processes = []
+    try:
+        for name in names:
+            port = _free_port()
+            processes.append(await asyncio.create_subprocess_exec(
+                sys.executable, str(STUB_SERVERS[name]),
+                "--transport", server_transport, "--port", str(port), *extra,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            ))
+            await _wait_for_port(port)
+            configs[name] = MCPServerConfig(
+                name=name, url=f"http://127.0.0.1:{port}{path}", transport_type=transport
+            )
+        yield configs
+    finally:
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(p.wait() for p in processes))
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Stub server on port {port} did not start within {timeout}s")
+            await asyncio.sleep(0.05)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+
+
+# -- Scenarios --------------------------------------------------------------
+
+
+async def bench_startup(transport: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """Time connect + initialize + ``list_tools`` for one server, sequentially."""
+    result = BenchmarkResult("startup", transport)
+    async with stub_servers(transport, ["math"], options) as configs:
+        samples = []
+        for _ in range(max(1, options.requests // 10)):
+            conn = ServerConnection(configs["math"])
+            started = time.perf_counter()
+            await conn.start()
+            samples.append(time.perf_counter() - started)
+            await conn.close()
+    _fill_latency(result, samples)
+    result.startup_ms = result.p50_ms
+    return result
+
+
+async def bench_memory(transport: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """Client-side memory held per open session (tracemalloc, Python heap only)."""
+    result = BenchmarkResult("memory", transport, count=options.sessions)
+    async with stub_servers(transport, ["math"], options) as configs:
+        connections = [ServerConnection(configs["math"]) for _ in range(options.sessions)]
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            started = time.perf_counter()
+            await start_connections(connections)
+            result.startup_ms = (time.perf_counter() - started) * 1000
+            gc.collect()
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            await asyncio.gather(*(c.close() for c in connections))
+    result.memory_per_session_kb = (after - before) / options.sessions / 1024
+    return result
+
+
+async def bench_openai_client(transport: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """``OpenAIMCPClient.chat`` against the math server."""
+    llm = _fake_llm(options)
+    async with stub_servers(transport, ["math"], options) as configs:
+        client = OpenAIMCPClient(server_config=configs["math"], openai_client=llm)
+        return await _run_chat_scenario(
+            "openai_client", transport, options, llm, client, lambda: client.chat("Compute.")
+        )
+
+
+async def bench_multi_client(transport: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """``MultiServerClient.chat`` across the math and text servers."""
+    llm = _fake_llm(options)
+    async with stub_servers(transport, ["math", "text"], options) as configs:
+        client = MultiServerClient(MCPConfig(servers=configs), openai_client=llm)
+        return await _run_chat_scenario(
+            "multi_client", transport, options, llm, client, lambda: client.chat("Compute.")
+        )
+
+
+async def bench_multi_stream(transport: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """``MultiServerClient.chat_stream``, drained to the final event."""
+    llm = _fake_llm(options)
+    async with stub_servers(transport, ["math", "text"], options) as configs:
+        client = MultiServerClient(MCPConfig(servers=configs), openai_client=llm)
+
+        async def request() -> None:
+            async for _ in client.chat_stream("Compute."):
+                pass
+
+        return await _run_chat_scenario("multi_stream", transport, options, llm, client, request)
+
+
+async def bench_agent(transport: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """``BaseAgent.run`` limited to the math server, on a shared MultiServerClient."""
+
+    class MathAgent(BaseAgent):
+        server_names = ["math"]
+
+    llm = _fake_llm(options)
+    async with stub_servers(transport, ["math", "text"], options) as configs:
+        client = MultiServerClient(MCPConfig(servers=configs), openai_client=llm)
+
+        async def request() -> None:
+            await MathAgent(client, llm).run("Compute.")
+
+        return await _run_chat_scenario("agent", transport, options, llm, client, request)
+
+
+SCENARIOS: dict[str, Callable[[str, BenchmarkOptions], Awaitable[BenchmarkResult]]] = {
+    "startup": bench_startup,
+    "memory": bench_memory,
+    "openai_client": bench_openai_client,
+    "multi_client": bench_multi_client,
+    "multi_stream": bench_multi_stream,
+    "agent": bench_agent,
+}
+
+
+def _fake_llm(options: BenchmarkOptions) -> FakeOpenAI:
+    return FakeOpenAI(
+        tool_rounds=options.tool_rounds,
+        calls_per_round=options.calls_per_round,
+        latency=options.llm_latency_ms / 1000,
+    )
+
+
+async def _run_chat_scenario(
+    scenario: str,
+    transport: str,
+    options: BenchmarkOptions,
+    llm: FakeOpenAI,
+    client: OpenAIMCPClient | MultiServerClient,
+    request: Callable[[], Awaitable[object]],
+) -> BenchmarkResult:
+    """Connect ``client``, run ``options.requests`` requests and collect timings."""
+    result = BenchmarkResult(scenario, transport)
+    async with AsyncExitStack() as stack:
+        started = time.perf_counter()
+        await stack.enter_async_context(client)
+        result.startup_ms = (time.perf_counter() - started) * 1000
+
+        await request()  # warm-up: first-call imports and schema conversion
+        llm.usage.tool_calls = 0
+
+        samples, wall = await _run_concurrently(request, options.requests, options.concurrency)
+        _fill_latency(result, samples)
+        result.tool_calls_per_sec = llm.usage.tool_calls / wall if wall else 0.0
+    return result
+
+
+async def _run_concurrently(
+    request: Callable[[], Awaitable[object]], total: int, concurrency: int
+) -> tuple[list[float], float]:
+    """Run ``total`` requests with ``concurrency`` workers; return latencies and wall time."""
+    samples: list[float] = []
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await request()
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return samples, time.perf_counter() - started
+
+
+def _fill_latency(result: BenchmarkResult, samples: list[float]) -> None:
+    result.count = len(samples)
+    result.p50_ms = percentile(samples, 50) * 1000
+    result.p99_ms = percentile(samples, 99) * 1000
+    result.mean_ms = sum(samples) / len(samples) * 1000 if samples else 0.0
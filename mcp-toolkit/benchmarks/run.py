@@ -0,0 +1,96 @@
+"""
+Run the benchmark suite and print a results table.
+
+Usage (from the mcp-toolkit directory):
+    python -m benchmarks.run
+    python -m benchmarks.run --transports stdio --scenarios multi_client agent
+    python -m benchmarks.run --requests 500 --concurrency 16 --json results.json
+
+Compare two runs by saving ``--json`` output before and after a change.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+
+from benchmarks.harness import SCENARIOS, TRANSPORTS, BenchmarkOptions, BenchmarkResult
+
+# (result field, header, width, decimals); decimals=None for text columns
+COLUMNS = [
+    ("scenario", "scenario", 14, None),
+    ("transport", "transport", 16, None),
+    ("count", "count", 6, 0),
+    ("p50_ms", "p50 ms", 9, 2),
+    ("p99_ms", "p99 ms", 9, 2),
+    ("tool_calls_per_sec", "tools/s", 10, 1),
+    ("startup_ms", "startup ms", 11, 1),
+    ("memory_per_session_kb", "KiB/session", 12, 1),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = BenchmarkOptions()
+    parser = argparse.ArgumentParser(description="Benchmark the MCP Toolkit tool-calling loop.")
+    parser.add_argument("--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS))
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=defaults.requests)
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser.add_argument("--tool-rounds", type=int, default=defaults.tool_rounds)
+    parser.add_argument("--calls-per-round", type=int, default=defaults.calls_per_round)
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Fake model delay per response, in ms")
+    parser.add_argument("--tool-latency", type=float, default=0.0, help="Stub tool delay per call, in ms")
+    parser.add_argument("--sessions", type=int, default=defaults.sessions)
+    parser.add_argument("--json", metavar="PATH", help="Also write results to a JSON file")
+    return parser.parse_args()
+
+
+def format_row(result: BenchmarkResult | None = None) -> str:
+    """One table row for ``result``, or the header row if ``result`` is None."""
+    cells = []
+    for field_name, header, width, decimals in COLUMNS:
+        if result is None:
+            cells.append(f"{header:<{width}}" if decimals is None else f"{header:>{width}}")
+        elif decimals is None:
+            cells.append(f"{getattr(result, field_name):<{width}}")
+        else:
+            cells.append(f"{getattr(result, field_name):>{width}.{decimals}f}")
+    return "  ".join(cells)
+
+
+async def run(args: argparse.Namespace) -> list[BenchmarkResult]:
+    options = BenchmarkOptions(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        tool_rounds=args.tool_rounds,
+        calls_per_round=args.calls_per_round,
+        llm_latency_ms=args.llm_latency,
+        tool_latency_ms=args.tool_latency,
+        sessions=args.sessions,
+    )
+    print(format_row())
+    results = []
+    for transport in args.transports:
+        for scenario in args.scenarios:
+            result = await SCENARIOS[scenario](transport, options)
+            results.append(result)
+            print(format_row(result), flush=True)
+    return results
+
+
+def main() -> None:
+    # The MCP SDK logs every request at INFO, which swamps the table
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    results = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+        print(f"\nWrote {len(results)} results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
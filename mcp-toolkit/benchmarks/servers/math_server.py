@@ -0,0 +1,59 @@
+"""
+Math stub server for benchmarks.
+
+Deterministic, network-free tools. Runs over any transport so the harness
+can compare stdio, SSE and streamable HTTP against the same tool code.
+
+Run standalone:
+    python math_server.py                                   # stdio
+    python math_server.py --transport sse --port 8101       # http://127.0.0.1:8101/sse
+    python math_server.py --transport streamable-http --port 8101  # .../mcp
+
+``--latency`` adds a fixed delay (milliseconds) to every tool call to model
+an upstream API.
+"""
+
+import argparse
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+parser.add_argument("--transport", default="stdio", choices=["stdio", "sse", "streamable-http"])
+parser.add_argument("--port", type=int, default=8101)
+parser.add_argument("--latency", type=float, default=0.0, help="Delay per tool call in ms")
+options = parser.parse_args()
+
+mcp = FastMCP("math", host="127.0.0.1", port=options.port, log_level="WARNING")
+
+
+async def _simulate_latency() -> None:
+    if options.latency:
+        await asyncio.sleep(options.latency / 1000)
+
+
+@mcp.tool()
+async def add(a: float, b: float) -> str:
+    """Add two numbers together."""
+    await _simulate_latency()
+    return str(a + b)
+
+
+@mcp.tool()
+async def multiply(a: float, b: float) -> str:
+    """Multiply two numbers together."""
+    await _simulate_latency()
+    return str(a * b)
+
+
+@mcp.tool()
+async def divide(a: float, b: float) -> str:
+    """Divide a by b. Returns an error message if b is zero."""
+    await _simulate_latency()
+    if b == 0:
+        return "Error: division by zero"
+    return str(a / b)
+
+
+if __name__ == "__main__":
+    mcp.run(transport=options.transport)
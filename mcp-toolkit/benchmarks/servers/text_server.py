@@ -0,0 +1,50 @@
+"""
+Text stub server for benchmarks.
+
+The second server in multi-server benchmarks; its tool names do not overlap
+with ``math_server.py``. Accepts the same ``--transport``, ``--port`` and
+``--latency`` options.
+"""
+
+import argparse
+import asyncio
+
+from mcp.server.fastmcp import FastMCP
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+parser.add_argument("--transport", default="stdio", choices=["stdio", "sse", "streamable-http"])
+parser.add_argument("--port", type=int, default=8102)
+parser.add_argument("--latency", type=float, default=0.0, help="Delay per tool call in ms")
+options = parser.parse_args()
+
+mcp = FastMCP("text", host="127.0.0.1", port=options.port, log_level="WARNING")
+
+
+async def _simulate_latency() -> None:
+    if options.latency:
+        await asyncio.sleep(options.latency / 1000)
+
+
+@mcp.tool()
+async def echo(message: str) -> str:
+    """Echo a message back unchanged."""
+    await _simulate_latency()
+    return message
+
+
+@mcp.tool()
+async def word_count(text: str) -> str:
+    """Count the words in a piece of text."""
+    await _simulate_latency()
+    return str(len(text.split()))
+
+
+@mcp.tool()
+async def reverse(text: str) -> str:
+    """Reverse a piece of text."""
+    await _simulate_latency()
+    return text[::-1]
+
+
+if __name__ == "__main__":
+    mcp.run(transport=options.transport)
@@ -1,7 +1,8 @@
 """Base agent for VoyageAI specialized agents.
 
 Thin wrapper around mcp_toolkit.agents.BaseAgent that wires in the
-app-configured OpenAI model so subclasses don't need to repeat it.
+app-configured OpenAI model and context budget so subclasses don't need
+to repeat them.
 """
 
 from openai import AsyncOpenAI
@@ -9,7 +10,7 @@ from openai import AsyncOpenAI
 from mcp_toolkit.agents import BaseAgent as _ToolkitBaseAgent
 from mcp_toolkit.clients.multi import MultiServerClient
 
-from app.config import OPENAI_MODEL
+from app.config import AGENT_CONTEXT_TOKENS, OPENAI_MODEL
 
 
 class BaseAgent(_ToolkitBaseAgent):
@@ -17,6 +18,8 @@ class BaseAgent(_ToolkitBaseAgent):
 
     Extends mcp_toolkit.agents.BaseAgent with the app's configured model
     so all specialist agents share the same model without repeating it.
+    Search results (Tavily especially) are long, so each run's prompt is
+    kept under AGENT_CONTEXT_TOKENS by shortening older tool results.
 
     Subclass usage::
 
@@ -25,5 +28,7 @@ class BaseAgent(_ToolkitBaseAgent):
             system_prompt = "You are a weather specialist."
     """
 
+    max_context_tokens = AGENT_CONTEXT_TOKENS
+
     def __init__(self, mcp_client: MultiServerClient, openai_client: AsyncOpenAI):
         super().__init__(mcp_client, openai_client, model=OPENAI_MODEL)
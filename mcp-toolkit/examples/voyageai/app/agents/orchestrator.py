@@ -13,17 +13,32 @@ Architecture:
 
 import asyncio
 from contextlib import AsyncExitStack
+from typing import AsyncIterator
+
 from openai import AsyncOpenAI
 
+from mcp_toolkit.cache import ToolResultCache
 from mcp_toolkit.clients.multi import MultiServerClient
-
-from app.config import OPENAI_API_KEY, OPENAI_MODEL, get_mcp_config
+from mcp_toolkit.deadline import deadline, time_left
+from mcp_toolkit.output import ToolOutputStore
+
+from app.config import (
+    AGENT_TIMEOUT,
+    MCP_CONFIG_PATH,
+    MCP_IDLE_TIMEOUT,
+    OPENAI_API_KEY,
+    OPENAI_MODEL,
+    TOOL_SNAPSHOT_PATH,
+    get_mcp_config,
+)
 from app.agents.base import BaseAgent
 from app.agents.weather import WeatherAgent
 from app.agents.flight import FlightAgent
 from app.agents.hotel import HotelAgent
 from app.agents.currency import CurrencyAgent
 
+AGENT_ORDER = ("weather", "flights", "hotels", "currency")
+
 PLANNER_PROMPT = """\
 You are VoyageAI, an expert travel planner. You've received research from
 specialist agents. Synthesize their findings into a clear, well-organized
@@ -46,6 +61,12 @@ Use markdown with these sections:
 Be specific and practical. If some research is missing, note it briefly and continue.
 """
 
+SUMMARY_PROMPT = """You keep a running summary of a conversation between a traveller and VoyageAI,
+a travel planner. Update the summary with the new messages. Keep destinations,
+dates, travellers, budget, preferences, decisions made and open questions; drop
+research details that were only background. Reply with the summary alone, in
+at most 200 words."""
+
 
 class TravelOrchestrator:
     """Orchestrates travel planning with parallel specialist agents."""
@@ -60,8 +81,32 @@ class TravelOrchestrator:
         """Connect to all MCP servers and set up specialist agents."""
         self._exit_stack = AsyncExitStack()
         config = get_mcp_config()
-        client = MultiServerClient(config, api_key=OPENAI_API_KEY)
+        # Tools with a cache_ttl in mcp_servers.json are answered from this
+        # cache when the same arguments come up again within the TTL, and
+        # identical calls already in flight (several agents or users asking
+        # about the same city) share one upstream call.
+        # Servers start on their first tool call (plan() often skips flights
+        # and currency entirely) and stop again after MCP_IDLE_TIMEOUT; their
+        # tool lists come from the snapshot left by the previous run.
+        # Results over a tool's max_output_chars reach the agents cut to
+        # their beginning and end; the full text stays in a temporary
+        # directory the agents can page through with read_tool_output.
+        outputs = ToolOutputStore()
+        self._exit_stack.callback(outputs.close)
+        client = MultiServerClient(
+            config,
+            api_key=OPENAI_API_KEY,
+            result_cache=ToolResultCache(maxsize=1024),
+            lazy=True,
+            idle_timeout=MCP_IDLE_TIMEOUT,
+            tool_snapshot=TOOL_SNAPSHOT_PATH,
+            output_store=outputs,
+        )
         self._mcp_client = await self._exit_stack.enter_async_context(client)
+        # Edits to mcp_servers.json take effect without a restart: only added
+        # or changed servers (re)connect, and agents see the new tools on
+        # their next request.
+        self._mcp_client.watch_config(MCP_CONFIG_PATH, loader=lambda _: get_mcp_config())
         self._openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
         # Create specialist agents (all share the same MCP + OpenAI clients)
@@ -81,39 +126,93 @@ class TravelOrchestrator:
 
     async def chat(self, user_message: str, history: list[dict] = None) -> str:
         """Process a user message using all specialist agents in parallel."""
-        if not self._mcp_client or not self._openai:
-            raise RuntimeError("Orchestrator not initialized.")
+        self._require_ready()
 
         # Run all agents in parallel — each agent's system_prompt focuses it on its domain
-        tasks = {name: user_message for name in ("weather", "flights", "hotels", "currency")}
+        tasks = {name: user_message for name in AGENT_ORDER}
         results = await self._run_agents(tasks)
 
         return await self._synthesize(user_message, results, history)
 
-    async def _run_agents(self, tasks: dict) -> dict[str, str]:
-        """Run specialist agents in parallel for the given tasks."""
-        async def _run_one(name: str, query: str) -> tuple[str, str]:
-            try:
-                result = await self._agents[name].run(query)
-                return name, result
-            except Exception as e:
-                return name, f"Error: {e}"
-
-        # Build coroutines for non-null tasks
+    async def chat_stream(
+        self, user_message: str, history: list[dict] = None
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Streaming variant of chat().
+
+        Yields ``(event, data)`` pairs:
+            ("agent", {"name", "content"}) — as soon as each specialist finishes
+            ("token", {"text"})            — planner synthesis deltas
+            ("done",  {"response"})        — the complete final response
+        """
+        self._require_ready()
+        tasks = {name: user_message for name in AGENT_ORDER}
+
+        results: dict[str, str] = {}
+        async for name, result in self._iter_agents(tasks):
+            results[name] = result
+            yield "agent", {"name": name, "content": result}
+
+        messages = self._chat_messages(user_message, _in_agent_order(results), history)
+        parts: list[str] = []
+        async for text in self._stream_completion(messages):
+            parts.append(text)
+            yield "token", {"text": text}
+        yield "done", {"response": "".join(parts)}
+
+    def _require_ready(self) -> None:
+        if not self._mcp_client or not self._openai:
+            raise RuntimeError("Orchestrator not initialized.")
+
+    async def _run_agent(self, name: str, query: str) -> tuple[str, str]:
+        """Run one specialist agent, turning failures into an error string.
+
+        The agent is cancelled if it is still running at the request
+        deadline; its tool calls already stop there on their own.
+        """
+        try:
+            result = await asyncio.wait_for(self._agents[name].run(query), time_left())
+            return name, result
+        except asyncio.TimeoutError:
+            return name, f"Error: no answer within {AGENT_TIMEOUT:g}s"
+        except Exception as e:
+            return name, f"Error: {e}"
+
+    def _agent_coros(self, tasks: dict) -> list:
+        """Build coroutines for the non-empty tasks of known agents."""
         coros = []
-        for name in ("weather", "flights", "hotels", "currency"):
+        for name in AGENT_ORDER:
             query = tasks.get(name)
             if query and name in self._agents:
-                coros.append(_run_one(name, query))
+                coros.append(self._run_agent(name, query))
+        return coros
 
-        # Run in parallel
-        pairs = await asyncio.gather(*coros)
+    async def _run_agents(self, tasks: dict) -> dict[str, str]:
+        """Run specialist agents in parallel for the given tasks.
+
+        All of them share one deadline of ``AGENT_TIMEOUT`` seconds, which
+        their tool calls inherit.
+        """
+        with deadline(AGENT_TIMEOUT):
+            pairs = await asyncio.gather(*self._agent_coros(tasks))
         return {name: result for name, result in pairs}
 
-    async def _synthesize(
+    async def _iter_agents(self, tasks: dict) -> AsyncIterator[tuple[str, str]]:
+        """Run specialist agents in parallel, yielding each result as it completes."""
+        # Tasks copy the context when created, so they keep the deadline
+        with deadline(AGENT_TIMEOUT):
+            pending = [asyncio.ensure_future(c) for c in self._agent_coros(tasks)]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            # The client may disconnect mid-stream; don't leave agents running
+            for task in pending:
+                task.cancel()
+
+    def _chat_messages(
         self, user_message: str, results: dict[str, str], history: list[dict] = None
-    ) -> str:
-        """Combine agent results into a final travel plan."""
+    ) -> list[dict]:
+        """Build the planner prompt for a chat message."""
         # Build research summary
         research_parts = []
         for name, result in results.items():
@@ -133,13 +232,35 @@ class TravelOrchestrator:
                 "Please synthesize this into a helpful travel plan."
             ),
         })
+        return messages
 
+    async def _synthesize(
+        self, user_message: str, results: dict[str, str], history: list[dict] = None
+    ) -> str:
+        """Combine agent results into a final travel plan."""
         response = await self._openai.chat.completions.create(
             model=OPENAI_MODEL,
-            messages=messages,
+            messages=self._chat_messages(user_message, results, history),
         )
+        self._mcp_client.metrics.llm_request("openai", OPENAI_MODEL, response.usage)
         return response.choices[0].message.content or ""
 
+    async def _stream_completion(self, messages: list[dict]) -> AsyncIterator[str]:
+        """Stream the planner's response as text deltas."""
+        stream = await self._openai.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        usage = None
+        async with stream:
+            async for chunk in stream:
+                usage = chunk.usage or usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        self._mcp_client.metrics.llm_request("openai", OPENAI_MODEL, usage)
+
     async def plan(self, trip: dict) -> dict:
         """Plan a trip from structured input. Deterministically selects agents.
 
@@ -157,13 +278,23 @@ class TravelOrchestrator:
         Returns:
             Dict: agents_called (list), results (per-agent markdown), summary (str)
         """
+        results = await self._run_agents(self._plan_tasks(trip))
+        summary = await self._synthesize_plan(trip, results)
+
+        return {
+            "agents_called": list(results.keys()),
+            "results": results,
+            "summary": summary,
+        }
+
+    def _plan_tasks(self, trip: dict) -> dict[str, str]:
+        """Build a targeted task for each agent the trip form calls for."""
         destination = trip.get("destination", "").strip()
         origin = trip.get("origin", "").strip()
         departure_date = trip.get("departure_date", "").strip()
         return_date = trip.get("return_date", "").strip()
         home_currency = trip.get("home_currency", "").strip()
 
-        # Build targeted task strings
         tasks: dict[str, str] = {
             "weather": (
                 f"Get current weather and forecast for {destination}"
@@ -189,18 +320,35 @@ class TravelOrchestrator:
                 f"used in {destination}. Show converted amounts for 50, 100, 500, "
                 f"and 1000 {home_currency}."
             )
+        return tasks
 
-        results = await self._run_agents(tasks)
-        summary = await self._synthesize_plan(trip, results)
+    async def plan_stream(self, trip: dict) -> AsyncIterator[tuple[str, dict]]:
+        """Streaming variant of plan().
 
-        return {
+        Yields ``(event, data)`` pairs:
+            ("agent", {"name", "content"}) — as soon as each specialist finishes
+            ("token", {"text"})            — itinerary synthesis deltas
+            ("done",  {"agents_called", "results", "summary"})
+        """
+        self._require_ready()
+        results: dict[str, str] = {}
+        async for name, result in self._iter_agents(self._plan_tasks(trip)):
+            results[name] = result
+            yield "agent", {"name": name, "content": result}
+
+        results = _in_agent_order(results)
+        parts: list[str] = []
+        async for text in self._stream_completion(self._plan_messages(trip, results)):
+            parts.append(text)
+            yield "token", {"text": text}
+        yield "done", {
             "agents_called": list(results.keys()),
             "results": results,
-            "summary": summary,
+            "summary": "".join(parts),
         }
 
-    async def _synthesize_plan(self, trip: dict, results: dict) -> str:
-        """Combine structured agent results into a travel itinerary."""
+    def _plan_messages(self, trip: dict, results: dict) -> list[dict]:
+        """Build the itinerary prompt for a structured trip."""
         destination = trip.get("destination", "")
         origin = trip.get("origin", "")
         departure_date = trip.get("departure_date", "")
@@ -218,17 +366,52 @@ class TravelOrchestrator:
             for name, content in results.items()
         )
 
+        return [
+            {"role": "system", "content": PLAN_PROMPT},
+            {
+                "role": "user",
+                "content": f"Trip: {trip_desc}{dates}\n\nAgent research:\n\n{research}",
+            },
+        ]
+
+    async def _synthesize_plan(self, trip: dict, results: dict) -> str:
+        """Combine structured agent results into a travel itinerary."""
+        response = await self._openai.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=self._plan_messages(trip, results),
+        )
+        self._mcp_client.metrics.llm_request("openai", OPENAI_MODEL, response.usage)
+        return response.choices[0].message.content or ""
+
+    async def summarize_history(self, summary: str, messages: list[dict]) -> str:
+        """Fold messages into a conversation's rolling summary (see app.history).
+
+        Raises:
+            RuntimeError: If the model returned no summary, so the messages
+                are not marked as summarized.
+        """
+        self._require_ready()
+        transcript = "\n\n".join(f"{m['role'].upper()}: {m['content']}" for m in messages)
         response = await self._openai.chat.completions.create(
             model=OPENAI_MODEL,
             messages=[
-                {"role": "system", "content": PLAN_PROMPT},
+                {"role": "system", "content": SUMMARY_PROMPT},
                 {
                     "role": "user",
-                    "content": f"Trip: {trip_desc}{dates}\n\nAgent research:\n\n{research}",
+                    "content": (
+                        f"Current summary:\n{summary or '(none yet)'}\n\n"
+                        f"New messages:\n\n{transcript}"
+                    ),
                 },
             ],
         )
-        return response.choices[0].message.content or ""
-
+        self._mcp_client.metrics.llm_request("openai", OPENAI_MODEL, response.usage)
+        content = response.choices[0].message.content
+        if not content:
+            raise RuntimeError("the model returned an empty summary")
+        return content
 
 
+def _in_agent_order(results: dict[str, str]) -> dict[str, str]:
+    """Reorder results collected in completion order into the fixed agent order."""
+    return {name: results[name] for name in AGENT_ORDER if name in results}
@@ -31,6 +31,28 @@ OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
 # MCP server config path
 MCP_CONFIG_PATH = Path(__file__).parent / "mcp_servers.json"
 
+# Remembered tool lists, so servers can start on first use (see orchestrator)
+TOOL_SNAPSHOT_PATH = PROJECT_ROOT / "data" / "tool_snapshot.json"
+
+# Seconds an unused MCP server stays running before it is shut down
+MCP_IDLE_TIMEOUT = float(os.environ.get("MCP_IDLE_TIMEOUT", "300"))
+
+# Seconds the specialist agents get per request, tool calls included
+AGENT_TIMEOUT = float(os.environ.get("AGENT_TIMEOUT", "60"))
+
+# Estimated prompt tokens each specialist agent run is kept under; older
+# tool results are shortened once a run gets close
+AGENT_CONTEXT_TOKENS = int(os.environ.get("AGENT_CONTEXT_TOKENS", "12000"))
+
+# Messages of a session sent verbatim to the planner; older ones are folded
+# into a rolling summary (see app.history)
+HISTORY_WINDOW = int(os.environ.get("HISTORY_WINDOW", "6"))
+
+# Tracing (see mcp_toolkit.tracing): a JSON-lines file and/or an OTLP/HTTP
+# collector URL such as http://localhost:4318/v1/traces. Off when unset.
+TRACE_FILE = os.environ.get("TRACE_FILE", "")
+OTLP_ENDPOINT = os.environ.get("OTLP_ENDPOINT", "")
+
 # Python executable (for spawning server subprocesses)
 PYTHON_PATH = sys.executable
 
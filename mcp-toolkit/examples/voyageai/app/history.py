@@ -0,0 +1,113 @@
+"""Bounded conversation history for the planner.
+
+Sending a whole session to the planner on every message makes long
+conversations slower and dearer each turn. HistoryManager sends only the
+last few messages verbatim, preceded by a rolling summary of everything
+older. The summary lives in SQLite next to the messages (see
+SessionStore.load_summary) and is refreshed incrementally after each
+turn: only messages that have left the window since the last refresh are
+folded into it, so each refresh costs one small LLM call. If refreshes keep
+failing, messages beyond twice the window are left out of the prompt, and a
+warning says how many.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from app.state import SessionStore
+
+logger = logging.getLogger(__name__)
+
+# (current summary, messages to fold in) -> updated summary
+Summarizer = Callable[[str, list[dict]], Awaitable[str]]
+
+
+class HistoryManager:
+    """Sliding window of recent messages plus a rolling summary, per session."""
+
+    def __init__(
+        self,
+        store: SessionStore,
+        summarize: Summarizer,
+        *,
+        window: int = 6,
+        batch: int = 20,
+    ):
+        """Initialize the manager.
+
+        Args:
+            store: Where messages and summaries are kept.
+            summarize: Coroutine function that folds messages into a summary.
+            window: Most recent messages sent verbatim.
+            batch: Most messages folded into the summary per LLM call, for
+                sessions with a long backlog (e.g. from before summaries).
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self._store = store
+        self._summarize = summarize
+        self.window = window
+        self.batch = batch
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def context(self, session_id: str) -> list[dict]:
+        """History to send with the next message of a session.
+
+        Messages the summary does not cover yet are sent verbatim, up to
+        twice the window, so a refresh that is still running (or failed)
+        loses nothing recent. Older ones beyond that are dropped with a
+        warning until a refresh catches up.
+        """
+        summary, through_id = self._store.load_summary(session_id)
+        limit = 2 * self.window
+        recent = self._store.load_messages_after(session_id, through_id, limit=limit)
+        if len(recent) == limit:
+            pending = self._store.count_messages_after(session_id, through_id)
+            if pending > limit:
+                logger.warning(
+                    "Session %s: %d messages are neither summarized nor in the window; "
+                    "leaving them out of the prompt",
+                    session_id, pending - limit,
+                )
+        messages = [{"role": m["role"], "content": m["content"]} for m in recent]
+        if summary:
+            messages.insert(0, {
+                "role": "system",
+                "content": f"Summary of the earlier conversation:\n{summary}",
+            })
+        return messages
+
+    def schedule_refresh(self, session_id: str) -> None:
+        """Refresh a session's summary in the background, unless already refreshing."""
+        task = self._refreshing.get(session_id)
+        if task is not None and not task.done():
+            return  # the running refresh re-reads the session until it is caught up
+        task = asyncio.create_task(self.refresh(session_id), name=f"history-refresh-{session_id}")
+        self._refreshing[session_id] = task
+        task.add_done_callback(lambda done: self._forget(session_id, done))
+
+    def _forget(self, session_id: str, task: asyncio.Task) -> None:
+        if self._refreshing.get(session_id) is task:
+            del self._refreshing[session_id]
+
+    async def refresh(self, session_id: str) -> None:
+        """Fold messages that have left the window into the session's summary."""
+        while True:
+            summary, through_id = self._store.load_summary(session_id)
+            pending = self._store.load_messages_after(session_id, through_id)
+            older = pending[:-self.window][:self.batch]
+            if not older:
+                return
+            try:
+                summary = await self._summarize(summary, older)
+            except Exception as e:
+                logger.warning("Could not refresh the summary of session %s: %s", session_id, e)
+                return
+            if not self._store.session_exists(session_id):
+                return  # deleted while summarizing
+            self._store.save_summary(session_id, summary, older[-1]["id"])
+
+    async def close(self) -> None:
+        """Wait for running refreshes to finish."""
+        await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
@@ -17,19 +17,31 @@ Production (single server):
     cd .. && uvicorn app.main:app
 """
 
+import json
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import AsyncIterator
 
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.config import PROJECT_ROOT, validate_config
+from mcp_toolkit.limiter import flow
+from mcp_toolkit.metrics import CONTENT_TYPE
+from mcp_toolkit.tracing import JsonLinesExporter, OTLPExporter, Tracer, set_tracer, span
+
+from app.config import HISTORY_WINDOW, OTLP_ENDPOINT, PROJECT_ROOT, TRACE_FILE, validate_config
 from app.agents.orchestrator import TravelOrchestrator
+from app.history import HistoryManager
 from app.state import SessionStore
 
 # Global instances
 orchestrator = TravelOrchestrator()
 session_store = SessionStore()
+# The planner sees the last HISTORY_WINDOW messages plus a summary of the rest
+history_manager = HistoryManager(
+    session_store, orchestrator.summarize_history, window=HISTORY_WINDOW
+)
 
 # React build output — populated by `cd frontend && npm run build`
 FRONTEND_DIST = PROJECT_ROOT / "frontend" / "dist"
@@ -39,15 +51,33 @@ FRONTEND_DIST = PROJECT_ROOT / "frontend" / "dist"
 async def lifespan(app: FastAPI):
     """Initialize MCP connections on startup, close on shutdown."""
     validate_config()
+    tracer = _start_tracing()
     await orchestrator.initialize()
     print(f"VoyageAI ready — connected to servers: {orchestrator._mcp_client.server_names}")
     print(f"Available tools: {orchestrator._mcp_client.tool_names}")
     yield
+    await history_manager.close()
     await orchestrator.close()
     session_store.close()
+    if tracer is not None:
+        tracer.shutdown()
     print("VoyageAI shut down.")
 
 
+def _start_tracing() -> Tracer | None:
+    """Install a tracer if TRACE_FILE or OTLP_ENDPOINT is set."""
+    exporters = []
+    if TRACE_FILE:
+        exporters.append(JsonLinesExporter(TRACE_FILE))
+    if OTLP_ENDPOINT:
+        exporters.append(OTLPExporter(OTLP_ENDPOINT, service_name="voyageai"))
+    if not exporters:
+        return None
+    tracer = Tracer(*exporters)
+    set_tracer(tracer)
+    return tracer
+
+
 app = FastAPI(
     title="VoyageAI",
     description="AI Travel Planner powered by MCP",
@@ -100,13 +130,17 @@ async def chat(request: Request) -> JSONResponse:
     if not session_id:
         session_id = session_store.create_session()
 
-    history = session_store.load_history(session_id)
+    history = history_manager.context(session_id)
 
     try:
-        response = await orchestrator.chat(user_message, history)
+        # Tool calls queue per session on busy servers, so one heavy user
+        # cannot starve the rest
+        with flow(session_id), span("chat", session=session_id):
+            response = await orchestrator.chat(user_message, history)
         # Persist both messages
         session_store.save_message(session_id, "user", user_message)
         session_store.save_message(session_id, "assistant", response)
+        history_manager.schedule_refresh(session_id)
         return JSONResponse({"response": response, "session_id": session_id})
     except Exception as e:
         return JSONResponse(
@@ -115,6 +149,46 @@ async def chat(request: Request) -> JSONResponse:
         )
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: Request):
+    """Streaming variant of /chat using Server-Sent Events.
+
+    Request body: same as /chat.
+    Events:
+        session — {"session_id"} (always first)
+        agent   — {"name", "content"} as each specialist agent finishes
+        token   — {"text"} deltas of the planner's response
+        done    — {"response"}
+        error   — {"error"}
+    """
+    body = await request.json()
+    user_message = body.get("message", "").strip()
+    session_id = body.get("session_id", "")
+
+    if not user_message:
+        return JSONResponse({"response": "Please enter a message."}, status_code=400)
+
+    if not session_id:
+        session_id = session_store.create_session()
+
+    history = history_manager.context(session_id)
+
+    async def events() -> AsyncIterator[str]:
+        yield _sse("session", {"session_id": session_id})
+        try:
+            with flow(session_id), span("chat", session=session_id):
+                async for event, data in orchestrator.chat_stream(user_message, history):
+                    if event == "done":
+                        session_store.save_message(session_id, "user", user_message)
+                        session_store.save_message(session_id, "assistant", data["response"])
+                        history_manager.schedule_refresh(session_id)
+                    yield _sse(event, data)
+        except Exception as e:
+            yield _sse("error", {"error": f"Sorry, something went wrong: {e}"})
+
+    return _sse_response(events())
+
+
 @app.post("/plan")
 async def plan_trip(request: Request) -> JSONResponse:
     """Plan a trip from structured form input.
@@ -140,22 +214,81 @@ async def plan_trip(request: Request) -> JSONResponse:
         session_id = session_store.create_session()
 
     try:
-        result = await orchestrator.plan(body)
+        with flow(session_id):
+            result = await orchestrator.plan(body)
 
         # Save to session so the sidebar shows meaningful trip titles
-        origin = body.get("origin", "").strip()
-        departure_date = body.get("departure_date", "").strip()
-        label = f"{origin} → {destination}" if origin else destination
-        if departure_date:
-            label += f"  ·  {departure_date}"
-        session_store.save_message(session_id, "user", f"Trip: {label}")
+        session_store.save_message(session_id, "user", f"Trip: {_trip_label(body)}")
         session_store.save_message(session_id, "assistant", result["summary"])
+        history_manager.schedule_refresh(session_id)
 
         return JSONResponse({**result, "session_id": session_id})
     except Exception as e:
         return JSONResponse({"error": str(e), "session_id": session_id}, status_code=500)
 
 
+@app.post("/plan/stream")
+async def plan_trip_stream(request: Request):
+    """Streaming variant of /plan using Server-Sent Events.
+
+    Request body: same as /plan.
+    Events:
+        session — {"session_id"} (always first)
+        agent   — {"name", "content"} as each specialist agent finishes
+        token   — {"text"} deltas of the itinerary
+        done    — {"agents_called", "results", "summary"}
+        error   — {"error"}
+    """
+    body = await request.json()
+    destination = body.get("destination", "").strip()
+    if not destination:
+        return JSONResponse({"error": "destination is required"}, status_code=400)
+
+    session_id = body.get("session_id", "").strip()
+    if not session_id:
+        session_id = session_store.create_session()
+
+    async def events() -> AsyncIterator[str]:
+        yield _sse("session", {"session_id": session_id})
+        try:
+            with flow(session_id):
+                async for event, data in orchestrator.plan_stream(body):
+                    if event == "done":
+                        session_store.save_message(session_id, "user", f"Trip: {_trip_label(body)}")
+                        session_store.save_message(session_id, "assistant", data["summary"])
+                        history_manager.schedule_refresh(session_id)
+                    yield _sse(event, data)
+        except Exception as e:
+            yield _sse("error", {"error": str(e)})
+
+    return _sse_response(events())
+
+
+def _trip_label(body: dict) -> str:
+    """Sidebar title for a planned trip, e.g. "London → Tokyo  ·  2025-07-01"."""
+    destination = body.get("destination", "").strip()
+    origin = body.get("origin", "").strip()
+    departure_date = body.get("departure_date", "").strip()
+    label = f"{origin} → {destination}" if origin else destination
+    if departure_date:
+        label += f"  ·  {departure_date}"
+    return label
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        # Stop proxies (nginx, Render) from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/sessions")
 async def list_sessions() -> JSONResponse:
     """List all conversation sessions."""
@@ -180,11 +313,37 @@ async def delete_session(session_id: str) -> JSONResponse:
 
 @app.get("/health")
 async def health() -> JSONResponse:
-    """Health check endpoint. Returns 503 if MCP servers are not connected."""
+    """Health check endpoint. Returns 503 if MCP servers are not connected.
+
+    Also reports per-server load and latency (calls in flight and queued,
+    error rate, p95 latency, restarts) and LLM token usage so far.
+    """
     connected = orchestrator._mcp_client is not None
     payload = {
         "status": "ok" if connected else "not_ready",
         "servers": orchestrator._mcp_client.server_names if connected else [],
         "tools": orchestrator._mcp_client.tool_names if connected else [],
     }
+    cache = orchestrator._mcp_client.result_cache if connected else None
+    if cache is not None:
+        payload["tool_cache"] = asdict(cache.stats())
+    if connected:
+        payload["queues"] = {
+            name: {**asdict(stats), "mean_wait": stats.mean_wait}
+            for name, stats in orchestrator._mcp_client.queue_stats.items()
+        }
+        stats = orchestrator._mcp_client.stats()
+        payload["load"] = {
+            name: {**asdict(server), "error_rate": server.error_rate}
+            for name, server in stats.servers.items()
+        }
+        payload["llm"] = {name: asdict(usage) for name, usage in stats.llm.items()}
     return JSONResponse(payload, status_code=200 if connected else 503)
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus metrics: tool latency and errors, LLM tokens, queues, restarts."""
+    if orchestrator._mcp_client is None:
+        return Response("", status_code=503, media_type=CONTENT_TYPE)
+    return Response(orchestrator._mcp_client.metrics.render(), media_type=CONTENT_TYPE)
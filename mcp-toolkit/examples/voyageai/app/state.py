@@ -45,6 +45,20 @@ class SessionStore:
                 FOREIGN KEY (session_id) REFERENCES sessions(id)
             )
         """)
+        # Rolling summary of each session's older messages (see app.history);
+        # through_id is the last message folded into it
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                session_id TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                through_id INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                FOREIGN KEY (session_id) REFERENCES sessions(id)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS messages_by_session ON messages (session_id, id)"
+        )
         self._conn.commit()
 
     def create_session(self) -> str:
@@ -106,6 +120,63 @@ class SessionStore:
         ).fetchall()
         return [{"role": row[0], "content": row[1]} for row in rows]
 
+    def load_messages_after(
+        self, session_id: str, after_id: int = 0, limit: int | None = None
+    ) -> list[dict]:
+        """Load the messages of a session newer than a given message.
+
+        Args:
+            session_id: The session to load.
+            after_id: Only messages with a larger id are returned.
+            limit: Return only the newest ``limit`` of them.
+
+        Returns:
+            List of message dicts with 'id', 'role' and 'content', oldest first.
+        """
+        rows = self._conn.execute(
+            "SELECT id, role, content FROM messages WHERE session_id = ? AND id > ? "
+            "ORDER BY id DESC LIMIT ?",
+            (session_id, after_id, -1 if limit is None else limit),
+        ).fetchall()
+        return [{"id": row[0], "role": row[1], "content": row[2]} for row in reversed(rows)]
+
+    def count_messages_after(self, session_id: str, after_id: int = 0) -> int:
+        """Count the messages of a session newer than a given message."""
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM messages WHERE session_id = ? AND id > ?",
+            (session_id, after_id),
+        ).fetchone()
+        return row[0]
+
+    def load_summary(self, session_id: str) -> tuple[str, int]:
+        """Load the rolling summary of a session.
+
+        Returns:
+            The summary text and the id of the last message it covers
+            (``("", 0)`` if nothing has been summarized yet).
+        """
+        row = self._conn.execute(
+            "SELECT summary, through_id FROM summaries WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return (row[0], row[1]) if row else ("", 0)
+
+    def save_summary(self, session_id: str, summary: str, through_id: int) -> None:
+        """Replace the rolling summary of a session.
+
+        Args:
+            session_id: The session to update.
+            summary: Summary of every message up to ``through_id``.
+            through_id: Id of the last message the summary covers.
+        """
+        now = datetime.utcnow().isoformat()
+        self._conn.execute(
+            "INSERT INTO summaries (session_id, summary, through_id, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET summary = excluded.summary, "
+            "through_id = excluded.through_id, updated_at = excluded.updated_at",
+            (session_id, summary, through_id, now),
+        )
+        self._conn.commit()
+
     def session_exists(self, session_id: str) -> bool:
         """Check if a session exists in the store.
 
@@ -135,8 +206,9 @@ class SessionStore:
         ]
 
     def delete_session(self, session_id: str) -> None:
-        """Delete a session and its messages."""
+        """Delete a session, its messages and its summary."""
         self._conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        self._conn.execute("DELETE FROM summaries WHERE session_id = ?", (session_id,))
         self._conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
         self._conn.commit()
 
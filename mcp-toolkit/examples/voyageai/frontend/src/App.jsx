@@ -1,15 +1,14 @@
 import { useState } from 'react'
 import TripForm from './components/TripForm'
-import AgentCard from './components/AgentCard'
 import ResultsView from './components/ResultsView'
-
-const ALL_AGENTS = ['weather', 'flights', 'hotels', 'currency']
+import { readEvents } from './sse'
 
 export default function App() {
-  const [screen, setScreen] = useState('form')   // 'form' | 'loading' | 'results'
+  const [screen, setScreen] = useState('form')   // 'form' | 'results'
   const [sessionId, setSessionId] = useState(null)
   const [tripForm, setTripForm] = useState(null)  // submitted form data
-  const [planData, setPlanData] = useState(null)  // API response
+  const [planData, setPlanData] = useState(null)  // API response (filled in as it streams)
+  const [streaming, setStreaming] = useState(false)
 
   function startNewTrip() {
     setSessionId(null)
@@ -19,38 +18,47 @@ export default function App() {
   }
 
   async function handlePlan(form) {
+    // Agents the backend will run, based on which fields were filled in
+    const expected = [
+      'weather',
+      ...(form.origin?.trim() ? ['flights'] : []),
+      'hotels',
+      ...(form.home_currency ? ['currency'] : []),
+    ]
     setTripForm(form)
-    setPlanData(null)
-    setScreen('loading')
+    setPlanData({ agents_called: expected, results: {}, summary: '' })
+    setStreaming(true)
+    setScreen('results')
 
     try {
-      const resp = await fetch('/plan', {
+      const resp = await fetch('/plan/stream', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ ...form, session_id: sessionId || '' }),
       })
-      const data = await resp.json()
-      if (!resp.ok) throw new Error(data.error || 'Planning failed')
+      if (!resp.ok) {
+        const data = await resp.json()
+        throw new Error(data.error || 'Planning failed')
+      }
 
-      if (data.session_id) setSessionId(data.session_id)
-      setPlanData(data)
-      setScreen('results')
+      // Agent cards fill in as each agent finishes; the itinerary streams in after
+      await readEvents(resp, (event, data) => {
+        if (event === 'session') setSessionId(data.session_id)
+        else if (event === 'agent') {
+          setPlanData(prev => ({ ...prev, results: { ...prev.results, [data.name]: data.content } }))
+        } else if (event === 'token') {
+          setPlanData(prev => ({ ...prev, summary: prev.summary + data.text }))
+        } else if (event === 'done') setPlanData(data)
+        else if (event === 'error') throw new Error(data.error)
+      })
     } catch (err) {
       alert(`Error: ${err.message}`)
       setScreen('form')
+    } finally {
+      setStreaming(false)
     }
   }
 
-  // Which agents are expected during loading (based on submitted form)
-  const loadingAgents = tripForm
-    ? new Set([
-        'weather',
-        'hotels',
-        ...(tripForm.origin?.trim() ? ['flights'] : []),
-        ...(tripForm.home_currency ? ['currency'] : []),
-      ])
-    : new Set()
-
   return (
     <div className="app-layout">
       <main className="main-area">
@@ -58,30 +66,11 @@ export default function App() {
           <TripForm onSubmit={handlePlan} loading={false} />
         )}
 
-        {screen === 'loading' && (
-          <div className="loading-page">
-            <div className="loading-header">
-              <h2>Planning your trip...</h2>
-              <p>{loadingAgents.size} agents running in parallel via MCP</p>
-            </div>
-            <div className="agent-grid">
-              {ALL_AGENTS.map(name => (
-                <AgentCard
-                  key={name}
-                  name={name}
-                  content={null}
-                  isLoading={loadingAgents.has(name)}
-                  isSkipped={!loadingAgents.has(name)}
-                />
-              ))}
-            </div>
-          </div>
-        )}
-
         {screen === 'results' && planData && (
           <ResultsView
             trip={tripForm}
             data={planData}
+            streaming={streaming}
             onPlanAnother={startNewTrip}
           />
         )}
@@ -4,7 +4,7 @@ import AgentCard from './AgentCard'
 
 const ALL_AGENTS = ['weather', 'flights', 'hotels', 'currency']
 
-export default function ResultsView({ trip, data, onPlanAnother }) {
+export default function ResultsView({ trip, data, streaming = false, onPlanAnother }) {
   const { agents_called = [], results = {}, summary = '' } = data
   const calledSet = new Set(agents_called)
 
@@ -23,7 +23,7 @@ export default function ResultsView({ trip, data, onPlanAnother }) {
         <div>
           <h2 className="results-title">✈️ {parts.join('  ·  ')}</h2>
           <p className="results-meta">
-            {agents_called.length} agents ran in parallel via MCP
+            {agents_called.length} agents {streaming ? 'running' : 'ran'} in parallel via MCP
           </p>
         </div>
         <button className="new-plan-btn" onClick={onPlanAnother}>
@@ -37,17 +37,18 @@ export default function ResultsView({ trip, data, onPlanAnother }) {
             key={name}
             name={name}
             content={results[name] || null}
-            isLoading={false}
+            isLoading={streaming && calledSet.has(name) && !results[name]}
             isSkipped={!calledSet.has(name)}
           />
         ))}
       </div>
 
-      {summary && (
+      {(summary || (streaming && agents_called.every(name => results[name]))) && (
         <div className="summary-card">
           <div className="summary-header">
             <span>📋</span>
             <h3>Trip Itinerary</h3>
+            {streaming && <span className="agent-spinner" />}
           </div>
           <div className="card-markdown summary-body">
             <ReactMarkdown remarkPlugins={[remarkGfm]}>{summary}</ReactMarkdown>
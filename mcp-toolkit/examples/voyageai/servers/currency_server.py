@@ -16,12 +16,14 @@ Usage:
 """
 
 import os
-import httpx
 from mcp.server.fastmcp import FastMCP
 
+from mcp_toolkit.server import http_get, http_lifespan
+
 server = FastMCP(
     "VoyageAI Currency",
     instructions="Real-time currency conversion and travel budget tools",
+    lifespan=http_lifespan,
 )
 
 EXCHANGE_RATE_BASE = "https://v6.exchangerate-api.com/v6"
@@ -51,12 +53,10 @@ async def get_exchange_rate(from_currency: str, to_currency: str) -> str:
     from_code = from_currency.upper().strip()
     to_code = to_currency.upper().strip()
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(
-            f"{EXCHANGE_RATE_BASE}/{api_key}/pair/{from_code}/{to_code}"
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await http_get(
+        f"{EXCHANGE_RATE_BASE}/{api_key}/pair/{from_code}/{to_code}"
+    )
+    data = resp.json()
 
     if data.get("result") != "success":
         return f"Error: Could not get rate for {from_code} → {to_code}. Check currency codes."
@@ -86,12 +86,10 @@ async def convert_currency(
     from_code = from_currency.upper().strip()
     to_code = to_currency.upper().strip()
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(
-            f"{EXCHANGE_RATE_BASE}/{api_key}/pair/{from_code}/{to_code}/{amount}"
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await http_get(
+        f"{EXCHANGE_RATE_BASE}/{api_key}/pair/{from_code}/{to_code}/{amount}"
+    )
+    data = resp.json()
 
     if data.get("result") != "success":
         return f"Error: Conversion failed for {amount} {from_code} → {to_code}."
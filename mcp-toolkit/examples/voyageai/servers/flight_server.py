@@ -12,12 +12,14 @@ Usage:
 """
 
 import os
-import httpx
 from mcp.server.fastmcp import FastMCP
 
+from mcp_toolkit.server import http_get, http_lifespan
+
 server = FastMCP(
     "VoyageAI Flights",
     instructions="Flight search and airport info powered by AviationStack API",
+    lifespan=http_lifespan,
 )
 
 AVIATIONSTACK_BASE = "http://api.aviationstack.com/v1"  # free tier: HTTP only
@@ -45,18 +47,17 @@ async def search_flights(departure_iata: str, arrival_iata: str) -> str:
     """
     api_key = _get_api_key()
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            f"{AVIATIONSTACK_BASE}/flights",
-            params={
-                "access_key": api_key,
-                "dep_iata": departure_iata.upper(),
-                "arr_iata": arrival_iata.upper(),
-                "limit": 5,
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await http_get(
+        f"{AVIATIONSTACK_BASE}/flights",
+        params={
+            "access_key": api_key,
+            "dep_iata": departure_iata.upper(),
+            "arr_iata": arrival_iata.upper(),
+            "limit": 5,
+        },
+        timeout=15,
+    )
+    data = resp.json()
 
     if "error" in data:
         return f"Error: {data['error'].get('message', 'Unknown error')}"
@@ -94,16 +95,15 @@ async def get_airport_info(iata_code: str) -> str:
     """
     api_key = _get_api_key()
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            f"{AVIATIONSTACK_BASE}/airports",
-            params={
-                "access_key": api_key,
-                "iata_code": iata_code.upper(),
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await http_get(
+        f"{AVIATIONSTACK_BASE}/airports",
+        params={
+            "access_key": api_key,
+            "iata_code": iata_code.upper(),
+        },
+        timeout=15,
+    )
+    data = resp.json()
 
     if "error" in data:
         return f"Error: {data['error'].get('message', 'Unknown error')}"
@@ -16,12 +16,14 @@ Usage:
 """
 
 import os
-import httpx
 from mcp.server.fastmcp import FastMCP
 
+from mcp_toolkit.server import http_get, http_lifespan
+
 server = FastMCP(
     "VoyageAI Weather",
     instructions="Weather data and travel packing suggestions powered by OpenWeather API",
+    lifespan=http_lifespan,
 )
 
 OPENWEATHER_BASE = "https://api.openweathermap.org/data/2.5"
@@ -50,13 +52,11 @@ async def get_current_weather(city: str, country_code: str = "") -> str:
     api_key = _get_api_key()
     query = f"{city},{country_code}" if country_code else city
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(
-            f"{OPENWEATHER_BASE}/weather",
-            params={"q": query, "appid": api_key, "units": "metric"},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await http_get(
+        f"{OPENWEATHER_BASE}/weather",
+        params={"q": query, "appid": api_key, "units": "metric"},
+    )
+    data = resp.json()
 
     weather = data["weather"][0]
     main = data["main"]
@@ -88,13 +88,11 @@ async def get_forecast(city: str, days: int = 5, country_code: str = "") -> str:
     query = f"{city},{country_code}" if country_code else city
     days = max(1, min(days, 5))
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(
-            f"{OPENWEATHER_BASE}/forecast",
-            params={"q": query, "appid": api_key, "units": "metric", "cnt": days * 8},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await http_get(
+        f"{OPENWEATHER_BASE}/forecast",
+        params={"q": query, "appid": api_key, "units": "metric", "cnt": days * 8},
+    )
+    data = resp.json()
 
     # Group by day (API returns 3-hour intervals)
     daily: dict[str, list] = {}
@@ -0,0 +1,135 @@
+"""Tests for the planner's bounded conversation history"""
+
+import asyncio
+import logging
+
+import pytest
+
+from app.history import HistoryManager
+from app.state import SessionStore
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(tmp_path / "sessions.db")
+
+
+class StubSummarizer:
+    """Joins message contents onto the summary; fails while ``broken`` is set."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.broken = False
+
+    async def __call__(self, summary: str, messages: list[dict]) -> str:
+        self.calls.append([m["content"] for m in messages])
+        if self.broken:
+            raise RuntimeError("no model")
+        return " ".join(filter(None, [summary, *(m["content"] for m in messages)]))
+
+
+def add_messages(store: SessionStore, session_id: str, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        store.save_message(session_id, "user" if i % 2 == 0 else "assistant", f"m{i}")
+
+
+class TestContext:
+    def test_short_session_is_sent_verbatim(self, store):
+        session = store.create_session()
+        add_messages(store, session, 3)
+        history = HistoryManager(store, StubSummarizer(), window=2)
+        assert history.context(session) == [
+            {"role": "user", "content": "m0"},
+            {"role": "assistant", "content": "m1"},
+            {"role": "user", "content": "m2"},
+        ]
+
+    @pytest.mark.anyio
+    async def test_summary_precedes_the_window(self, store):
+        session = store.create_session()
+        add_messages(store, session, 6)
+        history = HistoryManager(store, StubSummarizer(), window=2)
+        await history.refresh(session)
+
+        messages = history.context(session)
+        assert messages[0] == {
+            "role": "system",
+            "content": "Summary of the earlier conversation:\nm0 m1 m2 m3",
+        }
+        assert [m["content"] for m in messages[1:]] == ["m4", "m5"]
+
+    def test_warns_when_unsummarized_messages_are_dropped(self, store, caplog):
+        session = store.create_session()
+        add_messages(store, session, 7)
+        history = HistoryManager(store, StubSummarizer(), window=2)
+        with caplog.at_level(logging.WARNING, logger="app.history"):
+            messages = history.context(session)
+        assert [m["content"] for m in messages] == ["m3", "m4", "m5", "m6"]
+        assert "3 messages are neither summarized nor in the window" in caplog.text
+
+
+class TestRefresh:
+    @pytest.mark.anyio
+    async def test_backlog_is_folded_in_batches(self, store):
+        session = store.create_session()
+        add_messages(store, session, 9)
+        summarize = StubSummarizer()
+        history = HistoryManager(store, summarize, window=2, batch=3)
+        await history.refresh(session)
+
+        assert summarize.calls == [["m0", "m1", "m2"], ["m3", "m4", "m5"], ["m6"]]
+        summary, through_id = store.load_summary(session)
+        assert summary == "m0 m1 m2 m3 m4 m5 m6"
+        assert [m["content"] for m in store.load_messages_after(session, through_id)] == ["m7", "m8"]
+
+        # Caught up: nothing left to fold in
+        await history.refresh(session)
+        assert len(summarize.calls) == 3
+
+    @pytest.mark.anyio
+    async def test_failure_keeps_the_old_summary(self, store, caplog):
+        session = store.create_session()
+        add_messages(store, session, 4)
+        summarize = StubSummarizer()
+        history = HistoryManager(store, summarize, window=2)
+        await history.refresh(session)
+
+        add_messages(store, session, 2, start=4)
+        summarize.broken = True
+        with caplog.at_level(logging.WARNING, logger="app.history"):
+            await history.refresh(session)
+        assert "Could not refresh the summary" in caplog.text
+        assert store.load_summary(session)[0] == "m0 m1"
+        # The messages that were not folded in are still sent verbatim
+        assert [m["content"] for m in history.context(session)[1:]] == ["m2", "m3", "m4", "m5"]
+
+        summarize.broken = False
+        await history.refresh(session)
+        assert store.load_summary(session)[0] == "m0 m1 m2 m3"
+
+    @pytest.mark.anyio
+    async def test_scheduled_refreshes_do_not_overlap(self, store):
+        session = store.create_session()
+        add_messages(store, session, 4)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow(summary, messages):
+            started.set()
+            await release.wait()
+            return "summary"
+
+        history = HistoryManager(store, slow, window=2)
+        history.schedule_refresh(session)
+        await started.wait()
+        history.schedule_refresh(session)
+        assert len(history._refreshing) == 1
+
+        release.set()
+        await history.close()
+        assert store.load_summary(session)[0] == "summary"
@@ -8,6 +8,7 @@ Quick start:
 """
 
 from mcp_toolkit.converters import (
+    ToolSchemaCache,
     clean_schema,
     mcp_to_anthropic,
     mcp_to_gemini,
@@ -16,7 +17,20 @@ from mcp_toolkit.converters import (
     mcp_to_openai_completions,
     mcp_to_openai_responses,
 )
-from mcp_toolkit.config import MCPConfig, MCPServerConfig, load_config, load_config_from_dict
+from mcp_toolkit.cache import CacheStats, ToolResultCache
+from mcp_toolkit.config import (
+    ConfigDiff,
+    MCPConfig,
+    MCPServerConfig,
+    RestartPolicy,
+    ToolPolicy,
+    diff_configs,
+    load_config,
+    load_config_from_dict,
+)
+from mcp_toolkit.limiter import LimiterStats, ServerLimiter, ServerOverloadedError
+from mcp_toolkit.registry import RegisteredTool, ToolRegistry
+from mcp_toolkit.snapshot import ToolSnapshot
 from mcp_toolkit.transports import connect
 from mcp_toolkit.agents import BaseAgent
 
@@ -29,14 +43,29 @@ __all__ = [
     "mcp_to_openai_completions",
     "mcp_to_gemini",
     "mcp_to_anthropic",
+    "ToolSchemaCache",
     # Backward-compat aliases
     "mcp_to_openai",
     "mcp_to_openai_chat",
     # Config
     "MCPConfig",
     "MCPServerConfig",
+    "ToolPolicy",
+    "RestartPolicy",
     "load_config",
     "load_config_from_dict",
+    "ConfigDiff",
+    "diff_configs",
+    # Routing
+    "ToolRegistry",
+    "RegisteredTool",
+    "ToolSnapshot",
+    "ServerLimiter",
+    "LimiterStats",
+    "ServerOverloadedError",
+    # Caching
+    "ToolResultCache",
+    "CacheStats",
     # Transport
     "connect",
     # Agents
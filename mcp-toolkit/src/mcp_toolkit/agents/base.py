@@ -32,14 +32,16 @@ Typical usage:
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 if TYPE_CHECKING:
     from openai import AsyncOpenAI
     from mcp_toolkit.clients.multi import MultiServerClient
 
-from mcp_toolkit.converters import mcp_to_openai_completions
+from mcp_toolkit.budget import ContextBudget, TokenUsage
+from mcp_toolkit.clients.base import StreamEvent, ToolCall, _parse_arguments
+from mcp_toolkit.clients.openai import _stream_chat_completions
+from mcp_toolkit.tracing import span
 
 
 class BaseAgent:
@@ -58,6 +60,13 @@ class BaseAgent:
             Must match keys defined in your ``mcp_servers.json`` config.
         max_tool_rounds: Maximum tool-calling iterations before forcing a
             final response. Guards against infinite loops.
+        max_context_tokens: Estimated prompt size to keep each run under.
+            Once a run nears it, the results of older tool rounds are
+            shortened (see :class:`~mcp_toolkit.budget.ContextBudget`).
+            ``None`` (the default) never shortens them.
+        summarize_tool_results: Shorten old tool results by having the
+            agent's model summarize them, instead of keeping only their
+            beginning and end. Costs one extra LLM request per result.
 
     Example — single-server specialist agent::
 
@@ -75,6 +84,8 @@ class BaseAgent:
     system_prompt: str = "You are a helpful assistant with access to tools."
     server_names: list[str] = []
     max_tool_rounds: int = 10
+    max_context_tokens: int | None = None
+    summarize_tool_results: bool = False
 
     def __init__(
         self,
@@ -94,30 +105,93 @@ class BaseAgent:
         self._openai = openai_client
         self.model = model
         self._tools: list[dict[str, Any]] = []
+        self._registry = None
         self._setup_tools()
 
     def _setup_tools(self) -> None:
         """Build the filtered tool list for this agent's servers.
 
-        Filters ``mcp_client.all_tools`` to only the tools belonging to
-        ``server_names``. If ``server_names`` is empty, all tools are used.
+        Takes each of ``server_names``' tools straight from the client's
+        tool registry. If ``server_names`` is empty, all tools are used.
+        ``read_tool_output`` is added when the client has an output store.
+        Runs again whenever the client swaps in a new registry (e.g. after
+        a config reload).
         """
+        registry = self._registry = self._mcp.registry
         if not self.server_names:
-            raw_tools = self._mcp.all_tools
+            raw_tools = list(registry.tools)
         else:
-            tool_names: set[str] = set()
-            for server in self.server_names:
-                tool_names.update(self._mcp.get_tools_by_server(server))
-            raw_tools = [t for t in self._mcp.all_tools if t.name in tool_names]
+            raw_tools = [tool for server in self.server_names for tool in registry.tools_for(server)]
+        if self._mcp.output_store is not None:
+            raw_tools.append(self._mcp.output_store.tool)
 
-        self._tools = mcp_to_openai_completions(raw_tools)
+        # Reuse payloads already converted for the client or sibling agents
+        self._tools = [self._mcp.tool_schemas.get(t) for t in raw_tools]
+
+    def _current_tools(self) -> list[dict[str, Any]]:
+        """The agent's tool payloads, rebuilt if the client's registry changed."""
+        if self._mcp.registry is not self._registry:
+            self._setup_tools()
+        return self._tools
+
+    @property
+    def flow(self) -> str:
+        """Flow this agent's tool calls queue under on busy servers.
+
+        Defaults to the class name, so agents of different kinds take turns
+        on a shared server. Override it to queue per instance instead.
+        """
+        return type(self).__name__
 
     @property
     def tool_names(self) -> list[str]:
         """Names of tools available to this agent."""
-        return [t["function"]["name"] for t in self._tools]
+        return [t["function"]["name"] for t in self._current_tools()]
 
-    async def run(self, query: str, history: list[dict[str, Any]] | None = None) -> str:
+    def _build_messages(
+        self, query: str, history: list[dict[str, Any]] | None
+    ) -> list[dict[str, Any]]:
+        """Assemble the system prompt, optional history and the query."""
+        messages: list[dict[str, Any]] = [
+            {"role": "system", "content": self.system_prompt}
+        ]
+        if history:
+            messages.extend(history)
+        messages.append({"role": "user", "content": query})
+        return messages
+
+    def _context_budget(self, usage: TokenUsage | None) -> ContextBudget:
+        """A fresh budget for one run (see ``max_context_tokens``)."""
+        return ContextBudget(
+            self.max_context_tokens,
+            summarize=self._summarize if self.summarize_tool_results else None,
+            usage=usage,
+        )
+
+    async def _summarize(self, text: str) -> str:
+        """Condense an old tool result with the agent's model."""
+        with span("llm.request", provider="openai", model=self.model, purpose="summarize"):
+            response = await self._openai.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "Summarize this tool output in at most 120 words. Keep every "
+                        "name, number, date and price the user might still need.",
+                    },
+                    {"role": "user", "content": text},
+                ],
+            )
+        self._mcp.metrics.llm_request("openai", self.model, getattr(response, "usage", None))
+        return response.choices[0].message.content or ""
+
+    async def run(
+        self,
+        query: str,
+        history: list[dict[str, Any]] | None = None,
+        *,
+        usage: TokenUsage | None = None,
+    ) -> str:
         """Run the agent on a query, calling tools as many times as needed.
 
         The agent sends the query to the LLM, executes any requested tool
@@ -129,6 +203,8 @@ class BaseAgent:
             history: Optional prior conversation messages to include for
                 context. Each item should be a ``{"role": ..., "content": ...}``
                 dict.
+            usage: If given, the tokens this run uses (as reported by the
+                provider) are added to it.
 
         Returns:
             The agent's final text response after all tool calls complete.
@@ -137,50 +213,93 @@ class BaseAgent:
             RuntimeError: If ``max_tool_rounds`` is exceeded (the agent is
                 stuck in a tool-call loop).
         """
-        messages: list[dict[str, Any]] = [
-            {"role": "system", "content": self.system_prompt}
-        ]
-        if history:
-            messages.extend(history)
-        messages.append({"role": "user", "content": query})
-
-        for _ in range(self.max_tool_rounds):
-            response = await self._openai.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=self._tools if self._tools else None,
-            )
-
-            msg = response.choices[0].message
-
-            # No tool calls → model is done
-            if not msg.tool_calls:
-                return msg.content or ""
-
-            # Append the assistant's tool-calling turn to history
-            messages.append(msg.model_dump())
-
-            # Execute each tool call and append the results
-            for tc in msg.tool_calls:
-                try:
-                    args = json.loads(tc.function.arguments)
-                except json.JSONDecodeError:
-                    args = {}
-
-                try:
-                    result = await self._mcp.call_tool(tc.function.name, args)
-                except Exception as e:
-                    result = f"Error calling {tc.function.name}: {e}"
+        with span("agent.run", agent=type(self).__name__, model=self.model):
+            messages = self._build_messages(query, history)
+            tools = self._current_tools()
+            metrics = self._mcp.metrics
+            budget = self._context_budget(usage)
+
+            for rounds in range(1, self.max_tool_rounds + 1):
+                await budget.fit(messages)
+                with span("llm.request", provider="openai", model=self.model):
+                    response = await self._openai.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        tools=tools if tools else None,
+                    )
+                metrics.llm_request("openai", self.model, getattr(response, "usage", None))
+                budget.record(getattr(response, "usage", None), messages)
+
+                msg = response.choices[0].message
+
+                # No tool calls → model is done
+                if not msg.tool_calls:
+                    metrics.chat_finished(type(self).__name__, rounds)
+                    return msg.content or ""
+
+                # Append the assistant's tool-calling turn to history
+                messages.append(msg.model_dump())
+
+                # Execute the tool calls concurrently (through the client's shared
+                # dispatcher, so its concurrency limits span all agents) and append
+                # the results in request order
+                results = await self._mcp.dispatcher.dispatch([
+                    ToolCall(tc.id, tc.function.name, _parse_arguments(tc.function.arguments))
+                    for tc in msg.tool_calls
+                ], flow=self.flow)
+                for r in results:
+                    messages.append({
+                        "role": "tool",
+                        "tool_call_id": r.call.id,
+                        "content": r.content if r.ok else f"Error calling {r.call.name}: {r.error}",
+                    })
+
+            # Max rounds reached — ask for a final answer without tools
+            await budget.fit(messages)
+            with span("llm.request", provider="openai", model=self.model):
+                final = await self._openai.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                )
+            metrics.llm_request("openai", self.model, getattr(final, "usage", None))
+            budget.record(getattr(final, "usage", None), messages)
+            metrics.chat_finished(type(self).__name__, self.max_tool_rounds + 1)
+            return final.choices[0].message.content or ""
+
+    async def chat_stream(
+        self,
+        query: str,
+        history: list[dict[str, Any]] | None = None,
+        *,
+        usage: TokenUsage | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Streaming counterpart of :meth:`run`.
+
+        Yields text deltas as the model produces them and tool call events
+        as tools start and finish, so callers can show progress long before
+        the final answer is complete. After ``max_tool_rounds`` rounds one
+        last request is made without tools, as in :meth:`run`.
 
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": result,
-                })
+        Args:
+            query: The question or task for this agent.
+            history: Optional prior conversation messages.
+            usage: As for :meth:`run`.
 
-        # Max rounds reached — ask for a final answer without tools
-        final = await self._openai.chat.completions.create(
+        Yields:
+            :class:`~mcp_toolkit.clients.base.StreamEvent` objects, ending
+            with a ``"done"`` event whose ``text`` is the full answer.
+        """
+        async for event in _stream_chat_completions(
+            self._openai,
+            self._mcp.dispatcher,
+            messages=self._build_messages(query, history),
+            tools=self._current_tools(),
+            format_error=lambda r: f"Error calling {r.call.name}: {r.error}",
+            max_rounds=self.max_tool_rounds,
+            flow=self.flow,
+            metrics=self._mcp.metrics,
+            agent=type(self).__name__,
+            budget=self._context_budget(usage),
             model=self.model,
-            messages=messages,
-        )
-        return final.choices[0].message.content or ""
+        ):
+            yield event
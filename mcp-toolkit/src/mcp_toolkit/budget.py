@@ -0,0 +1,261 @@
+"""
+Context Budget
+
+Keeps the prompt of a tool-calling conversation under a token limit. Every
+round appends the model's tool calls and their full results to the
+messages, so a long loop sends an ever larger prompt — slower and dearer
+each round. A :class:`ContextBudget` estimates the prompt size before each
+request and, once it nears the limit, shortens the oldest tool results
+(keeping their beginning and end, or replacing them with a summary) until
+it fits again. The results of the latest round are never touched.
+
+Estimates start from a character count (about four characters per token)
+and are corrected by the prompt tokens the provider reports for each
+request, so they also cover the system prompt and tool schemas.
+
+The budget also adds up the tokens reported across the conversation, in
+:attr:`ContextBudget.usage`.
+
+Works on the message formats of every client: OpenAI Chat Completions
+(``{"role": "tool"}`` messages), Anthropic (``tool_result`` blocks) and
+Gemini (``function_response`` parts).
+
+Example:
+    >>> budget = ContextBudget(8000)
+    >>> while True:
+    ...     await budget.fit(messages)
+    ...     response = await openai.chat.completions.create(messages=messages, ...)
+    ...     budget.record(response.usage, messages)
+    ...     ...
+    >>> budget.usage
+    TokenUsage(requests=4, input_tokens=21490, output_tokens=312)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from mcp_toolkit.metrics import token_counts
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenUsage:
+    """Tokens used by the LLM requests of one conversation.
+
+    Attributes:
+        requests: Requests made.
+        input_tokens: Prompt tokens, as reported by the provider.
+        output_tokens: Completion tokens, as reported by the provider.
+    """
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+    def add(self, usage: Any) -> None:
+        """Count one request and the usage object of its response (OpenAI, Anthropic or Gemini)."""
+        input_tokens, output_tokens = token_counts(usage)
+        self.requests += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+
+class ContextBudget:
+    """Estimated-token budget for one conversation's prompt."""
+
+    def __init__(
+        self,
+        max_tokens: int | None,
+        *,
+        threshold: float = 0.8,
+        keep_recent: int = 1,
+        shortened_tokens: int = 200,
+        summarize: Callable[[str], Awaitable[str]] | None = None,
+        chars_per_token: float = 4.0,
+        usage: TokenUsage | None = None,
+    ):
+        """Initialize the budget.
+
+        Args:
+            max_tokens: Prompt size to stay under. ``None`` only counts
+                usage and never changes the messages.
+            threshold: Shorten old tool results once the estimate passes
+                this share of ``max_tokens``.
+            keep_recent: Tool rounds, counted from the latest, whose results
+                are never shortened.
+            shortened_tokens: Size a shortened result is cut down to.
+            summarize: Coroutine function that condenses a tool result, e.g.
+                with a cheap model. Without it (or if it fails) results are
+                cut to their beginning and end.
+            chars_per_token: Characters per token for estimates.
+            usage: Where to add up the tokens used, e.g. one shared by
+                several conversations. Defaults to a new :class:`TokenUsage`.
+        """
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError(f"max_tokens must be at least 1, got {max_tokens}")
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.max_tokens = max_tokens
+        self.threshold = threshold
+        self.keep_recent = keep_recent
+        self.shortened_tokens = shortened_tokens
+        self.summarize = summarize
+        self.chars_per_token = chars_per_token
+        self.usage = usage if usage is not None else TokenUsage()
+        self.shortened = 0
+        # (messages that were sent, prompt tokens the provider counted for them)
+        self._known: tuple[int, int] | None = None
+
+    def estimate(self, messages: list) -> int:
+        """Estimated prompt tokens for sending ``messages`` now."""
+        if self._known is not None and self._known[0] <= len(messages):
+            sent, tokens = self._known
+            return tokens + self._estimate(messages[sent:])
+        return self._estimate(messages)
+
+    def record(self, usage: Any, messages: list) -> None:
+        """Account for a response to a request that sent ``messages``.
+
+        Call it before appending the response to ``messages``.
+        """
+        self.usage.add(usage)
+        input_tokens, _ = token_counts(usage)
+        if input_tokens:
+            self._known = (len(messages), input_tokens)
+
+    async def fit(self, messages: list) -> int:
+        """Shorten old tool results in place until ``messages`` fit the budget.
+
+        Returns:
+            Estimated tokens saved (0 if nothing needed shortening).
+        """
+        if self.max_tokens is None:
+            return 0
+        limit = int(self.max_tokens * self.threshold)
+        over = self.estimate(messages) - limit
+        if over <= 0:
+            return 0
+
+        turns = _tool_result_turns(messages)
+        old = turns[:-self.keep_recent] if self.keep_recent else turns
+        saved = 0
+        max_chars = int(self.shortened_tokens * self.chars_per_token)
+        for slot in (slot for turn in old for slot in turn):
+            if saved >= over:
+                break
+            text = slot.text
+            if len(text) <= max_chars:
+                continue
+            shorter = await self._shorten(text, max_chars)
+            if len(shorter) >= len(text):
+                continue
+            slot.text = shorter
+            saved += int((len(text) - len(shorter)) / self.chars_per_token)
+            self.shortened += 1
+
+        if saved and self._known is not None:
+            sent, tokens = self._known
+            self._known = (sent, max(tokens - saved, 0))
+        if saved < over:
+            logger.debug("Context is still ~%d tokens over budget after shortening tool results", over - saved)
+        return saved
+
+    async def _shorten(self, text: str, max_chars: int) -> str:
+        if self.summarize is not None:
+            try:
+                summary = await self.summarize(text)
+            except Exception as e:
+                logger.warning("Could not summarize a tool result, truncating it instead: %s", e)
+            else:
+                if summary and len(summary) < len(text):
+                    return f"[Summary of an earlier tool result]\n{summary}"
+        return _head_tail(text, max_chars)
+
+    def _estimate(self, messages: list) -> int:
+        if not messages:
+            return 0
+        return int(len(json.dumps(messages, default=_jsonable)) / self.chars_per_token)
+
+
+class _ToolResultSlot:
+    """Read/write access to the text of one tool result, whatever the message format."""
+
+    def __init__(self, container: dict, key: str):
+        self._container = container
+        self._key = key
+
+    @property
+    def text(self) -> str:
+        return self._container[self._key]
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._container[self._key] = value
+
+
+def _tool_result_turns(messages: list) -> list[list[_ToolResultSlot]]:
+    """The tool results in ``messages``, grouped by the round they answer, oldest first."""
+    turns: list[list[_ToolResultSlot]] = []
+    previous_was_tool = False
+    for message in messages:
+        slots: list[_ToolResultSlot] = []
+        is_tool = False
+        if isinstance(message, dict):
+            content = message.get("content")
+            if message.get("role") == "tool":
+                # OpenAI: one message per result, consecutive within a round
+                is_tool = True
+                if isinstance(content, str):
+                    slots.append(_ToolResultSlot(message, "content"))
+            elif message.get("role") == "user" and isinstance(content, list):
+                # Anthropic: one user turn of tool_result blocks per round
+                slots.extend(
+                    _ToolResultSlot(block, "content")
+                    for block in content
+                    if isinstance(block, dict)
+                    and block.get("type") == "tool_result"
+                    and isinstance(block.get("content"), str)
+                )
+        elif getattr(message, "role", None) == "tool":
+            # Gemini: one tool Content of function_response parts per round
+            for part in message.parts or []:
+                response = part.function_response.response if part.function_response else None
+                if isinstance(response, dict) and isinstance(response.get("result"), str):
+                    slots.append(_ToolResultSlot(response, "result"))
+
+        if slots:
+            if is_tool and previous_was_tool and turns:
+                turns[-1].extend(slots)
+            else:
+                turns.append(slots)
+        previous_was_tool = is_tool
+    return turns
+
+
+def _head_tail(text: str, max_chars: int) -> str:
+    """Keep the beginning and end of ``text`` with a note of how much was cut."""
+    if len(text) <= max_chars:
+        return text
+    keep = max(max_chars - 100, 0)  # leaves room for the note
+    removed = len(text) - keep
+    head = keep * 2 // 3
+    tail = keep - head
+    note = f"\n[... {removed} characters of this earlier tool result were removed to save context ...]\n"
+    return text[:head] + note + (text[-tail:] if tail else "")
+
+
+def _jsonable(value: Any) -> Any:
+    """Fallback for SDK objects in messages (Anthropic content blocks, Gemini Content)."""
+    dump = getattr(value, "model_dump", None)
+    if dump is not None:
+        return dump(exclude_none=True)
+    return str(value)
@@ -0,0 +1,173 @@
+"""
+Tool Result Cache
+
+An in-memory LRU cache for tool results with per-entry expiry, so repeated
+calls with identical arguments (the same city's weather, the same exchange
+rate) are answered without another round trip to the server or its
+upstream API.
+
+Caching is opt-in twice over: a client only consults a cache you pass it,
+and only for tools whose :class:`~mcp_toolkit.config.ToolPolicy` sets a
+``cache_ttl``. Only successful results are stored.
+
+Example:
+    >>> from mcp_toolkit.cache import ToolResultCache
+    >>> cache = ToolResultCache(maxsize=512)
+    >>> client = MultiServerClient(config, result_cache=cache)
+    >>> ...
+    >>> cache.stats()
+    CacheStats(hits=12, misses=4, evictions=0, expirations=1, size=3)
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable
+
+CacheKey = tuple[str, str, str]
+
+
+@dataclass
+class CacheStats:
+    """Counters for a :class:`ToolResultCache`.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to call the tool.
+        evictions: Entries dropped to stay within ``maxsize``.
+        expirations: Entries dropped because their TTL ran out.
+        size: Entries currently held.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 if none yet)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def make_key(server: str, tool: str, arguments: dict[str, Any] | None) -> CacheKey:
+    """Build a cache key from a server, tool name and arguments.
+
+    Arguments are canonicalized (sorted keys, compact separators) so that
+    ``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}`` share an entry.
+    """
+    canonical = json.dumps(
+        arguments or {}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return (server, tool, canonical)
+
+
+class ToolResultCache:
+    """LRU cache of tool results with a TTL per entry.
+
+    Not thread-safe; share one instance between clients running on the same
+    event loop.
+    """
+
+    def __init__(self, maxsize: int = 1024, *, clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of results held. The least recently used
+                entry is evicted first.
+            clock: Monotonic time source (overridable for tests).
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def get(self, key: CacheKey) -> str | None:
+        """Return the cached result for ``key``, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if self._clock() < expires_at:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return value
+            del self._entries[key]
+            self._stats.expirations += 1
+        self._stats.misses += 1
+        return None
+
+    def put(self, key: CacheKey, value: str, ttl: float) -> None:
+        """Store a result for ``ttl`` seconds. A non-positive ``ttl`` is ignored."""
+        if ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    async def get_or_call(
+        self,
+        server: str,
+        tool: str,
+        arguments: dict[str, Any] | None,
+        ttl: float | None,
+        call: Callable[[], Awaitable[tuple[str, bool]]],
+    ) -> str:
+        """Return a cached result or run ``call`` and cache what it returns.
+
+        Args:
+            server: Server that owns the tool.
+            tool: Tool name.
+            arguments: Tool arguments.
+            ttl: Seconds to keep the result. ``None`` or ``0`` bypasses the
+                cache entirely (no lookup, no stats).
+            call: Coroutine function returning ``(text, cacheable)``. Results
+                with ``cacheable=False`` (e.g. tool errors) are passed through
+                but not stored.
+
+        Returns:
+            The tool result as text.
+        """
+        if not ttl:
+            text, _ = await call()
+            return text
+        key = make_key(server, tool, arguments)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        text, cacheable = await call()
+        if cacheable:
+            self.put(key, text, ttl)
+        return text
+
+    def invalidate(self, server: str | None = None, tool: str | None = None) -> int:
+        """Drop entries for a server and/or tool (all entries if neither is given).
+
+        Returns:
+            Number of entries removed.
+        """
+        doomed = [
+            key for key in self._entries
+            if (server is None or key[0] == server) and (tool is None or key[1] == tool)
+        ]
+        for key in doomed:
+            del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        return replace(self._stats, size=len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
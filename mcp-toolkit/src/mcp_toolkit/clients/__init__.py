@@ -8,9 +8,9 @@ Usage:
     >>> from mcp_toolkit.clients import OpenAIMCPClient, GeminiMCPClient
 """
 
-from mcp_toolkit.clients.base import BaseMCPClient
+from mcp_toolkit.clients.base import BaseMCPClient, StreamEvent
 
-__all__ = ["BaseMCPClient"]
+__all__ = ["BaseMCPClient", "StreamEvent"]
 
 # Lazy imports to avoid requiring all provider SDKs at once
 
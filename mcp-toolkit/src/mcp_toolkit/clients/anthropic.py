@@ -8,10 +8,12 @@ Handles the full tool-calling loop automatically.
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import Any, AsyncIterator
 
-from mcp_toolkit.clients.base import BaseMCPClient
-from mcp_toolkit.converters import mcp_to_anthropic
+from mcp_toolkit.budget import ContextBudget
+from mcp_toolkit.clients.base import BaseMCPClient, StreamEvent, ToolCall, ToolCallResult
+from mcp_toolkit.converters import ToolSchemaCache, to_anthropic
+from mcp_toolkit.tracing import end_span, span, start_span
 
 
 class AnthropicMCPClient(BaseMCPClient):
@@ -64,6 +66,7 @@ class AnthropicMCPClient(BaseMCPClient):
             ) from e
 
         self._anthropic = AsyncAnthropic(api_key=resolved_key)
+        self._tool_schemas = ToolSchemaCache(to_anthropic)
 
     async def chat(self, message: str) -> str:
         """Send a message and get a response with automatic tool execution.
@@ -80,21 +83,29 @@ class AnthropicMCPClient(BaseMCPClient):
         Returns:
             The model's final text response.
         """
-        tools = mcp_to_anthropic(self._mcp_tools)
+        tools = self._tool_schemas.convert(self._model_tools())
         messages = [{"role": "user", "content": message}]
 
+        budget = ContextBudget(self.max_context_tokens)
+        rounds = 0
         while True:
-            response = await self._anthropic.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=self.system_prompt,
-                tools=tools,
-                messages=messages,
-                temperature=self.temperature,
-            )
+            await budget.fit(messages)
+            with span("llm.request", provider="anthropic", model=self.model):
+                response = await self._anthropic.messages.create(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    system=self.system_prompt,
+                    tools=tools,
+                    messages=messages,
+                    temperature=self.temperature,
+                )
+            self.metrics.llm_request("anthropic", self.model, response.usage)
+            budget.record(response.usage, messages)
+            rounds += 1
 
             # Check if model wants to use tools
             if response.stop_reason != "tool_use":
+                self.metrics.chat_finished(type(self).__name__, rounds)
                 # Extract final text
                 text_parts = [
                     block.text
@@ -107,27 +118,87 @@ class AnthropicMCPClient(BaseMCPClient):
             assistant_content = response.content
             messages.append({"role": "assistant", "content": assistant_content})
 
-            tool_results = []
-            for block in assistant_content:
-                if block.type != "tool_use":
-                    continue
-
-                tool_name = block.name
-                tool_args = block.input
-
-                try:
-                    result = await self.call_tool(tool_name, tool_args)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": result,
-                    })
-                except Exception as e:
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": f"Error: {e}",
-                        "is_error": True,
-                    })
+            # Run every tool_use block from this turn concurrently
+            results = await self._dispatcher.dispatch(_tool_calls(assistant_content))
 
+            tool_results = [_tool_result_block(r) for r in results]
             messages.append({"role": "user", "content": tool_results})
+
+    async def chat_stream(self, message: str) -> AsyncIterator[StreamEvent]:
+        """Like :meth:`chat`, but streams text deltas and tool call events.
+
+        Args:
+            message: User message.
+
+        Yields:
+            :class:`~mcp_toolkit.clients.base.StreamEvent` objects, ending
+            with a ``"done"`` event.
+        """
+        tools = self._tool_schemas.convert(self._model_tools())
+        messages = [{"role": "user", "content": message}]
+
+        budget = ContextBudget(self.max_context_tokens)
+        rounds = 0
+        while True:
+            await budget.fit(messages)
+            requesting = start_span("llm.request", provider="anthropic", model=self.model)
+            try:
+                async with self._anthropic.messages.stream(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    system=self.system_prompt,
+                    tools=tools,
+                    messages=messages,
+                    temperature=self.temperature,
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield StreamEvent("text", text=text)
+                    response = await stream.get_final_message()
+            except BaseException as e:
+                end_span(requesting, e)
+                raise
+            end_span(requesting)
+            self.metrics.llm_request("anthropic", self.model, response.usage)
+            budget.record(response.usage, messages)
+            rounds += 1
+
+            if response.stop_reason != "tool_use":
+                self.metrics.chat_finished(type(self).__name__, rounds)
+                text_parts = [block.text for block in response.content if block.type == "text"]
+                yield StreamEvent("done", text="\n".join(text_parts))
+                return
+
+            messages.append({"role": "assistant", "content": response.content})
+
+            results: list[ToolCallResult] = []
+            async for event in self._dispatcher.dispatch_stream(
+                _tool_calls(response.content), results
+            ):
+                yield event
+
+            messages.append({"role": "user", "content": [_tool_result_block(r) for r in results]})
+
+
+def _tool_calls(content: list) -> list[ToolCall]:
+    """Extract the tool_use blocks of an assistant turn as tool calls."""
+    return [
+        ToolCall(block.id, block.name, block.input or {})
+        for block in content
+        if block.type == "tool_use"
+    ]
+
+
+def _tool_result_block(result: ToolCallResult) -> dict[str, Any]:
+    """Build the tool_result content block answering one tool call."""
+    if result.ok:
+        return {
+            "type": "tool_result",
+            "tool_use_id": result.call.id,
+            "content": result.content,
+        }
+    return {
+        "type": "tool_result",
+        "tool_use_id": result.call.id,
+        "content": f"Error: {result.error}",
+        "is_error": True,
+    }
@@ -6,16 +6,31 @@ Shared connection management and tool execution logic for all LLM-specific clien
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import time
 from abc import ABC, abstractmethod
-from contextlib import AsyncExitStack
-from typing import Any
+from contextlib import AsyncExitStack, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Literal
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
-from mcp_toolkit.config import MCPServerConfig
-from mcp_toolkit.transports import _detect_command
+from mcp_toolkit.cache import ToolResultCache
+from mcp_toolkit.config import MCPServerConfig, ToolPolicy
+from mcp_toolkit.deadline import call_with_timeout
+from mcp_toolkit.limiter import current_flow
+from mcp_toolkit.metrics import ClientMetrics
+from mcp_toolkit.output import ToolOutputStore, limit_output
+from mcp_toolkit.singleflight import SingleFlight, coalesce_key
+from mcp_toolkit.snapshot import ToolSnapshot
+from mcp_toolkit.tracing import end_span, span, start_span, use_span
+from mcp_toolkit.transports import _detect_command, _initialize, call_tool, server_version
+
+logger = logging.getLogger(__name__)
 
 
 class BaseMCPClient(ABC):
@@ -38,6 +53,13 @@ class BaseMCPClient(ABC):
         command: str | None = None,
         args: list[str] | None = None,
         system_prompt: str = "You are a helpful assistant with access to tools.",
+        max_parallel_tools: int | None = 8,
+        result_cache: ToolResultCache | None = None,
+        tool_policies: dict[str, ToolPolicy] | None = None,
+        tool_snapshot: ToolSnapshot | str | Path | None = None,
+        metrics: ClientMetrics | None = None,
+        max_context_tokens: int | None = None,
+        output_store: ToolOutputStore | None = None,
     ):
         """Initialize the MCP client.
 
@@ -53,6 +75,28 @@ class BaseMCPClient(ABC):
             command: Override the interpreter command.
             args: Override the command arguments.
             system_prompt: System prompt for the LLM.
+            max_parallel_tools: Maximum tool calls from one model turn that
+                run at the same time. ``None`` means no limit.
+            result_cache: Cache for tool results. Only tools with a
+                ``cache_ttl`` policy are cached.
+            tool_policies: Per-tool policies keyed by tool name. Defaults to
+                ``server_config.tools`` when a server config is given.
+            tool_snapshot: Remembered tool lists (a
+                :class:`~mcp_toolkit.snapshot.ToolSnapshot` or a path to its
+                file). If the server reports the same version as last time,
+                its tools are taken from the snapshot and ``list_tools`` runs
+                in the background instead of delaying startup.
+            metrics: Where tool call and LLM metrics are recorded (see
+                :mod:`mcp_toolkit.metrics`). Defaults to a new
+                :class:`~mcp_toolkit.metrics.ClientMetrics`, available as
+                :attr:`metrics`.
+            max_context_tokens: Estimated prompt size to keep each chat
+                under by shortening the results of older tool rounds (see
+                :class:`~mcp_toolkit.budget.ContextBudget`). ``None`` means
+                no limit.
+            output_store: Where results cut to their ``max_output_chars``
+                are kept in full. The model gets a ``read_tool_output`` tool
+                to page through them (see :mod:`mcp_toolkit.output`).
         """
         self._server_script = server_script
         self._server_url = server_url
@@ -60,10 +104,22 @@ class BaseMCPClient(ABC):
         self._command = command
         self._args = args
         self.system_prompt = system_prompt
+        self._result_cache = result_cache
+        if tool_policies is None:
+            tool_policies = server_config.tools if server_config else {}
+        self._tool_policies = dict(tool_policies)
+        self._single_flight = SingleFlight()
+        self.metrics = metrics if metrics is not None else ClientMetrics()
+        self.max_context_tokens = max_context_tokens
+        self.output_store = output_store
+        if isinstance(tool_snapshot, (str, Path)):
+            tool_snapshot = ToolSnapshot(tool_snapshot)
+        self._snapshot = tool_snapshot
 
         self._exit_stack = AsyncExitStack()
         self._session: ClientSession | None = None
         self._mcp_tools: list = []
+        self._dispatcher = ToolDispatcher(self.call_tool, max_concurrency=max_parallel_tools)
 
     async def __aenter__(self):
         await self._connect()
@@ -74,28 +130,68 @@ class BaseMCPClient(ABC):
 
     async def _connect(self) -> None:
         """Establish connection to the MCP server."""
-        if self._server_url:
-            await self._connect_sse(self._server_url)
-        elif self._server_script:
-            cmd = self._command or _detect_command(self._server_script)
-            args = self._args or [self._server_script]
-            await self._connect_stdio(cmd, args)
-        elif self._server_config:
-            cfg = self._server_config
-            if cfg.transport == "streamable_http":
-                await self._connect_streamable_http(cfg.url)
-            elif cfg.transport == "sse":
-                await self._connect_sse(cfg.url)
+        with span("mcp.connect", server=self.server_name):
+            if self._server_url:
+                await self._connect_sse(self._server_url)
+                cfg = MCPServerConfig(name=self.server_name, url=self._server_url, transport_type="sse")
+            elif self._server_script:
+                cmd = self._command or _detect_command(self._server_script)
+                args = self._args or [self._server_script]
+                await self._connect_stdio(cmd, args)
+                cfg = MCPServerConfig(name=self.server_name, command=cmd, args=args)
+            elif self._server_config:
+                cfg = self._server_config
+                if cfg.transport == "streamable_http":
+                    await self._connect_streamable_http(cfg.url)
+                elif cfg.transport == "sse":
+                    await self._connect_sse(cfg.url)
+                else:
+                    await self._connect_stdio(cfg.command, cfg.args, cfg.env or None)
             else:
-                await self._connect_stdio(cfg.command, cfg.args, cfg.env or None)
-        else:
-            raise ValueError(
-                "Must provide server_script, server_url, or server_config"
-            )
+                raise ValueError(
+                    "Must provide server_script, server_url, or server_config"
+                )
 
-        # Fetch available tools
-        response = await self._session.list_tools()
-        self._mcp_tools = response.tools
+        await self._load_tools(cfg)
+        if self.output_store is not None:
+            try:
+                self.output_store.check_names([t.name for t in self._mcp_tools], self.server_name)
+            except ValueError:
+                await self._exit_stack.aclose()
+                raise
+
+    async def _load_tools(self, cfg: MCPServerConfig) -> None:
+        """Fetch the tool list, or take it from the snapshot and re-list in the background."""
+        version = server_version(self._session)
+        cached = None
+        if self._snapshot is not None and version is not None:
+            cached = self._snapshot.get(cfg, version)
+        if cached is None:
+            with span("mcp.list_tools", server=self.server_name):
+                self._mcp_tools = (await self._session.list_tools()).tools
+            if self._snapshot is not None:
+                self._snapshot.put(cfg, self._mcp_tools, version)
+            return
+
+        self._mcp_tools = cached
+        revalidate = asyncio.create_task(self._revalidate_tools(cfg, version))
+
+        async def stop() -> None:
+            revalidate.cancel()
+            await asyncio.gather(revalidate, return_exceptions=True)
+
+        self._exit_stack.push_async_callback(stop)
+
+    async def _revalidate_tools(self, cfg: MCPServerConfig, version: str) -> None:
+        try:
+            with span("mcp.list_tools", server=self.server_name, revalidate=True):
+                tools = (await self._session.list_tools()).tools
+        except Exception as e:
+            logger.warning("Could not re-list tools of '%s': %s", self.server_name, e)
+            return
+        if self._snapshot.put(cfg, tools, version):
+            logger.info("Tools of '%s' changed since they were snapshotted", self.server_name)
+            self._mcp_tools = tools
 
     async def _connect_stdio(self, command: str, args: list[str], env: dict[str, str] | None = None) -> None:
         """Connect via stdio transport."""
@@ -107,7 +203,7 @@ class BaseMCPClient(ABC):
         self._session = await self._exit_stack.enter_async_context(
             ClientSession(read_stream, write_stream)
         )
-        await self._session.initialize()
+        await _initialize(self._session)
 
     async def _connect_sse(self, url: str) -> None:
         """Connect via SSE transport."""
@@ -123,7 +219,7 @@ class BaseMCPClient(ABC):
         self._session = await self._exit_stack.enter_async_context(
             ClientSession(read_stream, write_stream)
         )
-        await self._session.initialize()
+        await _initialize(self._session)
 
     async def _connect_streamable_http(self, url: str) -> None:
         """Connect via streamable HTTP transport."""
@@ -142,7 +238,7 @@ class BaseMCPClient(ABC):
         self._session = await self._exit_stack.enter_async_context(
             ClientSession(read_stream, write_stream)
         )
-        await self._session.initialize()
+        await _initialize(self._session)
 
     @property
     def session(self) -> ClientSession:
@@ -159,20 +255,88 @@ class BaseMCPClient(ABC):
     @property
     def tool_names(self) -> list[str]:
         """Names of available tools."""
-        return [t.name for t in self._mcp_tools]
+        return [t.name for t in self._model_tools()]
+
+    def _model_tools(self) -> list:
+        """The server's tools plus ``read_tool_output`` when there is an output store."""
+        if self.output_store is None:
+            return self._mcp_tools
+        return [*self._mcp_tools, self.output_store.tool]
+
+    @property
+    def result_cache(self) -> ToolResultCache | None:
+        """The tool result cache, if one was configured."""
+        return self._result_cache
+
+    @property
+    def server_name(self) -> str:
+        """Name used for this server in cache keys."""
+        if self._server_config and self._server_config.name:
+            return self._server_config.name
+        return self._server_url or self._server_script or ""
 
     async def call_tool(self, name: str, arguments: dict[str, Any] = None) -> str:
         """Execute an MCP tool and return the result as text.
 
+        Results of tools with a ``cache_ttl`` policy are served from
+        :attr:`result_cache` when possible. Calls are bounded by the tool's
+        ``timeout`` policy (or the server's ``tool_timeout``) and the current
+        :func:`~mcp_toolkit.deadline.deadline`. Identical concurrent calls to
+        cached or ``idempotent`` tools share one upstream call (see
+        :mod:`mcp_toolkit.singleflight`). Results longer than the tool's
+        ``max_output_chars`` are cut (see :mod:`mcp_toolkit.output`).
+
         Args:
             name: Tool name.
             arguments: Tool arguments dict.
 
         Returns:
             Tool result as a string.
+
+        Raises:
+            TimeoutError: If the call ran out of time; it is cancelled on the
+                server too.
         """
-        result = await self.session.call_tool(name, arguments or {})
-        return _extract_tool_text(result)
+        if self.output_store is not None and name == self.output_store.tool.name:
+            return await self.output_store.call(arguments)
+        policy = self._tool_policies.get(name)
+        timeout = policy.timeout if policy else None
+        if timeout is None and self._server_config is not None:
+            timeout = self._server_config.tool_timeout
+        max_chars = policy.max_output_chars if policy else None
+        if max_chars is None and self._server_config is not None:
+            max_chars = self._server_config.max_output_chars
+
+        async def invoke() -> tuple[str, bool]:
+            started = time.perf_counter()
+            try:
+                with span("mcp.call_tool", server=self.server_name, tool=name):
+                    result = await call_with_timeout(
+                        call_tool(self.session, name, arguments or {}),
+                        timeout,
+                        f"Tool '{name}' on server '{self.server_name}'",
+                    )
+            except BaseException as e:
+                self.metrics.tool_call(self.server_name, name, time.perf_counter() - started, error=e)
+                raise
+            ok = not getattr(result, "isError", False)
+            self.metrics.tool_call(self.server_name, name, time.perf_counter() - started, ok=ok)
+            text, spilled = await _tool_text(result, max_chars, self.output_store, self.server_name, name)
+            # A spilled result names a file the store may delete long before
+            # a cache entry would expire, so it is not cached
+            return text, ok and not spilled
+
+        async def cached() -> str:
+            if self._result_cache is None:
+                text, _ = await invoke()
+                return text
+            ttl = policy.cache_ttl if policy else None
+            return await self._result_cache.get_or_call(self.server_name, name, arguments, ttl, invoke)
+
+        key = coalesce_key(self.server_name, name, arguments, policy) if policy else None
+        if key is None:
+            return await cached()
+        return await self._single_flight.do(key, cached)
 
     @abstractmethod
     async def chat(self, message: str) -> str:
@@ -186,6 +350,27 @@ class BaseMCPClient(ABC):
         """
         ...
 
+    async def chat_stream(self, message: str) -> AsyncIterator[StreamEvent]:
+        """Like :meth:`chat`, but yields events as they happen.
+
+        Yields ``"text"`` events with model output deltas, ``"tool_started"``
+        / ``"tool_finished"`` / ``"tool_error"`` events around each tool
+        call, and a final ``"done"`` event carrying the complete answer.
+
+        Clients whose provider supports streaming override this. The default
+        runs :meth:`chat` and yields its result as a single text event.
+
+        Args:
+            message: User message.
+
+        Yields:
+            :class:`StreamEvent` objects.
+        """
+        text = await self.chat(message)
+        if text:
+            yield StreamEvent("text", text=text)
+        yield StreamEvent("done", text=text)
+
     async def chat_loop(self) -> None:
         """Run an interactive terminal chat session."""
         print(f"\nMCP Client ready! Tools: {self.tool_names}")
@@ -205,12 +390,252 @@ class BaseMCPClient(ABC):
             print(f"\nAssistant: {response}\n")
 
 
-def _extract_tool_text(result: Any) -> str:
-    """Extract text content from an MCP tool result."""
+def extract_tool_text(
+    result: Any,
+    max_chars: int | None = None,
+    spill: Callable[[], Any] | None = None,
+) -> str:
+    """Extract text content from an MCP tool result.
+
+    Args:
+        result: The tool result.
+        max_chars: Keep only the beginning and end of longer results (see
+            :func:`~mcp_toolkit.output.limit_output`).
+        spill: Opens a file for the complete text of a result that is cut.
+    """
     if hasattr(result, "content"):
         if isinstance(result.content, list):
-            return "\n".join(
-                getattr(part, "text", str(part)) for part in result.content
+            return limit_output(
+                (getattr(part, "text", str(part)) for part in result.content),
+                max_chars,
+                spill=spill,
             )
-        return str(result.content)
-    return str(result)
+        return limit_output([str(result.content)], max_chars, spill=spill)
+    return limit_output([str(result)], max_chars, spill=spill)
+
+
+async def _tool_text(
+    result: Any,
+    max_chars: int | None,
+    store: ToolOutputStore | None,
+    server: str,
+    tool: str,
+) -> tuple[str, bool]:
+    """Text of a tool result for the model, and whether it was spilled to ``store``.
+
+    Results long enough to be spilled are read and written to disk in a
+    worker thread, so a large write does not block the event loop.
+    """
+    if store is None or max_chars is None or _text_length(result) <= max_chars:
+        return extract_tool_text(result, max_chars), False
+    spilled = []
+
+    def spill() -> Any:
+        spilled.append(store.create(server, tool))
+        return spilled[-1]
+
+    text = await asyncio.to_thread(extract_tool_text, result, max_chars, spill)
+    return text, bool(spilled)
+
+
+def _text_length(result: Any) -> int:
+    """Length of the text :func:`extract_tool_text` would return uncut."""
+    if hasattr(result, "content") and isinstance(result.content, list):
+        parts = result.content
+        return sum(len(getattr(part, "text", str(part))) for part in parts) + max(len(parts) - 1, 0)
+    return len(str(getattr(result, "content", result)))
+
+
+def _parse_arguments(raw: str | None) -> dict[str, Any]:
+    """Parse a JSON-encoded tool arguments string, falling back to ``{}``."""
+    try:
+        args = json.loads(raw or "{}")
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return args if isinstance(args, dict) else {}
+
+
+@dataclass
+class ToolCall:
+    """One tool call requested by the model.
+
+    Attributes:
+        id: Provider-assigned call ID, used to pair the result with the request.
+        name: Tool name.
+        arguments: Parsed tool arguments.
+    """
+    id: str
+    name: str
+    arguments: dict[str, Any]
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of one dispatched tool call.
+
+    Attributes:
+        call: The call this result answers.
+        content: Tool output as text (empty if the call failed).
+        error: The exception raised by the call, if any.
+        elapsed: Wall-clock seconds spent in the call.
+    """
+    call: ToolCall
+    content: str = ""
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the call completed without raising."""
+        return self.error is None
+
+
+StreamEventType = Literal["text", "tool_started", "tool_finished", "tool_error", "done"]
+
+
+@dataclass
+class StreamEvent:
+    """One event from a streaming chat.
+
+    Attributes:
+        type: ``"text"`` (a model output delta in ``text``),
+            ``"tool_started"`` (``call`` is about to run),
+            ``"tool_finished"`` / ``"tool_error"`` (``result`` holds the
+            outcome) or ``"done"`` (``text`` is the complete final answer).
+        text: Text delta, or the full answer for ``"done"``.
+        call: The tool call, for tool events.
+        result: The tool call outcome, for ``"tool_finished"`` and ``"tool_error"``.
+    """
+    type: StreamEventType
+    text: str = ""
+    call: ToolCall | None = None
+    result: ToolCallResult | None = None
+
+
+class ToolDispatcher:
+    """Runs the tool calls from one model turn concurrently.
+
+    Shared by every provider client so that independent calls — for example
+    ``compare_weather`` plus three ``get_forecast`` calls — no longer wait on
+    each other. Results are always returned in the order the calls were
+    requested, regardless of which finished first, so the conversation
+    history stays deterministic.
+
+    Example:
+        >>> dispatcher = ToolDispatcher(client.call_tool, max_concurrency=4)
+        >>> results = await dispatcher.dispatch([
+        ...     ToolCall(id="1", name="get_forecast", arguments={"city": "Paris"}),
+        ...     ToolCall(id="2", name="get_forecast", arguments={"city": "Rome"}),
+        ... ])
+    """
+
+    def __init__(
+        self,
+        call_tool: Callable[[str, dict[str, Any]], Awaitable[str]],
+        *,
+        max_concurrency: int | None = 8,
+        server_limits: dict[str, int] | None = None,
+        resolve_server: Callable[[str], str | None] | None = None,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            call_tool: Coroutine function ``(name, arguments) -> str`` that
+                executes one tool.
+            max_concurrency: Maximum calls in flight at once across all
+                servers. ``None`` means no limit.
+            server_limits: Maximum calls in flight per server name.
+            resolve_server: Maps a tool name to its server name. Required for
+                ``server_limits`` to take effect.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self._call_tool = call_tool
+        self._resolve_server = resolve_server
+        self._server_limits = dict(server_limits or {})
+        self._global = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._per_server: dict[str, asyncio.Semaphore] = {}
+
+    async def dispatch(
+        self, calls: list[ToolCall], *, flow: Hashable = None
+    ) -> list[ToolCallResult]:
+        """Execute calls concurrently and return results in request order.
+
+        A failing call never aborts the others; its exception is captured in
+        the corresponding :class:`ToolCallResult`.
+
+        Args:
+            calls: Calls to execute.
+            flow: Who the calls belong to, for fair queuing on busy servers
+                (see :mod:`mcp_toolkit.limiter`). A flow set by the caller
+                with :func:`~mcp_toolkit.limiter.flow` takes precedence.
+        """
+        with span("tool.dispatch", calls=len(calls)):
+            if len(calls) == 1:
+                return [await self._run(calls[0], flow)]
+            return list(await asyncio.gather(*(self._run(call, flow) for call in calls)))
+
+    async def dispatch_stream(
+        self, calls: list[ToolCall], results: list[ToolCallResult], *, flow: Hashable = None
+    ) -> AsyncIterator[StreamEvent]:
+        """Like :meth:`dispatch`, but yields lifecycle events as calls progress.
+
+        Yields a ``"tool_started"`` event for every call up front (they all
+        start together), then ``"tool_finished"`` or ``"tool_error"`` as each
+        one completes, in completion order. Once the generator is exhausted,
+        ``results`` holds every result in request order. Calls still running
+        when the generator is closed early are cancelled.
+
+        Args:
+            calls: Calls to execute.
+            results: List that receives the results, in request order.
+            flow: As for :meth:`dispatch`.
+        """
+        dispatching = start_span("tool.dispatch", calls=len(calls))
+        with use_span(dispatching):
+            tasks = [asyncio.ensure_future(self._run(call, flow)) for call in calls]
+        try:
+            for call in calls:
+                yield StreamEvent("tool_started", call=call)
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                yield StreamEvent(
+                    "tool_finished" if result.ok else "tool_error",
+                    call=result.call,
+                    result=result,
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+            end_span(dispatching)
+        results.extend(task.result() for task in tasks)
+
+    async def _run(self, call: ToolCall, flow: Hashable = None) -> ToolCallResult:
+        # Wait for the per-server slot first so a call queued behind a busy
+        # server never holds a global slot that another server could use.
+        server_limit = self._server_semaphore(call.name) or nullcontext()
+        token = current_flow.set(flow) if flow is not None and current_flow.get() is None else None
+        started = time.perf_counter()
+        try:
+            with span("tool.call", tool=call.name):
+                async with server_limit:
+                    async with self._global or nullcontext():
+                        content = await self._call_tool(call.name, call.arguments)
+        except Exception as e:
+            return ToolCallResult(call=call, error=e, elapsed=time.perf_counter() - started)
+        finally:
+            if token is not None:
+                current_flow.reset(token)
+        return ToolCallResult(call=call, content=content, elapsed=time.perf_counter() - started)
+
+    def _server_semaphore(self, tool_name: str) -> asyncio.Semaphore | None:
+        if not self._server_limits or not self._resolve_server:
+            return None
+        server = self._resolve_server(tool_name)
+        limit = self._server_limits.get(server) if server else None
+        if not limit:
+            return None
+        semaphore = self._per_server.get(server)
+        if semaphore is None:
+            semaphore = self._per_server[server] = asyncio.Semaphore(limit)
+        return semaphore
@@ -8,10 +8,12 @@ Handles the full tool-calling loop automatically.
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import Any, AsyncIterator
 
-from mcp_toolkit.clients.base import BaseMCPClient, _extract_tool_text
-from mcp_toolkit.converters import clean_schema
+from mcp_toolkit.budget import ContextBudget
+from mcp_toolkit.clients.base import BaseMCPClient, StreamEvent, ToolCall, ToolCallResult
+from mcp_toolkit.converters import ToolSchemaCache, clean_schema
+from mcp_toolkit.tracing import end_span, span, start_span
 
 
 class GeminiMCPClient(BaseMCPClient):
@@ -60,21 +62,30 @@ class GeminiMCPClient(BaseMCPClient):
 
         self._genai_client = genai.Client(api_key=resolved_key)
         self._types = types
+        self._tool_schemas = ToolSchemaCache(self._to_function_declaration)
+        self._declarations: list | None = None
+        self._gemini_tools: list = []
+
+    def _to_function_declaration(self, tool):
+        """Convert one MCP tool to a Gemini FunctionDeclaration."""
+        parameters = clean_schema(tool.inputSchema) if tool.inputSchema else {}
+        return self._types.FunctionDeclaration(
+            name=tool.name,
+            description=tool.description or "",
+            parameters=parameters,
+        )
 
     def _build_tool_declarations(self):
-        """Convert MCP tools to Gemini FunctionDeclaration format."""
-        types = self._types
-        declarations = []
-        for tool in self._mcp_tools:
-            parameters = clean_schema(tool.inputSchema) if tool.inputSchema else {}
-            declarations.append(
-                types.FunctionDeclaration(
-                    name=tool.name,
-                    description=tool.description or "",
-                    parameters=parameters,
-                )
-            )
-        return [types.Tool(function_declarations=declarations)]
+        """Convert MCP tools to Gemini FunctionDeclaration format.
+
+        Declarations are cached per tool, and the wrapping ``types.Tool`` is
+        only rebuilt when the tool list changes.
+        """
+        declarations = self._tool_schemas.convert(self._model_tools())
+        if declarations is not self._declarations:
+            self._declarations = declarations
+            self._gemini_tools = [self._types.Tool(function_declarations=declarations)]
+        return self._gemini_tools
 
     async def chat(self, message: str) -> str:
         """Send a message and get a response with automatic tool execution.
@@ -98,15 +109,22 @@ class GeminiMCPClient(BaseMCPClient):
             types.Content(role="user", parts=[types.Part.from_text(text=message)])
         ]
 
+        budget = ContextBudget(self.max_context_tokens)
+        rounds = 0
         while True:
-            response = await self._genai_client.aio.models.generate_content(
-                model=self.model,
-                contents=contents,
-                config=types.GenerateContentConfig(
-                    tools=tools,
-                    system_instruction=self.system_prompt,
-                ),
-            )
+            await budget.fit(contents)
+            with span("llm.request", provider="gemini", model=self.model):
+                response = await self._genai_client.aio.models.generate_content(
+                    model=self.model,
+                    contents=contents,
+                    config=types.GenerateContentConfig(
+                        tools=tools,
+                        system_instruction=self.system_prompt,
+                    ),
+                )
+            self.metrics.llm_request("gemini", self.model, response.usage_metadata)
+            budget.record(response.usage_metadata, contents)
+            rounds += 1
 
             # Collect all parts from all candidates
             response_parts = []
@@ -118,6 +136,7 @@ class GeminiMCPClient(BaseMCPClient):
             function_calls = [p for p in response_parts if p.function_call]
 
             if not function_calls:
+                self.metrics.chat_finished(type(self).__name__, rounds)
                 # No tool calls — extract and return final text
                 text_parts = [
                     p.text for p in response_parts
@@ -128,24 +147,99 @@ class GeminiMCPClient(BaseMCPClient):
             # Append the model's response turn to the conversation history
             contents.append(types.Content(role="model", parts=response_parts))
 
-            # Execute all function calls and collect results
-            tool_result_parts = []
-            for part in function_calls:
-                tool_name = part.function_call.name
-                tool_args = dict(part.function_call.args) if part.function_call.args else {}
-
-                try:
-                    result = await self.call_tool(tool_name, tool_args)
-                    function_response = {"result": result}
-                except Exception as e:
-                    function_response = {"error": str(e)}
-
-                tool_result_parts.append(
-                    types.Part.from_function_response(
-                        name=tool_name,
-                        response=function_response,
-                    )
-                )
+            # Execute all function calls concurrently and collect results
+            results = await self._dispatcher.dispatch(_tool_calls(function_calls))
 
             # Append all tool results as one turn and loop back
-            contents.append(types.Content(role="tool", parts=tool_result_parts))
+            contents.append(self._tool_results_content(results))
+
+    async def chat_stream(self, message: str) -> AsyncIterator[StreamEvent]:
+        """Like :meth:`chat`, but streams text deltas and tool call events.
+
+        Args:
+            message: User message.
+
+        Yields:
+            :class:`~mcp_toolkit.clients.base.StreamEvent` objects, ending
+            with a ``"done"`` event.
+        """
+        types = self._types
+        tools = self._build_tool_declarations()
+        config = types.GenerateContentConfig(tools=tools, system_instruction=self.system_prompt)
+
+        contents = [
+            types.Content(role="user", parts=[types.Part.from_text(text=message)])
+        ]
+
+        budget = ContextBudget(self.max_context_tokens)
+        rounds = 0
+        while True:
+            await budget.fit(contents)
+            response_parts = []
+            text_parts: list[str] = []
+            usage = None
+            requesting = start_span("llm.request", provider="gemini", model=self.model)
+            try:
+                stream = await self._genai_client.aio.models.generate_content_stream(
+                    model=self.model,
+                    contents=contents,
+                    config=config,
+                )
+                async for chunk in stream:
+                    # Each chunk reports the usage of the response so far
+                    usage = chunk.usage_metadata or usage
+                    for candidate in chunk.candidates or []:
+                        if not (candidate.content and candidate.content.parts):
+                            continue
+                        for part in candidate.content.parts:
+                            response_parts.append(part)
+                            if part.text and not part.function_call:
+                                text_parts.append(part.text)
+                                yield StreamEvent("text", text=part.text)
+            except BaseException as e:
+                end_span(requesting, e)
+                raise
+            end_span(requesting)
+            self.metrics.llm_request("gemini", self.model, usage)
+            budget.record(usage, contents)
+            rounds += 1
+
+            function_calls = [p for p in response_parts if p.function_call]
+            if not function_calls:
+                self.metrics.chat_finished(type(self).__name__, rounds)
+                yield StreamEvent("done", text="".join(text_parts))
+                return
+
+            contents.append(types.Content(role="model", parts=response_parts))
+
+            results: list[ToolCallResult] = []
+            async for event in self._dispatcher.dispatch_stream(_tool_calls(function_calls), results):
+                yield event
+
+            contents.append(self._tool_results_content(results))
+
+    def _tool_results_content(self, results: list[ToolCallResult]):
+        """Build the tool turn answering every function call of one model turn."""
+        types = self._types
+        return types.Content(
+            role="tool",
+            parts=[
+                types.Part.from_function_response(
+                    name=r.call.name,
+                    response={"result": r.content} if r.ok else {"error": str(r.error)},
+                )
+                for r in results
+            ],
+        )
+
+
+def _tool_calls(function_calls: list) -> list[ToolCall]:
+    """Turn Gemini function-call parts into tool calls (the index is the call id)."""
+    return [
+        ToolCall(
+            str(i),
+            part.function_call.name,
+            dict(part.function_call.args) if part.function_call.args else {},
+        )
+        for i, part in enumerate(function_calls)
+    ]
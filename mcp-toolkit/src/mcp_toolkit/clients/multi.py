@@ -7,17 +7,76 @@ to a single LLM agent. The model decides which tools to call.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import logging
 import os
-from contextlib import AsyncExitStack
-from typing import Any
-
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-
-from mcp_toolkit.config import MCPConfig, MCPServerConfig, load_config, load_config_from_dict
-from mcp_toolkit.converters import mcp_to_openai_completions
-from mcp_toolkit.transports import _detect_command
+import time
+import uuid
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable
+
+from mcp_toolkit.budget import ContextBudget
+from mcp_toolkit.cache import ToolResultCache
+from mcp_toolkit.clients.base import (
+    StreamEvent,
+    ToolCall,
+    ToolDispatcher,
+    _parse_arguments,
+    _tool_text,
+)
+from mcp_toolkit.clients.openai import _stream_chat_completions
+from mcp_toolkit.config import (
+    MCPConfig,
+    MCPServerConfig,
+    _resolve_config_path,
+    diff_configs,
+    load_config,
+    load_config_from_dict,
+)
+from mcp_toolkit.connection import (
+    LazyServerConnection,
+    ServerStartupReport,
+    start_connections,
+)
+from mcp_toolkit.converters import ToolSchemaCache, to_openai_completions
+from mcp_toolkit.deadline import call_with_timeout
+from mcp_toolkit.hedging import HedgedCaller, HedgeStats
+from mcp_toolkit.limiter import LimiterStats, ServerLimiter, current_flow, flow
+from mcp_toolkit.metrics import ClientMetrics, ClientStats, LLMStats, ServerStats
+from mcp_toolkit.output import ToolOutputStore
+from mcp_toolkit.registry import CollisionPolicy, ToolRegistry
+from mcp_toolkit.replicas import ReplicaSet
+from mcp_toolkit.singleflight import SingleFlight, SingleFlightStats, coalesce_key
+from mcp_toolkit.snapshot import ToolSnapshot
+from mcp_toolkit.supervisor import SupervisedConnection
+from mcp_toolkit.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# What a client keeps per server in _sessions
+_Connection = SupervisedConnection | LazyServerConnection | ReplicaSet
+
+
+@dataclass
+class ReloadReport:
+    """Outcome of :meth:`MultiServerClient.reload`.
+
+    Attributes:
+        added: Servers connected for the first time.
+        removed: Servers drained and closed.
+        restarted: Servers reconnected because their connection settings changed.
+        updated: Servers whose tool policies or timeouts were updated in place.
+        failed: Servers that could not be (re)connected, with their startup
+            report. A server that fails to restart keeps its old session.
+    """
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    restarted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    failed: dict[str, ServerStartupReport] = field(default_factory=dict)
 
 
 class MultiServerClient:
@@ -39,6 +98,20 @@ class MultiServerClient:
         api_key: str | None = None,
         temperature: float = 0,
         system_prompt: str = "You are a helpful assistant with access to multiple tool servers.",
+        parallel_connect: bool = True,
+        connect_timeout: float | None = None,
+        max_parallel_tools: int | None = 8,
+        server_concurrency: dict[str, int] | None = None,
+        result_cache: ToolResultCache | None = None,
+        openai_client: Any = None,
+        on_tool_collision: CollisionPolicy = "namespace",
+        drain_timeout: float | None = 30.0,
+        lazy: bool = False,
+        idle_timeout: float | None = None,
+        tool_snapshot: ToolSnapshot | str | Path | None = None,
+        metrics: ClientMetrics | None = None,
+        max_context_tokens: int | None = None,
+        output_store: ToolOutputStore | None = None,
     ):
         """Initialize the multi-server client.
 
@@ -48,12 +121,94 @@ class MultiServerClient:
             api_key: OpenAI API key. Falls back to OPENAI_API_KEY env var.
             temperature: Sampling temperature.
             system_prompt: System prompt for the LLM.
+            parallel_connect: Start all servers concurrently (default). Set to
+                False to connect one server at a time.
+            connect_timeout: Default per-server connect timeout in seconds.
+                A server's own ``connect_timeout`` in config takes precedence.
+            max_parallel_tools: Maximum tool calls in flight at once across
+                all servers. ``None`` means no limit.
+            server_concurrency: Maximum tool calls in flight per server,
+                keyed by server name (e.g. ``{"flights": 2}``), for servers
+                without a ``max_concurrency`` in config.
+            result_cache: Cache for tool results. Only tools with a
+                ``cache_ttl`` in their server's ``"tools"`` config are cached.
+            openai_client: A ready-made ``AsyncOpenAI``-compatible client
+                (e.g. Azure, a proxy, or a fake for benchmarks). When given,
+                ``api_key`` is not needed.
+            on_tool_collision: What to do when servers expose the same tool
+                name: ``"namespace"`` (default) shows each copy to the model
+                as ``"<server>__<tool>"``; ``"error"`` fails startup.
+            drain_timeout: Seconds :meth:`reload` waits for in-flight calls on
+                a removed or restarted server before closing it.
+            lazy: Start servers on their first tool call instead of up front.
+                Servers whose tools are in ``tool_snapshot`` are not started
+                at all until needed; the others are started once to learn
+                their tools.
+            idle_timeout: With ``lazy``, close a server's session after this
+                many seconds without a tool call. It reopens on the next call.
+            tool_snapshot: Where the tools of each server are remembered —
+                a :class:`~mcp_toolkit.snapshot.ToolSnapshot` or a path to its
+                file. Defaults to an in-memory snapshot when ``lazy``. Servers
+                that report the same version as last time get their tools
+                from it without waiting for ``list_tools``; the live list is
+                fetched in the background and replaces it if different.
+            metrics: Where tool call, LLM and server metrics are recorded
+                (see :mod:`mcp_toolkit.metrics`). Defaults to a new
+                :class:`~mcp_toolkit.metrics.ClientMetrics`, available as
+                :attr:`metrics`; agents built on this client record into it
+                too.
+            max_context_tokens: Estimated prompt size to keep each chat
+                under by shortening the results of older tool rounds (see
+                :class:`~mcp_toolkit.budget.ContextBudget`). ``None`` means
+                no limit. Agents have their own ``max_context_tokens``.
+            output_store: Where results cut to their ``max_output_chars``
+                are kept in full. The model (and every agent) gets a
+                ``read_tool_output`` tool to page through them (see
+                :mod:`mcp_toolkit.output`).
         """
         self._config = config
         self.model = model
         self.temperature = temperature
         self.system_prompt = system_prompt
+        self.parallel_connect = parallel_connect
+        self.connect_timeout = connect_timeout
+        self._result_cache = result_cache
+        self._on_tool_collision = on_tool_collision
+        self.drain_timeout = drain_timeout
+        self._server_concurrency = dict(server_concurrency or {})
+        self._limiters: dict[str, ServerLimiter] = {}
+        self._hedger = HedgedCaller()
+        self._single_flight = SingleFlight()
+        self.metrics = metrics if metrics is not None else ClientMetrics()
+        self._register_server_metrics()
+        self.max_context_tokens = max_context_tokens
+        self.output_store = output_store
+        self.lazy = lazy
+        self.idle_timeout = idle_timeout
+        if tool_snapshot is None and lazy:
+            tool_snapshot = ToolSnapshot()
+        elif isinstance(tool_snapshot, (str, Path)):
+            tool_snapshot = ToolSnapshot(tool_snapshot)
+        self._snapshot: ToolSnapshot | None = tool_snapshot
+
+        self._openai = openai_client or self._default_openai(api_key)
+        self._sessions: dict[str, _Connection] = {}
+        self._startup_report: dict[str, ServerStartupReport] = {}
+        self._registry = ToolRegistry()
+        self._reload_lock = asyncio.Lock()
+        self._watch_path: str | None = None
+        self._watcher: asyncio.Task | None = None
+        self._reaper: asyncio.Task | None = None
+        self._tool_schemas = ToolSchemaCache(to_openai_completions)
+        self._dispatcher = ToolDispatcher(
+            self.call_tool,
+            max_concurrency=max_parallel_tools,
+            resolve_server=lambda name: self._registry.server_of(name),
+        )
 
+    @staticmethod
+    def _default_openai(api_key: str | None) -> Any:
+        """Build an ``AsyncOpenAI`` client from ``api_key`` or the environment."""
         resolved_key = api_key or os.getenv("OPENAI_API_KEY")
         if not resolved_key:
             raise ValueError(
@@ -68,29 +223,32 @@ class MultiServerClient:
                 "Install with: pip install 'mcp-toolkit[openai]'"
             ) from e
 
-        self._openai = AsyncOpenAI(api_key=resolved_key)
-        self._exit_stack = AsyncExitStack()
-        self._sessions: dict[str, ClientSession] = {}
-        self._all_mcp_tools: list = []
-        self._tool_to_server: dict[str, str] = {}
+        return AsyncOpenAI(api_key=resolved_key)
 
     @classmethod
     def from_config(
         cls,
         path: str | None = None,
+        *,
+        watch: bool = False,
         **kwargs,
     ) -> MultiServerClient:
         """Create a MultiServerClient from a config file.
 
         Args:
             path: Path to config JSON file. Uses default resolution if None.
+            watch: Reload the config whenever the file changes, once
+                connected (see :meth:`watch_config`).
             **kwargs: Passed to __init__ (model, api_key, etc.)
 
         Returns:
             MultiServerClient instance (not yet connected — use async with).
         """
         config = load_config(path)
-        return cls(config, **kwargs)
+        client = cls(config, **kwargs)
+        if watch:
+            client._watch_path = str(_resolve_config_path(path, "MCP_CONFIG"))
+        return client
 
     @classmethod
     def from_dict(
@@ -113,70 +271,410 @@ class MultiServerClient:
 
     async def __aenter__(self):
         await self._connect_all()
+        if self._watch_path:
+            self.watch_config(self._watch_path)
+        if self.lazy and self.idle_timeout is not None:
+            self._reaper = asyncio.create_task(self._reap_idle(), name="mcp-idle-reaper")
         return self
 
     async def __aexit__(self, *exc):
-        await self._exit_stack.aclose()
+        for task in (self._watcher, self._reaper):
+            if task is not None:
+                task.cancel()
+        self._watcher = self._reaper = None
+        await asyncio.gather(*(conn.close() for conn in self._sessions.values()))
+        self._sessions.clear()
 
     async def _connect_all(self) -> None:
-        """Connect to all configured servers."""
-        for name, server_cfg in self._config.servers.items():
+        """Connect to all configured servers.
+
+        Servers are started concurrently by default, so startup time tracks
+        the slowest server rather than the sum of all of them. Servers that
+        fail or time out are skipped and recorded in :attr:`startup_report`.
+        In lazy mode, servers with a tool snapshot are not started here.
+        """
+        connections = await self._start_servers(list(self._config.servers.values()))
+        for name, report in self._startup_report.items():
+            if not report.ok:
+                logger.warning(
+                    "Failed to connect to server '%s' (%s after %.2fs): %s",
+                    report.name, report.status, report.elapsed, report.error,
+                )
+        self._sessions.update(connections)
+
+        try:
+            self._registry = self._new_registry(self._sessions)
+        except ValueError:
+            await self.__aexit__(None, None, None)
+            raise
+
+        if not self._registry.tools:
+            await self.__aexit__(None, None, None)
+            raise RuntimeError("No tools loaded from any server.")
+
+    async def reload(self, config: MCPConfig) -> ReloadReport:
+        """Move to a new config without disturbing servers that did not change.
+
+        Added servers and servers whose connection settings changed are
+        connected first. The session map and tool registry are then swapped
+        in one step, so every request sees either the old or the new set of
+        tools. Removed and replaced sessions are closed once their in-flight
+        calls finish (or after ``drain_timeout``). Unchanged servers keep their
+        sessions; servers whose startup failed earlier are retried.
+
+        Args:
+            config: The new configuration.
+
+        Returns:
+            A :class:`ReloadReport` describing what changed.
+
+        Raises:
+            ValueError: If the new tool set has a name collision and the
+                client was created with ``on_tool_collision="error"``. The
+                old configuration stays in effect.
+        """
+        async with self._reload_lock:
+            live = MCPConfig(servers={name: conn.config for name, conn in self._sessions.items()})
+            diff = diff_configs(live, config)
+            report = ReloadReport(updated=diff.updated)
+            if diff.empty:
+                self._config = config
+                return report
+
+            names = diff.added + diff.changed
+            started = await self._start_servers([config.servers[n] for n in names])
+            for name in names:
+                startup = self._startup_report[name]
+                if not startup.ok:
+                    report.failed[name] = startup
+                    logger.warning(
+                        "Failed to connect to server '%s' during reload (%s): %s",
+                        name, startup.status, startup.error,
+                    )
+
+            sessions = {}
+            for name in config.servers:
+                conn = started.get(name) or self._sessions.get(name)
+                if conn is not None:
+                    sessions[name] = conn
             try:
-                session = await self._connect_one(server_cfg)
-                self._sessions[name] = session
+                registry = self._new_registry(sessions)
+            except ValueError:
+                await asyncio.gather(*(conn.close() for conn in started.values()))
+                raise
+
+            for name in diff.updated:
+                sessions[name].config = config.servers[name]
+            retired = [
+                conn for name, conn in self._sessions.items()
+                if sessions.get(name) is not conn
+            ]
+
+            # Swap atomically: nothing awaits between these assignments
+            self._sessions = sessions
+            self._registry = registry
+            self._config = config
+
+            report.added = [n for n in diff.added if n in started]
+            report.restarted = [n for n in diff.changed if n in started]
+            report.removed = diff.removed
+            for name in diff.removed:
+                self._startup_report.pop(name, None)
+                self._limiters.pop(name, None)
+            if self._result_cache is not None:
+                for name in report.restarted + report.removed:
+                    self._result_cache.invalidate(server=name)
+
+            await asyncio.gather(*(self._retire(conn) for conn in retired))
+            logger.info(
+                "Reloaded MCP config: added=%s removed=%s restarted=%s updated=%s failed=%s",
+                report.added, report.removed, report.restarted, report.updated, list(report.failed),
+            )
+            return report
+
+    def watch_config(
+        self,
+        path: str | Path,
+        *,
+        loader: Callable[[Path], MCPConfig] = load_config,
+        interval: float = 1.0,
+    ) -> None:
+        """Reload whenever a config file changes.
 
-                # Load tools from this server
-                response = await session.list_tools()
-                for tool in response.tools:
-                    self._all_mcp_tools.append(tool)
-                    self._tool_to_server[tool.name] = name
+        Polls the file's modification time every ``interval`` seconds and
+        calls :meth:`reload` when its contents change. A file that fails to
+        load (e.g. half-written JSON) is logged and skipped; the current
+        config stays in effect. Watching stops when the client exits.
+
+        Args:
+            path: Config file to watch.
+            loader: Turns the file into an :class:`MCPConfig`. Override it to
+                post-process the config (resolve paths, inject secrets).
+            interval: Seconds between checks.
+        """
+        if self._watcher is not None:
+            self._watcher.cancel()
+        self._watcher = asyncio.create_task(
+            self._watch(Path(path), loader, interval), name=f"mcp-config-watch:{path}"
+        )
 
+    async def _watch(self, path: Path, loader: Callable[[Path], MCPConfig], interval: float) -> None:
+        last_stat = _stat(path)
+        last_digest = _digest(path)
+        while True:
+            await asyncio.sleep(interval)
+            stat = _stat(path)
+            if stat == last_stat:
+                continue
+            last_stat = stat
+            digest = _digest(path)
+            if digest == last_digest:
+                continue
+            try:
+                config = loader(path)
             except Exception as e:
-                print(f"Warning: Failed to connect to server '{name}': {e}")
+                logger.warning("Not reloading %s: %s", path, e)
+                continue
+            last_digest = digest
+            try:
+                await self.reload(config)
+            except Exception:
+                logger.exception("Reloading %s failed", path)
 
-        if not self._all_mcp_tools:
-            raise RuntimeError("No tools loaded from any server.")
+    async def _start_servers(
+        self, configs: list[MCPServerConfig]
+    ) -> dict[str, _Connection]:
+        """Create and start connections, recording each outcome in the startup report.
+
+        In lazy mode, servers whose tools are already known from the snapshot
+        are returned unstarted with status ``"lazy"``.
 
-    async def _connect_one(self, cfg: MCPServerConfig) -> ClientSession:
-        """Connect to a single server."""
-        if cfg.transport == "streamable_http":
-            from mcp.client.streamable_http import streamable_http_client
-            transport = await self._exit_stack.enter_async_context(
-                streamable_http_client(url=cfg.url)
+        Returns:
+            The usable connections, keyed by server name.
+        """
+        connections = [self._new_connection(cfg) for cfg in configs]
+        pending = [
+            c for c in connections
+            if not all(isinstance(r, LazyServerConnection) and r.known for r in _replicas(c))
+        ]
+        reports = dict(zip(
+            (c.name for c in pending),
+            await start_connections(
+                pending, timeout=self.connect_timeout, parallel=self.parallel_connect
+            ),
+        ))
+
+        started = {}
+        for conn in connections:
+            report = reports.get(conn.name) or ServerStartupReport(
+                name=conn.name, status="lazy", elapsed=0.0, tool_count=len(conn.tools)
+            )
+            self._startup_report[conn.name] = report
+            if report.ok:
+                started[conn.name] = conn
+        return started
+
+    def _new_connection(self, config: MCPServerConfig) -> _Connection:
+        if config.replicas > 1:
+            return ReplicaSet(
+                config,
+                lambda on_tools_changed: self._new_replica(config, on_tools_changed),
+                on_tools_changed=self._on_tools_changed,
             )
-            read_stream, write_stream, _get_session_id = transport
-        elif cfg.transport == "sse":
-            from mcp.client.sse import sse_client
-            transport = await self._exit_stack.enter_async_context(
-                sse_client(url=cfg.url)
+        return self._new_replica(config, self._on_tools_changed)
+
+    def _new_replica(
+        self, config: MCPServerConfig, on_tools_changed: Callable[[Any], None]
+    ) -> SupervisedConnection | LazyServerConnection:
+        if not self.lazy:
+            return SupervisedConnection(
+                config,
+                snapshot=self._snapshot,
+                connect_timeout=self.connect_timeout,
+                on_tools_changed=on_tools_changed,
             )
-            read_stream, write_stream = transport
-        else:
-            server_params = StdioServerParameters(
-                command=cfg.command,
-                args=cfg.args,
-                env=cfg.env or None,
+        return LazyServerConnection(
+            config,
+            self._snapshot,
+            connect_timeout=self.connect_timeout,
+            on_tools_changed=on_tools_changed,
+        )
+
+    def _new_registry(self, sessions: dict[str, _Connection]) -> ToolRegistry:
+        """Index the tools of ``sessions`` under the client's collision policy.
+
+        Raises:
+            ValueError: On a name collision the policy does not resolve, or a
+                server tool that would be shadowed by ``read_tool_output``.
+        """
+        registry = ToolRegistry(
+            {name: conn.tools for name, conn in sessions.items()},
+            on_collision=self._on_tool_collision,
+        )
+        if self.output_store is not None:
+            for server in registry.servers:
+                self.output_store.check_names(registry.names_for(server), server)
+        return registry
+
+    def _on_tools_changed(self, conn: _Connection) -> None:
+        """Re-index a server whose live tools differ from its snapshot."""
+        if self._sessions.get(conn.name) is not conn:
+            return  # still starting; the registry is built once it is up
+        try:
+            self._registry = self._new_registry(self._sessions)
+        except ValueError as e:
+            logger.error("Keeping the previous tool registry: %s", e)
+
+    async def _reap_idle(self) -> None:
+        """Close lazily opened sessions that have been idle for ``idle_timeout``."""
+        interval = min(self.idle_timeout / 2, 30.0)
+        while True:
+            await asyncio.sleep(interval)
+            for conn in list(self._sessions.values()):
+                for replica in _replicas(conn):
+                    if (
+                        isinstance(replica, LazyServerConnection)
+                        and await replica.close_if_idle(self.idle_timeout)
+                    ):
+                        logger.info("Closed idle server '%s'", replica.name)
+
+    async def _retire(self, conn: _Connection) -> None:
+        """Close a connection once its in-flight calls have finished."""
+        if not await conn.drain(self.drain_timeout):
+            logger.warning(
+                "Closing server '%s' with %d call(s) still running after %ss",
+                conn.name, conn.in_flight, self.drain_timeout,
             )
-            transport = await self._exit_stack.enter_async_context(
-                stdio_client(server_params)
+        await conn.close()
+
+    @property
+    def startup_report(self) -> dict[str, ServerStartupReport]:
+        """Per-server connection outcome from the last startup, keyed by server name."""
+        return dict(self._startup_report)
+
+    @property
+    def queue_stats(self) -> dict[str, LimiterStats]:
+        """Per-server concurrency and queue-wait counters, for servers that have been called."""
+        return {name: limiter.stats for name, limiter in self._limiters.items()}
+
+    @property
+    def hedge_stats(self) -> dict[str, HedgeStats]:
+        """Per-server hedge and retry counters for idempotent tools that have been called."""
+        return dict(self._hedger.stats)
+
+    @property
+    def coalesce_stats(self) -> dict[str, SingleFlightStats]:
+        """Per-server counts of identical concurrent calls merged into one."""
+        return dict(self._single_flight.stats)
+
+    def stats(self) -> ClientStats:
+        """Load, latency and LLM usage so far, per server and per provider.
+
+        Every server in the current config is included, called or not.
+        """
+        servers: dict[str, ServerStats] = {}
+        for name, config in self._config.servers.items():
+            conn = self._sessions.get(name)
+            replicas = _replicas(conn) if conn is not None else []
+            limiter = self._limiters.get(name)
+            tool_calls = self.metrics.tool_calls
+            calls = int(tool_calls.total(server=name))
+            latency = self.metrics.tool_latency
+            servers[name] = ServerStats(
+                connected=any(r.connected for r in replicas),
+                replicas=config.replicas,
+                restarts=sum(getattr(r, "restarts", 0) for r in replicas),
+                in_flight=limiter.stats.in_flight if limiter else sum(r.in_flight for r in replicas),
+                queued=limiter.stats.queued if limiter else 0,
+                rejected=limiter.stats.rejected if limiter else 0,
+                calls=calls,
+                errors=calls - int(tool_calls.total(server=name, outcome="ok")),
+                mean_latency=latency.sum(server=name) / calls if calls else 0.0,
+                p95_latency=latency.quantile(0.95, server=name),
             )
-            read_stream, write_stream = transport
 
-        session = await self._exit_stack.enter_async_context(
-            ClientSession(read_stream, write_stream)
+        llm: dict[str, LLMStats] = {}
+        for _, labels, value in self.metrics.llm_requests.samples():
+            llm.setdefault(labels["provider"], LLMStats()).requests += int(value)
+        for _, labels, value in self.metrics.llm_tokens.samples():
+            provider = llm.setdefault(labels["provider"], LLMStats())
+            if labels["direction"] == "input":
+                provider.input_tokens += int(value)
+            else:
+                provider.output_tokens += int(value)
+
+        rounds = self.metrics.llm_rounds
+        chats = rounds.count()
+        return ClientStats(
+            servers=servers,
+            llm=llm,
+            chats=chats,
+            mean_rounds=rounds.sum() / chats if chats else 0.0,
+        )
+
+    def _register_server_metrics(self) -> None:
+        """Add per-server gauges that are read from the live connections on each scrape."""
+        registry = self.metrics.registry
+        queued = registry.gauge("mcp_queue_depth", "Tool calls waiting for a server slot.", ("server",))
+        in_flight = registry.gauge("mcp_calls_in_flight", "Tool calls running on a server.", ("server",))
+        connected = registry.gauge("mcp_server_up", "Whether a server has a live session (1) or not (0).", ("server",))
+        rejected = registry.counter(
+            "mcp_calls_rejected_total", "Tool calls turned away because the server queue was full.", ("server",)
+        )
+        restarts = registry.counter(
+            "mcp_session_restarts_total", "Sessions started to replace a crashed one.", ("server",)
         )
-        await session.initialize()
-        return session
+
+        def collect() -> None:
+            for gauge in (queued, in_flight, connected):
+                gauge.clear()
+            for name, stats in self.stats().servers.items():
+                queued.set(stats.queued, server=name)
+                in_flight.set(stats.in_flight, server=name)
+                connected.set(int(stats.connected), server=name)
+                rejected.set_total(stats.rejected, server=name)
+                restarts.set_total(stats.restarts, server=name)
+
+        registry.add_collector(collect)
+
+    @property
+    def registry(self) -> ToolRegistry:
+        """Index of the connected servers' tools (see :class:`~mcp_toolkit.registry.ToolRegistry`)."""
+        return self._registry
 
     @property
     def all_tools(self) -> list:
-        """All MCP tool objects across every connected server."""
-        return self._all_mcp_tools
+        """All MCP tool objects across every connected server, as the model sees them.
+
+        Includes ``read_tool_output`` when there is an :attr:`output_store`.
+        """
+        if self.output_store is None:
+            return self._registry.tools
+        return [*self._registry.tools, self.output_store.tool]
 
     @property
     def tool_names(self) -> list[str]:
         """Names of all available tools across all servers."""
-        return [t.name for t in self._all_mcp_tools]
+        return [t.name for t in self.all_tools]
+
+    @property
+    def tool_schemas(self) -> ToolSchemaCache:
+        """Shared cache of OpenAI Chat Completions tool payloads.
+
+        Agents built on this client convert their tool subsets through it,
+        so each tool schema is cleaned once no matter how many agents use it.
+        """
+        return self._tool_schemas
+
+    @property
+    def dispatcher(self) -> ToolDispatcher:
+        """The shared tool dispatcher (also used by agents built on this client)."""
+        return self._dispatcher
+
+    @property
+    def result_cache(self) -> ToolResultCache | None:
+        """The tool result cache, if one was configured."""
+        return self._result_cache
 
     @property
     def server_names(self) -> list[str]:
@@ -192,10 +690,7 @@ class MultiServerClient:
         Returns:
             List of tool names from that server.
         """
-        return [
-            name for name, server in self._tool_to_server.items()
-            if server == server_name
-        ]
+        return self._registry.names_for(server_name)
 
     async def call_tool_on_server(
         self, server_name: str, tool_name: str, arguments: dict[str, Any] = None
@@ -211,45 +706,113 @@ class MultiServerClient:
 
         Returns:
             Tool result as text.
+
+        Raises:
+            TimeoutError: If the call ran out of time (see :meth:`call_tool`).
         """
-        session = self._sessions.get(server_name)
-        if not session:
+        if server_name not in self._sessions:
             raise ValueError(f"Server '{server_name}' not connected. Available: {self.server_names}")
-
-        result = await session.call_tool(tool_name, arguments or {})
-
-        if hasattr(result, "content"):
-            if isinstance(result.content, list):
-                return "\n".join(
-                    getattr(part, "text", str(part)) for part in result.content
-                )
-            return str(result.content)
-        return str(result)
+        return await self._call(server_name, tool_name, arguments)
 
     async def call_tool(self, name: str, arguments: dict[str, Any] = None) -> str:
         """Execute a tool on the appropriate server.
 
+        Results of tools with a ``cache_ttl`` policy are served from
+        :attr:`result_cache` when possible. Calls are bounded by the tool's
+        timeout (see :meth:`MCPServerConfig.call_timeout`) and the current
+        :func:`~mcp_toolkit.deadline.deadline`. Tools with an ``idempotent``
+        policy are hedged and retried (see :mod:`mcp_toolkit.hedging`), and
+        identical concurrent calls to them or to cached tools share one
+        upstream call (see :mod:`mcp_toolkit.singleflight`). Results longer
+        than the tool's ``max_output_chars`` are cut (see
+        :mod:`mcp_toolkit.output`).
+
         Args:
-            name: Tool name.
+            name: Tool name as shown to the model, or a qualified
+                ``"<server>.<tool>"`` name.
             arguments: Tool arguments.
 
         Returns:
             Tool result as text.
+
+        Raises:
+            TimeoutError: If the call ran out of time; it is cancelled on the
+                server too.
         """
-        server_name = self._tool_to_server.get(name)
-        if not server_name:
+        if self.output_store is not None and name == self.output_store.tool.name:
+            return await self.output_store.call(arguments)
+        entry = self._registry.get(name)
+        if entry is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await self._call(entry.server, entry.name, arguments)
+
+    async def _call(self, server_name: str, tool_name: str, arguments: dict[str, Any] | None) -> str:
+        """Call a tool on a connected server, going through single-flight and the result cache."""
+        conn = self._sessions[server_name]
+        policy = conn.config.tool_policy(tool_name)
+        max_chars = conn.config.output_limit(tool_name)
+
+        async def limited() -> Any:
+            with span("mcp.call_tool", server=server_name, tool=tool_name):
+                async with self._limiter(conn.config).slot(current_flow.get()):
+                    return await conn.call_tool(tool_name, arguments or {})
+
+        async def attempt() -> Any:
+            # The timeout covers queueing for a slot as well as the call
+            return await call_with_timeout(
+                limited(),
+                conn.config.call_timeout(tool_name),
+                f"Tool '{tool_name}' on server '{server_name}'",
+            )
 
-        session = self._sessions[server_name]
-        result = await session.call_tool(name, arguments or {})
+        async def invoke() -> tuple[str, bool]:
+            started = time.perf_counter()
+            try:
+                if policy.idempotent:
+                    # A duplicate on the same session only doubles the upstream load
+                    live = sum(replica.connected for replica in _replicas(conn))
+                    result = await self._hedger.call(
+                        server_name, tool_name, attempt, policy, can_hedge=live > 1
+                    )
+                else:
+                    result = await attempt()
+            except BaseException as e:
+                self.metrics.tool_call(server_name, tool_name, time.perf_counter() - started, error=e)
+                raise
+            ok = not getattr(result, "isError", False)
+            self.metrics.tool_call(server_name, tool_name, time.perf_counter() - started, ok=ok)
+            text, spilled = await _tool_text(result, max_chars, self.output_store, server_name, tool_name)
+            # A spilled result names a file the store may delete long before
+            # a cache entry would expire, so it is not cached
+            return text, ok and not spilled
+
+        async def cached() -> str:
+            if self._result_cache is None:
+                text, _ = await invoke()
+                return text
+            return await self._result_cache.get_or_call(
+                server_name, tool_name, arguments, policy.cache_ttl, invoke
+            )
 
-        if hasattr(result, "content"):
-            if isinstance(result.content, list):
-                return "\n".join(
-                    getattr(part, "text", str(part)) for part in result.content
-                )
-            return str(result.content)
-        return str(result)
+        key = coalesce_key(server_name, tool_name, arguments, policy)
+        if key is None:
+            return await cached()
+        return await self._single_flight.do(key, cached)
+
+    def _limiter(self, config: MCPServerConfig) -> ServerLimiter:
+        """The server's limiter, kept in step with its (possibly reloaded) config."""
+        max_concurrency = config.max_concurrency or self._server_concurrency.get(config.name)
+        limiter = self._limiters.get(config.name)
+        if limiter is None:
+            limiter = self._limiters[config.name] = ServerLimiter(
+                config.name,
+                max_concurrency,
+                config.max_queue,
+                on_admit=lambda seconds, server=config.name: self.metrics.queue_wait(server, seconds),
+            )
+        elif (limiter.max_concurrency, limiter.max_queue) != (max_concurrency, config.max_queue):
+            limiter.configure(max_concurrency, config.max_queue)
+        return limiter
 
     async def chat(self, message: str) -> str:
         """Send a message and get a response with automatic multi-server tool use.
@@ -263,43 +826,77 @@ class MultiServerClient:
         Returns:
             The model's final text response.
         """
-        tools = mcp_to_openai_completions(self._all_mcp_tools)
-        messages: list[dict[str, Any]] = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": message},
-        ]
+        # Sticky tools need a flow to stick to (see ReplicaSet)
+        with _chat_flow():
+            tools = self._tool_schemas.convert(self.all_tools)
+            messages: list[dict[str, Any]] = [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": message},
+            ]
+
+            budget = ContextBudget(self.max_context_tokens)
+            rounds = 0
+            while True:
+                await budget.fit(messages)
+                with span("llm.request", provider="openai", model=self.model):
+                    response = await self._openai.chat.completions.create(
+                        model=self.model,
+                        tools=tools,
+                        messages=messages,
+                        temperature=self.temperature,
+                    )
+                self.metrics.llm_request("openai", self.model, getattr(response, "usage", None))
+                budget.record(getattr(response, "usage", None), messages)
+                rounds += 1
+
+                msg = response.choices[0].message
+
+                if not msg.tool_calls:
+                    self.metrics.chat_finished(type(self).__name__, rounds)
+                    return msg.content or ""
+
+                messages.append(msg.model_dump())
+
+                # Run every tool call from this turn concurrently, across servers
+                results = await self._dispatcher.dispatch([
+                    ToolCall(tc.id, tc.function.name, _parse_arguments(tc.function.arguments))
+                    for tc in msg.tool_calls
+                ])
+                for r in results:
+                    messages.append({
+                        "role": "tool",
+                        "tool_call_id": r.call.id,
+                        "content": r.content if r.ok else f"Error: {r.error}",
+                    })
+
+    async def chat_stream(self, message: str) -> AsyncIterator[StreamEvent]:
+        """Like :meth:`chat`, but streams text deltas and tool call events.
 
-        while True:
-            response = await self._openai.chat.completions.create(
-                model=self.model,
-                tools=tools,
+        Args:
+            message: User message.
+
+        Yields:
+            :class:`~mcp_toolkit.clients.base.StreamEvent` objects, ending
+            with a ``"done"`` event.
+        """
+        with _chat_flow():
+            messages: list[dict[str, Any]] = [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": message},
+            ]
+            async for event in _stream_chat_completions(
+                self._openai,
+                self._dispatcher,
                 messages=messages,
+                tools=self._tool_schemas.convert(self.all_tools),
+                format_error=lambda r: f"Error: {r.error}",
+                metrics=self.metrics,
+                agent=type(self).__name__,
+                budget=ContextBudget(self.max_context_tokens),
+                model=self.model,
                 temperature=self.temperature,
-            )
-
-            msg = response.choices[0].message
-
-            if not msg.tool_calls:
-                return msg.content or ""
-
-            messages.append(msg.model_dump())
-
-            for tc in msg.tool_calls:
-                try:
-                    tool_args = json.loads(tc.function.arguments or "{}")
-                except (json.JSONDecodeError, TypeError):
-                    tool_args = {}
-
-                try:
-                    result = await self.call_tool(tc.function.name, tool_args)
-                except Exception as e:
-                    result = f"Error: {e}"
-
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": result,
-                })
+            ):
+                yield event
 
     async def chat_loop(self) -> None:
         """Run an interactive terminal chat session."""
@@ -320,3 +917,32 @@ class MultiServerClient:
 
             response = await self.chat(query)
             print(f"\nAssistant: {response}\n")
+
+
+def _chat_flow() -> AbstractContextManager[None]:
+    """A flow of its own for one chat, unless the caller already set one."""
+    if current_flow.get() is not None:
+        return nullcontext()
+    return flow(uuid.uuid4().hex)
+
+
+def _replicas(conn: _Connection) -> list:
+    """The individual connections behind a server's entry in ``_sessions``."""
+    return conn.replicas if isinstance(conn, ReplicaSet) else [conn]
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    """Modification time and size of a file, or ``None`` if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _digest(path: Path) -> str | None:
+    """Content hash of a file, or ``None`` if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
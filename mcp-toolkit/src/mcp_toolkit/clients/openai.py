@@ -7,12 +7,21 @@ Handles the full tool-calling loop automatically.
 
 from __future__ import annotations
 
-import json
 import os
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Hashable
 
-from mcp_toolkit.clients.base import BaseMCPClient, _extract_tool_text
-from mcp_toolkit.converters import mcp_to_openai_completions
+from mcp_toolkit.clients.base import (
+    BaseMCPClient,
+    StreamEvent,
+    ToolCall,
+    ToolCallResult,
+    ToolDispatcher,
+    _parse_arguments,
+)
+from mcp_toolkit.budget import ContextBudget
+from mcp_toolkit.converters import ToolSchemaCache, to_openai_completions
+from mcp_toolkit.metrics import ClientMetrics
+from mcp_toolkit.tracing import end_span, span, start_span
 
 
 class OpenAIMCPClient(BaseMCPClient):
@@ -33,6 +42,7 @@ class OpenAIMCPClient(BaseMCPClient):
         model: str = "gpt-4o-mini",
         api_key: str | None = None,
         temperature: float = 0,
+        openai_client: Any = None,
         **kwargs,
     ):
         """Initialize the OpenAI MCP client.
@@ -41,12 +51,20 @@ class OpenAIMCPClient(BaseMCPClient):
             model: OpenAI model name (default: gpt-4o-mini).
             api_key: OpenAI API key. Falls back to OPENAI_API_KEY env var.
             temperature: Sampling temperature (0 = deterministic).
+            openai_client: A ready-made ``AsyncOpenAI``-compatible client
+                (e.g. Azure, a proxy, or a fake for benchmarks). When given,
+                ``api_key`` is not needed.
             **kwargs: Passed to BaseMCPClient (server_script, server_url, etc.)
         """
         super().__init__(**kwargs)
         self.model = model
         self.temperature = temperature
+        self._tool_schemas = ToolSchemaCache(to_openai_completions)
+        self._openai = openai_client or self._default_openai(api_key)
 
+    @staticmethod
+    def _default_openai(api_key: str | None) -> Any:
+        """Build an ``AsyncOpenAI`` client from ``api_key`` or the environment."""
         resolved_key = api_key or os.getenv("OPENAI_API_KEY")
         if not resolved_key:
             raise ValueError(
@@ -61,7 +79,7 @@ class OpenAIMCPClient(BaseMCPClient):
                 "Install with: pip install 'mcp-toolkit[openai]'"
             ) from e
 
-        self._openai = AsyncOpenAI(api_key=resolved_key)
+        return AsyncOpenAI(api_key=resolved_key)
 
     async def chat(self, message: str) -> str:
         """Send a message and get a response with automatic tool execution.
@@ -78,40 +96,209 @@ class OpenAIMCPClient(BaseMCPClient):
         Returns:
             The model's final text response.
         """
-        tools = mcp_to_openai_completions(self._mcp_tools)
+        tools = self._tool_schemas.convert(self._model_tools())
         messages: list[dict[str, Any]] = [
             {"role": "system", "content": self.system_prompt},
             {"role": "user", "content": message},
         ]
 
+        budget = ContextBudget(self.max_context_tokens)
+        rounds = 0
         while True:
-            response = await self._openai.chat.completions.create(
-                model=self.model,
-                tools=tools,
-                messages=messages,
-                temperature=self.temperature,
-            )
+            await budget.fit(messages)
+            with span("llm.request", provider="openai", model=self.model):
+                response = await self._openai.chat.completions.create(
+                    model=self.model,
+                    tools=tools,
+                    messages=messages,
+                    temperature=self.temperature,
+                )
+            self.metrics.llm_request("openai", self.model, getattr(response, "usage", None))
+            budget.record(getattr(response, "usage", None), messages)
+            rounds += 1
 
             msg = response.choices[0].message
 
             if not msg.tool_calls:
+                self.metrics.chat_finished(type(self).__name__, rounds)
                 return msg.content or ""
 
             messages.append(msg.model_dump())
 
-            for tc in msg.tool_calls:
-                try:
-                    tool_args = json.loads(tc.function.arguments or "{}")
-                except (json.JSONDecodeError, TypeError):
-                    tool_args = {}
-
-                try:
-                    result = await self.call_tool(tc.function.name, tool_args)
-                except Exception as e:
-                    result = f"Error: {e}"
-
+            # Run every tool call from this turn concurrently
+            results = await self._dispatcher.dispatch([
+                ToolCall(tc.id, tc.function.name, _parse_arguments(tc.function.arguments))
+                for tc in msg.tool_calls
+            ])
+            for r in results:
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": result,
+                    "tool_call_id": r.call.id,
+                    "content": r.content if r.ok else f"Error: {r.error}",
                 })
+
+    async def chat_stream(self, message: str) -> AsyncIterator[StreamEvent]:
+        """Like :meth:`chat`, but streams text deltas and tool call events.
+
+        Args:
+            message: User message.
+
+        Yields:
+            :class:`~mcp_toolkit.clients.base.StreamEvent` objects, ending
+            with a ``"done"`` event.
+        """
+        messages: list[dict[str, Any]] = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": message},
+        ]
+        async for event in _stream_chat_completions(
+            self._openai,
+            self._dispatcher,
+            messages=messages,
+            tools=self._tool_schemas.convert(self._model_tools()),
+            format_error=lambda r: f"Error: {r.error}",
+            metrics=self.metrics,
+            agent=type(self).__name__,
+            budget=ContextBudget(self.max_context_tokens),
+            model=self.model,
+            temperature=self.temperature,
+        ):
+            yield event
+
+
+class _CompletionAccumulator:
+    """Reassembles a streamed Chat Completions response from its chunks."""
+
+    def __init__(self):
+        self._text: list[str] = []
+        self._calls: dict[int, dict[str, Any]] = {}
+        self.usage: Any = None
+
+    @property
+    def text(self) -> str:
+        """All content received so far."""
+        return "".join(self._text)
+
+    def add(self, chunk: Any) -> str:
+        """Absorb one chunk and return its text delta (possibly empty)."""
+        # With include_usage, the last chunk carries usage and no choices
+        usage = getattr(chunk, "usage", None)
+        if usage is not None:
+            self.usage = usage
+        if not chunk.choices:
+            return ""
+        delta = chunk.choices[0].delta
+        for tc in delta.tool_calls or []:
+            slot = self._calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+            if tc.id:
+                slot["id"] = tc.id
+            if tc.function:
+                slot["name"] += tc.function.name or ""
+                slot["arguments"] += tc.function.arguments or ""
+        text = delta.content or ""
+        if text:
+            self._text.append(text)
+        return text
+
+    def tool_calls(self) -> list[ToolCall]:
+        """The tool calls requested by the response, in index order."""
+        return [
+            ToolCall(slot["id"], slot["name"], _parse_arguments(slot["arguments"]))
+            for _, slot in sorted(self._calls.items())
+        ]
+
+    def message(self) -> dict[str, Any]:
+        """The assistant turn as a message dict, ready to append to history."""
+        return {
+            "role": "assistant",
+            "content": self.text or None,
+            "tool_calls": [
+                {
+                    "id": slot["id"],
+                    "type": "function",
+                    "function": {"name": slot["name"], "arguments": slot["arguments"]},
+                }
+                for _, slot in sorted(self._calls.items())
+            ],
+        }
+
+
+async def _stream_chat_completions(
+    openai_client: Any,
+    dispatcher: ToolDispatcher,
+    *,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]],
+    format_error: Callable[[ToolCallResult], str],
+    max_rounds: int | None = None,
+    flow: Hashable = None,
+    metrics: ClientMetrics | None = None,
+    agent: str = "",
+    budget: ContextBudget | None = None,
+    **create_kwargs: Any,
+) -> AsyncIterator[StreamEvent]:
+    """Streaming Chat Completions tool-calling loop.
+
+    Shared by every client and agent that talks to OpenAI Chat Completions.
+    ``messages`` is extended in place with the assistant and tool turns.
+
+    Args:
+        openai_client: An ``AsyncOpenAI`` instance.
+        dispatcher: Dispatcher that executes the requested tool calls.
+        messages: Conversation so far.
+        tools: Tool payloads in Chat Completions format.
+        format_error: Builds the tool message content for a failed call.
+        max_rounds: Tool-calling rounds allowed before one last request is
+            made without tools. ``None`` means no limit.
+        flow: Flow the tool calls are queued under (see :mod:`mcp_toolkit.limiter`).
+        metrics: Where to record requests, token usage and rounds.
+        agent: Who is chatting, for the ``llm_rounds_per_chat`` metric.
+        budget: Keeps the prompt under a token limit and counts usage.
+        **create_kwargs: Passed to ``chat.completions.create`` (model, temperature, ...).
+    """
+    rounds = 0
+    while True:
+        offer_tools = bool(tools) and (max_rounds is None or rounds < max_rounds)
+        request = dict(create_kwargs, messages=messages, stream=True)
+        if offer_tools:
+            request["tools"] = tools
+        if metrics is not None or budget is not None:
+            request["stream_options"] = {"include_usage": True}
+        if budget is not None:
+            await budget.fit(messages)
+
+        accumulator = _CompletionAccumulator()
+        requesting = start_span("llm.request", provider="openai", model=str(create_kwargs.get("model")))
+        try:
+            async with await openai_client.chat.completions.create(**request) as stream:
+                async for chunk in stream:
+                    text = accumulator.add(chunk)
+                    if text:
+                        yield StreamEvent("text", text=text)
+        except BaseException as e:
+            end_span(requesting, e)
+            raise
+        end_span(requesting)
+        if metrics is not None:
+            metrics.llm_request("openai", str(create_kwargs.get("model")), accumulator.usage)
+        if budget is not None:
+            budget.record(accumulator.usage, messages)
+
+        calls = accumulator.tool_calls()
+        if not calls or not offer_tools:
+            if metrics is not None:
+                metrics.chat_finished(agent, rounds + 1)
+            yield StreamEvent("done", text=accumulator.text)
+            return
+
+        messages.append(accumulator.message())
+        results: list[ToolCallResult] = []
+        async for event in dispatcher.dispatch_stream(calls, results, flow=flow):
+            yield event
+        for r in results:
+            messages.append({
+                "role": "tool",
+                "tool_call_id": r.call.id,
+                "content": r.content if r.ok else format_error(r),
+            })
+        rounds += 1
@@ -7,16 +7,150 @@ Supports loading from JSON files, environment variables, or programmatic dicts.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 
 VALID_TRANSPORTS = ("stdio", "sse", "streamable_http")
+VALID_WHILE_DOWN = ("queue", "fail")
+
+
+@dataclass
+class ToolPolicy:
+    """Per-tool behaviour overrides, set under a server's ``"tools"`` key.
+
+    Example config:
+        ```json
+        "weather": {
+          "command": "python",
+          "args": ["weather_server.py"],
+          "tools": {"get_current_weather": {"cache_ttl": 600}}
+        }
+        ```
+
+    Attributes:
+        cache_ttl: Seconds a successful result may be served from a
+            :class:`~mcp_toolkit.cache.ToolResultCache`. ``None`` (default)
+            means the tool is never cached.
+        sticky: On a server with several ``replicas``, send every call made
+            in the same flow (see :func:`mcp_toolkit.limiter.flow`) to the
+            same replica, for tools that keep state between calls.
+        timeout: Seconds a call to this tool may take before it is cancelled
+            (see :mod:`mcp_toolkit.deadline`). ``None`` (default) falls back
+            to the server's ``tool_timeout``.
+        idempotent: Calling the tool twice with the same arguments does no
+            harm, so :class:`~mcp_toolkit.clients.multi.MultiServerClient`
+            may hedge and retry it (see :mod:`mcp_toolkit.hedging`).
+        retries: For idempotent tools, extra attempts after a transient
+            failure (the server went away, the call timed out).
+        hedge: For idempotent tools on a server with several live
+            ``replicas``, send a duplicate call to another replica when the
+            first runs past the tool's recent p95 latency.
+        max_output_chars: Longest result passed on to the model; longer
+            results keep their beginning and end (see
+            :mod:`mcp_toolkit.output`). ``None`` (default) falls back to the
+            server's ``max_output_chars``.
+        coalesce: Merge identical calls that are in flight at the same time
+            into one upstream call (see :mod:`mcp_toolkit.singleflight`).
+            Independent of ``cache_ttl``: nothing is kept once the call
+            finishes.
+    """
+    cache_ttl: float | None = None
+    sticky: bool = False
+    timeout: float | None = None
+    idempotent: bool = False
+    retries: int = 2
+    hedge: bool = True
+    max_output_chars: int | None = None
+    coalesce: bool = False
+
+    def validate(self, server: str, tool: str) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if self.cache_ttl is not None and self.cache_ttl < 0:
+            raise ValueError(
+                f"Server '{server}', tool '{tool}': cache_ttl must not be negative, "
+                f"got {self.cache_ttl}"
+            )
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError(
+                f"Server '{server}', tool '{tool}': timeout must be positive, got {self.timeout}"
+            )
+        if self.retries < 0:
+            raise ValueError(
+                f"Server '{server}', tool '{tool}': retries must not be negative, got {self.retries}"
+            )
+        if self.max_output_chars is not None and self.max_output_chars < 1:
+            raise ValueError(
+                f"Server '{server}', tool '{tool}': max_output_chars must be at least 1, "
+                f"got {self.max_output_chars}"
+            )
+
+
+@dataclass
+class RestartPolicy:
+    """How a lost server connection is restarted, set under a server's ``"restart"`` key.
+
+    Example config:
+        ```json
+        "flights": {
+          "command": "python",
+          "args": ["flight_server.py"],
+          "restart": {"max_attempts": 10, "max_backoff": 60, "while_down": "fail"}
+        }
+        ```
+
+    Attributes:
+        max_attempts: Restart attempts before giving up on the server.
+            ``None`` retries forever; ``0`` disables restarts.
+        backoff: Seconds before the first attempt; doubled after each
+            failed attempt.
+        max_backoff: Upper bound for the delay between attempts.
+        while_down: What tool calls do while the server is restarting:
+            ``"queue"`` (default) waits for it to come back, ``"fail"`` raises
+            ``ConnectionError`` straight away.
+        health_interval: Seconds between pings of an idle session, so a dead
+            server is restarted before a call runs into it. ``None`` (default)
+            only detects failures on tool calls.
+    """
+    max_attempts: int | None = 5
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    while_down: Literal["queue", "fail"] = "queue"
+    health_interval: float | None = None
+
+    def validate(self, server: str) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if self.max_attempts is not None and self.max_attempts < 0:
+            raise ValueError(
+                f"Server '{server}': restart.max_attempts must not be negative, "
+                f"got {self.max_attempts}"
+            )
+        if self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError(f"Server '{server}': restart backoff must not be negative")
+        if self.while_down not in VALID_WHILE_DOWN:
+            raise ValueError(
+                f"Server '{server}': restart.while_down must be one of {VALID_WHILE_DOWN}, "
+                f"got '{self.while_down}'"
+            )
+        if self.health_interval is not None and self.health_interval <= 0:
+            raise ValueError(
+                f"Server '{server}': restart.health_interval must be positive, "
+                f"got {self.health_interval}"
+            )
 
 
 @dataclass
@@ -31,6 +165,22 @@ class MCPServerConfig:
         url: Endpoint URL for SSE or streamable_http transport.
         transport_type: Explicit transport override ("stdio", "sse", "streamable_http").
             If not set, auto-detected from other fields.
+        connect_timeout: Maximum seconds to wait for the server to start and
+            complete its handshake. ``None`` means no limit.
+        tool_timeout: Maximum seconds a tool call may take, for tools without
+            a ``timeout`` policy of their own. ``None`` means no limit.
+        max_output_chars: Longest tool result passed on to the model, for
+            tools without a ``max_output_chars`` policy of their own.
+            ``None`` means no limit.
+        max_concurrency: Tool calls allowed to run on this server at once.
+            ``None`` means no limit.
+        max_queue: Tool calls allowed to wait for a slot when
+            ``max_concurrency`` is reached; further calls fail immediately.
+            ``None`` means no limit.
+        replicas: Sessions to run for this server; calls are spread across
+            them (see :class:`~mcp_toolkit.replicas.ReplicaSet`).
+        tools: Per-tool policies keyed by tool name (see :class:`ToolPolicy`).
+        restart: What to do when the connection is lost (see :class:`RestartPolicy`).
     """
     name: str = ""
     command: str = ""
@@ -38,6 +188,14 @@ class MCPServerConfig:
     env: dict[str, str] = field(default_factory=dict)
     url: str = ""
     transport_type: str = ""
+    connect_timeout: float | None = None
+    tool_timeout: float | None = None
+    max_output_chars: int | None = None
+    max_concurrency: int | None = None
+    max_queue: int | None = None
+    replicas: int = 1
+    tools: dict[str, ToolPolicy] = field(default_factory=dict)
+    restart: RestartPolicy = field(default_factory=RestartPolicy)
 
     @property
     def transport(self) -> str:
@@ -48,6 +206,37 @@ class MCPServerConfig:
             return "sse"
         return "stdio"
 
+    def tool_policy(self, tool_name: str) -> ToolPolicy:
+        """Return the policy for a tool, or the default policy if none is set."""
+        return self.tools.get(tool_name) or _DEFAULT_POLICY
+
+    def call_timeout(self, tool_name: str) -> float | None:
+        """Seconds a call to ``tool_name`` may take, or ``None`` for no limit."""
+        timeout = self.tool_policy(tool_name).timeout
+        return self.tool_timeout if timeout is None else timeout
+
+    def output_limit(self, tool_name: str) -> int | None:
+        """Characters of a ``tool_name`` result passed on to the model, or ``None`` for no limit."""
+        limit = self.tool_policy(tool_name).max_output_chars
+        return self.max_output_chars if limit is None else limit
+
+    def fingerprint(self) -> str:
+        """Return a stable hash of the fields that define the connection.
+
+        Two configs with the same fingerprint connect to the same server in
+        the same way, so a live session for one can be reused for the other.
+        """
+        identity = {
+            "name": self.name,
+            "transport": self.transport,
+            "command": self.command,
+            "args": self.args,
+            "env": self.env,
+            "url": self.url,
+        }
+        encoded = json.dumps(identity, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
     def validate(self) -> None:
         """Validate the configuration.
 
@@ -67,6 +256,39 @@ class MCPServerConfig:
             raise ValueError(
                 f"Server '{self.name}': cannot specify both 'command' and 'url'"
             )
+        if self.connect_timeout is not None and self.connect_timeout <= 0:
+            raise ValueError(
+                f"Server '{self.name}': connect_timeout must be positive, "
+                f"got {self.connect_timeout}"
+            )
+        if self.tool_timeout is not None and self.tool_timeout <= 0:
+            raise ValueError(
+                f"Server '{self.name}': tool_timeout must be positive, got {self.tool_timeout}"
+            )
+        if self.max_output_chars is not None and self.max_output_chars < 1:
+            raise ValueError(
+                f"Server '{self.name}': max_output_chars must be at least 1, "
+                f"got {self.max_output_chars}"
+            )
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(
+                f"Server '{self.name}': max_concurrency must be at least 1, "
+                f"got {self.max_concurrency}"
+            )
+        if self.max_queue is not None and self.max_queue < 0:
+            raise ValueError(
+                f"Server '{self.name}': max_queue must not be negative, got {self.max_queue}"
+            )
+        if self.replicas < 1:
+            raise ValueError(
+                f"Server '{self.name}': replicas must be at least 1, got {self.replicas}"
+            )
+        for tool_name, policy in self.tools.items():
+            policy.validate(self.name, tool_name)
+        self.restart.validate(self.name)
+
+
+_DEFAULT_POLICY = ToolPolicy()
 
 
 @dataclass
@@ -83,6 +305,60 @@ class MCPConfig:
         return list(self.servers.keys())
 
 
+@dataclass
+class ConfigDiff:
+    """Server-level differences between two :class:`MCPConfig` snapshots.
+
+    Attributes:
+        added: Servers only in the new config.
+        removed: Servers only in the old config.
+        changed: Servers whose connection settings (see
+            :meth:`MCPServerConfig.fingerprint`) or replica count changed;
+            they need new sessions.
+        updated: Servers where only settings that apply to a live session
+            changed (tool policies, restart policy, concurrency limits,
+            ``connect_timeout``, ``tool_timeout``, ``max_output_chars``).
+        unchanged: Servers that are identical in both.
+    """
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        """True if nothing needs to be done to move from old to new."""
+        return not (self.added or self.removed or self.changed or self.updated)
+
+
+def diff_configs(old: MCPConfig, new: MCPConfig) -> ConfigDiff:
+    """Compare two configs server by server.
+
+    Args:
+        old: The config currently in use.
+        new: The config to move to.
+
+    Returns:
+        A :class:`ConfigDiff`; names are listed in config order.
+    """
+    diff = ConfigDiff(removed=[name for name in old.servers if name not in new.servers])
+    for name, server in new.servers.items():
+        previous = old.servers.get(name)
+        if previous is None:
+            diff.added.append(name)
+        elif (
+            previous.fingerprint() != server.fingerprint()
+            or previous.replicas != server.replicas
+        ):
+            diff.changed.append(name)
+        elif previous != server:
+            diff.updated.append(name)
+        else:
+            diff.unchanged.append(name)
+    return diff
+
+
 def load_config(
     path: str | Path | None = None,
     *,
@@ -213,6 +489,34 @@ def _resolve_server_env_vars(info: dict[str, Any]) -> dict[str, Any]:
     return resolved
 
 
+def _parse_tool_policies(server: str, data: Any) -> dict[str, ToolPolicy]:
+    """Parse a server's ``"tools"`` mapping into :class:`ToolPolicy` objects."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Server '{server}': 'tools' must be an object keyed by tool name")
+    known = {f.name for f in fields(ToolPolicy)}
+    policies = {}
+    for tool_name, options in data.items():
+        if not isinstance(options, dict):
+            raise ValueError(f"Server '{server}', tool '{tool_name}': policy must be an object")
+        unknown = set(options) - known
+        if unknown:
+            raise ValueError(
+                f"Server '{server}', tool '{tool_name}': unknown policy keys {sorted(unknown)}"
+            )
+        policies[tool_name] = ToolPolicy(**options)
+    return policies
+
+
+def _parse_restart_policy(server: str, data: Any) -> RestartPolicy:
+    """Parse a server's ``"restart"`` object into a :class:`RestartPolicy`."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Server '{server}': 'restart' must be an object")
+    unknown = set(data) - {f.name for f in fields(RestartPolicy)}
+    if unknown:
+        raise ValueError(f"Server '{server}': unknown restart keys {sorted(unknown)}")
+    return RestartPolicy(**data)
+
+
 def _parse_config(data: dict[str, Any]) -> MCPConfig:
     """Parse a config dict into MCPConfig.
 
@@ -238,6 +542,14 @@ def _parse_config(data: dict[str, Any]) -> MCPConfig:
             env=info.get("env", {}),
             url=info.get("url", ""),
             transport_type=info.get("transport", ""),
+            connect_timeout=info.get("connect_timeout"),
+            tool_timeout=info.get("tool_timeout"),
+            max_output_chars=info.get("max_output_chars"),
+            max_concurrency=info.get("max_concurrency"),
+            max_queue=info.get("max_queue"),
+            replicas=info.get("replicas", 1),
+            tools=_parse_tool_policies(name, info.get("tools", {})),
+            restart=_parse_restart_policy(name, info.get("restart", {})),
         )
         servers[name].validate()
 
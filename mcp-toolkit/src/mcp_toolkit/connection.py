@@ -0,0 +1,515 @@
+"""
+MCP Server Connections
+
+Long-lived connections to a single MCP server. Each connection owns a
+dedicated background task that enters the transport and ``ClientSession``
+contexts and keeps them open until ``close()`` is called. Given a
+:class:`~mcp_toolkit.snapshot.ToolSnapshot`, a connection skips the
+``list_tools`` round trip when the server reports the version it had last
+time and re-lists its tools in the background instead.
+:class:`LazyServerConnection` opens one on first use instead and closes it
+again when it sits idle.
+
+Running every session in its own task lets many servers start up
+concurrently (anyio cancel scopes must be exited in the task that entered
+them, so the contexts cannot simply be shared on one ``AsyncExitStack``
+across ``asyncio.gather``) and lets individual servers be stopped without
+touching the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import anyio
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.snapshot import ToolSnapshot
+from mcp_toolkit.tracing import span
+from mcp_toolkit.transports import call_tool, connect, server_version
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ServerStartupReport:
+    """Outcome of connecting to one server.
+
+    Attributes:
+        name: Server name as defined in config.
+        status: ``"connected"``, ``"failed"``, ``"timeout"`` or ``"lazy"``
+            (tools known from a snapshot; the server starts on first call).
+        elapsed: Seconds spent connecting (spawn + initialize + list_tools).
+        tool_count: Number of tools discovered (0 unless connected).
+        error: Error message if the connection did not come up.
+    """
+    name: str
+    status: str
+    elapsed: float
+    tool_count: int = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """True if the server connected successfully or is ready to connect lazily."""
+        return self.status in ("connected", "lazy")
+
+
+class ServerConnection:
+    """A connection to one MCP server, owned by a background task.
+
+    Example:
+        >>> conn = ServerConnection(MCPServerConfig(name="demo", command="python", args=["demo.py"]))
+        >>> await conn.start()
+        >>> result = await conn.session.call_tool("add", {"a": 1, "b": 2})
+        >>> await conn.close()
+    """
+
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        *,
+        snapshot: ToolSnapshot | None = None,
+        on_tools_changed: Callable[[ServerConnection], None] | None = None,
+    ):
+        """Initialize the connection (does not connect yet).
+
+        Args:
+            config: Server configuration.
+            snapshot: Where tool lists are remembered. When the server
+                reports the same version as in the snapshot, ``tools`` is
+                served from it and re-listed in the background.
+            on_tools_changed: Called if that background re-listing finds
+                tools that differ from the snapshot; ``tools`` is already
+                updated when it runs.
+        """
+        self.config = config
+        self.tools: list = []
+        self.server_version: str | None = None
+        self._snapshot = snapshot
+        self._on_tools_changed = on_tools_changed
+        self._session: ClientSession | None = None
+        self._task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._stopping = False  # close() or a failed start() is tearing it down
+        self._error: BaseException | None = None
+        self._lost = asyncio.Event()
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def name(self) -> str:
+        """Server name from config."""
+        return self.config.name
+
+    @property
+    def session(self) -> ClientSession:
+        """The active MCP session."""
+        if self._session is None:
+            raise RuntimeError(f"Server '{self.name}' is not connected.")
+        return self._session
+
+    @property
+    def connected(self) -> bool:
+        """True while the session is open."""
+        return self._session is not None and not self._lost.is_set()
+
+    @property
+    def lost(self) -> bool:
+        """True once the server went away without :meth:`close` being called."""
+        return self._lost.is_set()
+
+    async def wait_lost(self) -> None:
+        """Wait until the connection is lost (see :attr:`lost`)."""
+        await self._lost.wait()
+
+    @property
+    def in_flight(self) -> int:
+        """Tool calls currently running on this connection."""
+        return self._in_flight
+
+    async def start(self, timeout: float | None = None) -> None:
+        """Connect, initialize and load the tool list.
+
+        Args:
+            timeout: Maximum seconds to wait for the server to come up.
+
+        Raises:
+            TimeoutError: If the server did not come up within ``timeout``.
+            Exception: Whatever the transport raised while connecting.
+        """
+        if self._task is not None:
+            raise RuntimeError(f"Server '{self.name}' already started.")
+        self._task = asyncio.create_task(self._run(), name=f"mcp-server:{self.name}")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            await self._cancel()
+            raise
+        if self._error is not None:
+            await self._cancel()
+            raise self._error
+
+    async def close(self) -> None:
+        """Close the session and stop the owner task."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._closing.set()
+        try:
+            await self._task
+        except BaseException:
+            pass
+        self._task = None
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """Call a tool on this server and return the raw MCP result.
+
+        Cancelling the call cancels it on the server too.
+        """
+        session = self.session
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            return await call_tool(session, name, arguments or {})
+        except Exception as e:
+            if _connection_lost(e):
+                self._mark_lost()
+            raise
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+
+    async def ping(self, timeout: float = 5.0) -> bool:
+        """Check that the server still answers.
+
+        Returns:
+            False if the session is closed, the ping failed or it timed out.
+            A failed ping, or a session that is gone without :meth:`close`
+            being called, marks the connection as :attr:`lost`.
+        """
+        if not self.connected:
+            started = self._task is not None and self._ready.is_set()
+            if started and self._session is None and not self._stopping:
+                self._mark_lost()  # the owner task ended on its own
+            return False
+        try:
+            await asyncio.wait_for(self._session.send_ping(), timeout)
+        except Exception as e:
+            if _connection_lost(e) or isinstance(e, asyncio.TimeoutError):
+                self._mark_lost()
+            return False
+        return True
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait for in-flight tool calls to finish.
+
+        Args:
+            timeout: Maximum seconds to wait. ``None`` means no limit.
+
+        Returns:
+            True if no calls are left running, False if the timeout expired.
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _run(self) -> None:
+        """Owner task: hold the transport and session open until closed."""
+        try:
+            async with connect(config=self.config) as session:
+                self.server_version = server_version(session)
+                cached = None
+                if self._snapshot is not None and self.server_version is not None:
+                    cached = self._snapshot.get(self.config, self.server_version)
+                revalidate = None
+                if cached is None:
+                    with span("mcp.list_tools", server=self.name):
+                        self.tools = (await session.list_tools()).tools
+                    if self._snapshot is not None:
+                        self._snapshot.put(self.config, self.tools, self.server_version)
+                else:
+                    self.tools = cached
+                    revalidate = asyncio.create_task(
+                        self._revalidate(session), name=f"mcp-revalidate:{self.name}"
+                    )
+                self._session = session
+                self._ready.set()
+                try:
+                    await self._closing.wait()
+                finally:
+                    if revalidate is not None:
+                        revalidate.cancel()
+                        await asyncio.gather(revalidate, return_exceptions=True)
+        except Exception as e:
+            self._error = e
+        finally:
+            was_up = self._session is not None
+            self._session = None
+            self._ready.set()
+            if was_up and not self._stopping:
+                # The transport gave out (or the server closed it) after startup
+                if self._error is not None:
+                    logger.warning("Session of server '%s' failed: %s", self.name, self._error)
+                self._mark_lost()
+
+    def _mark_lost(self) -> None:
+        """Record that the server went away and let the owner task unwind."""
+        if not self._lost.is_set():
+            logger.warning("Lost connection to server '%s'", self.name)
+        self._lost.set()
+        self._closing.set()
+
+    async def _revalidate(self, session: ClientSession) -> None:
+        """Re-list tools after serving them from the snapshot, and adopt any changes."""
+        try:
+            with span("mcp.list_tools", server=self.name, revalidate=True):
+                tools = (await session.list_tools()).tools
+        except Exception as e:
+            logger.warning("Could not re-list tools of server '%s': %s", self.name, e)
+            return
+        if not self._snapshot.put(self.config, tools, self.server_version):
+            return
+        logger.info("Tools of server '%s' changed since they were snapshotted", self.name)
+        self.tools = tools
+        if self._on_tools_changed is not None:
+            self._on_tools_changed(self)
+
+    async def _cancel(self) -> None:
+        """Cancel the owner task and wait for it to unwind."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._task.cancel()
+        try:
+            await self._task
+        except BaseException:
+            pass
+        self._task = None
+
+
+class LazyServerConnection:
+    """A server connection that is opened on first use and closed when idle.
+
+    Exposes the same interface as :class:`ServerConnection` (``tools``,
+    ``call_tool``, ``drain``, ``close``), but ``tools`` comes from a
+    :class:`~mcp_toolkit.snapshot.ToolSnapshot` when possible, so the server
+    process is not started until a tool is actually called.
+
+    Example:
+        >>> conn = LazyServerConnection(config, snapshot)
+        >>> await conn.call_tool("get_forecast", {"city": "Rome"})   # starts the server
+        >>> await conn.close_if_idle(300)                             # stops it again
+    """
+
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        snapshot: ToolSnapshot | None = None,
+        *,
+        connect_timeout: float | None = None,
+        on_tools_changed: Callable[[LazyServerConnection], None] | None = None,
+    ):
+        """Initialize the connection (does not connect yet).
+
+        Args:
+            config: Server configuration.
+            snapshot: Source of the tool list before the server first
+                starts, and where its live tool list is recorded.
+            connect_timeout: Default seconds to wait for the server to start;
+                the server's own ``connect_timeout`` takes precedence.
+            on_tools_changed: Called whenever a (re)connect or background
+                re-listing finds tools other than the ones in ``tools``;
+                ``tools`` is already updated when it runs.
+        """
+        self.config = config
+        cached = snapshot.get(config) if snapshot is not None else None
+        self.tools: list = cached if cached is not None else []
+        self.known = cached is not None
+        self.connect_timeout = connect_timeout
+        self.last_used = time.monotonic()
+        self._snapshot = snapshot
+        self._on_tools_changed = on_tools_changed
+        self._conn: ServerConnection | None = None
+        self._lock = asyncio.Lock()
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def name(self) -> str:
+        """Server name from config."""
+        return self.config.name
+
+    @property
+    def connected(self) -> bool:
+        """True while a session is open."""
+        return self._conn is not None and self._conn.connected
+
+    @property
+    def in_flight(self) -> int:
+        """Tool calls currently running (including any waiting for the server to start)."""
+        return self._in_flight
+
+    @property
+    def server_version(self) -> str | None:
+        """The server's version, once it has been connected."""
+        return self._conn.server_version if self._conn is not None else None
+
+    async def start(self, timeout: float | None = None) -> None:
+        """Connect now rather than on first call, and refresh ``tools``.
+
+        Raises:
+            TimeoutError: If the server did not come up within the timeout.
+            Exception: Whatever the transport raised while connecting.
+        """
+        await self._ensure_open(timeout)
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """Call a tool, starting the server first if it is not running."""
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            conn = await self._ensure_open()
+            return await conn.call_tool(name, arguments)
+        finally:
+            self._in_flight -= 1
+            self.last_used = time.monotonic()
+            if not self._in_flight:
+                self._idle.set()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait for in-flight tool calls to finish (see :meth:`ServerConnection.drain`)."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close_if_idle(self, idle_timeout: float, now: float | None = None) -> bool:
+        """Close the session if nothing has used it for ``idle_timeout`` seconds.
+
+        Returns:
+            True if a session was closed.
+        """
+        now = time.monotonic() if now is None else now
+        if not self.connected or self._in_flight or now - self.last_used < idle_timeout:
+            return False
+        async with self._lock:
+            if self._in_flight or self._conn is None:
+                return False
+            conn, self._conn = self._conn, None
+        await conn.close()
+        return True
+
+    async def close(self) -> None:
+        """Close the session if one is open."""
+        async with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            await conn.close()
+
+    async def _ensure_open(self, timeout: float | None = None) -> ServerConnection:
+        if self.connected:
+            return self._conn
+        async with self._lock:
+            # Another caller may have opened it while we waited for the lock
+            if self.connected:
+                return self._conn
+            if self._conn is not None:
+                await self._conn.close()  # the old session died; replace it
+                self._conn = None
+            if timeout is None:
+                timeout = self.config.connect_timeout
+            if timeout is None:
+                timeout = self.connect_timeout
+            conn = ServerConnection(
+                self.config, snapshot=self._snapshot, on_tools_changed=self._adopt_tools
+            )
+            await conn.start(timeout=timeout)
+            self._conn = conn
+            self.known = True
+        self._adopt_tools(conn)
+        return conn
+
+    def _adopt_tools(self, conn: ServerConnection) -> None:
+        if conn is not self._conn or conn.tools == self.tools:
+            return
+        self.tools = conn.tools
+        if self._on_tools_changed is not None:
+            self._on_tools_changed(self)
+
+
+def _connection_lost(exc: BaseException) -> bool:
+    """True if an exception from a session means the server is gone."""
+    if isinstance(exc, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)):
+        return True
+    return isinstance(exc, McpError) and exc.error.code == CONNECTION_CLOSED
+
+
+def _never_sent(exc: BaseException) -> bool:
+    """True if a call failed before its request reached the server."""
+    return isinstance(exc, (anyio.ClosedResourceError, anyio.BrokenResourceError))
+
+
+async def start_connections(
+    connections: list[ServerConnection],
+    *,
+    timeout: float | None = None,
+    parallel: bool = True,
+) -> list[ServerStartupReport]:
+    """Start several connections and report the outcome of each.
+
+    Never raises for an individual server — failures and timeouts are
+    recorded in the returned reports instead.
+
+    Args:
+        connections: Connections to start.
+        timeout: Default per-server connect timeout in seconds. A server's own
+            ``connect_timeout`` takes precedence.
+        parallel: Start all servers concurrently (default) or one at a time.
+
+    Returns:
+        One report per connection, in the same order.
+    """
+    async def _start(conn: ServerConnection) -> ServerStartupReport:
+        limit = conn.config.connect_timeout if conn.config.connect_timeout is not None else timeout
+        started = time.perf_counter()
+        try:
+            await conn.start(timeout=limit)
+        except asyncio.TimeoutError:
+            return ServerStartupReport(
+                name=conn.name,
+                status="timeout",
+                elapsed=time.perf_counter() - started,
+                error=f"did not connect within {limit}s",
+            )
+        except Exception as e:
+            return ServerStartupReport(
+                name=conn.name,
+                status="failed",
+                elapsed=time.perf_counter() - started,
+                error=str(e) or type(e).__name__,
+            )
+        return ServerStartupReport(
+            name=conn.name,
+            status="connected",
+            elapsed=time.perf_counter() - started,
+            tool_count=len(conn.tools),
+        )
+
+    if parallel:
+        return list(await asyncio.gather(*(_start(c) for c in connections)))
+    return [await _start(c) for c in connections]
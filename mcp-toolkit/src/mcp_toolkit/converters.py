@@ -7,29 +7,184 @@ Handles schema cleaning and format differences transparently.
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+# Keywords whose value maps *names* to subschemas. Their keys are property or
+# definition names, so a property literally called "title" must survive.
+_NAME_MAP_KEYWORDS = frozenset({
+    "properties", "patternProperties", "$defs", "definitions", "dependentSchemas",
+})
+
+# Keywords whose value is instance data, not a schema — left untouched.
+_DATA_KEYWORDS = frozenset({"default", "const", "enum", "examples"})
+
+
+# Nesting depth handled by the fast recursive walk before a subtree is handed
+# to the iterative walk (well below Python's default recursion limit).
+_MAX_RECURSIVE_DEPTH = 200
 
 
 def clean_schema(schema: Any) -> Any:
-    """Recursively remove 'title' fields from a JSON schema.
+    """Remove 'title' fields from a JSON schema.
 
     Many LLM providers reject schemas that include 'title' keys added by
     Pydantic or other serializers. This strips them out.
 
+    The input is never modified. Subtrees that contain no 'title' are
+    returned as-is rather than copied, so the result shares structure with
+    the input — treat it as read-only. Arbitrarily deep schemas are handled
+    (subtrees nested deeper than the recursion budget are walked
+    iteratively), and ``$ref`` pointers are left as references rather than
+    expanded, so heavily reused ``$defs`` entries are cleaned once.
+
+    Property and definition *names* are preserved (a property called
+    ``"title"`` is kept), and instance data under ``default``, ``const``,
+    ``enum`` and ``examples`` is not altered.
+
     Args:
         schema: A JSON schema dict (or list/primitive).
 
     Returns:
-        The cleaned schema with all 'title' fields removed.
+        The cleaned schema with all 'title' keywords removed.
+    """
+    return _clean(schema, 0, 0)
+
+
+def _clean(node: Any, name_map: int, depth: int) -> Any:
+    """Recursive walk; returns ``node`` itself when nothing below it changed."""
+    node_type = type(node)
+    if node_type is not dict and node_type is not list:
+        if isinstance(node, (dict, list)):  # subclasses take the general path
+            return _clean_deep(node, name_map)
+        return node
+    if depth > _MAX_RECURSIVE_DEPTH:
+        return _clean_deep(node, name_map)
+
+    if node_type is list:
+        cleaned = None
+        for i, item in enumerate(node):
+            new = _clean(item, 0, depth + 1)
+            if cleaned is None and new is not item:
+                cleaned = node[:i]
+            if cleaned is not None:
+                cleaned.append(new)
+        return node if cleaned is None else cleaned
+
+    cleaned = None
+    for i, (k, v) in enumerate(node.items()):
+        if k == "title" and not name_map:
+            if cleaned is None:
+                cleaned = _dict_prefix(node, i)
+            continue
+        new = v
+        if type(v) is dict or type(v) is list:
+            flag = _child_flag(k, v, name_map)
+            if flag >= 0:
+                new = _clean(v, flag, depth + 1)
+        if cleaned is None and new is not v:
+            cleaned = _dict_prefix(node, i)
+        if cleaned is not None:
+            cleaned[k] = new
+    return node if cleaned is None else cleaned
+
+
+def _dict_prefix(node: dict, n: int) -> dict:
+    """Copy the first ``n`` items of a dict (the part already known unchanged)."""
+    prefix = {}
+    for i, (k, v) in enumerate(node.items()):
+        if i == n:
+            break
+        prefix[k] = v
+    return prefix
+
+
+def _child_flag(k: str, v: Any, name_map: int) -> int:
+    """Classify a container child: 1 = name map, 0 = schema, -1 = data (skip)."""
+    if name_map:
+        return 0
+    if k in _DATA_KEYWORDS:
+        return -1
+    return 1 if k in _NAME_MAP_KEYWORDS and isinstance(v, dict) else 0
+
+
+def _clean_deep(root: Any, root_name_map: int) -> Any:
+    """Iterative post-order walk for subtrees too deep to recurse into.
+
+    Nodes are keyed by ``id(node) << 1 | is_name_map``; ``done`` holds cleaned
+    nodes and ``pending`` the nodes whose children are still being cleaned
+    (which also stops cyclic Python objects from looping forever).
     """
-    if isinstance(schema, dict):
-        schema = {k: v for k, v in schema.items() if k != "title"}
-        for key, value in list(schema.items()):
-            schema[key] = clean_schema(value)
-        return schema
-    if isinstance(schema, list):
-        return [clean_schema(item) for item in schema]
-    return schema
+    done: dict[int, Any] = {}
+    pending: set[int] = set()
+    stack: list[tuple[Any, int]] = [(root, root_name_map)]
+
+    while stack:
+        node, name_map = stack[-1]
+        key = id(node) << 1 | name_map
+        if key in pending:
+            stack.pop()
+            pending.discard(key)
+            done[key] = _rebuild(node, name_map, done)
+            continue
+        if key in done:
+            stack.pop()
+            continue
+        pending.add(key)
+        if isinstance(node, list):
+            for item in node:
+                if isinstance(item, (dict, list)):
+                    child = id(item) << 1
+                    if child not in done and child not in pending:
+                        stack.append((item, 0))
+            continue
+        for k, v in node.items():
+            if not isinstance(v, (dict, list)):
+                continue
+            flag = _child_flag(k, v, name_map)
+            if flag < 0:
+                continue
+            child = id(v) << 1 | flag
+            if child not in done and child not in pending:
+                stack.append((v, flag))
+
+    return done[id(root) << 1 | root_name_map]
+
+
+def _rebuild(node: Any, name_map: int, done: dict[int, Any]) -> Any:
+    """Return ``node`` with cleaned children, or ``node`` itself if nothing changed."""
+    if isinstance(node, list):
+        for item in node:
+            if isinstance(item, (dict, list)) and done.get(id(item) << 1, item) is not item:
+                return [
+                    done.get(id(x) << 1, x) if isinstance(x, (dict, list)) else x
+                    for x in node
+                ]
+        return node
+
+    for k, v in node.items():
+        if k == "title" and not name_map:
+            break
+        if isinstance(v, (dict, list)):
+            flag = _child_flag(k, v, name_map)
+            if flag >= 0 and done.get(id(v) << 1 | flag, v) is not v:
+                break
+    else:
+        return node
+
+    cleaned = {}
+    for k, v in node.items():
+        if k == "title" and not name_map:
+            continue
+        if isinstance(v, (dict, list)):
+            flag = _child_flag(k, v, name_map)
+            if flag >= 0:
+                v = done.get(id(v) << 1 | flag, v)
+        cleaned[k] = v
+    return cleaned
 
 
 def mcp_to_openai_responses(mcp_tools: list) -> list[dict[str, Any]]:
@@ -50,16 +205,7 @@ def mcp_to_openai_responses(mcp_tools: list) -> list[dict[str, Any]]:
         >>> tools = mcp_to_openai_responses(await session.list_tools())
         >>> response = openai.responses.create(model="gpt-4o", tools=tools, ...)
     """
-    openai_tools = []
-    for tool in mcp_tools:
-        parameters = clean_schema(tool.inputSchema) if tool.inputSchema else {}
-        openai_tools.append({
-            "type": "function",
-            "name": tool.name,
-            "description": tool.description or "",
-            "parameters": parameters,
-        })
-    return openai_tools
+    return [to_openai_responses(tool) for tool in mcp_tools]
 
 
 def mcp_to_openai_completions(mcp_tools: list) -> list[dict[str, Any]]:
@@ -79,18 +225,7 @@ def mcp_to_openai_completions(mcp_tools: list) -> list[dict[str, Any]]:
         >>> tools = mcp_to_openai_completions(await session.list_tools())
         >>> response = await openai.chat.completions.create(model="gpt-4o", tools=tools, ...)
     """
-    chat_tools = []
-    for tool in mcp_tools:
-        parameters = clean_schema(tool.inputSchema) if tool.inputSchema else {}
-        chat_tools.append({
-            "type": "function",
-            "function": {
-                "name": tool.name,
-                "description": tool.description or "",
-                "parameters": parameters,
-            },
-        })
-    return chat_tools
+    return [to_openai_completions(tool) for tool in mcp_tools]
 
 
 # Backward-compatible aliases
@@ -112,26 +247,7 @@ def mcp_to_gemini(mcp_tools: list) -> list[dict[str, Any]]:
         >>> declarations = mcp_to_gemini(mcp_tools)
         >>> # Use with: genai types.Tool(function_declarations=declarations)
     """
-    declarations = []
-    for tool in mcp_tools:
-        schema = clean_schema(tool.inputSchema) if tool.inputSchema else {}
-        # Gemini expects 'properties' and 'required' at top level of parameters
-        parameters = {}
-        if schema.get("properties"):
-            parameters["type"] = "OBJECT"
-            parameters["properties"] = {
-                name: _convert_property_to_gemini(prop)
-                for name, prop in schema["properties"].items()
-            }
-            if schema.get("required"):
-                parameters["required"] = schema["required"]
-
-        declarations.append({
-            "name": tool.name,
-            "description": tool.description or "",
-            "parameters": parameters if parameters else None,
-        })
-    return declarations
+    return [to_gemini(tool) for tool in mcp_tools]
 
 
 def mcp_to_anthropic(mcp_tools: list) -> list[dict[str, Any]]:
@@ -148,15 +264,156 @@ def mcp_to_anthropic(mcp_tools: list) -> list[dict[str, Any]]:
         >>> tools = mcp_to_anthropic(mcp_tools)
         >>> # Use with: client.messages.create(tools=tools, ...)
     """
-    anthropic_tools = []
-    for tool in mcp_tools:
-        input_schema = clean_schema(tool.inputSchema) if tool.inputSchema else {"type": "object", "properties": {}}
-        anthropic_tools.append({
+    return [to_anthropic(tool) for tool in mcp_tools]
+
+
+# Single-tool converters — used by the list converters above and by
+# ToolSchemaCache, which converts each tool once and reuses the result.
+
+def to_openai_responses(tool: Any) -> dict[str, Any]:
+    """Convert one MCP tool to OpenAI Responses API format."""
+    parameters = clean_schema(tool.inputSchema) if tool.inputSchema else {}
+    return {
+        "type": "function",
+        "name": tool.name,
+        "description": tool.description or "",
+        "parameters": parameters,
+    }
+
+
+def to_openai_completions(tool: Any) -> dict[str, Any]:
+    """Convert one MCP tool to OpenAI Chat Completions API format."""
+    parameters = clean_schema(tool.inputSchema) if tool.inputSchema else {}
+    return {
+        "type": "function",
+        "function": {
             "name": tool.name,
             "description": tool.description or "",
-            "input_schema": input_schema,
-        })
-    return anthropic_tools
+            "parameters": parameters,
+        },
+    }
+
+
+def to_gemini(tool: Any) -> dict[str, Any]:
+    """Convert one MCP tool to a Gemini FunctionDeclaration-compatible dict."""
+    schema = clean_schema(tool.inputSchema) if tool.inputSchema else {}
+    # Gemini expects 'properties' and 'required' at top level of parameters
+    parameters = {}
+    if schema.get("properties"):
+        parameters["type"] = "OBJECT"
+        parameters["properties"] = {
+            name: _convert_property_to_gemini(prop)
+            for name, prop in schema["properties"].items()
+        }
+        if schema.get("required"):
+            parameters["required"] = schema["required"]
+
+    return {
+        "name": tool.name,
+        "description": tool.description or "",
+        "parameters": parameters if parameters else None,
+    }
+
+
+def to_anthropic(tool: Any) -> dict[str, Any]:
+    """Convert one MCP tool to Anthropic's tool format."""
+    input_schema = clean_schema(tool.inputSchema) if tool.inputSchema else {"type": "object", "properties": {}}
+    return {
+        "name": tool.name,
+        "description": tool.description or "",
+        "input_schema": input_schema,
+    }
+
+
+def schema_hash(schema: Any) -> str:
+    """Return a content hash of a JSON schema (key order does not matter)."""
+    encoded = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class ToolSchemaCache:
+    """Memoized conversion of MCP tools to a provider's tool format.
+
+    Each tool is converted once and the payload reused for as long as the
+    tool's name, description and schema are unchanged. Tools are first looked
+    up by object identity (no hashing at all on the hot path) and otherwise
+    by a content hash of their schema, so a re-fetched but identical tool
+    list still hits the cache. (A tool object mutated in place is not
+    re-hashed; replace the tool instead.)
+
+    ``convert()`` returns the *same list object* while the tool list is
+    unchanged, so callers can cheaply detect when they need to rebuild
+    anything derived from it. Treat returned payloads as read-only — they are
+    shared between callers.
+
+    Example:
+        >>> cache = ToolSchemaCache(to_openai_completions)
+        >>> tools = cache.convert(session_tools)   # converts
+        >>> tools is cache.convert(session_tools)  # cached, no work done
+        True
+    """
+
+    def __init__(self, convert: Callable[[Any], Any], *, maxsize: int = 4096):
+        """Initialize the cache.
+
+        Args:
+            convert: Single-tool converter, e.g. :func:`to_anthropic`.
+            maxsize: Maximum number of converted tools kept.
+        """
+        self._convert = convert
+        self._maxsize = maxsize
+        self._payloads: OrderedDict[tuple, Any] = OrderedDict()
+        self._identity: dict[int, tuple[Any, tuple]] = {}
+        self._last_keys: tuple = ()
+        self._last: list = []
+        self.hits = 0
+        self.misses = 0
+
+    def convert(self, mcp_tools: list) -> list:
+        """Convert a tool list, reusing cached payloads where possible."""
+        keys = tuple(self._key(tool) for tool in mcp_tools)
+        if keys == self._last_keys and len(self._last) == len(keys):
+            return self._last
+
+        converted = [self._payload(tool, key) for tool, key in zip(mcp_tools, keys)]
+        self._last_keys = keys
+        self._last = converted
+        return converted
+
+    def get(self, tool: Any) -> Any:
+        """Return the converted payload for a single tool."""
+        return self._payload(tool, self._key(tool))
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        self._payloads.clear()
+        self._identity.clear()
+        self._last_keys = ()
+        self._last = []
+
+    def _payload(self, tool: Any, key: tuple) -> Any:
+        payload = self._payloads.get(key)
+        if payload is None:
+            self.misses += 1
+            payload = self._convert(tool)
+            self._payloads[key] = payload
+            if len(self._payloads) > self._maxsize:
+                self._payloads.popitem(last=False)
+        else:
+            self.hits += 1
+            self._payloads.move_to_end(key)
+        return payload
+
+    def _key(self, tool: Any) -> tuple:
+        entry = self._identity.get(id(tool))
+        if entry is not None and entry[0] is tool:
+            return entry[1]
+        key = (tool.name, tool.description, schema_hash(tool.inputSchema))
+        if len(self._identity) >= self._maxsize:
+            self._identity.clear()
+        # Holding a reference to the tool keeps its id() from being reused
+        self._identity[id(tool)] = (tool, key)
+        return key
 
 
 def _convert_property_to_gemini(prop: dict) -> dict:
@@ -0,0 +1,84 @@
+"""
+Tool Call Timeouts and Deadlines
+
+Bounds how long a tool call may take. Each call gets the timeout of its tool
+(``ToolPolicy.timeout``, or the server's ``tool_timeout``) and, when one is
+set, whatever is left of the request's *deadline*. A deadline is set once
+around a whole request with :func:`deadline` and applies to every tool call
+made inside it, including calls in tasks started from it (agents run with
+``asyncio.gather``, parallel tool dispatch), since tasks inherit the context.
+
+A call that runs out of time raises ``TimeoutError``; the request is
+cancelled on the server too (see ``transports.call_tool``).
+
+Example:
+    >>> with deadline(30):
+    ...     await asyncio.gather(agent_a.run(query), agent_b.run(query))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# time.monotonic() by which the current request must be done (see :func:`deadline`)
+current_deadline: ContextVar[float | None] = ContextVar("mcp_toolkit_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Give tool calls made inside the block ``seconds`` from now to finish.
+
+    A deadline nested inside another can only make it earlier. ``None``
+    leaves the current deadline (if any) as it is.
+    """
+    if seconds is None:
+        yield
+        return
+    at = time.monotonic() + seconds
+    outer = current_deadline.get()
+    token = current_deadline.set(at if outer is None else min(at, outer))
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+def time_left() -> float | None:
+    """Seconds until the current deadline (negative once it passed), or ``None``."""
+    at = current_deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+async def call_with_timeout(call: Awaitable[T], timeout: float | None, what: str) -> T:
+    """Await ``call`` for at most ``timeout`` seconds and the current deadline.
+
+    Args:
+        call: The coroutine to run.
+        timeout: The call's own limit in seconds; ``None`` means no limit.
+        what: Description of the call for the error message, e.g.
+            ``"Tool 'search' on server 'flights'"``.
+
+    Raises:
+        TimeoutError: If the limit or the deadline passed first. ``call`` is
+            cancelled.
+    """
+    left = time_left()
+    if left is None or (timeout is not None and timeout <= left):
+        limit, reason = timeout, f"timed out after {timeout}s"
+    else:
+        limit, reason = max(left, 0.0), "ran out of time (request deadline)"
+    if limit is None:
+        return await call
+    if limit <= 0:
+        call.close()
+        raise TimeoutError(f"{what} {reason}")
+    try:
+        return await asyncio.wait_for(call, limit)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"{what} {reason}") from None
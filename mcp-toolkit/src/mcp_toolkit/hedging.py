@@ -0,0 +1,213 @@
+"""
+Hedged and Retried Tool Calls
+
+For tools marked ``idempotent`` in config — calling them twice does no
+harm — a :class:`HedgedCaller` cuts tail latency in two ways:
+
+- **Hedging**: on a server with more than one live replica (see
+  :mod:`mcp_toolkit.replicas`), if a call is still running after the
+  tool's recent p95 latency, a duplicate is sent to another replica and
+  whichever answers first wins; the other is cancelled. A single session
+  offers no independent path, so its calls are never duplicated.
+- **Retries**: a call that fails with a transient error (the server went
+  away, the call timed out) is tried again after a jittered exponential
+  backoff, as long as the request deadline allows.
+
+Example config:
+    ```json
+    "weather": {
+      "command": "python",
+      "args": ["weather_server.py"],
+      "tools": {"get_forecast": {"idempotent": true, "retries": 2}}
+    }
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from mcp_toolkit.config import ToolPolicy
+from mcp_toolkit.connection import _connection_lost
+from mcp_toolkit.deadline import time_left
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """Counters for the idempotent calls to one server.
+
+    Attributes:
+        calls: Calls made through the hedger.
+        hedged: Calls for which a duplicate was sent.
+        hedge_wins: Hedged calls answered by the duplicate first.
+        retries: Extra attempts made after transient failures.
+    """
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    retries: int = 0
+
+
+class LatencyTracker:
+    """Recent call latencies per key, for picking hedge delays."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """Initialize the tracker.
+
+        Args:
+            window: Latencies kept per key; older ones are forgotten.
+            min_samples: Latencies needed before :meth:`quantile` answers.
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[Hashable, deque[float]] = {}
+
+    def record(self, key: Hashable, seconds: float) -> None:
+        """Remember how long one successful call took."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def quantile(self, key: Hashable, q: float = 0.95) -> float | None:
+        """The ``q`` quantile of the recent latencies, or ``None`` if too few are known."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class HedgedCaller:
+    """Runs idempotent calls with hedging and retries (see module docs)."""
+
+    def __init__(
+        self,
+        *,
+        tracker: LatencyTracker | None = None,
+        quantile: float = 0.95,
+        min_delay: float = 0.01,
+        backoff: float = 0.1,
+        max_backoff: float = 2.0,
+    ):
+        """Initialize the caller.
+
+        Args:
+            tracker: Where latencies are recorded. A new one by default.
+            quantile: Latency quantile after which a duplicate is sent.
+            min_delay: Shortest hedge delay in seconds, so very fast tools
+                are not duplicated on every call.
+            backoff: Upper bound of the first retry's random delay in
+                seconds; doubles with each further retry.
+            max_backoff: Cap on the retry delay bound, in seconds.
+        """
+        self.tracker = tracker or LatencyTracker()
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats: dict[str, HedgeStats] = {}
+
+    def hedge_delay(self, key: Hashable) -> float | None:
+        """Seconds to wait before hedging a call, or ``None`` if not known yet."""
+        latency = self.tracker.quantile(key, self.quantile)
+        return None if latency is None else max(latency, self.min_delay)
+
+    async def call(
+        self,
+        server: str,
+        tool: str,
+        attempt: Callable[[], Awaitable[T]],
+        policy: ToolPolicy,
+        *,
+        can_hedge: bool = True,
+    ) -> T:
+        """Run ``attempt`` with the hedging and retries ``policy`` allows.
+
+        Args:
+            server: Server name, for stats.
+            tool: Tool name; latencies are tracked per ``(server, tool)``.
+            attempt: Makes one call; invoked once per attempt and hedge.
+            policy: The tool's policy (``retries``, ``hedge``).
+            can_hedge: Whether a duplicate could take another path, i.e.
+                the server has another live replica. If not, the call is
+                only retried.
+
+        Raises:
+            Exception: The last attempt's error, once retries are used up
+                or the error is not transient.
+        """
+        stats = self.stats.get(server)
+        if stats is None:
+            stats = self.stats[server] = HedgeStats()
+        stats.calls += 1
+        key = (server, tool)
+
+        retry = 0
+        while True:
+            try:
+                return await self._hedged(key, attempt, stats, policy.hedge and can_hedge)
+            except Exception as e:
+                if retry >= policy.retries or not _transient(e):
+                    raise
+                delay = random.uniform(0, min(self.backoff * 2 ** retry, self.max_backoff))
+                left = time_left()
+                if left is not None and left <= delay:
+                    raise
+            retry += 1
+            stats.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _hedged(
+        self,
+        key: Hashable,
+        attempt: Callable[[], Awaitable[T]],
+        stats: HedgeStats,
+        hedge: bool,
+    ) -> T:
+        """One attempt, plus a duplicate if it runs past the hedge delay."""
+        loop = asyncio.get_running_loop()
+        delay = self.hedge_delay(key) if hedge else None
+
+        async def timed() -> T:
+            started = loop.time()
+            result = await attempt()
+            self.tracker.record(key, loop.time() - started)
+            return result
+
+        if delay is None:
+            return await timed()
+        first = asyncio.ensure_future(timed())
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return first.result()
+            stats.hedged += 1
+            tasks.add(asyncio.ensure_future(timed()))
+
+            error: BaseException | None = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            stats.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _transient(exc: BaseException) -> bool:
+    """True for failures worth retrying: the server went away or the call timed out."""
+    return isinstance(exc, (ConnectionError, TimeoutError)) or _connection_lost(exc)
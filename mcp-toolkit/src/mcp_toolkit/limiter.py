@@ -0,0 +1,212 @@
+"""
+Per-Server Concurrency Limits
+
+Caps how many tool calls run on one server at a time and how many may wait
+for a slot. Waiting calls are grouped by *flow* — usually the agent or
+request that made them — and slots are handed out round-robin across flows,
+so one busy caller cannot starve the others. When the queue is full, new
+calls are rejected immediately with :class:`ServerOverloadedError` instead
+of piling up behind a slow server.
+
+Example:
+    >>> limiter = ServerLimiter("flights", max_concurrency=2, max_queue=10)
+    >>> async with limiter.slot(flow="FlightAgent"):
+    ...     await conn.call_tool("search_flights", {...})
+    >>> limiter.stats.mean_wait
+    0.0
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Hashable, Iterator
+
+# Flow of the tool calls made in the current context (see :func:`flow`)
+current_flow: ContextVar[Hashable | None] = ContextVar("mcp_toolkit_flow", default=None)
+
+
+@contextmanager
+def flow(key: Hashable) -> Iterator[None]:
+    """Attribute tool calls made inside the block to a flow.
+
+    Flows set this way take precedence over an agent's own flow, so an
+    application can queue fairly per user or session:
+
+        >>> with flow(session_id):
+        ...     await orchestrator.chat(message)
+    """
+    token = current_flow.set(key)
+    try:
+        yield
+    finally:
+        current_flow.reset(token)
+
+
+class ServerOverloadedError(RuntimeError):
+    """A tool call was turned away because the server's wait queue was full.
+
+    Attributes:
+        server: Name of the overloaded server.
+        in_flight: Calls running on it when the call was rejected.
+        queued: Calls waiting for a slot when the call was rejected.
+    """
+
+    def __init__(self, server: str, in_flight: int, queued: int):
+        super().__init__(
+            f"Server '{server}' is overloaded: {in_flight} calls running, {queued} queued"
+        )
+        self.server = server
+        self.in_flight = in_flight
+        self.queued = queued
+
+
+@dataclass
+class LimiterStats:
+    """Counters for one :class:`ServerLimiter`.
+
+    Attributes:
+        in_flight: Calls holding a slot right now.
+        queued: Calls waiting for a slot right now.
+        admitted: Calls that got a slot.
+        rejected: Calls turned away because the queue was full.
+        waited: Admitted calls that had to queue.
+        total_wait: Seconds spent queueing, summed over admitted calls.
+        max_wait: Longest single queue wait in seconds.
+    """
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Average queue wait per admitted call, in seconds."""
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+
+class ServerLimiter:
+    """Concurrency limit and bounded, fair wait queue for one server."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int | None = None,
+        max_queue: int | None = None,
+        *,
+        on_admit: Callable[[float], None] | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            name: Server name, used in error messages.
+            max_concurrency: Calls allowed to run at once. ``None`` means no
+                limit (calls never queue).
+            max_queue: Calls allowed to wait for a slot. ``None`` means no
+                limit; ``0`` rejects every call that cannot run immediately.
+            on_admit: Called with the seconds each admitted call waited
+                (``0.0`` if it got a slot at once), e.g. to feed a histogram.
+        """
+        self.name = name
+        self.on_admit = on_admit
+        self.stats = LimiterStats()
+        self._waiters: dict[Hashable, deque[asyncio.Future]] = {}
+        self.configure(max_concurrency, max_queue)
+
+    def configure(self, max_concurrency: int | None, max_queue: int | None) -> None:
+        """Change the limits; waiting calls are admitted if there is new room."""
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError(f"max_queue must not be negative, got {max_queue}")
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._admit_waiters()
+
+    @asynccontextmanager
+    async def slot(self, flow: Hashable = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block (see :meth:`acquire`)."""
+        await self.acquire(flow)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, flow: Hashable = None) -> None:
+        """Wait for a slot.
+
+        Args:
+            flow: Who the call belongs to. Waiting calls of different flows
+                are admitted in turn; within a flow, in arrival order.
+
+        Raises:
+            ServerOverloadedError: If the server is at capacity and its queue
+                is full.
+        """
+        stats = self.stats
+        if self._has_room() and not stats.queued:
+            stats.in_flight += 1
+            stats.admitted += 1
+            if self.on_admit is not None:
+                self.on_admit(0.0)
+            return
+        if self.max_queue is not None and stats.queued >= self.max_queue:
+            stats.rejected += 1
+            raise ServerOverloadedError(self.name, stats.in_flight, stats.queued)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(flow, deque()).append(waiter)
+        stats.queued += 1
+        started = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # admitted just as we were cancelled
+            else:
+                self._forget(flow, waiter)
+            raise
+        wait = time.perf_counter() - started
+        stats.waited += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        if self.on_admit is not None:
+            self.on_admit(wait)
+
+    def release(self) -> None:
+        """Give back a slot taken with :meth:`acquire`."""
+        self.stats.in_flight -= 1
+        self._admit_waiters()
+
+    def _has_room(self) -> bool:
+        return self.max_concurrency is None or self.stats.in_flight < self.max_concurrency
+
+    def _admit_waiters(self) -> None:
+        """Hand free slots to waiting calls, one flow at a time."""
+        while self._waiters and self._has_room():
+            flow = next(iter(self._waiters))
+            queue = self._waiters.pop(flow)
+            waiter = queue.popleft()
+            if queue:
+                self._waiters[flow] = queue  # back of the line
+            self.stats.queued -= 1
+            self.stats.in_flight += 1
+            self.stats.admitted += 1
+            waiter.set_result(None)
+
+    def _forget(self, flow: Hashable, waiter: asyncio.Future) -> None:
+        """Drop a cancelled waiter from its queue."""
+        queue = self._waiters.get(flow)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del self._waiters[flow]
+        self.stats.queued -= 1
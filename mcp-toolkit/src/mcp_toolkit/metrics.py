@@ -0,0 +1,478 @@
+"""
+Metrics
+
+Counters, gauges and histograms in the Prometheus data model, rendered in
+the Prometheus text format so any Prometheus-compatible scraper can read
+them — without depending on ``prometheus_client``.
+
+:class:`ClientMetrics` holds what :class:`~mcp_toolkit.clients.multi.MultiServerClient`,
+the single-server clients and :class:`~mcp_toolkit.agents.BaseAgent` record:
+
+- ``mcp_tool_calls_total{server,tool,outcome}`` — outcome is ``ok``,
+  ``error`` (the tool reported an error), ``timeout`` or ``cancelled``
+- ``mcp_tool_call_duration_seconds{server,tool}`` — histogram
+- ``llm_requests_total{provider,model}``
+- ``llm_tokens_total{provider,model,direction}`` — ``input`` or ``output``,
+  as reported by the provider
+- ``llm_rounds_per_chat{agent}`` — histogram of LLM requests per answer
+
+``MultiServerClient`` adds gauges read when the metrics are collected:
+queue depth, calls in flight, rejected calls and session restarts per
+server.
+
+Example:
+    >>> async with MultiServerClient.from_config() as mcp:
+    ...     await mcp.chat("Weather in Rome?")
+    ...     print(mcp.metrics.render())
+    # HELP mcp_tool_calls_total Tool calls sent to MCP servers, by outcome.
+    # TYPE mcp_tool_calls_total counter
+    mcp_tool_calls_total{server="weather",tool="get_current_weather",outcome="ok"} 1.0
+    ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Content-Type of :meth:`MetricsRegistry.render` output
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = tuple[str, ...]
+
+
+class _Metric:
+    """A named family of series, one per combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+
+    def _key(self, labels: dict[str, Any]) -> LabelKey:
+        if len(labels) != len(self.labels) or set(labels) != set(self.labels):
+            raise ValueError(
+                f"Metric '{self.name}' takes labels {list(self.labels)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _matches(self, key: LabelKey, labels: dict[str, Any]) -> bool:
+        """True if the series ``key`` has every label value in ``labels``."""
+        unknown = set(labels) - set(self.labels)
+        if unknown:
+            raise ValueError(f"Metric '{self.name}' has no labels {sorted(unknown)}")
+        return all(key[self.labels.index(name)] == str(value) for name, value in labels.items())
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """``(sample name, labels, value)`` for every series."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A value that only goes up, such as calls made."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add ``amount`` (>= 0) to the series for ``labels``."""
+        if amount < 0:
+            raise ValueError(f"Counter '{self.name}' cannot decrease")
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: Any) -> None:
+        """Set the series to a total counted elsewhere (for collectors)."""
+        self._values[self._key(labels)] = float(value)
+
+    def total(self, **labels: Any) -> float:
+        """Sum of the series that have the given label values (all if none given)."""
+        return sum(v for key, v in self._values.items() if self._matches(key, labels))
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for key, value in self._values.items():
+            yield self.name, dict(zip(self.labels, key)), value
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, such as queue depth."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the series for ``labels``."""
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Add ``amount`` (may be negative) to the series for ``labels``."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def total(self, **labels: Any) -> float:
+        """Sum of the series that have the given label values (all if none given)."""
+        return sum(v for key, v in self._values.items() if self._matches(key, labels))
+
+    def clear(self) -> None:
+        """Drop every series, e.g. before a collector sets the current ones."""
+        self._values.clear()
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for key, value in self._values.items():
+            yield self.name, dict(zip(self.labels, key)), value
+
+
+@dataclass
+class _HistogramSeries:
+    counts: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+class Histogram(_Metric):
+    """Observations counted into buckets, such as call latencies."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelKey, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation in the series for ``labels``."""
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            # One count per bucket plus the implicit +Inf bucket
+            series = self._series[key] = _HistogramSeries([0] * (len(self.buckets) + 1))
+        series.counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    def count(self, **labels: Any) -> int:
+        """Observations in the series that have the given label values."""
+        return sum(s.count for s in self._select(labels))
+
+    def sum(self, **labels: Any) -> float:
+        """Sum of the observations in the series that have the given label values."""
+        return sum(s.sum for s in self._select(labels))
+
+    def quantile(self, q: float, **labels: Any) -> float | None:
+        """Estimate the ``q``-quantile from the buckets, as Prometheus' ``histogram_quantile`` does.
+
+        Interpolates linearly within the bucket the quantile falls in; if
+        that is the +Inf bucket, returns the largest finite bound. Returns
+        ``None`` if nothing was observed.
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        for series in self._select(labels):
+            counts = [a + b for a, b in zip(counts, series.counts)]
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for i, n in enumerate(counts):
+            if seen + n >= rank and n:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+    def _select(self, labels: dict[str, Any]) -> list[_HistogramSeries]:
+        return [s for key, s in self._series.items() if self._matches(key, labels)]
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for key, series in self._series.items():
+            labels = dict(zip(self.labels, key))
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), series.counts):
+                cumulative += n
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, series.sum
+            yield f"{self.name}_count", labels, series.count
+
+
+class MetricsRegistry:
+    """A set of metrics rendered together.
+
+    Metrics are created on first request and returned as-is afterwards, so
+    several components can share one by name.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """Get or create a :class:`Counter`."""
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        """Get or create a :class:`Gauge`."""
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a :class:`Histogram`."""
+        return self._get(Histogram, name, help, labels, buckets=buckets)
+
+    def _get(self, cls: type, name: str, help: str, labels: Sequence[str], **kwargs: Any) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help, labels, **kwargs)
+        elif type(metric) is not cls or metric.labels != tuple(labels):
+            raise ValueError(
+                f"Metric '{name}' is already registered as a {metric.kind} "
+                f"with labels {list(metric.labels)}"
+            )
+        return metric
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """Call ``collect`` before every :meth:`render`, to update values kept elsewhere."""
+        self._collectors.append(collect)
+
+    def collect(self) -> list[_Metric]:
+        """Run the collectors and return every metric."""
+        for collect in self._collectors:
+            try:
+                collect()
+            except Exception:
+                logger.exception("Metrics collector %r failed", collect)
+        return list(self._metrics.values())
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (see :data:`CONTENT_TYPE`)."""
+        lines: list[str] = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {_escape(metric.help, quote=False)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    pairs = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                    name = f"{name}{{{pairs}}}"
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class ClientMetrics:
+    """The metrics recorded by clients and agents, in one :class:`MetricsRegistry`.
+
+    Attributes:
+        registry: Where the metrics live; render it for a ``/metrics`` endpoint.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        """Initialize the metrics.
+
+        Args:
+            registry: Registry to add them to, e.g. one shared with the
+                application's own metrics. Defaults to a new one.
+        """
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.tool_calls = self.registry.counter(
+            "mcp_tool_calls_total",
+            "Tool calls sent to MCP servers, by outcome.",
+            ("server", "tool", "outcome"),
+        )
+        self.tool_latency = self.registry.histogram(
+            "mcp_tool_call_duration_seconds",
+            "Seconds from sending a tool call to its result, queueing, retries and hedges included.",
+            ("server", "tool"),
+        )
+        self.queue_waits = self.registry.histogram(
+            "mcp_queue_wait_seconds",
+            "Seconds tool calls waited for a server slot; 0 for calls that ran at once.",
+            ("server",),
+        )
+        self.llm_requests = self.registry.counter(
+            "llm_requests_total", "Requests made to an LLM.", ("provider", "model")
+        )
+        self.llm_tokens = self.registry.counter(
+            "llm_tokens_total",
+            "Tokens used by LLM requests, as reported by the provider.",
+            ("provider", "model", "direction"),
+        )
+        self.llm_rounds = self.registry.histogram(
+            "llm_rounds_per_chat",
+            "LLM requests made to answer one chat message or agent query.",
+            ("agent",),
+            buckets=(1, 2, 3, 4, 5, 6, 8, 10, 15, 20),
+        )
+
+    def tool_call(
+        self,
+        server: str,
+        tool: str,
+        seconds: float,
+        *,
+        ok: bool = True,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record one finished tool call.
+
+        Args:
+            server: Server the call went to.
+            tool: Tool name on that server.
+            seconds: How long the call took.
+            ok: False if the tool returned an error result.
+            error: The exception the call raised, if any.
+        """
+        if isinstance(error, asyncio.CancelledError):
+            outcome = "cancelled"
+        elif isinstance(error, TimeoutError):
+            outcome = "timeout"
+        elif error is not None or not ok:
+            outcome = "error"
+        else:
+            outcome = "ok"
+        self.tool_calls.inc(server=server, tool=tool, outcome=outcome)
+        self.tool_latency.observe(seconds, server=server, tool=tool)
+
+    def queue_wait(self, server: str, seconds: float) -> None:
+        """Record how long one admitted tool call waited for a server slot."""
+        self.queue_waits.observe(seconds, server=server)
+
+    def llm_request(self, provider: str, model: str, usage: Any = None) -> None:
+        """Record one LLM request and the tokens the provider says it used.
+
+        Args:
+            provider: ``"openai"``, ``"anthropic"`` or ``"gemini"``.
+            model: Model name.
+            usage: The response's usage object (``response.usage``, or
+                ``usage_metadata`` for Gemini), if there is one.
+        """
+        self.llm_requests.inc(provider=provider, model=model)
+        input_tokens, output_tokens = token_counts(usage)
+        if input_tokens:
+            self.llm_tokens.inc(input_tokens, provider=provider, model=model, direction="input")
+        if output_tokens:
+            self.llm_tokens.inc(output_tokens, provider=provider, model=model, direction="output")
+
+    def chat_finished(self, agent: str, rounds: int) -> None:
+        """Record how many LLM requests one answer took."""
+        self.llm_rounds.observe(rounds, agent=agent)
+
+    def render(self) -> str:
+        """Shortcut for ``registry.render()``."""
+        return self.registry.render()
+
+
+@dataclass
+class ServerStats:
+    """Load and latency of one server, from :meth:`MultiServerClient.stats`.
+
+    Attributes:
+        connected: Whether a session is up (lazy servers may not be started).
+        replicas: Sessions run for the server.
+        restarts: Sessions started to replace crashed ones.
+        in_flight: Calls running right now.
+        queued: Calls waiting for a slot right now.
+        rejected: Calls turned away because the queue was full.
+        calls: Finished tool calls.
+        errors: Calls that failed, timed out or returned an error.
+        mean_latency: Average call duration in seconds.
+        p95_latency: Estimated 95th percentile call duration in seconds.
+    """
+    connected: bool = False
+    replicas: int = 1
+    restarts: int = 0
+    in_flight: int = 0
+    queued: int = 0
+    rejected: int = 0
+    calls: int = 0
+    errors: int = 0
+    mean_latency: float = 0.0
+    p95_latency: float | None = None
+
+    @property
+    def error_rate(self) -> float:
+        """Share of finished calls that were not ``ok``."""
+        return self.errors / self.calls if self.calls else 0.0
+
+
+@dataclass
+class LLMStats:
+    """Requests and tokens for one LLM provider.
+
+    Attributes:
+        requests: Requests made.
+        input_tokens: Prompt tokens reported by the provider.
+        output_tokens: Completion tokens reported by the provider.
+    """
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass
+class ClientStats:
+    """Summary returned by :meth:`MultiServerClient.stats`.
+
+    Attributes:
+        servers: Per-server load and latency.
+        llm: Per-provider requests and tokens.
+        chats: Answers produced (client chats and agent runs).
+        mean_rounds: Average LLM requests per answer.
+    """
+    servers: dict[str, ServerStats] = field(default_factory=dict)
+    llm: dict[str, LLMStats] = field(default_factory=dict)
+    chats: int = 0
+    mean_rounds: float = 0.0
+
+
+def token_counts(usage: Any) -> tuple[int, int]:
+    """``(input, output)`` tokens from an OpenAI, Anthropic or Gemini usage object."""
+    if usage is None:
+        return 0, 0
+    for input_name, output_name in (
+        ("prompt_tokens", "completion_tokens"),         # OpenAI Chat Completions
+        ("input_tokens", "output_tokens"),              # Anthropic, OpenAI Responses
+        ("prompt_token_count", "candidates_token_count"),  # Gemini
+    ):
+        if hasattr(usage, input_name):
+            return getattr(usage, input_name) or 0, getattr(usage, output_name, 0) or 0
+    return 0, 0
+
+
+def _escape(value: str, quote: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(float(value))
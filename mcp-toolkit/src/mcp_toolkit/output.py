@@ -0,0 +1,311 @@
+"""
+Tool Output Limits
+
+Keeps oversized tool results out of the prompt. A ``run_command("cat
+bigfile")`` or a search returning sixty job postings would otherwise go to
+the model in full, and stay in the conversation for every later request.
+
+With a ``max_output_chars`` limit (per tool in its :class:`ToolPolicy`, or
+for the whole server in :class:`MCPServerConfig`), a longer result keeps its
+beginning and end, joined by a one-line marker the model can parse::
+
+    [truncated] {"total_chars": 91234, "omitted_chars": 83234, "resource": "tool-output://4f1c…", "read_with": "read_tool_output"}
+
+Results are cut while their content parts are read, so the full text is
+never joined into one string. Given a :class:`ToolOutputStore`, clients also
+spill the complete result to a file and expose a ``read_tool_output`` tool
+the model can call to page through it by handle. Spilling runs in a worker
+thread, off the event loop. Spilled results are not put in a
+:class:`~mcp_toolkit.cache.ToolResultCache`: the store deletes old files
+after ``max_outputs`` newer ones, which could be long before a cached
+entry expires.
+
+Example:
+    >>> store = ToolOutputStore()
+    >>> text = limit_output(["x" * 50_000], 4000, spill=lambda: store.create("terminal", "run_command"))
+    >>> store.read("4f1c9e0a2b7d", offset=4000)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from mcp.types import Tool
+
+logger = logging.getLogger(__name__)
+
+READ_TOOL_NAME = "read_tool_output"
+RESOURCE_SCHEME = "tool-output://"
+
+
+@dataclass
+class StoredOutput:
+    """A complete tool result spilled to disk.
+
+    Attributes:
+        handle: Id the model passes to ``read_tool_output``.
+        server: Server that produced the result.
+        tool: Tool that produced the result.
+        path: File holding the text.
+        total_chars: Length of the text.
+    """
+    handle: str
+    server: str
+    tool: str
+    path: Path
+    total_chars: int = 0
+
+    @property
+    def uri(self) -> str:
+        """``"tool-output://<handle>"``."""
+        return RESOURCE_SCHEME + self.handle
+
+
+class _SpillFile:
+    """Writes one result to its file, part by part."""
+
+    def __init__(self, store: ToolOutputStore, entry: StoredOutput):
+        self._store = store
+        self.entry = entry
+        self._file = entry.path.open("w", encoding="utf-8", newline="")
+
+    def write(self, text: str) -> None:
+        self._file.write(text)
+        self.entry.total_chars += len(text)
+
+    def close(self) -> None:
+        self._file.close()
+        self._store._add(self.entry)
+
+    def discard(self) -> None:
+        """Drop a file that could not be written in full."""
+        self._file.close()
+        self.entry.path.unlink(missing_ok=True)
+
+
+class ToolOutputStore:
+    """Files holding complete tool results that were too long for the prompt.
+
+    Only the latest ``max_outputs`` results are kept; older files are
+    deleted. Without a ``directory`` a temporary one is used and removed
+    when the store is closed or garbage collected.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        page_chars: int = 8000,
+        max_outputs: int = 100,
+    ):
+        """Initialize the store.
+
+        Args:
+            directory: Where result files are written. Created if missing.
+            page_chars: Characters ``read_tool_output`` returns when the
+                model does not ask for a ``limit``.
+            max_outputs: Results kept before the oldest are deleted.
+        """
+        if page_chars < 1:
+            raise ValueError(f"page_chars must be at least 1, got {page_chars}")
+        if max_outputs < 1:
+            raise ValueError(f"max_outputs must be at least 1, got {max_outputs}")
+        if directory is None:
+            self.directory = Path(tempfile.mkdtemp(prefix="mcp-tool-output-"))
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self.directory, True)
+        else:
+            self.directory = Path(directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._cleanup = None
+        self.page_chars = page_chars
+        self.max_outputs = max_outputs
+        self._outputs: OrderedDict[str, StoredOutput] = OrderedDict()
+        # Results are spilled from worker threads
+        self._lock = threading.Lock()
+        self.tool = Tool(
+            name=READ_TOOL_NAME,
+            description=(
+                "Read part of a tool result that was truncated. Pass the 'resource' "
+                "from its [truncated] marker and the character offset to start at."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "resource": {"type": "string", "description": "tool-output:// handle from the marker"},
+                    "offset": {"type": "integer", "description": "First character to return", "default": 0},
+                    "limit": {"type": "integer", "description": f"Characters to return (default {page_chars})"},
+                },
+                "required": ["resource"],
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self._outputs)
+
+    def create(self, server: str, tool: str) -> _SpillFile:
+        """Open a file for one result; it is kept once closed."""
+        handle = uuid.uuid4().hex[:12]
+        entry = StoredOutput(handle, server, tool, self.directory / f"{handle}.txt")
+        return _SpillFile(self, entry)
+
+    def check_names(self, names: Iterable[str], server: str) -> None:
+        """Make sure none of a server's tools would be shadowed by ``read_tool_output``.
+
+        Raises:
+            ValueError: If ``names`` includes the store's tool name.
+        """
+        if self.tool.name in names:
+            raise ValueError(
+                f"Server '{server}' has a tool named '{self.tool.name}', which clashes "
+                "with the output store's tool; rename it or run without an output_store"
+            )
+
+    def get(self, handle: str) -> StoredOutput | None:
+        """The stored result for a handle or ``tool-output://`` URI, if still kept."""
+        with self._lock:
+            return self._outputs.get(handle.removeprefix(RESOURCE_SCHEME))
+
+    def read(self, handle: str, offset: int = 0, limit: int | None = None) -> str:
+        """One page of a stored result, headed by a JSON line describing it.
+
+        Raises:
+            ValueError: If the handle is unknown or was evicted.
+        """
+        entry = self.get(handle)
+        if entry is None:
+            raise ValueError(f"Unknown or expired tool output: {handle}")
+        offset = max(offset, 0)
+        limit = self.page_chars if limit is None or limit < 1 else limit
+        with entry.path.open(encoding="utf-8", newline="") as f:
+            f.read(offset)
+            text = f.read(limit)
+        end = min(offset + len(text), entry.total_chars)
+        header = {
+            "resource": entry.uri,
+            "offset": offset,
+            "end": end,
+            "total_chars": entry.total_chars,
+            "next_offset": end if end < entry.total_chars else None,
+        }
+        return f"[page] {json.dumps(header)}\n{text}"
+
+    async def call(self, arguments: dict[str, Any] | None) -> str:
+        """Run the ``read_tool_output`` tool."""
+        arguments = arguments or {}
+        return await asyncio.to_thread(
+            self.read,
+            str(arguments.get("resource", "")),
+            int(arguments.get("offset") or 0),
+            int(arguments["limit"]) if arguments.get("limit") else None,
+        )
+
+    def close(self) -> None:
+        """Delete every stored result (and the directory, if temporary)."""
+        with self._lock:
+            entries = list(self._outputs.values())
+            self._outputs.clear()
+        for entry in entries:
+            entry.path.unlink(missing_ok=True)
+        if self._cleanup is not None:
+            self._cleanup()
+
+    def _add(self, entry: StoredOutput) -> None:
+        with self._lock:
+            self._outputs[entry.handle] = entry
+            evicted = []
+            while len(self._outputs) > self.max_outputs:
+                evicted.append(self._outputs.popitem(last=False)[1])
+        for old in evicted:
+            old.path.unlink(missing_ok=True)
+
+
+def limit_output(
+    parts: Iterable[str],
+    max_chars: int | None,
+    *,
+    separator: str = "\n",
+    spill: Callable[[], _SpillFile] | None = None,
+) -> str:
+    """Join text parts, keeping only the beginning and end past ``max_chars``.
+
+    Parts are consumed one at a time: at most about ``max_chars`` characters
+    are held while reading, whatever the size of the result.
+
+    Args:
+        parts: Text parts of a result, in order.
+        max_chars: Characters to keep (plus the marker). ``None`` joins
+            everything.
+        separator: Text placed between parts.
+        spill: Opens a file for the complete result (see
+            :meth:`ToolOutputStore.create`). Only called once the result
+            turns out to be too long.
+
+    Returns:
+        The text, with a ``[truncated]`` marker where characters were removed.
+    """
+    if max_chars is None:
+        return separator.join(parts)
+
+    head_budget = max_chars * 2 // 3
+    tail_budget = max_chars - head_budget
+    head: list[str] = []
+    head_len = 0
+    tail: deque[str] = deque()
+    tail_len = 0
+    total = 0
+    spilled: _SpillFile | None = None
+
+    def chunks() -> Iterable[str]:
+        for i, part in enumerate(parts):
+            if i:
+                yield separator
+            yield part
+
+    try:
+        for chunk in chunks():
+            total += len(chunk)
+            if spilled is not None:
+                spilled.write(chunk)
+            if head_len < head_budget:
+                taken = chunk[:head_budget - head_len]
+                head.append(taken)
+                head_len += len(taken)
+                chunk = chunk[len(taken):]
+            if chunk:
+                tail.append(chunk)
+                tail_len += len(chunk)
+            if spill is not None and spilled is None and total > max_chars:
+                # Nothing has been dropped yet, so the file can start from what is held
+                spilled = spill()
+                for held in (*head, *tail):
+                    spilled.write(held)
+            while tail and tail_len - len(tail[0]) >= tail_budget:
+                tail_len -= len(tail.popleft())
+    except BaseException:
+        # A partial file must not be paged as if it were the whole result
+        if spilled is not None:
+            spilled.discard()
+        raise
+    if spilled is not None:
+        spilled.close()
+
+    if total <= max_chars:
+        return "".join(head) + "".join(tail)
+
+    tail_text = "".join(tail)[-tail_budget:] if tail_budget else ""
+    marker: dict[str, Any] = {"total_chars": total, "omitted_chars": total - head_len - len(tail_text)}
+    if spilled is not None:
+        marker["resource"] = spilled.entry.uri
+        marker["read_with"] = READ_TOOL_NAME
+    return "".join(head) + f"\n[truncated] {json.dumps(marker)}\n" + tail_text
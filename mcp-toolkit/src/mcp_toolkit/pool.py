@@ -0,0 +1,348 @@
+"""
+MCP Session Pool
+
+Keeps warm MCP sessions per server config and hands them out for tool calls,
+so callers stop paying a subprocess spawn and ``initialize()`` handshake on
+every call.
+
+The pool runs its sessions on a private event loop in a background thread.
+That makes it usable from plain synchronous code (Streamlit, scripts) as well
+as from async code running on any other event loop.
+
+Example:
+    >>> from mcp_toolkit.pool import SessionPool
+    >>> pool = SessionPool(size=2, max_idle=300)
+    >>> cfg = MCPServerConfig(name="medical", command="python", args=["server.py"])
+    >>> pool.call_tool_sync(cfg, "extract_symptoms", {"text": "headache"})   # sync
+    >>> await pool.call_tool(cfg, "extract_symptoms", {"text": "headache"})  # async
+    >>> pool.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncGenerator, Coroutine
+
+from mcp_toolkit.clients.base import extract_tool_text
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.connection import ServerConnection
+from mcp_toolkit.deadline import call_with_timeout
+
+
+@dataclass
+class PoolStats:
+    """Counters for one server's sessions in a :class:`SessionPool`.
+
+    Attributes:
+        idle: Sessions currently warm and waiting in the pool.
+        in_use: Sessions currently leased to a caller.
+        created: Sessions opened since the pool started.
+        recycled: Sessions closed for idle time, use count or a failed health check.
+        calls: Tool calls served.
+    """
+    idle: int = 0
+    in_use: int = 0
+    created: int = 0
+    recycled: int = 0
+    calls: int = 0
+
+
+@dataclass
+class _PooledSession:
+    """A warm connection plus the bookkeeping used to decide when to recycle it."""
+    conn: ServerConnection
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    checked_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class _ServerSlots:
+    """The sessions the pool holds for a single server config."""
+
+    def __init__(self, config: MCPServerConfig, pool: SessionPool):
+        self.config = config
+        self.stats = PoolStats()
+        self._pool = pool
+        self._idle: deque[_PooledSession] = deque()
+        self._limit = asyncio.Semaphore(pool.size)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncGenerator[ServerConnection, None]:
+        """Check out a healthy session for the duration of the block."""
+        async with self._limit:
+            pooled = await self._checkout()
+            self.stats.in_use += 1
+            try:
+                yield pooled.conn
+            except Exception:
+                # Force a health check before this session is handed out again
+                pooled.checked_at = 0.0
+                raise
+            finally:
+                self.stats.in_use -= 1
+                self._checkin(pooled)
+
+    async def warm(self) -> None:
+        """Open sessions until the pool holds ``size`` of them."""
+        missing = self._pool.size - len(self._idle) - self.stats.in_use
+        opened = await asyncio.gather(*(self._open() for _ in range(missing)))
+        self._idle.extend(opened)
+        self.stats.idle = len(self._idle)
+
+    def reap(self, now: float) -> None:
+        """Retire idle sessions that have outlived ``max_idle``."""
+        keep = deque()
+        for pooled in self._idle:
+            if self._expired(pooled, now):
+                self._retire(pooled)
+            else:
+                keep.append(pooled)
+        self._idle = keep
+        self.stats.idle = len(self._idle)
+
+    async def close(self) -> None:
+        """Close every idle session."""
+        idle, self._idle = list(self._idle), deque()
+        self.stats.idle = 0
+        await asyncio.gather(*(p.conn.close() for p in idle))
+
+    async def _checkout(self) -> _PooledSession:
+        now = time.monotonic()
+        while self._idle:
+            # LIFO: reuse the most recently used session so colder ones age out
+            pooled = self._idle.pop()
+            self.stats.idle = len(self._idle)
+            if self._expired(pooled, now):
+                self._retire(pooled)
+                continue
+            if now - pooled.checked_at >= self._pool.health_check_interval:
+                if not await self._healthy(pooled):
+                    self._retire(pooled)
+                    continue
+                pooled.checked_at = now
+            return pooled
+        return await self._open()
+
+    def _checkin(self, pooled: _PooledSession) -> None:
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+        self.stats.calls += 1
+        max_uses = self._pool.max_uses
+        if not pooled.conn.connected or (max_uses and pooled.uses >= max_uses):
+            self._retire(pooled)
+            return
+        self._idle.append(pooled)
+        self.stats.idle = len(self._idle)
+
+    async def _open(self) -> _PooledSession:
+        conn = ServerConnection(self.config)
+        timeout = self.config.connect_timeout
+        if timeout is None:
+            timeout = self._pool.connect_timeout
+        await conn.start(timeout=timeout)
+        self.stats.created += 1
+        return _PooledSession(conn=conn)
+
+    async def _healthy(self, pooled: _PooledSession) -> bool:
+        return await pooled.conn.ping(timeout=5)
+
+    def _expired(self, pooled: _PooledSession, now: float) -> bool:
+        max_idle = self._pool.max_idle
+        return bool(max_idle) and now - pooled.last_used > max_idle
+
+    def _retire(self, pooled: _PooledSession) -> None:
+        # Closing a stdio session waits for the subprocess to exit; don't make
+        # the caller that triggered the recycle wait for it.
+        self.stats.recycled += 1
+        self._pool._spawn(pooled.conn.close())
+
+
+class SessionPool:
+    """A pool of warm MCP sessions keyed by server config.
+
+    Sessions are opened on first use (or up front with :meth:`warm`), reused
+    across calls, health-checked with a ping when they have been idle, and
+    recycled after ``max_idle`` seconds without use or ``max_uses`` calls.
+
+    Attributes:
+        size: Maximum concurrent sessions per server config.
+        max_idle: Seconds an idle session is kept before it is closed.
+            ``None`` keeps sessions until the pool is closed.
+        max_uses: Calls served before a session is replaced. ``None`` means
+            no limit.
+        health_check_interval: Ping a session before reuse if it has not been
+            checked for this many seconds.
+        connect_timeout: Default seconds to wait for a new session; a server's
+            own ``connect_timeout`` takes precedence.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 1,
+        max_idle: float | None = 300.0,
+        max_uses: int | None = None,
+        health_check_interval: float = 30.0,
+        connect_timeout: float | None = 60.0,
+    ):
+        """Initialize the pool. No sessions are opened until first use.
+
+        Args:
+            size: Maximum concurrent sessions per server config.
+            max_idle: Idle seconds before a session is recycled.
+            max_uses: Calls before a session is recycled.
+            health_check_interval: Idle seconds before a ping on checkout.
+            connect_timeout: Default seconds to wait for a new session.
+        """
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.size = size
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self.health_check_interval = health_check_interval
+        self.connect_timeout = connect_timeout
+
+        self._slots: dict[str, _ServerSlots] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._background: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+
+    # -- Public API ---------------------------------------------------------
+
+    async def call_tool(
+        self, config: MCPServerConfig, name: str, arguments: dict[str, Any] | None = None
+    ) -> str:
+        """Call a tool on a pooled session and return the result as text.
+
+        Every text part of the result is returned, joined by newlines, the
+        same text an LLM client would pass to the model.
+        """
+        return await asyncio.wrap_future(self._submit(self._call_tool(config, name, arguments)))
+
+    def call_tool_sync(
+        self, config: MCPServerConfig, name: str, arguments: dict[str, Any] | None = None
+    ) -> str:
+        """Blocking variant of :meth:`call_tool` for synchronous callers."""
+        return self._submit(self._call_tool(config, name, arguments)).result()
+
+    async def list_tools(self, config: MCPServerConfig) -> list:
+        """Return the MCP tool objects exposed by a server."""
+        return await asyncio.wrap_future(self._submit(self._list_tools(config)))
+
+    def list_tools_sync(self, config: MCPServerConfig) -> list:
+        """Blocking variant of :meth:`list_tools`."""
+        return self._submit(self._list_tools(config)).result()
+
+    def warm(self, config: MCPServerConfig) -> None:
+        """Open ``size`` sessions for a server now instead of on first call."""
+        self._submit(self._slots_for(config).warm()).result()
+
+    def stats(self) -> dict[str, PoolStats]:
+        """Snapshot of per-server pool counters, keyed by server name."""
+        return {slots.config.name: replace(slots.stats) for slots in self._slots.values()}
+
+    def close(self) -> None:
+        """Close all sessions and stop the pool's background loop."""
+        if self._loop is None:
+            return
+        self._submit(self._close_all()).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    async def aclose(self) -> None:
+        """Async variant of :meth:`close`."""
+        await asyncio.to_thread(self.close)
+
+    def __enter__(self) -> SessionPool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self) -> SessionPool:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    # -- Internals (run on the pool loop) ------------------------------------
+
+    async def _call_tool(
+        self, config: MCPServerConfig, name: str, arguments: dict[str, Any] | None
+    ) -> str:
+        async def leased() -> Any:
+            async with self._slots_for(config).lease() as conn:
+                return await conn.call_tool(name, arguments or {})
+
+        result = await call_with_timeout(
+            leased(), config.call_timeout(name), f"Tool '{name}' on server '{config.name}'"
+        )
+        return extract_tool_text(result, config.output_limit(name))
+
+    async def _list_tools(self, config: MCPServerConfig) -> list:
+        async with self._slots_for(config).lease() as conn:
+            return list(conn.tools)
+
+    def _slots_for(self, config: MCPServerConfig) -> _ServerSlots:
+        key = config.fingerprint()
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = _ServerSlots(config, self)
+        return slots
+
+    async def _reap_forever(self) -> None:
+        interval = min(self.max_idle / 2, 30.0)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for slots in self._slots.values():
+                slots.reap(now)
+
+    async def _close_all(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        await asyncio.gather(*(slots.close() for slots in self._slots.values()))
+        await asyncio.gather(*self._background, return_exceptions=True)
+        self._slots.clear()
+
+    def _spawn(self, coro: Coroutine) -> None:
+        task = self._loop.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run() -> None:
+                    asyncio.set_event_loop(loop)
+                    if self.max_idle:
+                        self._reaper = loop.create_task(self._reap_forever())
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._loop = loop
+                self._thread = threading.Thread(
+                    target=_run, name="mcp-session-pool", daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+            return self._loop
@@ -0,0 +1,196 @@
+"""
+Tool Registry
+
+Indexes the tools of many MCP servers for routing. A registry is built once
+from each server's tool list and then answers every lookup with a dict hit:
+tools by server, the owning server of a tool, and the tool object itself.
+
+Every tool has a *qualified* name, ``"<server>.<tool>"``, that always
+resolves. The name shown to the model is the plain tool name when it is
+unique; when several servers expose the same name each copy is renamed to
+``"<server>__<tool>"`` (dots are not allowed in OpenAI or Anthropic function
+names), so no tool silently shadows another.
+
+Registries are immutable snapshots: build a new one when the set of servers
+changes and swap it in.
+
+Example:
+    >>> registry = ToolRegistry({"weather": weather_tools, "flights": flight_tools})
+    >>> registry.resolve("weather.get_forecast").server
+    'weather'
+    >>> [t.name for t in registry.tools_for("flights")]
+    ['search_flights', 'get_flight_details']
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Literal, Mapping
+
+logger = logging.getLogger(__name__)
+
+CollisionPolicy = Literal["namespace", "error"]
+
+# Separator in the model-facing names of colliding tools
+NAMESPACE_SEPARATOR = "__"
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+@dataclass(frozen=True)
+class RegisteredTool:
+    """One tool in a :class:`ToolRegistry`.
+
+    Attributes:
+        server: Name of the server that owns the tool.
+        name: The tool's name on its server (what ``call_tool`` sends).
+        exposed_name: The name shown to the model.
+        tool: The MCP tool object, renamed to ``exposed_name`` if needed.
+    """
+    server: str
+    name: str
+    exposed_name: str
+    tool: Any
+
+    @property
+    def qualified_name(self) -> str:
+        """``"<server>.<tool>"``."""
+        return f"{self.server}.{self.name}"
+
+
+class ToolRegistry:
+    """Immutable index of the tools exposed by a set of MCP servers.
+
+    Attributes:
+        collisions: Tool names exposed by more than one server, mapped to
+            the servers that expose them.
+    """
+
+    def __init__(
+        self,
+        servers: Mapping[str, list] | None = None,
+        *,
+        on_collision: CollisionPolicy = "namespace",
+    ):
+        """Build the registry.
+
+        Args:
+            servers: Tool lists keyed by server name.
+            on_collision: ``"namespace"`` (default) exposes colliding tools
+                as ``"<server>__<tool>"``; ``"error"`` raises instead.
+
+        Raises:
+            ValueError: If tool names collide and ``on_collision="error"``,
+                or if a namespaced name clashes with another tool's name.
+        """
+        if on_collision not in ("namespace", "error"):
+            raise ValueError(
+                f"on_collision must be 'namespace' or 'error', got {on_collision!r}"
+            )
+        servers = dict(servers or {})
+
+        owners: dict[str, list[str]] = {}
+        for server, tools in servers.items():
+            for tool in tools:
+                owners.setdefault(tool.name, []).append(server)
+        self.collisions = {name: owner for name, owner in owners.items() if len(owner) > 1}
+
+        if self.collisions:
+            if on_collision == "error":
+                raise ValueError(f"Tool names exposed by more than one server: {self.collisions}")
+            logger.warning(
+                "Tool names exposed by more than one server, namespacing them: %s",
+                self.collisions,
+            )
+
+        self._by_server: dict[str, list[RegisteredTool]] = {}
+        self._by_exposed: dict[str, RegisteredTool] = {}
+        self._by_qualified: dict[str, RegisteredTool] = {}
+        for server, tools in servers.items():
+            entries = []
+            for tool in tools:
+                name = exposed = tool.name
+                if name in self.collisions:
+                    exposed = _namespaced(server, name)
+                    tool = _renamed(tool, exposed)
+                if exposed in self._by_exposed:
+                    raise ValueError(
+                        f"Tool name '{exposed}' from server '{server}' clashes with "
+                        f"'{self._by_exposed[exposed].qualified_name}'"
+                    )
+                entry = RegisteredTool(server=server, name=name, exposed_name=exposed, tool=tool)
+                entries.append(entry)
+                self._by_exposed[exposed] = entry
+                self._by_qualified[entry.qualified_name] = entry
+            self._by_server[server] = entries
+
+        self._tools_by_server = {
+            server: [entry.tool for entry in entries] for server, entries in self._by_server.items()
+        }
+        self._tools = [tool for tools in self._tools_by_server.values() for tool in tools]
+
+    @property
+    def servers(self) -> list[str]:
+        """Server names, in registration order."""
+        return list(self._by_server)
+
+    @property
+    def tools(self) -> list:
+        """Every tool object as the model sees it. Treat as read-only."""
+        return self._tools
+
+    @property
+    def names(self) -> list[str]:
+        """Every model-facing tool name."""
+        return list(self._by_exposed)
+
+    def tools_for(self, server: str) -> list:
+        """Tool objects of one server (empty if unknown). Treat as read-only."""
+        return self._tools_by_server.get(server, [])
+
+    def names_for(self, server: str) -> list[str]:
+        """Model-facing tool names of one server (empty if the server is unknown)."""
+        return [entry.exposed_name for entry in self._by_server.get(server, ())]
+
+    def get(self, name: str) -> RegisteredTool | None:
+        """Look up a tool by model-facing or qualified name."""
+        return self._by_exposed.get(name) or self._by_qualified.get(name)
+
+    def resolve(self, name: str) -> RegisteredTool:
+        """Like :meth:`get`, but raises for unknown names.
+
+        Raises:
+            KeyError: If no tool has that name.
+        """
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def server_of(self, name: str) -> str | None:
+        """Name of the server that owns a tool, or ``None``."""
+        entry = self.get(name)
+        return entry.server if entry else None
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._by_exposed)
+
+
+def _namespaced(server: str, tool: str) -> str:
+    """Model-facing name for a colliding tool, limited to ``[A-Za-z0-9_-]``."""
+    return _UNSAFE_NAME_CHARS.sub("_", f"{server}{NAMESPACE_SEPARATOR}{tool}")
+
+
+def _renamed(tool: Any, name: str) -> Any:
+    """A copy of an MCP tool object under a different name."""
+    if hasattr(tool, "model_copy"):
+        return tool.model_copy(update={"name": name})
+    renamed = copy.copy(tool)
+    renamed.name = name
+    return renamed
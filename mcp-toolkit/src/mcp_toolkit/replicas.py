@@ -0,0 +1,196 @@
+"""
+Server Replicas
+
+Runs several sessions — for stdio servers, several processes — for one
+server config and spreads tool calls across them, so a CPU-bound server
+scales past one core. Each call goes to the replica with the fewest calls in
+flight. Tools with a ``sticky`` policy instead always go to the same replica
+for a given flow (see :mod:`mcp_toolkit.limiter`), for servers that keep
+per-caller state between calls. A flow's replica is fixed by its position in
+the config, so dropping another replica does not move it; while it is down,
+the flow's calls go to the next live replica and return once it is back.
+
+Example config:
+    ```json
+    "pubmed": {"command": "python", "args": ["pubmed_server.py"], "replicas": 4,
+               "tools": {"open_session": {"sticky": true}}}
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.connection import LazyServerConnection
+from mcp_toolkit.limiter import current_flow
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """Several connections to one server config, used as one connection.
+
+    Exposes the same interface as
+    :class:`~mcp_toolkit.connection.ServerConnection` (``tools``,
+    ``call_tool``, ``drain``, ``close``). Replicas can be any connection
+    type — supervised, lazy or plain.
+
+    Attributes:
+        replicas: The underlying connections.
+    """
+
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        make_replica: Callable[[Callable[[Any], None]], Any],
+        *,
+        on_tools_changed: Callable[[ReplicaSet], None] | None = None,
+    ):
+        """Create ``config.replicas`` connections (does not connect yet).
+
+        Args:
+            config: Server configuration.
+            make_replica: Builds one connection, given the callback it should
+                call when its tools change.
+            on_tools_changed: Called when any replica's tools change.
+        """
+        self._config = config
+        self._on_tools_changed = on_tools_changed
+        self.replicas = [make_replica(self._replica_tools_changed) for _ in range(config.replicas)]
+        # One slot per configured replica, None once dropped; sticky flows hash to a slot
+        self._slots: list[Any | None] = list(self.replicas)
+        self._next = 0
+
+    @property
+    def config(self) -> MCPServerConfig:
+        """Server configuration; setting it updates every replica."""
+        return self._config
+
+    @config.setter
+    def config(self, config: MCPServerConfig) -> None:
+        self._config = config
+        for replica in self.replicas:
+            replica.config = config
+
+    @property
+    def name(self) -> str:
+        """Server name from config."""
+        return self._config.name
+
+    @property
+    def tools(self) -> list:
+        """Tools of the first replica that knows them."""
+        for replica in self.replicas:
+            if replica.tools:
+                return replica.tools
+        return []
+
+    @property
+    def server_version(self) -> str | None:
+        """Version reported by the first connected replica."""
+        return next((r.server_version for r in self.replicas if r.server_version), None)
+
+    @property
+    def connected(self) -> bool:
+        """True while any replica has a live session."""
+        return any(replica.connected for replica in self.replicas)
+
+    @property
+    def in_flight(self) -> int:
+        """Tool calls running across all replicas."""
+        return sum(replica.in_flight for replica in self.replicas)
+
+    async def start(self, timeout: float | None = None) -> None:
+        """Start every replica concurrently.
+
+        Replicas that fail to start are dropped with a warning, as long as
+        at least one comes up.
+
+        Raises:
+            Exception: The first replica's error, if none of them started.
+        """
+        outcomes = await asyncio.gather(
+            *(replica.start(timeout=timeout) for replica in self.replicas),
+            return_exceptions=True,
+        )
+        failed = [(r, e) for r, e in zip(self.replicas, outcomes) if isinstance(e, BaseException)]
+        if len(failed) == len(self.replicas):
+            raise failed[0][1]
+        for replica, error in failed:
+            logger.warning(
+                "Replica of server '%s' failed to start, running %d of %d: %s",
+                self.name, len(self.replicas) - len(failed), len(self.replicas), error,
+            )
+            self.replicas.remove(replica)
+            self._slots = [None if r is replica else r for r in self._slots]
+            await replica.close()
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """Call a tool on the least busy replica, or the flow's replica for sticky tools."""
+        return await self.pick(name).call_tool(name, arguments)
+
+    def pick(self, tool_name: str) -> Any:
+        """The replica that should run the next call to ``tool_name``."""
+        replicas = self.replicas
+        flow = current_flow.get()
+        if flow is not None and self._config.tool_policy(tool_name).sticky:
+            return self._sticky(flow)
+
+        # Least outstanding requests; scan from a rotating start so ties
+        # are spread instead of always landing on the first replica
+        count = len(replicas)
+        start = self._next
+        self._next = (start + 1) % count
+        best = None
+        for i in range(count):
+            replica = replicas[(start + i) % count]
+            if best is None or _load(replica) < _load(best):
+                best = replica
+        return best
+
+    def _sticky(self, flow: Any) -> Any:
+        """The flow's replica, or the next live one while it is down."""
+        slots = self._slots
+        home = hash(flow) % len(slots)
+        for i in range(len(slots)):
+            replica = slots[(home + i) % len(slots)]
+            if replica is not None and _available(replica):
+                if i:
+                    logger.debug(
+                        "Replica %d of server '%s' is down; flow %r uses replica %d meanwhile",
+                        home, self.name, flow, (home + i) % len(slots),
+                    )
+                return replica
+        # Nothing is up: wait on the flow's own replica if it still exists
+        return slots[home] if slots[home] is not None else self.replicas[0]
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait for in-flight calls on every replica (see ``ServerConnection.drain``)."""
+        outcomes = await asyncio.gather(*(r.drain(timeout) for r in self.replicas))
+        return all(outcomes)
+
+    async def close(self) -> None:
+        """Close every replica."""
+        await asyncio.gather(*(replica.close() for replica in self.replicas))
+
+    def _replica_tools_changed(self, replica: Any) -> None:
+        if self._on_tools_changed is not None:
+            self._on_tools_changed(self)
+
+
+def _load(replica: Any) -> tuple[bool, int, bool]:
+    """Sort key for picking a replica; lowest wins.
+
+    Replicas that are down (restarting) come last. Otherwise the fewest calls
+    in flight wins, and on a tie an open session beats a lazy replica that
+    would have to start its server first.
+    """
+    return (not _available(replica), replica.in_flight, not replica.connected)
+
+
+def _available(replica: Any) -> bool:
+    """True if a call can run on the replica now, or once its lazy server starts."""
+    return replica.connected or isinstance(replica, LazyServerConnection)
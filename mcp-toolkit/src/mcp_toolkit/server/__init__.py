@@ -1,12 +1,34 @@
 """
 MCP Server Utilities
 
-Helpers for building MCP tool servers — environment loading, AI helpers, etc.
+Helpers for building MCP tool servers — environment loading, AI helpers,
+pooled HTTP, etc.
 
 Usage:
-    >>> from mcp_toolkit.server import openai_helper, load_env
+    >>> from mcp_toolkit.server import openai_helper, load_env, http_get
 """
 
 from mcp_toolkit.server.helpers import load_env, openai_helper, get_env_or_raise
+from mcp_toolkit.server.http import (
+    aclose_http_client,
+    configure_http,
+    get_http_client,
+    http_get,
+    http_lifespan,
+    http_post,
+    http_request,
+)
 
-__all__ = ["load_env", "openai_helper", "get_env_or_raise"]
+__all__ = [
+    "load_env",
+    "openai_helper",
+    "get_env_or_raise",
+    # Pooled HTTP
+    "http_get",
+    "http_post",
+    "http_request",
+    "http_lifespan",
+    "get_http_client",
+    "configure_http",
+    "aclose_http_client",
+]
@@ -0,0 +1,229 @@
+"""
+Pooled HTTP Client for MCP Servers
+
+Tool implementations that call external APIs should not open a new
+connection for every call — each ``httpx.AsyncClient(...)`` block or
+``requests.get`` pays DNS, TCP and TLS setup again. This module keeps one
+``httpx.AsyncClient`` per process with a keep-alive connection pool (and
+HTTP/2 when the ``h2`` package is installed), and retries transient failures
+with exponential backoff.
+
+Example:
+    from mcp.server.fastmcp import FastMCP
+    from mcp_toolkit.server import http_get, http_lifespan
+
+    mcp = FastMCP("weather", lifespan=http_lifespan)
+
+    @mcp.tool()
+    async def check_weather(city: str) -> str:
+        response = await http_get(f"https://wttr.in/{city}", params={"format": "3"})
+        return response.text
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import httpx
+
+# Methods that are safe to send twice; others are only retried when the
+# caller passes ``retries=`` explicitly.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses worth retrying: rate limiting and transient upstream failures.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on a single wait, including server-provided Retry-After values.
+MAX_BACKOFF = 30.0
+
+
+@dataclass
+class HttpSettings:
+    """Settings for the shared client (see :func:`configure_http`)."""
+    timeout: float = 10.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    retries: int = 2
+    backoff: float = 0.5
+    transport: httpx.AsyncBaseTransport | None = None
+
+
+_settings = HttpSettings()
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def configure_http(**options: Any) -> None:
+    """Change the settings of the shared client.
+
+    Must be called before the first request (or after :func:`aclose_http_client`).
+
+    Args:
+        **options: Any :class:`HttpSettings` field — ``timeout``,
+            ``max_connections``, ``max_keepalive_connections``,
+            ``keepalive_expiry``, ``http2`` (``None`` = use HTTP/2 if ``h2``
+            is installed), ``headers`` (sent with every request), ``retries``,
+            ``backoff`` (base delay in seconds) or ``transport``.
+
+    Raises:
+        RuntimeError: If the shared client has already been created.
+        TypeError: If an unknown option is given.
+    """
+    global _settings
+    if _client is not None and not _client.is_closed:
+        raise RuntimeError(
+            "configure_http() must be called before the first request "
+            "(or after aclose_http_client())."
+        )
+    _settings = HttpSettings(**{**_settings.__dict__, **options})
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client, creating it on first use.
+
+    Use this directly when you need something the request helpers don't
+    cover (streaming downloads, custom auth).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # A client's connections belong to the loop that opened them, so a
+        # new loop (e.g. a second asyncio.run) gets a fresh client.
+        _client = _build_client(_settings)
+        _client_loop = loop
+    return _client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def http_lifespan(server: Any = None) -> AsyncIterator[dict[str, Any]]:
+    """FastMCP lifespan that closes the shared client when the server stops.
+
+    Example:
+        >>> mcp = FastMCP("weather", lifespan=http_lifespan)
+    """
+    try:
+        yield {}
+    finally:
+        await aclose_http_client()
+
+
+async def http_request(
+    method: str,
+    url: str,
+    *,
+    retries: int | None = None,
+    backoff: float | None = None,
+    raise_for_status: bool = True,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Send a request on the shared client, retrying transient failures.
+
+    Connection errors, timeouts and 429/5xx responses are retried with
+    exponential backoff and jitter; a ``Retry-After`` header is honoured.
+    Non-idempotent methods (POST, PATCH) are not retried unless ``retries``
+    is given explicitly.
+
+    Args:
+        method: HTTP method.
+        url: Request URL.
+        retries: Extra attempts after the first. Defaults to the configured
+            value for idempotent methods and 0 otherwise.
+        backoff: Base delay in seconds (doubled after each attempt).
+        raise_for_status: Raise ``httpx.HTTPStatusError`` for 4xx/5xx
+            responses once retries are exhausted.
+        **kwargs: Passed to ``httpx.AsyncClient.request`` (params, json,
+            headers, timeout, ...).
+
+    Returns:
+        The response.
+    """
+    method = method.upper()
+    if retries is None:
+        retries = _settings.retries if method in IDEMPOTENT_METHODS else 0
+    if backoff is None:
+        backoff = _settings.backoff
+
+    client = get_http_client()
+    for attempt in range(retries + 1):
+        last = attempt == retries
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if last:
+                raise
+            await asyncio.sleep(_backoff_delay(backoff, attempt))
+            continue
+
+        if response.status_code in RETRY_STATUSES and not last:
+            delay = _retry_after(response)
+            await response.aclose()
+            await asyncio.sleep(delay if delay is not None else _backoff_delay(backoff, attempt))
+            continue
+
+        if raise_for_status:
+            response.raise_for_status()
+        return response
+
+    raise AssertionError("unreachable")
+
+
+async def http_get(url: str, **kwargs: Any) -> httpx.Response:
+    """``GET`` through :func:`http_request`."""
+    return await http_request("GET", url, **kwargs)
+
+
+async def http_post(url: str, **kwargs: Any) -> httpx.Response:
+    """``POST`` through :func:`http_request` (not retried unless ``retries=`` is set)."""
+    return await http_request("POST", url, **kwargs)
+
+
+def _build_client(settings: HttpSettings) -> httpx.AsyncClient:
+    http2 = settings.http2
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+    elif http2 and importlib.util.find_spec("h2") is None:
+        raise ImportError(
+            "HTTP/2 requires the 'h2' package. "
+            "Install with: pip install 'mcp-toolkit[http2]'"
+        )
+    return httpx.AsyncClient(
+        timeout=settings.timeout,
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        http2=http2,
+        headers=settings.headers,
+        transport=settings.transport,
+    )
+
+
+def _backoff_delay(base: float, attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(MAX_BACKOFF, base * 2 ** attempt))
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds requested by a ``Retry-After`` header, if it is numeric."""
+    value = response.headers.get("Retry-After")
+    try:
+        return min(MAX_BACKOFF, max(0.0, float(value))) if value else None
+    except ValueError:
+        return None
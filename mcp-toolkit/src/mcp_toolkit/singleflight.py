@@ -0,0 +1,118 @@
+"""
+Single-Flight Tool Calls
+
+Merges identical tool calls that are in flight at the same time — same
+server, tool and arguments — into one upstream call whose result (or
+error) is handed to every caller. When four agents ask for the weather in
+Tokyo at once, the weather API is called once.
+
+Unlike :class:`~mcp_toolkit.cache.ToolResultCache`, nothing is kept after
+the call finishes, so this is safe for tools whose results must not be
+reused later (live prices, current positions). Clients coalesce only tools
+whose policy sets ``coalesce``, whether or not they are cached. Calls to
+``sticky`` tools are only merged within one flow.
+
+Example:
+    >>> flights = SingleFlight()
+    >>> await asyncio.gather(
+    ...     flights.do(("weather", "get_current_weather", '{"city":"Tokyo"}'), call),
+    ...     flights.do(("weather", "get_current_weather", '{"city":"Tokyo"}'), call),
+    ... )                                   # call() runs once
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from mcp_toolkit.cache import make_key
+from mcp_toolkit.config import ToolPolicy
+from mcp_toolkit.limiter import current_flow
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for the coalesced calls to one server.
+
+    Attributes:
+        calls: Calls made through :meth:`SingleFlight.do`.
+        coalesced: Calls that joined one already in flight instead of
+            calling the server themselves.
+    """
+    calls: int = 0
+    coalesced: int = 0
+
+
+class _Flight:
+    """One upstream call and the callers waiting for it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome."""
+
+    def __init__(self):
+        self._flights: dict[Hashable, _Flight] = {}
+        self.stats: dict[str, SingleFlightStats] = {}
+
+    async def do(self, key: tuple, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call``, or wait for the identical call already in flight.
+
+        The call runs in its own task, in the context of the caller that
+        started it (so under that caller's deadline). Callers that give up
+        leave it running for the others; it is cancelled only when every
+        caller has gone.
+
+        Args:
+            key: Identifies identical calls; its first item is the server
+                name, used for :attr:`stats`.
+            call: Makes the upstream call.
+        """
+        stats = self.stats.get(key[0])
+        if stats is None:
+            stats = self.stats[key[0]] = SingleFlightStats()
+        stats.calls += 1
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Everyone gave up; later callers start a fresh call
+                self._land(key, flight)
+                flight.task.cancel()
+
+    def _land(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+def coalesce_key(
+    server: str, tool: str, arguments: dict[str, Any] | None, policy: ToolPolicy
+) -> tuple | None:
+    """The :meth:`SingleFlight.do` key for a call, or ``None`` if it must run on its own.
+
+    Only tools with ``coalesce`` set are shared; calls to sticky tools only
+    within the current flow, since their result depends on per-flow state.
+    """
+    if not policy.coalesce:
+        return None
+    key = make_key(server, tool, arguments)
+    return (*key, current_flow.get()) if policy.sticky else key
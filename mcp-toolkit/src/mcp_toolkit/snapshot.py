@@ -0,0 +1,158 @@
+"""
+Tool-List Snapshots
+
+Remembers the tools each server exposed the last time it was connected, so
+a lazily connected :class:`~mcp_toolkit.clients.multi.MultiServerClient` can
+show the model its tools without starting the server first.
+
+Entries are keyed by server name and only used while the server's
+:meth:`~mcp_toolkit.config.MCPServerConfig.fingerprint` is unchanged, so
+editing a server's command, args, env or URL invalidates its snapshot. Each
+entry also records the server name and version from ``initialize()``; a
+connected client that sees the same version serves the snapshot right away
+and re-lists tools in the background (see
+:class:`~mcp_toolkit.connection.ServerConnection`).
+
+The file is compact JSON, gzip-compressed when the path ends in ``.gz``.
+
+Example:
+    >>> snapshot = ToolSnapshot("data/tool_snapshot.json.gz")
+    >>> tools = snapshot.get(config.servers["weather"])   # None if unknown or stale
+    >>> snapshot.put(config.servers["weather"], session_tools, version="weather/1.2.0")
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any
+
+from mcp.types import Tool
+
+from mcp_toolkit.config import MCPServerConfig
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 2
+
+
+class ToolSnapshot:
+    """Tool lists per server, optionally persisted to a JSON file.
+
+    Without a path the snapshot lives in memory only, which still lets a
+    lazy client close idle sessions and reopen them later without another
+    ``list_tools`` round trip.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """Load the snapshot file if it exists.
+
+        Args:
+            path: JSON file to read and write. ``None`` keeps it in memory.
+                A missing or unreadable file starts an empty snapshot.
+        """
+        self.path = Path(path) if path else None
+        self._entries: dict[str, dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            self._entries = self._read(self.path)
+
+    def get(self, config: MCPServerConfig, version: str | None = None) -> list[Tool] | None:
+        """Return the remembered tools for a server, or ``None`` if there are none.
+
+        Args:
+            config: The server's current config; a snapshot taken under a
+                different fingerprint is ignored.
+            version: The running server's version (see
+                :func:`~mcp_toolkit.transports.server_version`). If given, a
+                snapshot taken from another version is ignored.
+        """
+        entry = self._entries.get(config.name)
+        if not entry or entry.get("fingerprint") != config.fingerprint():
+            return None
+        if version is not None and entry.get("version") != version:
+            return None
+        try:
+            return [Tool.model_validate(t) for t in entry["tools"]]
+        except Exception as e:
+            logger.warning("Ignoring unreadable tool snapshot for '%s': %s", config.name, e)
+            return None
+
+    def put(self, config: MCPServerConfig, tools: list, version: str | None = None) -> bool:
+        """Remember a server's tools and write the file if one is configured.
+
+        Args:
+            config: The server's config.
+            tools: Its tools, as returned by ``list_tools()``.
+            version: The server's version, if known.
+
+        Returns:
+            True if the tools differ from the ones remembered before (or
+            none were remembered for this config).
+        """
+        entry = {
+            "fingerprint": config.fingerprint(),
+            "version": version,
+            "tools": [_dump_tool(t) for t in tools],
+        }
+        old = self._entries.get(config.name)
+        if old == entry:
+            return False
+        self._entries[config.name] = entry
+        if self.path:
+            self._write(self.path)
+        return not old or old.get("fingerprint") != entry["fingerprint"] or old["tools"] != entry["tools"]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def _read(self, path: Path) -> dict[str, dict[str, Any]]:
+        try:
+            raw = path.read_bytes()
+            if path.suffix == ".gz":
+                raw = gzip.decompress(raw)
+            data = json.loads(raw)
+        except (OSError, ValueError, EOFError, zlib.error) as e:
+            logger.warning("Ignoring unreadable tool snapshot %s: %s", path, e)
+            return {}
+        if not isinstance(data, dict) or not isinstance(data.get("servers", {}), dict):
+            logger.warning("Ignoring unreadable tool snapshot %s: not a snapshot object", path)
+            return {}
+        if data.get("format") != SNAPSHOT_FORMAT:
+            return {}
+        return data.get("servers", {})
+
+    def _write(self, path: Path) -> None:
+        """Write atomically, so a crash never leaves a half-written file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"format": SNAPSHOT_FORMAT, "servers": self._entries}, separators=(",", ":")
+        ).encode("utf-8")
+        if path.suffix == ".gz":
+            payload = gzip.compress(payload, mtime=0)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Could not write tool snapshot %s: %s", path, e)
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _dump_tool(tool: Any) -> dict[str, Any]:
+    """A JSON-ready dict for an MCP tool object."""
+    if hasattr(tool, "model_dump"):
+        return tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return {
+        "name": tool.name,
+        "description": getattr(tool, "description", None),
+        "inputSchema": getattr(tool, "inputSchema", {}),
+    }
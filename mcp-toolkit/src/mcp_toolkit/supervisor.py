@@ -0,0 +1,246 @@
+"""
+Server Supervision
+
+Keeps a server connection alive across server crashes. A
+:class:`SupervisedConnection` notices when its session is lost — a tool call
+hits a closed stream, or a periodic ping fails — and starts a fresh session
+with exponential backoff, which replays ``initialize()`` and the tool
+listing. Calls made while the server is down wait for it to come back or
+fail fast, according to the server's
+:class:`~mcp_toolkit.config.RestartPolicy`.
+
+A call that was already running when the server died fails with
+``ConnectionError``: the server may have acted on it, so it is not retried.
+Calls that never reached the server are retried on the new session when the
+policy is ``"queue"``.
+
+Example:
+    >>> conn = SupervisedConnection(config.servers["flights"])
+    >>> await conn.start(timeout=10)
+    >>> await conn.call_tool("search_flights", {...})   # survives a server crash
+    >>> conn.restarts
+    1
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.connection import ServerConnection, _connection_lost, _never_sent
+from mcp_toolkit.snapshot import ToolSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class SupervisedConnection:
+    """A :class:`~mcp_toolkit.connection.ServerConnection` that restarts itself.
+
+    Exposes the same interface as ``ServerConnection`` (``tools``,
+    ``call_tool``, ``drain``, ``close``).
+
+    Attributes:
+        restarts: Sessions started to replace a lost one.
+    """
+
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        *,
+        snapshot: ToolSnapshot | None = None,
+        connect_timeout: float | None = None,
+        on_tools_changed: Callable[[SupervisedConnection], None] | None = None,
+    ):
+        """Initialize the connection (does not connect yet).
+
+        Args:
+            config: Server configuration; its ``restart`` policy is read on
+                every restart, so reloaded policies apply.
+            snapshot: Passed to each session (see ``ServerConnection``).
+            connect_timeout: Default seconds to wait for a restart; the
+                server's own ``connect_timeout`` takes precedence.
+            on_tools_changed: Called when a new session reports tools other
+                than the ones in ``tools``.
+        """
+        self.config = config
+        self.connect_timeout = connect_timeout
+        self.restarts = 0
+        self._snapshot = snapshot
+        self._on_tools_changed = on_tools_changed
+        self._conn = self._new_session()
+        self._up = asyncio.Event()
+        self._down_error: ConnectionError | None = None
+        self._supervisor: asyncio.Task | None = None
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def name(self) -> str:
+        """Server name from config."""
+        return self.config.name
+
+    @property
+    def tools(self) -> list:
+        """The current session's tools."""
+        return self._conn.tools
+
+    @property
+    def server_version(self) -> str | None:
+        """The current session's server version."""
+        return self._conn.server_version
+
+    @property
+    def connected(self) -> bool:
+        """True while a live session is open."""
+        return self._conn.connected
+
+    @property
+    def in_flight(self) -> int:
+        """Tool calls currently running or waiting for a restart."""
+        return self._in_flight
+
+    async def start(self, timeout: float | None = None) -> None:
+        """Start the first session and begin supervising it.
+
+        Raises:
+            TimeoutError: If the server did not come up within ``timeout``.
+            Exception: Whatever the transport raised while connecting.
+        """
+        await self._conn.start(timeout=timeout)
+        self._up.set()
+        self._supervisor = asyncio.create_task(
+            self._supervise(), name=f"mcp-supervisor:{self.name}"
+        )
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """Call a tool, waiting out or failing fast on a restart per policy.
+
+        Raises:
+            ConnectionError: If the server is down and the policy is
+                ``"fail"``, restarts were given up, or the server died while
+                handling this call.
+        """
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            conn = await self._session()
+            try:
+                return await conn.call_tool(name, arguments)
+            except Exception as e:
+                if not _connection_lost(e):
+                    raise
+                if not (_never_sent(e) and self.config.restart.while_down == "queue"):
+                    raise ConnectionError(
+                        f"Server '{self.name}' went away during '{name}'"
+                    ) from e
+            # The request never left this process; send it to the new session
+            conn = await self._session()
+            return await conn.call_tool(name, arguments)
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait for in-flight tool calls to finish (see ``ServerConnection.drain``)."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Stop supervising and close the session."""
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            await asyncio.gather(self._supervisor, return_exceptions=True)
+            self._supervisor = None
+        self._down(ConnectionError(f"Server '{self.name}' is closed"))
+        await self._conn.close()
+
+    async def _session(self) -> ServerConnection:
+        """The live session, waiting for a restart if the policy allows."""
+        if self._conn.lost and self._down_error is None:
+            self._up.clear()  # the supervisor may not have noticed yet
+        if not self._up.is_set():
+            if self.config.restart.while_down == "fail":
+                raise ConnectionError(f"Server '{self.name}' is restarting")
+            await self._up.wait()
+        if self._down_error is not None:
+            raise ConnectionError(str(self._down_error))
+        return self._conn
+
+    async def _supervise(self) -> None:
+        """Watch the session and replace it whenever it is lost."""
+        while True:
+            await self._wait_lost(self._conn)
+            self._up.clear()
+            if not await self._restart():
+                return
+
+    async def _wait_lost(self, conn: ServerConnection) -> None:
+        interval = self.config.restart.health_interval
+        if interval is None:
+            await conn.wait_lost()
+            return
+        while not conn.lost:
+            try:
+                await asyncio.wait_for(conn.wait_lost(), interval)
+            except asyncio.TimeoutError:
+                if not conn.in_flight:
+                    await conn.ping(timeout=interval)
+
+    async def _restart(self) -> bool:
+        """Replace the lost session, backing off between attempts.
+
+        Returns:
+            False if the policy's attempts ran out.
+        """
+        policy = self.config.restart
+        await self._conn.close()
+        delay = policy.backoff
+        attempt = 0
+        while policy.max_attempts is None or attempt < policy.max_attempts:
+            attempt += 1
+            await asyncio.sleep(delay)
+            conn = self._new_session()
+            timeout = self.config.connect_timeout
+            if timeout is None:
+                timeout = self.connect_timeout
+            try:
+                await conn.start(timeout=timeout)
+            except Exception as e:
+                logger.warning(
+                    "Restart %d of server '%s' failed: %s", attempt, self.name, e or type(e).__name__
+                )
+                delay = min(delay * 2, policy.max_backoff)
+                continue
+            tools_changed = conn.tools != self._conn.tools
+            self._conn = conn
+            self.restarts += 1
+            self._up.set()
+            logger.info("Restarted server '%s' (attempt %d)", self.name, attempt)
+            if tools_changed and self._on_tools_changed is not None:
+                self._on_tools_changed(self)
+            return True
+
+        logger.error("Giving up on server '%s' after %d restart attempts", self.name, attempt)
+        self._down(ConnectionError(f"Server '{self.name}' is down"))
+        return False
+
+    def _down(self, error: ConnectionError) -> None:
+        """Fail current and future waiters with ``error``."""
+        self._down_error = error
+        self._up.set()
+
+    def _new_session(self) -> ServerConnection:
+        return ServerConnection(
+            self.config, snapshot=self._snapshot, on_tools_changed=self._adopt_tools
+        )
+
+    def _adopt_tools(self, conn: ServerConnection) -> None:
+        if conn is self._conn and self._on_tools_changed is not None:
+            self._on_tools_changed(self)
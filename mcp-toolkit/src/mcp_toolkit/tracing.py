@@ -0,0 +1,330 @@
+"""
+Tracing
+
+Records timed spans across the tool-calling loop, so a slow answer can be
+pinned on the LLM, one MCP server or the code around them. Instrumented
+out of the box:
+
+- ``agent.run`` — one :meth:`BaseAgent.run() <mcp_toolkit.agents.BaseAgent.run>`
+  (``agent``, ``model``)
+- ``llm.request`` — one model request (``provider``, ``model``)
+- ``tool.dispatch`` — the tool calls of one model turn (``calls``)
+- ``tool.call`` — one tool call as the model asked for it (``tool``)
+- ``mcp.call_tool`` — one request to a server (``server``, ``tool``);
+  hedges and retries show up as several of these under one ``tool.call``
+- ``mcp.connect`` — starting a session (``server``, ``transport``)
+- ``mcp.list_tools`` — listing a server's tools (``server``, and ``revalidate``
+  when re-listing after a snapshot hit)
+
+Tracing is off until :func:`set_tracer` installs a :class:`Tracer`; until
+then every instrumentation point costs one global lookup. Spans nest
+through a context variable, so spans started in tasks (parallel agents,
+parallel tool calls) get the right parent.
+
+Example:
+    >>> from mcp_toolkit.tracing import InMemoryExporter, JsonLinesExporter, Tracer, set_tracer, span
+    >>> memory = InMemoryExporter()
+    >>> set_tracer(Tracer(memory, JsonLinesExporter("traces.jsonl")))
+    >>> with span("request", session=session_id):
+    ...     await orchestrator.chat(message)
+    >>> [(s.name, round(s.duration * 1000)) for s in memory.spans]
+    [('mcp.call_tool', 812), ('tool.call', 815), ('llm.request', 1490), ...]
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+logger = logging.getLogger(__name__)
+
+AttributeValue = str | int | float | bool
+
+
+@dataclass
+class Span:
+    """One timed operation.
+
+    Attributes:
+        name: What was timed, e.g. ``"mcp.call_tool"``.
+        trace_id: 128-bit id shared by every span of one trace.
+        span_id: 64-bit id of this span.
+        parent_id: ``span_id`` of the enclosing span, or ``None`` for a root.
+        start_ns: Start time, nanoseconds since the epoch.
+        end_ns: End time, or ``None`` while the span is open.
+        attributes: Details such as the server or tool name.
+        error: ``"<ExceptionType>: <message>"`` if the operation failed.
+    """
+    name: str
+    trace_id: int
+    span_id: int
+    parent_id: int | None = None
+    start_ns: int = 0
+    end_ns: int | None = None
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (0.0 while open)."""
+        return (self.end_ns - self.start_ns) / 1e9 if self.end_ns is not None else 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the operation did not fail."""
+        return self.error is None
+
+    def set(self, **attributes: AttributeValue) -> None:
+        """Add or overwrite attributes."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready form, with ids as hex strings as in OpenTelemetry."""
+        return {
+            "name": self.name,
+            "trace_id": f"{self.trace_id:032x}",
+            "span_id": f"{self.span_id:016x}",
+            "parent_id": f"{self.parent_id:016x}" if self.parent_id is not None else None,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class SpanExporter(ABC):
+    """Receives every finished span."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Handle one finished span. Must not block for long."""
+
+    def shutdown(self) -> None:
+        """Flush and release resources. Called by :meth:`Tracer.shutdown`."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests and ad-hoc inspection."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def named(self, name: str) -> list[Span]:
+        """The spans called ``name``, in the order they finished."""
+        return [s for s in self.spans if s.name == name]
+
+    def clear(self) -> None:
+        """Forget all spans."""
+        self.spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """Appends each finished span to a file as one line of JSON (see :meth:`Span.to_dict`)."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8", buffering=1)
+
+    def export(self, span: Span) -> None:
+        self._file.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+    def shutdown(self) -> None:
+        self._file.close()
+
+
+class OTLPExporter(SpanExporter):
+    """Sends spans to an OpenTelemetry collector over OTLP/HTTP.
+
+    Spans are batched and sent from a background thread by the
+    OpenTelemetry SDK. Requires the ``otlp`` extra.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        *,
+        service_name: str = "mcp-toolkit",
+        headers: dict[str, str] | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            endpoint: The collector's OTLP/HTTP traces URL.
+            service_name: ``service.name`` resource attribute.
+            headers: Extra HTTP headers, e.g. for authentication.
+
+        Raises:
+            ImportError: If the OpenTelemetry SDK is not installed.
+        """
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        except ImportError as e:
+            raise ImportError(
+                "OTLPExporter requires the OpenTelemetry SDK. "
+                "Install with: pip install 'mcp-toolkit[otlp]'"
+            ) from e
+        self._resource = Resource.create({"service.name": service_name})
+        self._processor = BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, headers=headers))
+
+    def export(self, span: Span) -> None:
+        from opentelemetry.sdk.trace import ReadableSpan
+        from opentelemetry.trace import SpanContext, Status, StatusCode, TraceFlags
+
+        def context(span_id: int) -> SpanContext:
+            return SpanContext(
+                span.trace_id, span_id, is_remote=False, trace_flags=TraceFlags(TraceFlags.SAMPLED)
+            )
+
+        self._processor.on_end(ReadableSpan(
+            name=span.name,
+            context=context(span.span_id),
+            parent=context(span.parent_id) if span.parent_id is not None else None,
+            resource=self._resource,
+            attributes=span.attributes,
+            status=Status(StatusCode.ERROR, span.error) if span.error else Status(StatusCode.OK),
+            start_time=span.start_ns,
+            end_time=span.end_ns,
+        ))
+
+    def shutdown(self) -> None:
+        self._processor.shutdown()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to its exporters."""
+
+    def __init__(self, *exporters: SpanExporter):
+        self.exporters = list(exporters)
+
+    def start(
+        self, name: str, attributes: dict[str, AttributeValue] | None = None
+    ) -> Span:
+        """Open a span under the current one (a new trace if there is none).
+
+        The span does not become current; see :meth:`span` for that.
+        """
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else random.getrandbits(128),
+            span_id=random.getrandbits(64),
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+
+    def end(self, span: Span, error: BaseException | None = None) -> None:
+        """Close a span and export it."""
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                logger.exception("Span exporter %s failed", type(exporter).__name__)
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: dict[str, AttributeValue] | None = None
+    ) -> Iterator[Span]:
+        """Time the block as a span that is current while it runs."""
+        span = self.start(name, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, e)
+            raise
+        else:
+            self.end(span)
+        finally:
+            _current_span.reset(token)
+
+    def shutdown(self) -> None:
+        """Shut down every exporter."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+_tracer: Tracer | None = None
+_current_span: ContextVar[Span | None] = ContextVar("mcp_toolkit_span", default=None)
+_NO_SPAN = nullcontext()
+
+
+def set_tracer(tracer: Tracer | None) -> Tracer | None:
+    """Install the tracer used by all instrumentation (``None`` turns tracing off).
+
+    Returns:
+        The previously installed tracer.
+    """
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def get_tracer() -> Tracer | None:
+    """The installed tracer, or ``None`` if tracing is off."""
+    return _tracer
+
+
+def current_span() -> Span | None:
+    """The innermost span open in the current context."""
+    return _current_span.get()
+
+
+def span(name: str, **attributes: AttributeValue) -> ContextManager[Span | None]:
+    """Time the block as a span, if tracing is on.
+
+    Yields the :class:`Span`, or ``None`` when tracing is off.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, attributes)
+
+
+def start_span(name: str, **attributes: AttributeValue) -> Span | None:
+    """Open a span without making it current; close it with :func:`end_span`.
+
+    For code that cannot wrap the operation in a ``with`` block, such as
+    async generators (a span made current there would leak into the
+    consumer between yields).
+    """
+    tracer = _tracer
+    return tracer.start(name, attributes) if tracer is not None else None
+
+
+def end_span(span: Span | None, error: BaseException | None = None) -> None:
+    """Close a span from :func:`start_span`. ``None`` is ignored."""
+    tracer = _tracer
+    if span is not None and tracer is not None:
+        tracer.end(span, error)
+
+
+@contextmanager
+def use_span(span: Span | None) -> Iterator[None]:
+    """Make ``span`` current for the block, e.g. while creating child tasks."""
+    if span is None:
+        yield
+        return
+    token = _current_span.set(span)
+    try:
+        yield
+    finally:
+        _current_span.reset(token)
@@ -7,14 +7,33 @@ transport type (stdio subprocess or SSE over HTTP).
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import sys
+import weakref
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import (
+    CallToolResult,
+    CancelledNotification,
+    CancelledNotificationParams,
+    ClientNotification,
+    InitializeResult,
+)
 
 from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.tracing import end_span, start_span
+
+logger = logging.getLogger(__name__)
+
+# initialize() results of live sessions (ClientSession does not keep serverInfo)
+_init_results: weakref.WeakKeyDictionary[ClientSession, InitializeResult] = weakref.WeakKeyDictionary()
+
+# Cancellation notices still being sent (keeps their tasks alive)
+_cancellations: set[asyncio.Task] = set()
 
 
 @asynccontextmanager
@@ -68,25 +87,38 @@ async def connect(
 
     if url:
         if transport_type == "streamable_http":
-            async with _connect_streamable_http(url) as session:
-                yield session
+            transport = _connect_streamable_http(url)
         else:
-            async with _connect_sse(url) as session:
-                yield session
+            transport_type = "sse"
+            transport = _connect_sse(url)
     elif script:
         resolved_command = command or _detect_command(script)
         resolved_args = args if args is not None else [script]
-        async with _connect_stdio(resolved_command, resolved_args, env) as session:
-            yield session
+        transport_type = "stdio"
+        transport = _connect_stdio(resolved_command, resolved_args, env)
     elif command and args:
-        async with _connect_stdio(command, args, env) as session:
-            yield session
+        transport_type = "stdio"
+        transport = _connect_stdio(command, args, env)
     else:
         raise ValueError(
             "Must provide one of: script (path), url (SSE/streamable_http endpoint), "
             "or config (MCPServerConfig)"
         )
 
+    # Covers spawn/handshake only, so it ends at the yield rather than
+    # staying open (and current) for the life of the session
+    connecting = start_span(
+        "mcp.connect", server=config.name if config else (url or script or command), transport=transport_type
+    )
+    try:
+        async with transport as session:
+            end_span(connecting)
+            connecting = None
+            yield session
+    except BaseException as e:
+        end_span(connecting, e)
+        raise
+
 
 @asynccontextmanager
 async def _connect_stdio(
@@ -100,7 +132,7 @@ async def _connect_stdio(
     )
     async with stdio_client(server_params) as (read_stream, write_stream):
         async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
+            await _initialize(session)
             yield session
 
 
@@ -117,7 +149,7 @@ async def _connect_sse(url: str) -> AsyncGenerator[ClientSession, None]:
 
     async with sse_client(url=url) as (read_stream, write_stream):
         async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
+            await _initialize(session)
             yield session
 
 
@@ -138,10 +170,66 @@ async def _connect_streamable_http(url: str) -> AsyncGenerator[ClientSession, No
 
     async with streamable_http_client(url=url) as (read_stream, write_stream, _get_session_id):
         async with ClientSession(read_stream, write_stream) as session:
-            await session.initialize()
+            await _initialize(session)
             yield session
 
 
+async def _initialize(session: ClientSession) -> InitializeResult:
+    """Run the MCP handshake and remember its result for :func:`server_version`."""
+    result = await session.initialize()
+    _init_results[session] = result
+    return result
+
+
+def server_version(session: ClientSession) -> str | None:
+    """The server's ``"<name>/<version>"`` from its ``initialize()`` response.
+
+    Returns ``None`` if the session was not initialized through this module.
+    """
+    result = _init_results.get(session)
+    if result is None:
+        return None
+    info = result.serverInfo
+    return f"{info.name}/{info.version}"
+
+
+async def call_tool(
+    session: ClientSession, name: str, arguments: dict[str, Any] | None = None
+) -> CallToolResult:
+    """``session.call_tool()`` that tells the server when the caller gives up.
+
+    If the call is cancelled — it timed out, or the request it belongs to
+    was abandoned — a ``notifications/cancelled`` message is sent for it so
+    the server stops working on it as well.
+
+    The request id is read from the SDK's private ``_request_id`` counter.
+    Should a future SDK drop it, calls still work; only the notification is
+    skipped.
+    """
+    # call_tool() takes this id for its request before its first await
+    request_id = getattr(session, "_request_id", None)
+    try:
+        return await session.call_tool(name, arguments)
+    except asyncio.CancelledError:
+        if request_id is None:
+            raise
+        task = asyncio.create_task(_send_cancelled(session, request_id))
+        _cancellations.add(task)
+        task.add_done_callback(_cancellations.discard)
+        raise
+
+
+async def _send_cancelled(session: ClientSession, request_id: int) -> None:
+    notification = ClientNotification(CancelledNotification(
+        params=CancelledNotificationParams(requestId=request_id, reason="Client cancelled the call"),
+    ))
+    try:
+        await session.send_notification(notification)
+    except Exception as e:
+        # The session is gone, so the server is no longer working on it
+        logger.debug("Could not cancel request %s: %s", request_id, e)
+
+
 def _detect_command(script: str) -> str:
     """Auto-detect the interpreter command from script extension."""
     if script.endswith(".py"):
@@ -0,0 +1,15 @@
+"""Fixtures shared by the tests"""
+
+import pytest
+
+from tests.helpers import demo
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def demo_config():
+    return demo()
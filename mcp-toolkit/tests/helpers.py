@@ -0,0 +1,24 @@
+"""Config and tool factories shared by the tests"""
+
+import sys
+from pathlib import Path
+
+from mcp.types import Tool
+
+from mcp_toolkit.config import MCPConfig, MCPServerConfig
+
+ROOT = Path(__file__).parent.parent
+DEMO_SERVER = str(ROOT / "examples" / "quickstarts" / "demo_server.py")
+
+
+def demo(name: str = "demo", **kwargs) -> MCPServerConfig:
+    """Config for the quickstart demo server (echo, add, greet)."""
+    return MCPServerConfig(name=name, command=sys.executable, args=[DEMO_SERVER], **kwargs)
+
+
+def config(*servers: MCPServerConfig) -> MCPConfig:
+    return MCPConfig(servers={s.name: s for s in servers})
+
+
+def tool(name: str) -> Tool:
+    return Tool(name=name, description=f"The {name} tool", inputSchema={"type": "object", "properties": {}})
@@ -0,0 +1,72 @@
+"""Smoke tests for the benchmarks/ harness (fake LLM and a tiny stdio run)"""
+
+import pytest
+
+from benchmarks.fake_llm import FakeOpenAI
+from benchmarks.harness import BenchmarkOptions, bench_multi_client, percentile
+
+
+TOOLS = [
+    {"type": "function", "function": {
+        "name": "add",
+        "parameters": {"type": "object", "properties": {"a": {"type": "number"}, "b": {"type": "number"}}},
+    }},
+    {"type": "function", "function": {
+        "name": "echo",
+        "parameters": {"type": "object", "properties": {"message": {"type": "string"}}},
+    }},
+]
+
+
+class TestFakeOpenAI:
+    @pytest.mark.anyio
+    async def test_scripted_tool_rounds_then_answer(self):
+        llm = FakeOpenAI(tool_rounds=2, calls_per_round=3, answer="Done.")
+        messages = [{"role": "user", "content": "go"}]
+
+        for _ in range(2):
+            response = await llm.chat.completions.create(model="m", messages=messages, tools=TOOLS)
+            msg = response.choices[0].message
+            assert len(msg.tool_calls) == 3
+            messages.append(msg.model_dump())
+            messages += [{"role": "tool", "tool_call_id": tc.id, "content": "1"} for tc in msg.tool_calls]
+
+        final = await llm.chat.completions.create(model="m", messages=messages, tools=TOOLS)
+        assert final.choices[0].message.content == "Done."
+        assert (llm.usage.requests, llm.usage.tool_calls, llm.usage.tool_results) == (3, 6, 6)
+
+    @pytest.mark.anyio
+    async def test_arguments_follow_schema(self):
+        llm = FakeOpenAI(calls_per_round=2)
+        response = await llm.chat.completions.create(
+            messages=[{"role": "user", "content": "go"}], tools=TOOLS
+        )
+        add, echo = response.choices[0].message.tool_calls
+        assert add.function.name == "add"
+        assert add.function.arguments == '{"a": 1.0, "b": 1.0}'
+        assert echo.function.name == "echo"
+        assert '"message": "benchmark input 1"' in echo.function.arguments
+
+    @pytest.mark.anyio
+    async def test_no_tools_offered_answers_directly(self):
+        llm = FakeOpenAI()
+        response = await llm.chat.completions.create(messages=[{"role": "user", "content": "go"}])
+        assert response.choices[0].message.tool_calls is None
+
+
+def test_percentile():
+    samples = [float(n) for n in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.anyio
+async def test_multi_client_scenario_over_stdio():
+    result = await bench_multi_client(
+        "stdio", BenchmarkOptions(requests=4, concurrency=2, calls_per_round=2)
+    )
+    assert result.count == 4
+    assert 0 < result.p50_ms <= result.p99_ms
+    assert result.tool_calls_per_sec > 0
+    assert result.startup_ms > 0
@@ -0,0 +1,114 @@
+"""Tests for token accounting and context budgets"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.budget import ContextBudget, TokenUsage, _head_tail
+
+
+def openai_round(call_id: str, result: str) -> list[dict]:
+    return [
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"id": call_id, "type": "function", "function": {"name": "search", "arguments": "{}"}}],
+        },
+        {"role": "tool", "tool_call_id": call_id, "content": result},
+    ]
+
+
+class TestTokenUsage:
+    def test_adds_usage_of_each_provider(self):
+        usage = TokenUsage()
+        usage.add(SimpleNamespace(prompt_tokens=100, completion_tokens=20))
+        usage.add(SimpleNamespace(input_tokens=50, output_tokens=5))
+        usage.add(None)
+        assert (usage.requests, usage.input_tokens, usage.output_tokens) == (3, 150, 25)
+        assert usage.total_tokens == 175
+
+
+class TestHeadTail:
+    def test_keeps_beginning_and_end(self):
+        text = "A" * 1000 + "Z" * 1000
+        short = _head_tail(text, 400)
+        assert len(short) < 500
+        assert short.startswith("A") and short.endswith("Z")
+        assert "1700 characters" in short
+
+    def test_short_text_unchanged(self):
+        assert _head_tail("hello", 400) == "hello"
+
+
+class TestContextBudget:
+    @pytest.mark.anyio
+    async def test_shortens_old_results_but_keeps_latest_round(self):
+        messages = [{"role": "user", "content": "plan a trip"}]
+        messages += openai_round("1", "x" * 8000)
+        messages += openai_round("2", "y" * 8000)
+        messages += openai_round("3", "z" * 8000)
+        budget = ContextBudget(4000, shortened_tokens=100)
+
+        saved = await budget.fit(messages)
+
+        assert saved > 0
+        assert len(messages[2]["content"]) < 500
+        assert "removed to save context" in messages[2]["content"]
+        assert messages[-1]["content"] == "z" * 8000
+        assert budget.shortened >= 1
+        assert budget.estimate(messages) <= 4000
+
+    @pytest.mark.anyio
+    async def test_under_budget_is_untouched(self):
+        messages = [{"role": "user", "content": "hi"}] + openai_round("1", "x" * 8000)
+        assert await ContextBudget(100_000).fit(messages) == 0
+        assert await ContextBudget(None).fit(messages + openai_round("2", "y")) == 0
+        assert messages[2]["content"] == "x" * 8000
+
+    @pytest.mark.anyio
+    async def test_anthropic_tool_result_blocks(self):
+        def tool_results(call_id, text):
+            return {"role": "user", "content": [{"type": "tool_result", "tool_use_id": call_id, "content": text}]}
+
+        messages = [
+            {"role": "user", "content": "hi"},
+            tool_results("a", "x" * 8000),
+            tool_results("b", "y" * 8000),
+        ]
+        await ContextBudget(3000, shortened_tokens=100).fit(messages)
+        assert len(messages[1]["content"][0]["content"]) < 500
+        assert messages[2]["content"][0]["content"] == "y" * 8000
+
+    @pytest.mark.anyio
+    async def test_reported_prompt_tokens_calibrate_estimate(self):
+        messages = [{"role": "user", "content": "hi"}]
+        budget = ContextBudget(10_000)
+        budget.record(SimpleNamespace(prompt_tokens=5000, completion_tokens=10), messages)
+        messages += openai_round("1", "x" * 400)
+
+        # 5000 reported for the first message plus an estimate for the round added since
+        assert 5100 <= budget.estimate(messages) < 5200
+        assert budget.usage.requests == 1
+
+    @pytest.mark.anyio
+    async def test_summarize_hook_and_fallback(self):
+        async def summarize(text):
+            return "short summary"
+
+        async def broken(text):
+            raise RuntimeError("no model")
+
+        for hook, expected in ((summarize, "[Summary of an earlier tool result]\nshort summary"), (broken, None)):
+            messages = [{"role": "user", "content": "hi"}]
+            messages += openai_round("1", "x" * 8000) + openai_round("2", "y" * 8000)
+            await ContextBudget(3000, summarize=hook).fit(messages)
+            if expected is not None:
+                assert messages[2]["content"] == expected
+            else:
+                assert "removed to save context" in messages[2]["content"]
+
+    def test_rejects_bad_settings(self):
+        with pytest.raises(ValueError):
+            ContextBudget(0)
+        with pytest.raises(ValueError):
+            ContextBudget(1000, threshold=1.5)
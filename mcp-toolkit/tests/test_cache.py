@@ -0,0 +1,151 @@
+"""Tests for mcp_toolkit.cache"""
+
+import pytest
+
+from mcp_toolkit.cache import ToolResultCache, make_key
+from mcp_toolkit.config import ToolPolicy
+from tests.helpers import demo
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMakeKey:
+    def test_argument_order_does_not_matter(self):
+        assert make_key("s", "t", {"a": 1, "b": 2}) == make_key("s", "t", {"b": 2, "a": 1})
+
+    def test_none_and_empty_arguments_match(self):
+        assert make_key("s", "t", None) == make_key("s", "t", {})
+
+    def test_server_and_tool_are_part_of_key(self):
+        args = {"city": "Paris"}
+        assert make_key("a", "t", args) != make_key("b", "t", args)
+        assert make_key("s", "t1", args) != make_key("s", "t2", args)
+
+
+class TestToolResultCache:
+    def test_hit_and_miss_counters(self):
+        cache = ToolResultCache()
+        key = make_key("s", "t", {})
+        assert cache.get(key) is None
+        cache.put(key, "value", ttl=10)
+        assert cache.get(key) == "value"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_entry_expires(self):
+        clock = FakeClock()
+        cache = ToolResultCache(clock=clock)
+        key = make_key("s", "t", {})
+        cache.put(key, "value", ttl=10)
+        clock.now = 9.9
+        assert cache.get(key) == "value"
+        clock.now = 10.0
+        assert cache.get(key) is None
+        assert cache.stats().expirations == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ToolResultCache(maxsize=2)
+        a, b, c = (make_key("s", name, {}) for name in "abc")
+        cache.put(a, "a", ttl=10)
+        cache.put(b, "b", ttl=10)
+        cache.get(a)  # a is now most recently used
+        cache.put(c, "c", ttl=10)
+        assert cache.get(b) is None
+        assert cache.get(a) == "a"
+        assert cache.get(c) == "c"
+        assert cache.stats().evictions == 1
+
+    def test_non_positive_ttl_not_stored(self):
+        cache = ToolResultCache()
+        cache.put(make_key("s", "t", {}), "value", ttl=0)
+        assert len(cache) == 0
+
+    def test_invalidate_by_server_and_tool(self):
+        cache = ToolResultCache()
+        cache.put(make_key("weather", "now", {}), "1", ttl=10)
+        cache.put(make_key("weather", "forecast", {}), "2", ttl=10)
+        cache.put(make_key("flights", "now", {}), "3", ttl=10)
+        assert cache.invalidate(tool="now") == 2
+        assert cache.invalidate(server="weather") == 1
+        assert len(cache) == 0
+
+    def test_stats_is_a_snapshot(self):
+        cache = ToolResultCache()
+        before = cache.stats()
+        cache.get(make_key("s", "t", {}))
+        assert before.misses == 0
+
+    def test_rejects_bad_maxsize(self):
+        with pytest.raises(ValueError, match="maxsize"):
+            ToolResultCache(maxsize=0)
+
+    @pytest.mark.anyio
+    async def test_get_or_call(self):
+        cache = ToolResultCache()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return f"result {len(calls)}", True
+
+        assert await cache.get_or_call("s", "t", {"x": 1}, 60, call) == "result 1"
+        assert await cache.get_or_call("s", "t", {"x": 1}, 60, call) == "result 1"
+        assert await cache.get_or_call("s", "t", {"x": 2}, 60, call) == "result 2"
+        assert len(calls) == 2
+
+    @pytest.mark.anyio
+    async def test_get_or_call_without_ttl_bypasses_cache(self):
+        cache = ToolResultCache()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "result", True
+
+        await cache.get_or_call("s", "t", {}, None, call)
+        await cache.get_or_call("s", "t", {}, None, call)
+        assert len(calls) == 2
+        assert cache.stats().misses == 0
+
+    @pytest.mark.anyio
+    async def test_errors_are_not_cached(self):
+        cache = ToolResultCache()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "Error: upstream down", False
+
+        await cache.get_or_call("s", "t", {}, 60, call)
+        await cache.get_or_call("s", "t", {}, 60, call)
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+
+class TestMultiServerClientCache:
+    @pytest.mark.anyio
+    async def test_call_tool_uses_policy(self):
+        pytest.importorskip("openai")
+        from mcp_toolkit.clients.multi import MultiServerClient
+        from mcp_toolkit.config import MCPConfig
+
+        config = MCPConfig(servers={"demo": demo(tools={"greet": ToolPolicy(cache_ttl=60)})})
+        cache = ToolResultCache()
+        async with MultiServerClient(config, api_key="test", result_cache=cache) as client:
+            first = await client.call_tool("greet", {"name": "Ada"})
+            second = await client.call_tool("greet", {"name": "Ada"})
+            await client.call_tool("echo", {"message": "hi"})
+            await client.call_tool("echo", {"message": "hi"})
+
+        assert first == second
+        stats = cache.stats()
+        # echo has no cache_ttl, so only the greet calls touch the cache
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
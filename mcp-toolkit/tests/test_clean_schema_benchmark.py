@@ -0,0 +1,96 @@
+"""Micro-benchmark for mcp_toolkit.converters.clean_schema
+
+Generates large schemas shaped like real Pydantic output — many models under
+``$defs``, wide property lists, deep nesting — and reports throughput. The
+assertions only check correctness and a very loose time budget so the test
+stays stable on slow CI machines; run with ``pytest -s`` to see the numbers.
+"""
+
+import time
+
+from mcp_toolkit.converters import clean_schema
+
+
+def _model(name: str, n_fields: int, refs: list[str]) -> dict:
+    properties = {}
+    for i in range(n_fields):
+        if refs and i % 5 == 0:
+            field = {"$ref": f"#/$defs/{refs[i % len(refs)]}"}
+        elif i % 3 == 0:
+            field = {"title": f"Field {i}", "type": "array",
+                     "items": {"title": "Item", "type": "string"}}
+        else:
+            field = {"title": f"Field {i}", "type": "string", "description": f"Field {i}"}
+        properties[f"field_{i}"] = field
+    return {"title": name, "type": "object", "properties": properties,
+            "required": list(properties)[: n_fields // 2]}
+
+
+def wide_schema(n_models: int = 200, n_fields: int = 30) -> dict:
+    """A tool schema with many $defs models referencing each other."""
+    names = [f"Model{i}" for i in range(n_models)]
+    defs = {name: _model(name, n_fields, names[:i]) for i, name in enumerate(names)}
+    root = _model("Root", n_fields, names)
+    root["$defs"] = defs
+    return root
+
+
+def deep_schema(depth: int = 5000) -> dict:
+    """A nested-model chain far deeper than Python's recursion limit."""
+    schema = {"title": "Leaf", "type": "string"}
+    for i in range(depth):
+        schema = {"title": f"Level{i}", "type": "object", "properties": {"child": schema}}
+    return schema
+
+
+def clean_tool_list(n_tools: int = 300) -> list[dict]:
+    """Schemas with nothing to clean — the common case after a first pass."""
+    return [clean_schema(_model(f"Tool{i}", 10, [])) for i in range(n_tools)]
+
+
+def _throughput(fn, arg, repeat: int) -> tuple[float, float]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    elapsed = time.perf_counter() - started
+    return elapsed, repeat / elapsed
+
+
+def _count_nodes(schema) -> int:
+    count, stack = 0, [schema]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if isinstance(node, dict):
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+    return count
+
+
+def test_benchmark_wide_schema_with_defs():
+    schema = wide_schema()
+    nodes = _count_nodes(schema)
+    elapsed, per_sec = _throughput(clean_schema, schema, repeat=20)
+    print(f"\nwide ($defs): {nodes} nodes, {per_sec:.1f} schemas/s, "
+          f"{nodes * per_sec / 1e6:.2f}M nodes/s")
+    assert "title" not in clean_schema(schema)["$defs"]["Model7"]
+    assert elapsed < 30
+
+
+def test_benchmark_deep_schema():
+    schema = deep_schema()
+    elapsed, per_sec = _throughput(clean_schema, schema, repeat=20)
+    print(f"\ndeep (5000 levels): {per_sec:.1f} schemas/s")
+    assert elapsed < 30
+
+
+def test_benchmark_already_clean_schemas_are_shared():
+    tools = clean_tool_list()
+    started = time.perf_counter()
+    results = [clean_schema(t) for t in tools for _ in range(10)]
+    elapsed = time.perf_counter() - started
+    print(f"\nalready clean: {len(results) / elapsed:.0f} schemas/s")
+    # Nothing to strip, so every result is the input itself — zero copies
+    assert all(r is t for r, t in zip(results, (t for t in tools for _ in range(10))))
+    assert elapsed < 30
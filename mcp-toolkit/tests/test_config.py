@@ -7,6 +7,9 @@ from pathlib import Path
 from mcp_toolkit.config import (
     MCPServerConfig,
     MCPConfig,
+    RestartPolicy,
+    ToolPolicy,
+    diff_configs,
     load_config,
     load_config_from_dict,
     _parse_config,
@@ -162,3 +165,173 @@ class TestLoadConfigFromDict:
             }
         })
         assert config.servers["my_server"].command == "python"
+
+
+class TestConnectTimeout:
+    def test_parsed_from_config(self):
+        config = load_config_from_dict({
+            "mcpServers": {
+                "slow": {"command": "python", "args": ["slow.py"], "connect_timeout": 5},
+                "fast": {"command": "python", "args": ["fast.py"]},
+            }
+        })
+        assert config.servers["slow"].connect_timeout == 5
+        assert config.servers["fast"].connect_timeout is None
+
+    def test_validate_rejects_non_positive(self):
+        cfg = MCPServerConfig(name="test", command="python", connect_timeout=0)
+        with pytest.raises(ValueError, match="connect_timeout must be positive"):
+            cfg.validate()
+
+
+class TestToolTimeouts:
+    def test_tool_policy_overrides_server_default(self):
+        config = load_config_from_dict({
+            "s": {"command": "python", "tool_timeout": 20, "tools": {"slow": {"timeout": 90}}},
+        })
+        server = config.servers["s"]
+        assert server.call_timeout("slow") == 90
+        assert server.call_timeout("other") == 20
+        assert MCPServerConfig(name="s", command="python").call_timeout("t") is None
+
+    def test_validate_rejects_non_positive(self):
+        with pytest.raises(ValueError, match="tool_timeout must be positive"):
+            MCPServerConfig(name="s", command="python", tool_timeout=0).validate()
+        with pytest.raises(ValueError, match="timeout must be positive"):
+            load_config_from_dict({"s": {"command": "python", "tools": {"t": {"timeout": -1}}}})
+
+
+class TestConcurrencyLimits:
+    def test_parsed_from_config(self):
+        config = load_config_from_dict({
+            "flights": {"command": "python", "max_concurrency": 4, "max_queue": 32},
+        })
+        server = config.servers["flights"]
+        assert (server.max_concurrency, server.max_queue) == (4, 32)
+
+    def test_validate_rejects_bad_limits(self):
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            MCPServerConfig(name="s", command="python", max_concurrency=0).validate()
+        with pytest.raises(ValueError, match="max_queue must not be negative"):
+            MCPServerConfig(name="s", command="python", max_queue=-1).validate()
+
+
+class TestReplicas:
+    def test_parsed_from_config(self):
+        config = load_config_from_dict({
+            "pubmed": {"command": "python", "replicas": 4, "tools": {"open": {"sticky": True}}},
+        })
+        server = config.servers["pubmed"]
+        assert server.replicas == 4
+        assert server.tool_policy("open").sticky
+        assert not server.tool_policy("search").sticky
+
+    def test_validate_rejects_zero(self):
+        with pytest.raises(ValueError, match="replicas must be at least 1"):
+            MCPServerConfig(name="s", command="python", replicas=0).validate()
+
+    def test_replica_change_needs_new_sessions(self):
+        old = MCPConfig(servers={"s": MCPServerConfig(name="s", command="python")})
+        new = MCPConfig(servers={"s": MCPServerConfig(name="s", command="python", replicas=2)})
+        assert diff_configs(old, new).changed == ["s"]
+
+
+class TestToolPolicies:
+    def test_parsed_from_config(self):
+        config = load_config_from_dict({
+            "mcpServers": {
+                "weather": {
+                    "command": "python",
+                    "args": ["weather.py"],
+                    "tools": {"get_current_weather": {"cache_ttl": 600}},
+                },
+            }
+        })
+        server = config.servers["weather"]
+        assert server.tool_policy("get_current_weather") == ToolPolicy(cache_ttl=600)
+        assert server.tool_policy("get_forecast").cache_ttl is None
+
+    def test_unknown_policy_key_rejected(self):
+        with pytest.raises(ValueError, match="unknown policy keys"):
+            load_config_from_dict({
+                "s": {"command": "python", "tools": {"t": {"cache_tll": 5}}},
+            })
+
+    def test_idempotent_policy(self):
+        config = load_config_from_dict({
+            "s": {"command": "python", "tools": {"t": {"idempotent": True, "retries": 3, "hedge": False}}},
+        })
+        assert config.servers["s"].tool_policy("t") == ToolPolicy(idempotent=True, retries=3, hedge=False)
+        with pytest.raises(ValueError, match="retries must not be negative"):
+            load_config_from_dict({"s": {"command": "python", "tools": {"t": {"retries": -1}}}})
+
+    def test_negative_ttl_rejected(self):
+        with pytest.raises(ValueError, match="cache_ttl must not be negative"):
+            load_config_from_dict({
+                "s": {"command": "python", "tools": {"t": {"cache_ttl": -1}}},
+            })
+
+    def test_policies_do_not_change_fingerprint(self):
+        plain = MCPServerConfig(name="s", command="python", args=["s.py"])
+        with_policy = MCPServerConfig(
+            name="s", command="python", args=["s.py"], tools={"t": ToolPolicy(cache_ttl=5)}
+        )
+        assert plain.fingerprint() == with_policy.fingerprint()
+
+
+class TestRestartPolicy:
+    def test_parsed_from_config(self):
+        config = load_config_from_dict({
+            "flights": {
+                "command": "python",
+                "restart": {"max_attempts": None, "max_backoff": 60, "while_down": "fail"},
+            },
+            "weather": {"command": "python"},
+        })
+        assert config.servers["flights"].restart == RestartPolicy(
+            max_attempts=None, max_backoff=60, while_down="fail"
+        )
+        assert config.servers["weather"].restart == RestartPolicy()
+
+    def test_unknown_key_rejected(self):
+        with pytest.raises(ValueError, match="unknown restart keys"):
+            load_config_from_dict({"s": {"command": "python", "restart": {"retries": 3}}})
+
+    def test_invalid_while_down_rejected(self):
+        with pytest.raises(ValueError, match="while_down must be one of"):
+            load_config_from_dict({"s": {"command": "python", "restart": {"while_down": "drop"}}})
+
+    def test_policy_change_is_an_update(self):
+        old = MCPConfig(servers={"s": MCPServerConfig(name="s", command="python")})
+        new = MCPConfig(servers={
+            "s": MCPServerConfig(name="s", command="python", restart=RestartPolicy(max_attempts=1)),
+        })
+        assert diff_configs(old, new).updated == ["s"]
+
+
+class TestDiffConfigs:
+    def test_classifies_each_server(self):
+        old = load_config_from_dict({
+            "same": {"command": "python", "args": ["same.py"]},
+            "policy": {"command": "python", "args": ["p.py"]},
+            "moved": {"command": "python", "args": ["old.py"]},
+            "gone": {"command": "python", "args": ["gone.py"]},
+        })
+        new = load_config_from_dict({
+            "same": {"command": "python", "args": ["same.py"]},
+            "policy": {"command": "python", "args": ["p.py"], "tools": {"t": {"cache_ttl": 5}}},
+            "moved": {"command": "python", "args": ["new.py"]},
+            "fresh": {"url": "http://localhost:8000/sse"},
+        })
+        diff = diff_configs(old, new)
+        assert diff.added == ["fresh"]
+        assert diff.removed == ["gone"]
+        assert diff.changed == ["moved"]
+        assert diff.updated == ["policy"]
+        assert diff.unchanged == ["same"]
+        assert not diff.empty
+
+    def test_identical_configs(self):
+        config = load_config_from_dict({"s": {"command": "python", "args": ["s.py"]}})
+        other = load_config_from_dict({"s": {"command": "python", "args": ["s.py"]}})
+        assert diff_configs(config, other).empty
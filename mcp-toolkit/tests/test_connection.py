@@ -0,0 +1,76 @@
+"""Tests for mcp_toolkit.connection"""
+
+import sys
+
+import pytest
+
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.connection import ServerConnection, start_connections
+from tests.helpers import demo
+
+
+def hanging_config(name: str = "hang") -> MCPServerConfig:
+    return MCPServerConfig(
+        name=name, command=sys.executable, args=["-c", "import time; time.sleep(30)"]
+    )
+
+
+class TestServerConnection:
+    @pytest.mark.anyio
+    async def test_start_loads_tools(self):
+        conn = ServerConnection(demo())
+        await conn.start(timeout=30)
+        try:
+            assert conn.connected
+            assert {t.name for t in conn.tools} == {"echo", "add", "greet"}
+            result = await conn.call_tool("echo", {"message": "hi"})
+            assert result.content[0].text == "hi"
+        finally:
+            await conn.close()
+        assert not conn.connected
+
+    @pytest.mark.anyio
+    async def test_start_timeout(self):
+        conn = ServerConnection(hanging_config())
+        with pytest.raises(TimeoutError):
+            await conn.start(timeout=0.5)
+        assert not conn.connected
+
+
+class TestStartConnections:
+    @pytest.mark.anyio
+    async def test_reports_each_server(self):
+        connections = [ServerConnection(demo("a")), ServerConnection(demo("b"))]
+        try:
+            reports = await start_connections(connections, timeout=30)
+        finally:
+            for conn in connections:
+                await conn.close()
+        assert [r.name for r in reports] == ["a", "b"]
+        assert all(r.ok for r in reports)
+
+    @pytest.mark.anyio
+    async def test_per_server_timeout_overrides_default(self):
+        slow = hanging_config("slow")
+        slow.connect_timeout = 0.5
+        connections = [ServerConnection(demo("a")), ServerConnection(slow)]
+        try:
+            reports = await start_connections(connections, timeout=30)
+        finally:
+            for conn in connections:
+                await conn.close()
+
+        assert reports[0].ok
+        assert reports[0].tool_count == 3
+        assert reports[1].status == "timeout"
+        assert reports[1].tool_count == 0
+
+    @pytest.mark.anyio
+    async def test_failed_server_is_reported(self):
+        broken = MCPServerConfig(
+            name="broken", command=sys.executable, args=["-c", "raise SystemExit(1)"]
+        )
+        connections = [ServerConnection(broken)]
+        reports = await start_connections(connections, timeout=30)
+        assert reports[0].status == "failed"
+        assert reports[0].error
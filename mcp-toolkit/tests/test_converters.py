@@ -2,7 +2,16 @@
 
 import pytest
 
-from mcp_toolkit.converters import clean_schema, mcp_to_openai, mcp_to_openai_chat, mcp_to_gemini, mcp_to_anthropic
+from mcp_toolkit.converters import (
+    ToolSchemaCache,
+    clean_schema,
+    mcp_to_anthropic,
+    mcp_to_gemini,
+    mcp_to_openai,
+    mcp_to_openai_chat,
+    schema_hash,
+    to_openai_completions,
+)
 
 
 class MockTool:
@@ -79,6 +88,67 @@ class TestCleanSchema:
         assert clean_schema(42) == 42
         assert clean_schema(None) is None
 
+    def test_does_not_modify_input(self):
+        schema = {"title": "Top", "properties": {"a": {"title": "A", "type": "string"}}}
+        clean_schema(schema)
+        assert schema == {"title": "Top", "properties": {"a": {"title": "A", "type": "string"}}}
+
+    def test_shares_unchanged_subtrees(self):
+        untouched = {"type": "object", "properties": {"x": {"type": "integer"}}}
+        schema = {"title": "Top", "properties": {"inner": untouched}}
+        result = clean_schema(schema)
+        assert result is not schema
+        assert result["properties"]["inner"] is untouched
+
+    def test_returns_input_when_nothing_to_clean(self):
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+        assert clean_schema(schema) is schema
+
+    def test_keeps_property_named_title(self):
+        schema = {
+            "type": "object",
+            "properties": {"title": {"title": "Title", "type": "string"}},
+            "required": ["title"],
+        }
+        result = clean_schema(schema)
+        assert result["properties"]["title"] == {"type": "string"}
+        assert result["required"] == ["title"]
+
+    def test_leaves_instance_data_alone(self):
+        schema = {"type": "object", "default": {"title": "Untitled"}, "title": "Doc"}
+        assert clean_schema(schema) == {"type": "object", "default": {"title": "Untitled"}}
+
+    def test_cleans_defs_and_keeps_refs(self):
+        schema = {
+            "$defs": {"Address": {"title": "Address", "type": "object",
+                                  "properties": {"city": {"title": "City", "type": "string"}}}},
+            "properties": {"home": {"$ref": "#/$defs/Address"}},
+        }
+        result = clean_schema(schema)
+        assert result["$defs"]["Address"] == {
+            "type": "object", "properties": {"city": {"type": "string"}}
+        }
+        assert result["properties"]["home"] == {"$ref": "#/$defs/Address"}
+
+    def test_shared_subschema(self):
+        shared = {"title": "Point", "type": "object"}
+        schema = {"anyOf": [shared, shared, shared]}
+        result = clean_schema(schema)
+        assert result == {"anyOf": [{"type": "object"}] * 3}
+        assert shared == {"title": "Point", "type": "object"}
+
+    def test_deep_nesting_beyond_recursion_limit(self):
+        import sys
+        depth = sys.getrecursionlimit() * 2
+        schema = leaf = {"title": "Leaf", "type": "string"}
+        for _ in range(depth):
+            schema = {"title": "Node", "type": "array", "items": schema}
+        result = clean_schema(schema)
+        for _ in range(depth):
+            assert "title" not in result
+            result = result["items"]
+        assert result == {"type": "string"}
+
 
 class TestMCPToOpenAI:
     def test_converts_tools(self, sample_tools):
@@ -190,3 +260,55 @@ class TestMCPToOpenAIChat:
 
     def test_handles_empty_list(self):
         assert mcp_to_openai_chat([]) == []
+
+
+class TestToolSchemaCache:
+    def test_matches_uncached_converter(self, sample_tools):
+        cache = ToolSchemaCache(to_openai_completions)
+        assert cache.convert(sample_tools) == mcp_to_openai_chat(sample_tools)
+
+    def test_unchanged_list_returns_same_object(self, sample_tools):
+        cache = ToolSchemaCache(to_openai_completions)
+        first = cache.convert(sample_tools)
+        assert cache.convert(sample_tools) is first
+        assert cache.misses == 2
+
+    def test_refetched_identical_tools_hit_cache(self, sample_tools):
+        cache = ToolSchemaCache(to_openai_completions)
+        first = cache.convert(sample_tools)
+        refetched = [MockTool(t.name, t.description, dict(t.inputSchema)) for t in sample_tools]
+        second = cache.convert(refetched)
+        assert second is first
+        assert cache.misses == 2
+
+    def test_changed_schema_is_reconverted(self, sample_tools):
+        cache = ToolSchemaCache(to_openai_completions)
+        first = cache.convert(sample_tools)
+        changed = MockTool("check_weather", "Get current weather for a city", {
+            "type": "object",
+            "properties": {"city": {"type": "string"}, "units": {"type": "string"}},
+        })
+        second = cache.convert([changed, sample_tools[1]])
+        assert second is not first
+        assert "units" in second[0]["function"]["parameters"]["properties"]
+        assert second[1] is first[1]
+        assert cache.misses == 3
+
+    def test_get_shares_payloads(self, sample_tools):
+        cache = ToolSchemaCache(to_openai_completions)
+        converted = cache.convert(sample_tools)
+        assert cache.get(sample_tools[1]) is converted[1]
+
+    def test_maxsize_evicts_oldest(self, sample_tools):
+        cache = ToolSchemaCache(to_openai_completions, maxsize=1)
+        cache.convert(sample_tools)
+        cache.get(sample_tools[0])
+        assert cache.misses == 3
+
+
+class TestSchemaHash:
+    def test_key_order_does_not_matter(self):
+        assert schema_hash({"a": 1, "b": [1, 2]}) == schema_hash({"b": [1, 2], "a": 1})
+
+    def test_different_content_differs(self):
+        assert schema_hash({"a": 1}) != schema_hash({"a": 2})
@@ -0,0 +1,149 @@
+"""Tests for tool call timeouts, request deadlines and server-side cancellation"""
+
+import asyncio
+import sys
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.clients.base import ToolCall
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, ToolPolicy
+from mcp_toolkit.deadline import call_with_timeout, current_deadline, deadline, time_left
+from mcp_toolkit.transports import call_tool, connect
+
+SLOW_SERVER = textwrap.dedent('''
+    import asyncio
+    import sys
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("slow")
+
+    @mcp.tool()
+    async def slow(seconds: float) -> str:
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            with open(sys.argv[1], "a") as f:
+                f.write("cancelled\\n")
+            raise
+        return "done"
+
+    @mcp.tool()
+    def fast() -> str:
+        return "fast"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+@pytest.fixture
+def slow_server(tmp_path):
+    script = tmp_path / "slow_server.py"
+    script.write_text(SLOW_SERVER)
+    marker = tmp_path / "cancelled.txt"
+
+    def make(**options) -> MCPServerConfig:
+        return MCPServerConfig(
+            name="slow", command=sys.executable, args=[str(script), str(marker)], **options
+        )
+    make.marker = marker
+    return make
+
+
+async def wait_for_file(path, timeout: float = 5.0) -> str:
+    for _ in range(int(timeout / 0.02)):
+        if path.exists():
+            return path.read_text()
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"{path} was not written")
+
+
+class TestDeadline:
+    def test_nested_deadline_only_shortens(self):
+        assert time_left() is None
+        with deadline(10):
+            with deadline(60):
+                assert 9 < time_left() <= 10
+            with deadline(1):
+                assert time_left() <= 1
+            with deadline(None):
+                assert 9 < time_left() <= 10
+        assert current_deadline.get() is None
+
+    @pytest.mark.anyio
+    async def test_tool_timeout(self):
+        with pytest.raises(TimeoutError, match="Tool 't' timed out after 0.05s"):
+            await call_with_timeout(asyncio.sleep(1), 0.05, "Tool 't'")
+
+    @pytest.mark.anyio
+    async def test_deadline_wins_when_sooner(self):
+        with deadline(0.05):
+            with pytest.raises(TimeoutError, match="request deadline"):
+                await call_with_timeout(asyncio.sleep(1), 10, "Tool 't'")
+        with deadline(5):
+            assert await call_with_timeout(asyncio.sleep(0, "ok"), 10, "Tool 't'") == "ok"
+
+    @pytest.mark.anyio
+    async def test_expired_deadline_fails_without_calling(self):
+        call = asyncio.sleep(0)
+        with deadline(-1):
+            with pytest.raises(TimeoutError, match="request deadline"):
+                await call_with_timeout(call, None, "Tool 't'")
+        assert call.cr_frame is None  # closed, never started
+
+
+class TestCancelNotification:
+    @pytest.mark.anyio
+    async def test_sdk_numbers_requests_as_expected(self, slow_server):
+        # call_tool() relies on this private counter; fails if the SDK renames it
+        async with connect(config=slow_server()) as session:
+            request_id = session._request_id
+            assert isinstance(request_id, int)
+            await session.call_tool("fast", {})
+            assert session._request_id > request_id
+
+    @pytest.mark.anyio
+    async def test_skipped_without_request_id(self):
+        sent = []
+
+        async def send_notification(notification):
+            sent.append(notification)
+
+        session = SimpleNamespace(
+            call_tool=lambda name, arguments: asyncio.sleep(30),
+            send_notification=send_notification,
+        )
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(call_tool(session, "slow"), 0.05)
+        await asyncio.sleep(0)
+        assert sent == []
+
+
+class TestClientTimeouts:
+    @pytest.mark.anyio
+    async def test_timed_out_call_is_cancelled_on_server(self, slow_server):
+        config = MCPConfig(servers={"slow": slow_server(tools={"slow": ToolPolicy(timeout=0.3)})})
+        async with MultiServerClient(config, openai_client=object()) as client:
+            with pytest.raises(TimeoutError, match="Tool 'slow' on server 'slow' timed out"):
+                await client.call_tool("slow", {"seconds": 30})
+            assert await wait_for_file(slow_server.marker) == "cancelled\n"
+            # The session is still usable afterwards
+            assert await client.call_tool_on_server("slow", "fast") == "fast"
+
+    @pytest.mark.anyio
+    async def test_deadline_reaches_dispatched_calls(self, slow_server):
+        config = MCPConfig(servers={"slow": slow_server(tool_timeout=30)})
+        async with MultiServerClient(config, openai_client=object()) as client:
+            with deadline(0.3):
+                results = await client.dispatcher.dispatch([
+                    ToolCall("1", "slow", {"seconds": 30}),
+                    ToolCall("2", "fast", {}),
+                ])
+            assert isinstance(results[0].error, TimeoutError)
+            assert "request deadline" in str(results[0].error)
+            assert results[1].content == "fast"
+            assert await wait_for_file(slow_server.marker) == "cancelled\n"
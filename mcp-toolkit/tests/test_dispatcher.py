@@ -0,0 +1,99 @@
+"""Tests for the tool dispatcher in mcp_toolkit.clients.base"""
+
+import asyncio
+
+import pytest
+
+from mcp_toolkit.clients.base import ToolCall, ToolDispatcher, _parse_arguments
+
+
+class RecordingTools:
+    """Fake tool backend that tracks how many calls run at once."""
+
+    def __init__(self, delays: dict[str, float] | None = None):
+        self.delays = delays or {}
+        self.active = 0
+        self.peak = 0
+        self.peak_by_server: dict[str, int] = {}
+        self._active_by_server: dict[str, int] = {}
+
+    async def call_tool(self, name: str, arguments: dict) -> str:
+        server = name.split("_")[0]
+        self.active += 1
+        self._active_by_server[server] = self._active_by_server.get(server, 0) + 1
+        self.peak = max(self.peak, self.active)
+        self.peak_by_server[server] = max(
+            self.peak_by_server.get(server, 0), self._active_by_server[server]
+        )
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.01))
+            if name.endswith("fail"):
+                raise RuntimeError("upstream down")
+            return f"{name}:{arguments.get('x')}"
+        finally:
+            self.active -= 1
+            self._active_by_server[server] -= 1
+
+
+def calls(*names: str) -> list[ToolCall]:
+    return [ToolCall(id=str(i), name=n, arguments={"x": i}) for i, n in enumerate(names)]
+
+
+class TestToolDispatcher:
+    @pytest.mark.anyio
+    async def test_results_keep_request_order(self):
+        tools = RecordingTools({"weather_slow": 0.05, "weather_fast": 0.0})
+        dispatcher = ToolDispatcher(tools.call_tool)
+        results = await dispatcher.dispatch(calls("weather_slow", "weather_fast"))
+        assert [r.call.id for r in results] == ["0", "1"]
+        assert [r.content for r in results] == ["weather_slow:0", "weather_fast:1"]
+
+    @pytest.mark.anyio
+    async def test_runs_calls_concurrently(self):
+        tools = RecordingTools()
+        dispatcher = ToolDispatcher(tools.call_tool)
+        await dispatcher.dispatch(calls("a_x", "b_x", "c_x", "d_x"))
+        assert tools.peak == 4
+
+    @pytest.mark.anyio
+    async def test_global_cap(self):
+        tools = RecordingTools()
+        dispatcher = ToolDispatcher(tools.call_tool, max_concurrency=2)
+        await dispatcher.dispatch(calls("a_x", "b_x", "c_x", "d_x", "e_x"))
+        assert tools.peak == 2
+
+    @pytest.mark.anyio
+    async def test_per_server_limit(self):
+        tools = RecordingTools()
+        dispatcher = ToolDispatcher(
+            tools.call_tool,
+            server_limits={"flights": 1},
+            resolve_server=lambda name: name.split("_")[0],
+        )
+        await dispatcher.dispatch(calls("flights_a", "flights_b", "flights_c", "weather_a"))
+        assert tools.peak_by_server["flights"] == 1
+        assert tools.peak == 2
+
+    @pytest.mark.anyio
+    async def test_errors_are_captured(self):
+        tools = RecordingTools()
+        dispatcher = ToolDispatcher(tools.call_tool)
+        ok, failed = await dispatcher.dispatch(calls("a_ok", "a_fail"))
+        assert ok.ok and ok.content == "a_ok:0"
+        assert not failed.ok
+        assert str(failed.error) == "upstream down"
+
+    def test_rejects_invalid_cap(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            ToolDispatcher(RecordingTools().call_tool, max_concurrency=0)
+
+
+class TestParseArguments:
+    def test_valid_json(self):
+        assert _parse_arguments('{"city": "Paris"}') == {"city": "Paris"}
+
+    def test_empty_and_invalid(self):
+        assert _parse_arguments(None) == {}
+        assert _parse_arguments("") == {}
+        assert _parse_arguments("{not json") == {}
+        assert _parse_arguments("[1, 2]") == {}
@@ -0,0 +1,194 @@
+"""Tests for hedged and retried calls to idempotent tools"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, ToolPolicy
+from mcp_toolkit.deadline import deadline
+from mcp_toolkit.hedging import HedgedCaller, LatencyTracker
+
+# Slow tool that counts its calls
+SLOW_SERVER = textwrap.dedent('''
+    import asyncio
+    import sys
+    from pathlib import Path
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("slow")
+    calls = Path(sys.argv[1])
+
+    @mcp.tool()
+    async def lookup(city: str) -> str:
+        calls.write_text(str(int(calls.read_text()) + 1 if calls.exists() else 1))
+        await asyncio.sleep(0.3)
+        return f"{city}: sunny"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+# Tool whose first call hangs, as when an upstream API stalls once
+STALL_ONCE_SERVER = textwrap.dedent('''
+    import asyncio
+    import sys
+    from pathlib import Path
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("stall")
+    calls = Path(sys.argv[1])
+
+    @mcp.tool()
+    async def lookup(city: str) -> str:
+        count = int(calls.read_text()) + 1 if calls.exists() else 1
+        calls.write_text(str(count))
+        if count == 1:
+            await asyncio.sleep(30)
+        return f"{city}: sunny"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+def warmed_caller(latency: float = 0.01) -> HedgedCaller:
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(5):
+        tracker.record(("s", "t"), latency)
+    return HedgedCaller(tracker=tracker, backoff=0.01)
+
+
+class TestLatencyTracker:
+    def test_needs_min_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("k", 1.0)
+        tracker.record("k", 2.0)
+        assert tracker.quantile("k") is None
+        tracker.record("k", 3.0)
+        assert tracker.quantile("k", 0.5) == 2.0
+
+    def test_p95_of_recent_window(self):
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for i in range(200):
+            tracker.record("k", float(i))
+        assert tracker.quantile("k") == 195.0
+
+
+class TestHedgedCaller:
+    @pytest.mark.anyio
+    async def test_slow_call_is_hedged(self):
+        caller = warmed_caller()
+        delays = iter([5.0, 0.0])
+        cancelled = []
+
+        async def attempt():
+            delay = next(delays)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return f"slept {delay}"
+
+        result = await asyncio.wait_for(
+            caller.call("s", "t", attempt, ToolPolicy(idempotent=True)), 1
+        )
+        assert result == "slept 0.0"
+        assert cancelled == [5.0]
+        stats = caller.stats["s"]
+        assert (stats.calls, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+
+    @pytest.mark.anyio
+    async def test_no_hedge_without_history_or_when_disabled(self):
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        await HedgedCaller().call("s", "t", attempt, ToolPolicy(idempotent=True))
+        await warmed_caller().call("s", "t", attempt, ToolPolicy(idempotent=True, hedge=False))
+        await warmed_caller().call("s", "t", attempt, ToolPolicy(idempotent=True), can_hedge=False)
+        assert calls == 3
+
+    @pytest.mark.anyio
+    async def test_transient_errors_are_retried(self):
+        caller = HedgedCaller(backoff=0.01)
+        errors = [ConnectionError("gone"), TimeoutError("slow")]
+
+        async def attempt():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        assert await caller.call("s", "t", attempt, ToolPolicy(idempotent=True)) == "ok"
+        assert caller.stats["s"].retries == 2
+
+    @pytest.mark.anyio
+    async def test_gives_up(self):
+        caller = HedgedCaller(backoff=0.01)
+        attempts = 0
+
+        async def failing(error):
+            nonlocal attempts
+            attempts += 1
+            raise error
+
+        with pytest.raises(ConnectionError):
+            await caller.call(
+                "s", "t", lambda: failing(ConnectionError()), ToolPolicy(idempotent=True, retries=1)
+            )
+        assert attempts == 2
+
+        attempts = 0
+        with pytest.raises(ValueError):
+            await caller.call("s", "t", lambda: failing(ValueError()), ToolPolicy(idempotent=True))
+        assert attempts == 1  # not transient
+
+        attempts = 0
+        with deadline(0):
+            with pytest.raises(TimeoutError):
+                await caller.call("s", "t", lambda: failing(TimeoutError()), ToolPolicy(idempotent=True))
+        assert attempts == 1  # no time left to retry
+
+
+class TestClientRetries:
+    @pytest.mark.anyio
+    async def test_timed_out_idempotent_call_is_retried(self, tmp_path):
+        script = tmp_path / "stall_server.py"
+        script.write_text(STALL_ONCE_SERVER)
+        server = MCPServerConfig(
+            name="stall",
+            command=sys.executable,
+            args=[str(script), str(tmp_path / "calls.txt")],
+            tools={"lookup": ToolPolicy(idempotent=True, timeout=0.5)},
+        )
+        async with MultiServerClient(MCPConfig(servers={"stall": server}), openai_client=object()) as client:
+            assert await client.call_tool("lookup", {"city": "Rome"}) == "Rome: sunny"
+            assert client.hedge_stats["stall"].retries == 1
+
+    @pytest.mark.anyio
+    async def test_single_replica_server_is_not_hedged(self, tmp_path):
+        script = tmp_path / "slow_server.py"
+        script.write_text(SLOW_SERVER)
+        calls = tmp_path / "calls.txt"
+        server = MCPServerConfig(
+            name="slow",
+            command=sys.executable,
+            args=[str(script), str(calls)],
+            tools={"lookup": ToolPolicy(idempotent=True)},
+        )
+        async with MultiServerClient(MCPConfig(servers={"slow": server}), openai_client=object()) as client:
+            # Recorded latencies far below the call's, so it would be hedged
+            for _ in range(50):
+                client._hedger.tracker.record(("slow", "lookup"), 0.01)
+            assert await client.call_tool("lookup", {"city": "Rome"}) == "Rome: sunny"
+            assert client.hedge_stats["slow"].hedged == 0
+            assert calls.read_text() == "1"
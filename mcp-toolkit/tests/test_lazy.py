@@ -0,0 +1,68 @@
+"""Tests for lazy server connections and tool snapshots"""
+
+import pytest
+
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.connection import LazyServerConnection
+from mcp_toolkit.snapshot import ToolSnapshot
+from tests.helpers import config, demo, tool
+
+
+class TestLazyClient:
+    @pytest.mark.anyio
+    async def test_snapshot_hit_defers_start_until_first_call(self):
+        snapshot = ToolSnapshot()
+        snapshot.put(demo(), [tool("echo"), tool("add"), tool("greet")])
+
+        async with MultiServerClient(
+            config(demo()), openai_client=object(), lazy=True, tool_snapshot=snapshot
+        ) as client:
+            conn = client._sessions["demo"]
+            assert isinstance(conn, LazyServerConnection)
+            assert client.startup_report["demo"].status == "lazy"
+            assert client.tool_names == ["echo", "add", "greet"]
+            assert not conn.connected
+
+            assert await client.call_tool("echo", {"message": "hi"}) == "hi"
+            assert conn.connected
+
+        assert not conn.connected
+
+    @pytest.mark.anyio
+    async def test_snapshot_miss_connects_and_records_tools(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        async with MultiServerClient(
+            config(demo()), openai_client=object(), lazy=True, tool_snapshot=path
+        ) as client:
+            assert client.startup_report["demo"].status == "connected"
+            assert client._sessions["demo"].connected
+        assert [t.name for t in ToolSnapshot(path).get(demo())] == ["echo", "add", "greet"]
+
+    @pytest.mark.anyio
+    async def test_stale_snapshot_is_corrected_on_open(self):
+        snapshot = ToolSnapshot()
+        snapshot.put(demo(), [tool("echo"), tool("retired_tool")])
+
+        async with MultiServerClient(
+            config(demo()), openai_client=object(), lazy=True, tool_snapshot=snapshot
+        ) as client:
+            registry = client.registry
+            assert await client.call_tool("echo", {"message": "hi"}) == "hi"
+            assert client.registry is not registry
+            assert client.tool_names == ["echo", "add", "greet"]
+
+    @pytest.mark.anyio
+    async def test_idle_session_is_closed_and_reopened(self):
+        async with MultiServerClient(
+            config(demo()), openai_client=object(), lazy=True, idle_timeout=60
+        ) as client:
+            conn = client._sessions["demo"]
+            assert conn.connected
+            assert not await conn.close_if_idle(60)
+            assert await conn.close_if_idle(60, now=conn.last_used + 61)
+            assert not conn.connected
+
+            assert await client.call_tool("add", {"a": 2, "b": 3}) == "5.0"
+            assert conn.connected
+            assert client._reaper is not None
+        assert client._reaper is None
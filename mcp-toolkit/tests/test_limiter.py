@@ -0,0 +1,125 @@
+"""Tests for ServerLimiter and per-server limits in MultiServerClient"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from mcp_toolkit.clients.base import ToolCall
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig
+from mcp_toolkit.limiter import ServerLimiter, ServerOverloadedError, current_flow, flow
+
+ROOT = Path(__file__).parent.parent
+MATH_SERVER = str(ROOT / "benchmarks" / "servers" / "math_server.py")
+
+
+class TestServerLimiter:
+    @pytest.mark.anyio
+    async def test_limits_concurrency(self):
+        limiter = ServerLimiter("s", max_concurrency=2)
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.stats.admitted == 6
+        assert limiter.stats.waited == 4
+        assert limiter.stats.max_wait > 0
+        assert (limiter.stats.in_flight, limiter.stats.queued) == (0, 0)
+
+    @pytest.mark.anyio
+    async def test_round_robin_across_flows(self):
+        limiter = ServerLimiter("s", max_concurrency=1)
+        order = []
+        gate = asyncio.Event()
+
+        async def call(flow_key, label):
+            async with limiter.slot(flow_key):
+                order.append(label)
+                await gate.wait()
+
+        tasks = [asyncio.create_task(call("a", f"a{i}")) for i in range(4)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("b", "b0")))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert order == ["a0", "a1", "b0", "a2", "a3"]
+
+    @pytest.mark.anyio
+    async def test_full_queue_rejects_immediately(self):
+        limiter = ServerLimiter("flights", max_concurrency=1, max_queue=1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServerOverloadedError, match="Server 'flights' is overloaded") as raised:
+            await limiter.acquire()
+        assert (raised.value.server, raised.value.in_flight, raised.value.queued) == ("flights", 1, 1)
+        assert isinstance(raised.value, RuntimeError)
+        assert limiter.stats.rejected == 1
+
+        limiter.release()
+        await waiting
+        assert limiter.stats.in_flight == 1
+
+    @pytest.mark.anyio
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = ServerLimiter("s", max_concurrency=1, max_queue=1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert limiter.stats.queued == 0
+        limiter.release()
+        assert limiter.stats.in_flight == 0
+
+    @pytest.mark.anyio
+    async def test_raising_the_limit_admits_waiters(self):
+        limiter = ServerLimiter("s", max_concurrency=1)
+        await limiter.acquire()
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.configure(2, None)
+        await asyncio.wait_for(waiting, 1)
+        assert limiter.stats.in_flight == 2
+
+    def test_flow_context(self):
+        assert current_flow.get() is None
+        with flow("session-1"):
+            assert current_flow.get() == "session-1"
+        assert current_flow.get() is None
+
+
+class TestClientLimits:
+    @pytest.mark.anyio
+    async def test_overflow_is_rejected_and_waits_are_measured(self):
+        math = MCPServerConfig(
+            name="math",
+            command=sys.executable,
+            args=[MATH_SERVER, "--latency", "200"],
+            max_concurrency=1,
+            max_queue=1,
+        )
+        async with MultiServerClient(
+            MCPConfig(servers={"math": math}), openai_client=object()
+        ) as client:
+            results = await client.dispatcher.dispatch(
+                [ToolCall(str(i), "add", {"a": i, "b": 1}) for i in range(3)], flow="agent"
+            )
+            assert [r.ok for r in results] == [True, True, False]
+            assert isinstance(results[2].error, ServerOverloadedError)
+
+            stats = client.queue_stats["math"]
+            assert (stats.admitted, stats.rejected, stats.waited) == (2, 1, 1)
+            assert stats.max_wait >= 0.1
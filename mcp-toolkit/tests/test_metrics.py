@@ -0,0 +1,151 @@
+"""Tests for the metrics registry and client stats"""
+
+import asyncio
+import sys
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, ToolPolicy
+from mcp_toolkit.metrics import ClientMetrics, MetricsRegistry
+
+FLAKY_SERVER = textwrap.dedent('''
+    import asyncio
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("flaky")
+
+    @mcp.tool()
+    def echo(text: str) -> str:
+        return text
+
+    @mcp.tool()
+    def fail() -> str:
+        raise ValueError("nope")
+
+    @mcp.tool()
+    async def hang() -> str:
+        await asyncio.sleep(30)
+        return "late"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+class TestRegistry:
+    def test_render(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made.", ("server",))
+        calls.inc(server="weather")
+        calls.inc(2, server='we"ird')
+        registry.gauge("depth", "Queue depth.").set(3)
+
+        assert registry.render().splitlines() == [
+            "# HELP calls_total Calls made.",
+            "# TYPE calls_total counter",
+            'calls_total{server="weather"} 1.0',
+            'calls_total{server="we\\"ird"} 2.0',
+            "# HELP depth Queue depth.",
+            "# TYPE depth gauge",
+            "depth 3.0",
+        ]
+
+    def test_histogram(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            latency.observe(value, tool="a")
+        latency.observe(0.05, tool="b")
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{tool="a",le="0.1"} 1.0' in lines
+        assert 'latency_seconds_bucket{tool="a",le="1.0"} 3.0' in lines
+        assert 'latency_seconds_bucket{tool="a",le="+Inf"} 4.0' in lines
+        assert 'latency_seconds_count{tool="a"} 4.0' in lines
+
+        assert latency.count() == 5
+        assert latency.sum(tool="a") == pytest.approx(6.05)
+        assert latency.quantile(0.5, tool="a") == pytest.approx(0.55)
+        assert latency.quantile(0.99, tool="a") == 1.0  # +Inf bucket
+        assert latency.quantile(0.5, tool="missing") is None
+
+    def test_labels_are_checked(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made.", ("server",))
+        with pytest.raises(ValueError):
+            calls.inc(tool="x")
+        with pytest.raises(ValueError):
+            calls.inc(-1, server="x")
+        assert registry.counter("calls_total", "Calls made.", ("server",)) is calls
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Calls made.", ("server",))
+
+    def test_collectors_run_before_render(self):
+        registry = MetricsRegistry()
+        depth = registry.gauge("depth", "Queue depth.")
+        queue = [1, 2]
+        registry.add_collector(lambda: depth.set(len(queue)))
+        queue.append(3)
+        assert "depth 3.0" in registry.render()
+
+
+class TestClientMetrics:
+    def test_outcomes(self):
+        metrics = ClientMetrics()
+        metrics.tool_call("s", "t", 0.1)
+        metrics.tool_call("s", "t", 0.1, ok=False)
+        metrics.tool_call("s", "t", 0.1, error=TimeoutError())
+        metrics.tool_call("s", "t", 0.1, error=asyncio.CancelledError())
+        assert {
+            labels["outcome"]: value for _, labels, value in metrics.tool_calls.samples()
+        } == {"ok": 1, "error": 1, "timeout": 1, "cancelled": 1}
+
+    def test_token_usage_from_each_provider(self):
+        metrics = ClientMetrics()
+        metrics.llm_request("openai", "gpt", SimpleNamespace(prompt_tokens=100, completion_tokens=20))
+        metrics.llm_request("anthropic", "claude", SimpleNamespace(input_tokens=50, output_tokens=5))
+        metrics.llm_request("gemini", "flash", SimpleNamespace(prompt_token_count=10, candidates_token_count=1))
+        metrics.llm_request("openai", "gpt", None)
+
+        tokens = metrics.llm_tokens
+        assert tokens.total(provider="openai", direction="input") == 100
+        assert tokens.total(provider="anthropic", direction="output") == 5
+        assert tokens.total(provider="gemini") == 11
+        assert metrics.llm_requests.total(provider="openai") == 2
+
+
+class TestClientStats:
+    @pytest.mark.anyio
+    async def test_stats_and_render(self, tmp_path):
+        script = tmp_path / "flaky_server.py"
+        script.write_text(FLAKY_SERVER)
+        server = MCPServerConfig(
+            name="flaky",
+            command=sys.executable,
+            args=[str(script)],
+            tools={"hang": ToolPolicy(timeout=0.2)},
+        )
+        async with MultiServerClient(MCPConfig(servers={"flaky": server}), openai_client=object()) as client:
+            await client.call_tool("echo", {"text": "hi"})
+            await client.call_tool("fail")
+            with pytest.raises(TimeoutError):
+                await client.call_tool("hang")
+
+            stats = client.stats().servers["flaky"]
+            assert stats.connected
+            assert (stats.calls, stats.errors) == (3, 2)
+            assert stats.error_rate == pytest.approx(2 / 3)
+            assert stats.mean_latency > 0
+            assert stats.p95_latency is not None
+
+            text = client.metrics.render()
+            assert 'mcp_tool_calls_total{server="flaky",tool="hang",outcome="timeout"} 1.0' in text
+            assert 'mcp_server_up{server="flaky"} 1.0' in text
+            assert 'mcp_queue_depth{server="flaky"} 0.0' in text
+            assert 'mcp_session_restarts_total{server="flaky"} 0.0' in text
+            assert 'mcp_queue_wait_seconds_count{server="flaky"} 3.0' in text
+            assert client.metrics.queue_waits.count(server="flaky") == 3
@@ -0,0 +1,245 @@
+"""Tests for tool output limits and the spill-to-disk store"""
+
+import json
+import sys
+import textwrap
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.cache import ToolResultCache
+from mcp_toolkit.clients.base import _tool_text
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.clients.openai import OpenAIMCPClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, ToolPolicy, load_config_from_dict
+from mcp_toolkit.output import ToolOutputStore, limit_output
+
+BIG_SERVER = textwrap.dedent('''
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("big")
+
+    @mcp.tool()
+    def cat(lines: int) -> str:
+        return "\\n".join(f"line {i}" for i in range(lines))
+
+    @mcp.tool()
+    def small() -> str:
+        return "ok"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+CLASH_SERVER = textwrap.dedent('''
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("clash")
+
+    @mcp.tool()
+    def read_tool_output(resource: str) -> str:
+        return resource
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+def marker(text: str) -> dict:
+    line = next(line for line in text.splitlines() if line.startswith("[truncated] "))
+    return json.loads(line.removeprefix("[truncated] "))
+
+
+class TestLimitOutput:
+    def test_short_output_unchanged(self):
+        assert limit_output(["a", "b"], 10) == "a\nb"
+        assert limit_output(["a" * 100], None) == "a" * 100
+
+    def test_keeps_head_and_tail(self):
+        parts = (f"part {i}" for i in range(1000))
+        text = limit_output(parts, 300)
+
+        assert text.startswith("part 0\npart 1\n")
+        assert text.endswith("part 999")
+        info = marker(text)
+        full = "\n".join(f"part {i}" for i in range(1000))
+        assert info["total_chars"] == len(full)
+        assert info["omitted_chars"] == len(full) - 300
+        assert "resource" not in info
+
+    def test_spills_only_when_cut(self, tmp_path):
+        store = ToolOutputStore(tmp_path)
+        spill = lambda: store.create("terminal", "run_command")  # noqa: E731
+
+        assert limit_output(["short"], 100, spill=spill) == "short"
+        assert len(store) == 0
+
+        parts = [f"row {i}" for i in range(500)]
+        text = limit_output(parts, 200, spill=spill)
+        info = marker(text)
+        assert info["read_with"] == "read_tool_output"
+        stored = store.get(info["resource"])
+        assert stored.path.read_text() == "\n".join(parts)
+        assert stored.total_chars == info["total_chars"]
+
+
+    def test_failed_read_leaves_no_partial_file(self, tmp_path):
+        store = ToolOutputStore(tmp_path)
+
+        def parts():
+            yield "x" * 500
+            raise ConnectionError("stream cut")
+
+        with pytest.raises(ConnectionError):
+            limit_output(parts(), 100, spill=lambda: store.create("s", "t"))
+        assert len(store) == 0
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestToolOutputStore:
+    @pytest.mark.anyio
+    async def test_spills_off_the_event_loop(self, tmp_path):
+        store = ToolOutputStore(tmp_path)
+        threads = []
+        create = store.create
+
+        def spy(server, tool):
+            threads.append(threading.get_ident())
+            return create(server, tool)
+
+        store.create = spy
+        result = SimpleNamespace(content=[SimpleNamespace(text="x" * 1000)])
+        assert await _tool_text(result, 2000, store, "s", "t") == ("x" * 1000, False)
+        assert threads == []
+
+        text, spilled = await _tool_text(result, 100, store, "s", "t")
+        assert spilled
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_pages(self, tmp_path):
+        store = ToolOutputStore(tmp_path, page_chars=10)
+        text = limit_output(["0123456789" * 5], 20, spill=lambda: store.create("s", "t"))
+        handle = marker(text)["resource"]
+
+        page = store.read(handle, offset=45)
+        header, body = page.split("\n", 1)
+        assert body == "56789"
+        assert json.loads(header.removeprefix("[page] ")) == {
+            "resource": handle, "offset": 45, "end": 50, "total_chars": 50, "next_offset": None,
+        }
+        assert store.read(handle).endswith("\n0123456789")
+
+    def test_evicts_oldest(self, tmp_path):
+        store = ToolOutputStore(tmp_path, max_outputs=2)
+        handles = []
+        for _ in range(3):
+            text = limit_output(["x" * 100], 10, spill=lambda: store.create("s", "t"))
+            handles.append(marker(text)["resource"])
+
+        assert len(store) == 2
+        assert len(list(tmp_path.iterdir())) == 2
+        with pytest.raises(ValueError):
+            store.read(handles[0])
+
+    def test_temporary_directory_removed_on_close(self):
+        store = ToolOutputStore()
+        limit_output(["x" * 100], 10, spill=lambda: store.create("s", "t"))
+        directory = store.directory
+        assert directory.exists()
+        store.close()
+        assert not directory.exists()
+
+
+class TestConfig:
+    def test_tool_limit_falls_back_to_server(self):
+        config = load_config_from_dict({
+            "terminal": {
+                "command": "python",
+                "args": ["terminal_server.py"],
+                "max_output_chars": 4000,
+                "tools": {"run_command": {"max_output_chars": 8000}},
+            }
+        })
+        server = config.servers["terminal"]
+        assert server.output_limit("run_command") == 8000
+        assert server.output_limit("list_files") == 4000
+
+    def test_rejects_non_positive_limits(self):
+        with pytest.raises(ValueError):
+            MCPServerConfig(name="s", command="python", max_output_chars=0).validate()
+        with pytest.raises(ValueError):
+            ToolPolicy(max_output_chars=-1).validate("s", "t")
+
+
+class TestClient:
+    @pytest.mark.anyio
+    async def test_truncated_result_can_be_paged(self, tmp_path):
+        script = tmp_path / "big_server.py"
+        script.write_text(BIG_SERVER)
+        server = MCPServerConfig(
+            name="big",
+            command=sys.executable,
+            args=[str(script)],
+            tools={"cat": ToolPolicy(max_output_chars=500)},
+        )
+        store = ToolOutputStore(tmp_path / "outputs", page_chars=100_000)
+        config = MCPConfig(servers={"big": server})
+        async with MultiServerClient(config, openai_client=object(), output_store=store) as client:
+            assert "read_tool_output" in client.tool_names
+
+            text = await client.call_tool("cat", {"lines": 5000})
+            assert len(text) < 700
+            info = marker(text)
+
+            page = await client.call_tool("read_tool_output", {"resource": info["resource"], "offset": 0})
+            assert page.split("\n", 1)[1] == "\n".join(f"line {i}" for i in range(5000))
+
+            assert await client.call_tool("small") == "ok"
+            assert len(store) == 1
+
+    @pytest.mark.anyio
+    async def test_spilled_results_are_not_cached(self, tmp_path):
+        script = tmp_path / "big_server.py"
+        script.write_text(BIG_SERVER)
+        server = MCPServerConfig(
+            name="big",
+            command=sys.executable,
+            args=[str(script)],
+            max_output_chars=500,
+            tools={"cat": ToolPolicy(cache_ttl=600)},
+        )
+        store = ToolOutputStore(tmp_path / "outputs", max_outputs=1)
+        cache = ToolResultCache()
+        config = MCPConfig(servers={"big": server})
+        async with MultiServerClient(
+            config, openai_client=object(), output_store=store, result_cache=cache
+        ) as client:
+            first = marker(await client.call_tool("cat", {"lines": 5000}))["resource"]
+            await client.call_tool("cat", {"lines": 6000})  # evicts the first file
+            again = marker(await client.call_tool("cat", {"lines": 5000}))["resource"]
+
+            assert again != first
+            assert (await client.call_tool("read_tool_output", {"resource": again})).startswith("[page]")
+            # Results that fit are still cached
+            await client.call_tool("cat", {"lines": 3})
+            assert await client.call_tool("cat", {"lines": 3}) == "line 0\nline 1\nline 2"
+            assert cache.stats().hits == 1
+
+    @pytest.mark.anyio
+    async def test_server_tool_named_like_the_store_tool_is_rejected(self, tmp_path):
+        script = tmp_path / "clash_server.py"
+        script.write_text(CLASH_SERVER)
+        server = MCPServerConfig(name="clash", command=sys.executable, args=[str(script)])
+        client = MultiServerClient(
+            MCPConfig(servers={"clash": server}), openai_client=object(), output_store=ToolOutputStore(tmp_path)
+        )
+        with pytest.raises(ValueError, match="Server 'clash' has a tool named 'read_tool_output'"):
+            await client.__aenter__()
+        assert client._sessions == {}
+        single = OpenAIMCPClient(
+            server_script=str(script), openai_client=object(), output_store=ToolOutputStore(tmp_path)
+        )
+        with pytest.raises(ValueError, match="clashes with the output store's tool"):
+            await single.__aenter__()
@@ -0,0 +1,53 @@
+"""Tests for mcp_toolkit.pool"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.clients.base import extract_tool_text
+from mcp_toolkit.pool import SessionPool
+
+
+class TestSessionPool:
+    def test_sync_calls_reuse_session(self, demo_config):
+        with SessionPool(size=1) as pool:
+            assert pool.call_tool_sync(demo_config, "echo", {"message": "a"}) == "a"
+            assert pool.call_tool_sync(demo_config, "add", {"a": 2, "b": 3}) == "5.0"
+            stats = pool.stats()["demo"]
+        assert stats.created == 1
+        assert stats.calls == 2
+        assert stats.idle == 1
+
+    @pytest.mark.anyio
+    async def test_async_calls(self, demo_config):
+        async with SessionPool(size=1) as pool:
+            result = await pool.call_tool(demo_config, "greet", {"name": "Ada"})
+            tools = await pool.list_tools(demo_config)
+            stats = pool.stats()["demo"]
+        assert "Ada" in result
+        assert {t.name for t in tools} == {"echo", "add", "greet"}
+        assert stats.created == 1
+
+    def test_recycles_after_max_uses(self, demo_config):
+        with SessionPool(size=1, max_uses=1) as pool:
+            pool.call_tool_sync(demo_config, "echo", {"message": "a"})
+            pool.call_tool_sync(demo_config, "echo", {"message": "b"})
+            stats = pool.stats()["demo"]
+        assert stats.created == 2
+        assert stats.recycled == 2
+
+    def test_warm_opens_sessions_up_front(self, demo_config):
+        with SessionPool(size=2) as pool:
+            pool.warm(demo_config)
+            stats = pool.stats()["demo"]
+        assert stats.created == 2
+        assert stats.idle == 2
+
+    def test_rejects_invalid_size(self):
+        with pytest.raises(ValueError, match="size must be at least 1"):
+            SessionPool(size=0)
+
+
+def test_results_join_every_text_part():
+    result = SimpleNamespace(content=[SimpleNamespace(text="first"), SimpleNamespace(text="second")])
+    assert extract_tool_text(result) == "first\nsecond"
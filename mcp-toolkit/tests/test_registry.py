@@ -0,0 +1,105 @@
+"""Tests for mcp_toolkit.registry"""
+
+import sys
+
+import pytest
+
+from mcp_toolkit.registry import ToolRegistry
+from tests.helpers import config, demo, tool
+
+
+class TestToolRegistry:
+    def test_indexes_by_server_and_name(self):
+        registry = ToolRegistry({
+            "weather": [tool("get_forecast"), tool("get_alerts")],
+            "flights": [tool("search_flights")],
+        })
+        assert registry.servers == ["weather", "flights"]
+        assert registry.names_for("weather") == ["get_forecast", "get_alerts"]
+        assert [t.name for t in registry.tools_for("flights")] == ["search_flights"]
+        assert registry.server_of("search_flights") == "flights"
+        assert len(registry) == 3
+        assert registry.collisions == {}
+
+    def test_qualified_names_resolve(self):
+        registry = ToolRegistry({"weather": [tool("get_forecast")]})
+        entry = registry.resolve("weather.get_forecast")
+        assert (entry.server, entry.name, entry.exposed_name) == ("weather", "get_forecast", "get_forecast")
+        assert entry.qualified_name == "weather.get_forecast"
+        assert "weather.get_forecast" in registry
+
+    def test_unknown_names(self):
+        registry = ToolRegistry({"weather": [tool("get_forecast")]})
+        assert registry.get("nope") is None
+        assert registry.server_of("flights.get_forecast") is None
+        assert registry.tools_for("flights") == []
+        with pytest.raises(KeyError):
+            registry.resolve("nope")
+
+    def test_collisions_are_namespaced(self):
+        original = tool("search")
+        registry = ToolRegistry({
+            "web": [original, tool("fetch")],
+            "docs": [tool("search")],
+        })
+        assert registry.collisions == {"search": ["web", "docs"]}
+        assert registry.names == ["web__search", "fetch", "docs__search"]
+        assert registry.resolve("docs__search").name == "search"
+        assert registry.resolve("web.search").exposed_name == "web__search"
+        assert "search" not in registry
+        # The model sees the renamed copy; the server's tool object is untouched
+        assert registry.tools_for("web")[0].name == "web__search"
+        assert original.name == "search"
+
+    def test_namespaced_names_are_function_name_safe(self):
+        registry = ToolRegistry({
+            "my server": [tool("run")],
+            "other.v2": [tool("run")],
+        })
+        assert registry.names == ["my_server__run", "other_v2__run"]
+
+    def test_collision_error_policy(self):
+        with pytest.raises(ValueError, match="more than one server"):
+            ToolRegistry({"a": [tool("x")], "b": [tool("x")]}, on_collision="error")
+
+    def test_rejects_unknown_policy(self):
+        with pytest.raises(ValueError, match="on_collision"):
+            ToolRegistry({}, on_collision="last")
+
+    def test_scales_to_many_servers(self):
+        servers = {f"s{i}": [tool(f"s{i}_t{j}") for j in range(20)] for i in range(200)}
+        registry = ToolRegistry(servers)
+        assert len(registry) == 4000
+        assert registry.names_for("s150")[0] == "s150_t0"
+        assert registry.server_of("s199_t19") == "s199"
+
+
+class TestMultiServerClientRegistry:
+    @pytest.mark.anyio
+    async def test_same_server_twice_is_namespaced(self):
+        from mcp_toolkit.clients.multi import MultiServerClient
+
+        async with MultiServerClient(config(demo("a"), demo("b")), openai_client=object()) as client:
+            assert client.get_tools_by_server("b") == ["b__echo", "b__add", "b__greet"]
+            assert await client.call_tool("a__echo", {"message": "hi"}) == "hi"
+            assert await client.call_tool("b.greet", {"name": "Ada"}) == (
+                "Hello, Ada! Welcome to MCP Toolkit."
+            )
+            with pytest.raises(ValueError, match="Unknown tool"):
+                await client.call_tool("echo", {"message": "hi"})
+
+    @pytest.mark.anyio
+    async def test_no_tools_closes_sessions(self, tmp_path):
+        from mcp_toolkit.clients.multi import MultiServerClient
+        from mcp_toolkit.config import MCPServerConfig
+
+        script = tmp_path / "empty_server.py"
+        script.write_text(
+            "from mcp.server.fastmcp import FastMCP\n"
+            "FastMCP('empty').run()\n"
+        )
+        empty = MCPServerConfig(name="empty", command=sys.executable, args=[str(script)])
+        client = MultiServerClient(config(empty), openai_client=object())
+        with pytest.raises(RuntimeError, match="No tools loaded"):
+            await client.__aenter__()
+        assert client._sessions == {}
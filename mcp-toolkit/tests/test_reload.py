@@ -0,0 +1,131 @@
+"""Tests for MultiServerClient.reload() and config watching"""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from mcp_toolkit.agents import BaseAgent
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPServerConfig, ToolPolicy
+from tests.helpers import DEMO_SERVER, ROOT, config, demo
+
+MATH_SERVER = str(ROOT / "benchmarks" / "servers" / "math_server.py")
+
+
+def math(*extra: str) -> MCPServerConfig:
+    return MCPServerConfig(name="math", command=sys.executable, args=[MATH_SERVER, *extra])
+
+
+class MathAgent(BaseAgent):
+    server_names = ["math"]
+
+
+class TestReload:
+    @pytest.mark.anyio
+    async def test_add_server_keeps_existing_session(self):
+        async with MultiServerClient(config(demo()), openai_client=object()) as client:
+            demo_session = client._sessions["demo"]
+            agent = MathAgent(client, object())
+            assert agent.tool_names == []
+
+            report = await client.reload(config(demo(), math()))
+
+            assert report.added == ["math"]
+            assert (report.removed, report.restarted, report.failed) == ([], [], {})
+            assert client._sessions["demo"] is demo_session
+            assert client.server_names == ["demo", "math"]
+            assert await client.call_tool("multiply", {"a": 2, "b": 3}) == "6.0"
+            # Agents pick up the new registry on their next use; both servers
+            # expose "add", so each copy is now namespaced
+            assert agent.tool_names == ["math__add", "multiply", "divide"]
+            assert "demo__add" in client.tool_names
+
+    @pytest.mark.anyio
+    async def test_removed_server_finishes_in_flight_calls(self):
+        async with MultiServerClient(
+            config(demo(), math("--latency", "300")), openai_client=object()
+        ) as client:
+            call = asyncio.create_task(client.call_tool("multiply", {"a": 2, "b": 3}))
+            await asyncio.sleep(0.1)
+
+            report = await client.reload(config(demo()))
+
+            assert report.removed == ["math"]
+            assert call.done() and call.result() == "6.0"
+            assert "multiply" not in client.tool_names
+            with pytest.raises(ValueError, match="Unknown tool"):
+                await client.call_tool("multiply", {"a": 2, "b": 3})
+
+    @pytest.mark.anyio
+    async def test_changed_and_updated_servers(self):
+        async with MultiServerClient(config(demo()), openai_client=object()) as client:
+            first = client._sessions["demo"]
+
+            report = await client.reload(config(demo(tools={"greet": ToolPolicy(cache_ttl=5)})))
+            assert report.updated == ["demo"]
+            assert client._sessions["demo"] is first
+            assert first.config.tool_policy("greet").cache_ttl == 5
+
+            report = await client.reload(config(demo(env={"DEMO_FLAG": "1"})))
+            assert report.restarted == ["demo"]
+            assert client._sessions["demo"] is not first
+            assert not first.connected
+            assert await client.call_tool("echo", {"message": "hi"}) == "hi"
+
+    @pytest.mark.anyio
+    async def test_failed_restart_keeps_old_session(self):
+        async with MultiServerClient(
+            config(demo()), openai_client=object(), connect_timeout=10
+        ) as client:
+            first = client._sessions["demo"]
+            broken = MCPServerConfig(
+                name="demo", command=sys.executable, args=["-c", "raise SystemExit(1)"]
+            )
+
+            report = await client.reload(config(broken))
+
+            assert list(report.failed) == ["demo"]
+            assert client._sessions["demo"] is first
+            assert await client.call_tool("echo", {"message": "still here"}) == "still here"
+
+    @pytest.mark.anyio
+    async def test_unchanged_config_is_a_no_op(self):
+        async with MultiServerClient(config(demo()), openai_client=object()) as client:
+            registry = client.registry
+            report = await client.reload(config(demo()))
+            assert (report.added, report.removed, report.restarted, report.updated) == ([], [], [], [])
+            assert client.registry is registry
+
+
+class TestWatchConfig:
+    @pytest.mark.anyio
+    async def test_file_change_triggers_reload(self, tmp_path):
+        path = tmp_path / "mcp_servers.json"
+
+        def write(servers):
+            path.write_text(json.dumps({"mcpServers": servers}))
+
+        demo_entry = {"command": sys.executable, "args": [DEMO_SERVER]}
+        write({"demo": demo_entry})
+
+        async with MultiServerClient.from_config(str(path), openai_client=object()) as client:
+            client.watch_config(path, interval=0.05)
+            path.write_text("{ not json")  # half-written file is skipped
+            await asyncio.sleep(0.2)
+            write({"demo": demo_entry, "math": {"command": sys.executable, "args": [MATH_SERVER]}})
+
+            for _ in range(200):
+                if "math" in client.server_names:
+                    break
+                await asyncio.sleep(0.05)
+            assert client.server_names == ["demo", "math"]
+
+        assert client._watcher is None
+
+    def test_from_config_watch_resolves_path(self, tmp_path):
+        path = tmp_path / "mcp_servers.json"
+        path.write_text(json.dumps({"mcpServers": {"demo": {"command": "python"}}}))
+        client = MultiServerClient.from_config(str(path), watch=True, openai_client=object())
+        assert client._watch_path == str(path)
@@ -0,0 +1,193 @@
+"""Tests for ReplicaSet (several sessions per server config)"""
+
+import asyncio
+import sys
+import json
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.clients.base import ToolCall
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, ToolPolicy
+from mcp_toolkit.limiter import flow
+from mcp_toolkit.replicas import ReplicaSet
+
+PID_SERVER = textwrap.dedent('''
+    import asyncio
+    import os
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("pids")
+
+    @mcp.tool()
+    async def pid(delay: float = 0.0) -> int:
+        await asyncio.sleep(delay)
+        return os.getpid()
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+@pytest.fixture
+def pid_server(tmp_path):
+    script = tmp_path / "pid_server.py"
+    script.write_text(PID_SERVER)
+
+    def make(replicas: int, **tools: ToolPolicy) -> MCPServerConfig:
+        return MCPServerConfig(
+            name="pids",
+            command=sys.executable,
+            args=[str(script)],
+            replicas=replicas,
+            tools=tools,
+        )
+    return make
+
+
+class FakeReplica:
+    def __init__(self, config, in_flight=0, connected=True):
+        self.config = config
+        self.in_flight = in_flight
+        self.connected = connected
+        self.fails = False
+
+    async def start(self, timeout=None):
+        if self.fails:
+            raise OSError("did not start")
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeOpenAI:
+    """Asks for ``calls`` tool calls in the first round, then answers."""
+
+    def __init__(self, *calls: tuple[str, dict]):
+        self._calls = calls
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.requests.append(list(kwargs["messages"]))
+        tool_calls = [
+            SimpleNamespace(id=str(i), function=SimpleNamespace(name=name, arguments=json.dumps(args)))
+            for i, (name, args) in enumerate(self._calls)
+        ] if len(self.requests) == 1 else None
+        message = SimpleNamespace(
+            content=None if tool_calls else "done",
+            tool_calls=tool_calls,
+            model_dump=lambda: {"role": "assistant", "content": None},
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def fake_set(config: MCPServerConfig, *loads: tuple[int, bool]) -> ReplicaSet:
+    replicas = iter(FakeReplica(config, n, up) for n, up in loads)
+    return ReplicaSet(config, lambda on_tools_changed: next(replicas))
+
+
+class TestPick:
+    def test_least_outstanding(self):
+        config = MCPServerConfig(name="s", command="x", replicas=3)
+        replicas = fake_set(config, (2, True), (0, True), (1, True))
+        assert all(replicas.pick("t") is replicas.replicas[1] for _ in range(3))
+
+    def test_ties_rotate(self):
+        config = MCPServerConfig(name="s", command="x", replicas=3)
+        replicas = fake_set(config, (0, True), (0, True), (0, True))
+        assert {id(replicas.pick("t")) for _ in range(3)} == {id(r) for r in replicas.replicas}
+
+    def test_down_replicas_are_avoided(self):
+        config = MCPServerConfig(name="s", command="x", replicas=2)
+        replicas = fake_set(config, (0, False), (5, True))
+        assert replicas.pick("t") is replicas.replicas[1]
+
+    def test_sticky_tools_follow_the_flow(self):
+        config = MCPServerConfig(
+            name="s", command="x", replicas=4, tools={"login": ToolPolicy(sticky=True)}
+        )
+        replicas = fake_set(config, *[(0, True)] * 4)
+        with flow("session-1"):
+            chosen = replicas.pick("login")
+            chosen.in_flight = 10  # busy, but still the flow's replica
+            assert replicas.pick("login") is chosen
+            assert replicas.pick("search") is not chosen
+        # Without a flow there is nothing to stick to
+        assert replicas.pick("login") is not chosen
+
+    @pytest.mark.anyio
+    async def test_sticky_flow_survives_dropped_and_down_replicas(self):
+        config = MCPServerConfig(
+            name="s", command="x", replicas=4, tools={"login": ToolPolicy(sticky=True)}
+        )
+        replicas = fake_set(config, *[(0, True)] * 4)
+        with flow("session-1"):
+            chosen = replicas.pick("login")
+        next(r for r in replicas.replicas if r is not chosen).fails = True
+        await replicas.start()
+        assert len(replicas.replicas) == 3
+
+        with flow("session-1"):
+            # Dropping another replica does not remap the flow
+            assert replicas.pick("login") is chosen
+            chosen.connected = False
+            fallback = replicas.pick("login")
+            assert fallback is not chosen and fallback.connected
+            assert replicas.pick("login") is fallback
+            chosen.connected = True
+            assert replicas.pick("login") is chosen
+
+
+class TestClientReplicas:
+    @pytest.mark.anyio
+    async def test_calls_are_spread_across_processes(self, pid_server):
+        config = MCPConfig(servers={"pids": pid_server(3)})
+        async with MultiServerClient(config, openai_client=object()) as client:
+            assert client.tool_names == ["pid"]
+            results = await client.dispatcher.dispatch(
+                [ToolCall(str(i), "pid", {"delay": 0.2}) for i in range(6)]
+            )
+            pids = [r.content for r in results]
+            assert len(set(pids)) == 3
+            assert all(pids.count(p) == 2 for p in pids)
+
+    @pytest.mark.anyio
+    async def test_sticky_calls_stay_on_one_process(self, pid_server):
+        config = MCPConfig(servers={"pids": pid_server(3, pid=ToolPolicy(sticky=True))})
+        async with MultiServerClient(config, openai_client=object()) as client:
+            with flow("user-1"):
+                pids = await asyncio.gather(
+                    *(client.call_tool("pid", {"delay": 0.05}) for _ in range(4))
+                )
+            assert len(set(pids)) == 1
+
+    @pytest.mark.anyio
+    async def test_lazy_replicas_start_on_demand(self, pid_server):
+        config = MCPConfig(servers={"pids": pid_server(2)})
+        async with MultiServerClient(config, openai_client=object(), lazy=True) as client:
+            replicas = client._sessions["pids"].replicas
+            for replica in replicas:
+                await replica.close()
+            assert not any(r.connected for r in replicas)
+
+            # One call at a time reuses the first replica it opened
+            await client.call_tool("pid")
+            await client.call_tool("pid")
+            assert sum(r.connected for r in replicas) == 1
+
+            # Overlapping calls open the second
+            await asyncio.gather(*(client.call_tool("pid", {"delay": 0.2}) for _ in range(2)))
+            assert all(r.connected for r in replicas)
+
+    @pytest.mark.anyio
+    async def test_chat_sticks_without_a_flow(self, pid_server):
+        config = MCPConfig(servers={"pids": pid_server(3, pid=ToolPolicy(sticky=True))})
+        openai = FakeOpenAI(*[("pid", {"delay": 0.05})] * 4)
+        async with MultiServerClient(config, openai_client=openai) as client:
+            assert await client.chat("which process?") == "done"
+        pids = [m["content"] for m in openai.requests[1] if m["role"] == "tool"]
+        assert len(pids) == 4 and len(set(pids)) == 1
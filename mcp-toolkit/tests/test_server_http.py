@@ -0,0 +1,115 @@
+"""Tests for mcp_toolkit.server.http"""
+
+import httpx
+import pytest
+
+from mcp_toolkit.server import http as http_module
+from mcp_toolkit.server.http import (
+    HttpSettings,
+    aclose_http_client,
+    configure_http,
+    get_http_client,
+    http_get,
+    http_lifespan,
+    http_post,
+)
+
+
+@pytest.fixture
+def responses():
+    """Serve scripted responses and record the requests that were made."""
+    script: list = []
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        item = script.pop(0) if script else httpx.Response(200, text="ok")
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    configure_http(transport=httpx.MockTransport(handler), backoff=0)
+    yield script, seen
+    http_module._client = None
+    http_module._settings = HttpSettings()
+
+
+class TestSharedClient:
+    @pytest.mark.anyio
+    async def test_client_is_reused(self, responses):
+        assert get_http_client() is get_http_client()
+
+    @pytest.mark.anyio
+    async def test_closed_client_is_replaced(self, responses):
+        first = get_http_client()
+        await aclose_http_client()
+        assert first.is_closed
+        assert get_http_client() is not first
+
+    @pytest.mark.anyio
+    async def test_configure_after_first_use_rejected(self, responses):
+        get_http_client()
+        with pytest.raises(RuntimeError, match="before the first request"):
+            configure_http(timeout=5)
+
+    @pytest.mark.anyio
+    async def test_lifespan_closes_client(self, responses):
+        async with http_lifespan(None):
+            client = get_http_client()
+        assert client.is_closed
+
+
+class TestRetries:
+    @pytest.mark.anyio
+    async def test_get_retries_transient_status(self, responses):
+        script, seen = responses
+        script.extend([httpx.Response(503), httpx.Response(200, text="fine")])
+        response = await http_get("https://api.example.com/x")
+        assert response.text == "fine"
+        assert len(seen) == 2
+
+    @pytest.mark.anyio
+    async def test_get_retries_connection_errors(self, responses):
+        script, seen = responses
+        script.append(httpx.ConnectError("refused"))
+        response = await http_get("https://api.example.com/x")
+        assert response.status_code == 200
+        assert len(seen) == 2
+
+    @pytest.mark.anyio
+    async def test_gives_up_after_retries(self, responses):
+        script, seen = responses
+        script.extend([httpx.Response(503)] * 5)
+        with pytest.raises(httpx.HTTPStatusError):
+            await http_get("https://api.example.com/x", retries=1)
+        assert len(seen) == 2
+
+    @pytest.mark.anyio
+    async def test_client_errors_are_not_retried(self, responses):
+        script, seen = responses
+        script.append(httpx.Response(404))
+        with pytest.raises(httpx.HTTPStatusError):
+            await http_get("https://api.example.com/x")
+        assert len(seen) == 1
+
+    @pytest.mark.anyio
+    async def test_post_not_retried_by_default(self, responses):
+        script, seen = responses
+        script.append(httpx.Response(503))
+        with pytest.raises(httpx.HTTPStatusError):
+            await http_post("https://api.example.com/x", json={"a": 1})
+        assert len(seen) == 1
+
+    @pytest.mark.anyio
+    async def test_raise_for_status_can_be_disabled(self, responses):
+        script, _ = responses
+        script.append(httpx.Response(404))
+        response = await http_get("https://api.example.com/x", raise_for_status=False)
+        assert response.status_code == 404
+
+    def test_retry_after_header(self):
+        response = httpx.Response(429, headers={"Retry-After": "2"})
+        assert http_module._retry_after(response) == 2.0
+        assert http_module._retry_after(httpx.Response(429)) is None
+        huge = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert http_module._retry_after(huge) == http_module.MAX_BACKOFF
@@ -0,0 +1,152 @@
+"""Tests for SingleFlight (coalescing identical concurrent tool calls)"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, ToolPolicy
+from mcp_toolkit.limiter import flow
+from mcp_toolkit.singleflight import SingleFlight, coalesce_key
+
+COUNTING_SERVER = textwrap.dedent('''
+    import asyncio
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("counting")
+    calls = 0
+
+    @mcp.tool()
+    async def weather(city: str) -> str:
+        global calls
+        calls += 1
+        await asyncio.sleep(0.2)
+        return f"{city}: call {calls}"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+KEY = ("weather", "get_current_weather", '{"city":"Tokyo"}')
+
+
+@pytest.fixture
+def counting_server(tmp_path):
+    script = tmp_path / "counting_server.py"
+    script.write_text(COUNTING_SERVER)
+
+    def make(**policy) -> MCPServerConfig:
+        return MCPServerConfig(
+            name="counting",
+            command=sys.executable,
+            args=[str(script)],
+            tools={"weather": ToolPolicy(**policy)},
+        )
+    return make
+
+
+class TestSingleFlight:
+    @pytest.mark.anyio
+    async def test_concurrent_calls_share_one_upstream_call(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return f"result {calls}"
+
+        results = await asyncio.gather(*(flights.do(KEY, call) for _ in range(3)))
+        assert results == ["result 1"] * 3
+        assert (flights.stats["weather"].calls, flights.stats["weather"].coalesced) == (3, 2)
+        assert len(flights) == 0
+
+        # Nothing is remembered once the call has landed
+        assert await flights.do(KEY, call) == "result 2"
+
+    @pytest.mark.anyio
+    async def test_errors_reach_every_caller(self):
+        flights = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("gone")
+
+        results = await asyncio.gather(
+            *(flights.do(KEY, call) for _ in range(2)), return_exceptions=True
+        )
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    @pytest.mark.anyio
+    async def test_call_survives_until_last_caller_leaves(self):
+        flights = SingleFlight()
+        cancelled = asyncio.Event()
+        release = asyncio.Event()
+
+        async def call():
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "ok"
+
+        first = asyncio.create_task(flights.do(KEY, call))
+        second = asyncio.create_task(flights.do(KEY, call))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+        release.set()
+        assert await second == "ok"
+
+        release.clear()
+        third = asyncio.create_task(flights.do(KEY, call))
+        await asyncio.sleep(0)
+        third.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert len(flights) == 0
+
+    def test_only_shareable_tools_are_coalesced(self):
+        args = {"city": "Tokyo"}
+        assert coalesce_key("s", "t", args, ToolPolicy()) is None
+        assert coalesce_key("s", "t", args, ToolPolicy(coalesce=True)) == ("s", "t", '{"city":"Tokyo"}')
+        # Caching or idempotence alone does not opt a tool in
+        assert coalesce_key("s", "t", args, ToolPolicy(idempotent=True, cache_ttl=60)) is None
+
+        sticky = ToolPolicy(coalesce=True, sticky=True)
+        with flow("a"):
+            key_a = coalesce_key("s", "t", args, sticky)
+        with flow("b"):
+            key_b = coalesce_key("s", "t", args, sticky)
+        assert key_a != key_b
+
+
+class TestClientCoalescing:
+    @pytest.mark.anyio
+    async def test_identical_calls_hit_the_server_once(self, counting_server):
+        server = counting_server(coalesce=True)
+        async with MultiServerClient(MCPConfig(servers={"counting": server}), openai_client=object()) as client:
+            results = await asyncio.gather(
+                *(client.call_tool("weather", {"city": "Tokyo"}) for _ in range(4)),
+                client.call_tool("weather", {"city": "Rome"}),
+            )
+            assert results[:4] == [results[0]] * 4
+            assert results[4].startswith("Rome")
+            assert client.coalesce_stats["counting"].coalesced == 3
+
+            # Not a cache: the next call goes to the server again
+            assert await client.call_tool("weather", {"city": "Tokyo"}) == "Tokyo: call 3"
+
+    @pytest.mark.anyio
+    async def test_only_tools_with_the_flag_are_coalesced(self, counting_server):
+        for policy, upstream in (({"coalesce": True}, 1), ({"idempotent": True}, 3)):
+            config = MCPConfig(servers={"counting": counting_server(**policy)})
+            async with MultiServerClient(config, openai_client=object()) as client:
+                await asyncio.gather(*(client.call_tool("weather", {"city": "Oslo"}) for _ in range(3)))
+                # The server numbers its calls, so the next one shows how many went upstream
+                assert await client.call_tool("weather", {"city": "Oslo"}) == f"Oslo: call {upstream + 1}"
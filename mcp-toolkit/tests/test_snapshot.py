@@ -0,0 +1,131 @@
+"""Tests for persistent tool snapshots and background revalidation"""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from mcp_toolkit.clients.openai import OpenAIMCPClient
+from mcp_toolkit.config import MCPServerConfig
+from mcp_toolkit.connection import ServerConnection
+from mcp_toolkit.snapshot import ToolSnapshot
+from tests.helpers import DEMO_SERVER, demo, tool
+
+DEMO_TOOLS = ["echo", "add", "greet"]
+
+
+async def wait_for(predicate, timeout: float = 5.0) -> None:
+    for _ in range(int(timeout / 0.02)):
+        if predicate():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("condition not met in time")
+
+
+class TestToolSnapshot:
+    def test_round_trip_through_file(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        snapshot = ToolSnapshot(path)
+        assert snapshot.put(demo(), [tool("echo"), tool("add")], version="demo/1.0")
+        assert not snapshot.put(demo(), [tool("echo"), tool("add")], version="demo/1.0")
+
+        reloaded = ToolSnapshot(path)
+        assert "demo" in reloaded
+        assert [t.name for t in reloaded.get(demo())] == ["echo", "add"]
+        assert reloaded.get(demo())[0].description == "The echo tool"
+        raw = path.read_bytes()
+        assert b'", "' not in raw and b'": ' not in raw
+
+    def test_gzip_file(self, tmp_path):
+        path = tmp_path / "snapshot.json.gz"
+        ToolSnapshot(path).put(demo(), [tool("echo")])
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert [t.name for t in ToolSnapshot(path).get(demo())] == ["echo"]
+
+    def test_fingerprint_change_invalidates(self):
+        snapshot = ToolSnapshot()
+        snapshot.put(demo(), [tool("echo")])
+        assert snapshot.get(demo(env={"DEMO_FLAG": "1"})) is None
+        # Tool policies are not part of the fingerprint
+        assert snapshot.get(demo(connect_timeout=5)) is not None
+
+    def test_version_must_match_when_given(self):
+        snapshot = ToolSnapshot()
+        snapshot.put(demo(), [tool("echo")], version="demo/1.0")
+        assert snapshot.get(demo(), "demo/1.0") is not None
+        assert snapshot.get(demo(), "demo/2.0") is None
+        assert snapshot.get(demo()) is not None
+        # A new version with the same tools is recorded but is not a change
+        assert not snapshot.put(demo(), [tool("echo")], version="demo/2.0")
+        assert snapshot.get(demo(), "demo/2.0") is not None
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text("{ not json")
+        snapshot = ToolSnapshot(path)
+        assert snapshot.get(demo()) is None
+        snapshot.put(demo(), [tool("echo")])
+        assert json.loads(path.read_text())["servers"]["demo"]["tools"][0]["name"] == "echo"
+
+    @pytest.mark.parametrize("content", ["[1, 2]", '"text"', '{"format": 2, "servers": [1]}'])
+    def test_json_that_is_not_a_snapshot_starts_empty(self, tmp_path, content):
+        path = tmp_path / "snapshot.json"
+        path.write_text(content)
+        snapshot = ToolSnapshot(path)
+        assert snapshot.get(demo()) is None
+        assert "demo" not in snapshot
+
+
+class TestRevalidation:
+    @pytest.mark.anyio
+    async def test_same_version_serves_snapshot_then_revalidates(self):
+        snapshot = ToolSnapshot()
+        first = ServerConnection(demo(), snapshot=snapshot)
+        await first.start(timeout=10)
+        await first.close()
+        assert first.server_version and first.server_version.startswith("demo/")
+
+        # Pretend the server's tools changed without a version bump
+        snapshot.put(demo(), [tool("echo")], version=first.server_version)
+        changed = []
+        conn = ServerConnection(demo(), snapshot=snapshot, on_tools_changed=changed.append)
+        await conn.start(timeout=10)
+        try:
+            assert [t.name for t in conn.tools] == ["echo"]
+            await wait_for(lambda: changed)
+            assert changed == [conn]
+            assert [t.name for t in conn.tools] == DEMO_TOOLS
+            assert [t.name for t in snapshot.get(demo(), first.server_version)] == DEMO_TOOLS
+        finally:
+            await conn.close()
+
+    @pytest.mark.anyio
+    async def test_other_version_lists_tools_before_ready(self):
+        snapshot = ToolSnapshot()
+        snapshot.put(demo(), [tool("echo")], version="demo/0.0.1")
+        conn = ServerConnection(demo(), snapshot=snapshot)
+        await conn.start(timeout=10)
+        try:
+            assert [t.name for t in conn.tools] == DEMO_TOOLS
+        finally:
+            await conn.close()
+
+    @pytest.mark.anyio
+    async def test_single_server_client_uses_snapshot(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        async with OpenAIMCPClient(
+            server_script=DEMO_SERVER, openai_client=object(), tool_snapshot=path
+        ) as client:
+            assert client.tool_names == DEMO_TOOLS
+
+        snapshot = ToolSnapshot(path)
+        config = MCPServerConfig(name=DEMO_SERVER, command=sys.executable, args=[DEMO_SERVER])
+        version = snapshot._entries[DEMO_SERVER]["version"]
+        snapshot.put(config, [tool("echo")], version=version)
+
+        async with OpenAIMCPClient(
+            server_script=DEMO_SERVER, openai_client=object(), tool_snapshot=path
+        ) as client:
+            assert client.tool_names == ["echo"]
+            await wait_for(lambda: client.tool_names == DEMO_TOOLS)
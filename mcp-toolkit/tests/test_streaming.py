@@ -0,0 +1,210 @@
+"""Tests for streaming chat (StreamEvent, dispatch_stream, chat_stream)"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_toolkit.agents import BaseAgent
+from mcp_toolkit.clients.base import ToolCall, ToolDispatcher
+from mcp_toolkit.clients.openai import _CompletionAccumulator
+from mcp_toolkit.converters import ToolSchemaCache, to_openai_completions
+from mcp_toolkit.metrics import ClientMetrics
+from mcp_toolkit.registry import ToolRegistry
+
+
+def text_chunk(text):
+    delta = SimpleNamespace(content=text, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def tool_chunk(index, id=None, name=None, arguments=None):
+    call = SimpleNamespace(
+        index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments)
+    )
+    delta = SimpleNamespace(content=None, tool_calls=[call])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+class FakeOpenAI:
+    """Replays one scripted list of chunks per ``create`` call."""
+
+    def __init__(self, *turns):
+        self._turns = list(turns)
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        assert kwargs["stream"] is True
+        self.requests.append({**kwargs, "messages": list(kwargs["messages"])})
+        return FakeStream(self._turns.pop(0))
+
+
+class FakeMCP:
+    """Just enough of MultiServerClient for BaseAgent."""
+
+    def __init__(self, tools, call_tool):
+        self.registry = ToolRegistry({"fake": tools})
+        self.all_tools = self.registry.tools
+        self.output_store = None
+        self.tool_schemas = ToolSchemaCache(to_openai_completions)
+        self.dispatcher = ToolDispatcher(call_tool)
+        self.metrics = ClientMetrics()
+
+
+def mcp_tool(name):
+    return SimpleNamespace(
+        name=name, description=name, inputSchema={"type": "object", "properties": {}}
+    )
+
+
+class TestCompletionAccumulator:
+    def test_text_deltas(self):
+        acc = _CompletionAccumulator()
+        assert acc.add(text_chunk("Hel")) == "Hel"
+        assert acc.add(text_chunk("lo")) == "lo"
+        assert acc.text == "Hello"
+        assert acc.tool_calls() == []
+
+    def test_tool_call_fragments_are_joined(self):
+        acc = _CompletionAccumulator()
+        acc.add(tool_chunk(1, id="b", name="second", arguments=""))
+        acc.add(tool_chunk(0, id="a", name="first", arguments='{"ci'))
+        acc.add(tool_chunk(0, arguments='ty": "Paris"}'))
+        acc.add(tool_chunk(1, arguments="{}"))
+        calls = acc.tool_calls()
+        assert [c.id for c in calls] == ["a", "b"]
+        assert calls[0].arguments == {"city": "Paris"}
+        message = acc.message()
+        assert message["content"] is None
+        assert message["tool_calls"][0]["function"] == {
+            "name": "first", "arguments": '{"city": "Paris"}'
+        }
+
+    def test_chunk_without_choices(self):
+        acc = _CompletionAccumulator()
+        assert acc.add(SimpleNamespace(choices=[])) == ""
+
+
+class TestDispatchStream:
+    @pytest.mark.anyio
+    async def test_events_in_completion_order_results_in_request_order(self):
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def call_tool(name, arguments):
+            await asyncio.sleep(delays.get(name, 0))
+            if name == "broken":
+                raise RuntimeError("upstream down")
+            return name
+
+        dispatcher = ToolDispatcher(call_tool)
+        calls = [ToolCall("1", "slow", {}), ToolCall("2", "fast", {}), ToolCall("3", "broken", {})]
+        results = []
+        events = [e async for e in dispatcher.dispatch_stream(calls, results)]
+
+        assert [e.type for e in events[:3]] == ["tool_started"] * 3
+        finished = [(e.type, e.call.name) for e in events[3:]]
+        assert finished[-1] == ("tool_finished", "slow")
+        assert ("tool_error", "broken") in finished
+        assert [r.call.id for r in results] == ["1", "2", "3"]
+        assert str(results[2].error) == "upstream down"
+
+    @pytest.mark.anyio
+    async def test_closing_early_cancels_pending_calls(self):
+        cancelled = asyncio.Event()
+
+        async def call_tool(name, arguments):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        dispatcher = ToolDispatcher(call_tool)
+        stream = dispatcher.dispatch_stream([ToolCall("1", "hang", {})], [])
+        assert (await stream.__anext__()).type == "tool_started"
+        await asyncio.sleep(0)
+        await stream.aclose()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+class TestAgentChatStream:
+    @pytest.mark.anyio
+    async def test_streams_text_and_tool_events(self):
+        async def call_tool(name, arguments):
+            return f"sunny in {arguments['city']}"
+
+        usage = SimpleNamespace(choices=[], usage=SimpleNamespace(prompt_tokens=40, completion_tokens=4))
+        openai = FakeOpenAI(
+            [tool_chunk(0, id="call_1", name="weather", arguments='{"city": "Rome"}')],
+            [text_chunk("It is "), text_chunk("sunny."), usage],
+        )
+        mcp = FakeMCP([mcp_tool("weather")], call_tool)
+        agent = BaseAgent(mcp, openai)
+        events = [e async for e in agent.chat_stream("Weather in Rome?")]
+
+        assert [e.type for e in events] == [
+            "tool_started", "tool_finished", "text", "text", "done"
+        ]
+        assert events[1].result.content == "sunny in Rome"
+        assert events[-1].text == "It is sunny."
+        # The second request carries the assistant tool turn and the tool result
+        second = openai.requests[1]["messages"]
+        assert second[-2]["tool_calls"][0]["id"] == "call_1"
+        assert second[-1] == {"role": "tool", "tool_call_id": "call_1", "content": "sunny in Rome"}
+        # Usage is requested on the stream and recorded, along with the round count
+        assert openai.requests[0]["stream_options"] == {"include_usage": True}
+        assert mcp.metrics.llm_tokens.total(direction="input") == 40
+        assert mcp.metrics.llm_rounds.sum(agent="BaseAgent") == 2
+
+    @pytest.mark.anyio
+    async def test_tool_error_is_reported_to_model(self):
+        async def call_tool(name, arguments):
+            raise RuntimeError("no such city")
+
+        openai = FakeOpenAI(
+            [tool_chunk(0, id="c", name="weather", arguments="{}")],
+            [text_chunk("Sorry.")],
+        )
+        agent = BaseAgent(FakeMCP([mcp_tool("weather")], call_tool), openai)
+        events = [e async for e in agent.chat_stream("?")]
+
+        assert events[1].type == "tool_error"
+        tool_message = openai.requests[1]["messages"][-1]
+        assert tool_message["content"] == "Error calling weather: no such city"
+
+    @pytest.mark.anyio
+    async def test_max_tool_rounds_forces_final_answer_without_tools(self):
+        async def call_tool(name, arguments):
+            return "again"
+
+        class LoopingAgent(BaseAgent):
+            max_tool_rounds = 1
+
+        openai = FakeOpenAI(
+            [tool_chunk(0, id="c", name="weather", arguments="{}")],
+            [text_chunk("Final.")],
+        )
+        agent = LoopingAgent(FakeMCP([mcp_tool("weather")], call_tool), openai)
+        events = [e async for e in agent.chat_stream("?")]
+
+        assert events[-1].text == "Final."
+        assert "tools" in openai.requests[0]
+        assert "tools" not in openai.requests[1]
@@ -0,0 +1,179 @@
+"""Tests for SupervisedConnection (restarting crashed servers)"""
+
+import asyncio
+import sys
+import textwrap
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit import connection
+from mcp_toolkit.config import MCPConfig, MCPServerConfig, RestartPolicy
+from mcp_toolkit.supervisor import SupervisedConnection
+
+CRASHY_SERVER = textwrap.dedent('''
+    import os
+    import threading
+
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("crashy")
+
+    @mcp.tool()
+    def pid() -> int:
+        return os.getpid()
+
+    @mcp.tool()
+    def crash() -> str:
+        os._exit(1)
+
+    @mcp.tool()
+    def crash_soon() -> str:
+        threading.Timer(0.1, os._exit, (1,)).start()
+        return "bye"
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+@pytest.fixture
+def crashy(tmp_path):
+    script = tmp_path / "crashy_server.py"
+    script.write_text(CRASHY_SERVER)
+
+    def make(**restart) -> MCPServerConfig:
+        return MCPServerConfig(
+            name="crashy",
+            command=sys.executable,
+            args=[str(script)],
+            restart=RestartPolicy(**{"backoff": 0.05, **restart}),
+        )
+    return make
+
+
+async def wait_for(predicate, timeout: float = 10.0) -> None:
+    for _ in range(int(timeout / 0.02)):
+        if predicate():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("condition not met in time")
+
+
+class TestSupervisedConnection:
+    @pytest.mark.anyio
+    async def test_restarts_after_crash(self, crashy):
+        conn = SupervisedConnection(crashy())
+        await conn.start(timeout=10)
+        try:
+            first_pid = (await conn.call_tool("pid")).content[0].text
+
+            with pytest.raises(ConnectionError, match="went away during 'crash'"):
+                await conn.call_tool("crash")
+
+            # Queued until the new session is up, then served by it
+            result = await conn.call_tool("pid")
+            assert result.content[0].text != first_pid
+            assert conn.restarts == 1
+            assert [t.name for t in conn.tools] == ["pid", "crash", "crash_soon"]
+        finally:
+            await conn.close()
+
+    @pytest.mark.anyio
+    async def test_fail_fast_while_down(self, crashy):
+        conn = SupervisedConnection(crashy(backoff=0.5, while_down="fail"))
+        await conn.start(timeout=10)
+        try:
+            with pytest.raises(ConnectionError):
+                await conn.call_tool("crash")
+            with pytest.raises(ConnectionError, match="restarting"):
+                await conn.call_tool("pid")
+            await wait_for(lambda: conn.restarts == 1)
+            assert not (await conn.call_tool("pid")).isError
+        finally:
+            await conn.close()
+
+    @pytest.mark.anyio
+    async def test_gives_up_after_max_attempts(self, crashy):
+        conn = SupervisedConnection(crashy(max_attempts=0))
+        await conn.start(timeout=10)
+        try:
+            with pytest.raises(ConnectionError):
+                await conn.call_tool("crash")
+            with pytest.raises(ConnectionError, match="is down"):
+                await conn.call_tool("pid")
+            assert conn.restarts == 0
+        finally:
+            await conn.close()
+
+    @pytest.mark.anyio
+    async def test_health_check_restarts_idle_server(self, crashy):
+        conn = SupervisedConnection(crashy(health_interval=0.1))
+        await conn.start(timeout=10)
+        try:
+            assert (await conn.call_tool("crash_soon")).content[0].text == "bye"
+            await wait_for(lambda: conn.restarts == 1)
+            assert conn.connected
+        finally:
+            await conn.close()
+
+
+    @pytest.mark.anyio
+    async def test_restarts_when_transport_fails_after_start(self, crashy, monkeypatch):
+        broken = asyncio.Event()
+        real_connect = connection.connect
+        sessions = 0
+
+        @asynccontextmanager
+        async def failing_connect(config):
+            # Like an HTTP transport whose background task dies mid-session
+            nonlocal sessions
+            sessions += 1
+            first = sessions == 1
+
+            async def fail():
+                await broken.wait()
+                if first:
+                    raise OSError("stream reset")
+
+            async with real_connect(config=config) as session:
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(fail)
+                    yield session
+                    tg.cancel_scope.cancel()
+
+        monkeypatch.setattr(connection, "connect", failing_connect)
+        conn = SupervisedConnection(crashy())
+        await conn.start(timeout=10)
+        try:
+            first_pid = (await conn.call_tool("pid")).content[0].text
+            broken.set()
+            await wait_for(lambda: conn.restarts == 1)
+            assert (await conn.call_tool("pid")).content[0].text != first_pid
+        finally:
+            await conn.close()
+
+    @pytest.mark.anyio
+    async def test_ping_marks_dead_session_lost(self, crashy):
+        conn = connection.ServerConnection(crashy())
+        await conn.start(timeout=10)
+        try:
+            conn._session = None  # as if the owner task died before noticing
+            assert not await conn.ping()
+            assert conn.lost
+        finally:
+            await conn.close()
+
+
+class TestMultiServerClientSupervision:
+    @pytest.mark.anyio
+    async def test_client_recovers_from_crash(self, crashy):
+        config = MCPConfig(servers={"crashy": crashy()})
+        async with MultiServerClient(config, openai_client=object()) as client:
+            before = await client.call_tool("pid")
+            with pytest.raises(ConnectionError):
+                await client.call_tool("crash")
+            assert await client.call_tool("pid") != before
+            assert client._sessions["crashy"].restarts == 1
@@ -0,0 +1,140 @@
+"""Tests for tracing spans and exporters"""
+
+import json
+import sys
+import textwrap
+
+import pytest
+
+from mcp_toolkit.clients.base import ToolCall
+from mcp_toolkit.clients.multi import MultiServerClient
+from mcp_toolkit.config import MCPConfig, MCPServerConfig
+from mcp_toolkit.tracing import (
+    InMemoryExporter,
+    JsonLinesExporter,
+    Tracer,
+    current_span,
+    end_span,
+    set_tracer,
+    span,
+    start_span,
+)
+
+ECHO_SERVER = textwrap.dedent('''
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("echo")
+
+    @mcp.tool()
+    def echo(text: str) -> str:
+        return text
+
+    @mcp.tool()
+    def fail() -> str:
+        raise ValueError("nope")
+
+    if __name__ == "__main__":
+        mcp.run()
+''')
+
+
+@pytest.fixture
+def exporter():
+    memory = InMemoryExporter()
+    previous = set_tracer(Tracer(memory))
+    yield memory
+    set_tracer(previous)
+
+
+class TestTracer:
+    def test_spans_nest(self, exporter):
+        with span("outer", user="a") as outer:
+            with span("inner") as inner:
+                assert current_span() is inner
+            assert current_span() is outer
+        assert current_span() is None
+
+        assert [s.name for s in exporter.spans] == ["inner", "outer"]
+        assert inner.parent_id == outer.span_id
+        assert inner.trace_id == outer.trace_id
+        assert outer.parent_id is None
+        assert outer.attributes == {"user": "a"}
+        assert outer.end_ns >= inner.end_ns >= inner.start_ns >= outer.start_ns
+
+    def test_errors_are_recorded(self, exporter):
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("bad input")
+        assert exporter.spans[0].error == "ValueError: bad input"
+        assert not exporter.spans[0].ok
+
+    def test_manual_spans_do_not_become_current(self, exporter):
+        with span("outer") as outer:
+            started = start_span("manual")
+            assert current_span() is outer
+            end_span(started)
+        assert started.parent_id == outer.span_id
+
+    def test_disabled(self):
+        assert set_tracer(None) is None
+        with span("ignored") as s:
+            assert s is None
+        assert start_span("ignored") is None
+        end_span(None)
+
+    def test_json_lines(self, tmp_path):
+        path = tmp_path / "traces" / "spans.jsonl"
+        tracer = Tracer(JsonLinesExporter(path))
+        with tracer.span("outer"):
+            with tracer.span("inner", {"tool": "echo"}):
+                pass
+        tracer.shutdown()
+
+        inner, outer = [json.loads(line) for line in path.read_text().splitlines()]
+        assert inner["parent_id"] == outer["span_id"]
+        assert len(outer["trace_id"]) == 32
+        assert inner["attributes"] == {"tool": "echo"}
+        assert inner["duration_ms"] >= 0
+
+
+class TestClientSpans:
+    @pytest.mark.anyio
+    async def test_tool_calls_are_traced(self, tmp_path, exporter):
+        script = tmp_path / "echo_server.py"
+        script.write_text(ECHO_SERVER)
+        server = MCPServerConfig(name="echo", command=sys.executable, args=[str(script)])
+        async with MultiServerClient(MCPConfig(servers={"echo": server}), openai_client=object()) as client:
+            (connect,) = exporter.named("mcp.connect")
+            assert connect.attributes == {"server": "echo", "transport": "stdio"}
+            (listed,) = exporter.named("mcp.list_tools")
+            assert listed.attributes["server"] == "echo"
+
+            exporter.clear()
+            await client.dispatcher.dispatch([ToolCall("1", "echo", {"text": "hi"}), ToolCall("2", "fail", {})])
+
+        (dispatch,) = exporter.named("tool.dispatch")
+        calls = {s.attributes["tool"]: s for s in exporter.named("tool.call")}
+        assert all(s.parent_id == dispatch.span_id for s in calls.values())
+        for server_call in exporter.named("mcp.call_tool"):
+            assert server_call.attributes["server"] == "echo"
+            assert server_call.parent_id == calls[server_call.attributes["tool"]].span_id
+        # The tool's own error comes back as a result, not an exception
+        assert calls["fail"].ok
+
+    @pytest.mark.anyio
+    async def test_streamed_dispatch_is_traced(self, tmp_path, exporter):
+        script = tmp_path / "echo_server.py"
+        script.write_text(ECHO_SERVER)
+        server = MCPServerConfig(name="echo", command=sys.executable, args=[str(script)])
+        async with MultiServerClient(MCPConfig(servers={"echo": server}), openai_client=object()) as client:
+            exporter.clear()
+            results = []
+            calls = [ToolCall(str(i), "echo", {"text": str(i)}) for i in range(3)]
+            async for _ in client.dispatcher.dispatch_stream(calls, results):
+                assert current_span() is None
+
+        (dispatch,) = exporter.named("tool.dispatch")
+        assert dispatch.attributes == {"calls": 3}
+        tool_calls = exporter.named("tool.call")
+        assert len(tool_calls) == 3
+        assert all(s.parent_id == dispatch.span_id for s in tool_calls)
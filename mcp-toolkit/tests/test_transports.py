@@ -6,6 +6,12 @@ from mcp_toolkit.transports import _detect_command, connect
 from mcp_toolkit.config import MCPServerConfig
 
 
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request):
+    # These need no server, so they also run on trio
+    return request.param
+
+
 class TestDetectCommand:
     def test_python_script(self):
         assert _detect_command("server.py") == __import__("sys").executable
@@ -31,6 +37,13 @@ class TestConnectValidation:
             async with connect():
                 pass
 
+    @pytest.mark.anyio
+    async def test_connect_command_without_args_is_rejected(self):
+        cfg = MCPServerConfig(name="test", command="python")
+        with pytest.raises(ValueError, match="Must provide one of"):
+            async with connect(config=cfg):
+                pass
+
     @pytest.mark.anyio
     async def test_connect_streamable_http_config_routes_correctly(self):
         """Verify that streamable_http config triggers the correct code path."""